@@ -10,12 +10,15 @@ Run with: streamlit run app.py
 
 import streamlit as st
 import json
+import os
+import sqlite3
 import pandas as pd
 from pathlib import Path
 import plotly.express as px
 import plotly.graph_objects as go
 import math
 import yaml
+from dataclasses import replace as _dc_replace
 import streamlit_authenticator as stauth
 
 # Calculation engine (Phase 6 — engine wiring)
@@ -28,12 +31,15 @@ from engine.waterfall import aggregate_to_annual as _engine_aggregate_to_annual
 from engine.swap import build_nwl_swap_schedule as _engine_nwl_swap
 from engine.swap import build_lanred_swap_schedule as _engine_lanred_swap
 from engine.swap import compute_nwl_swap_bounds as _engine_swap_bounds
+from engine.statements import evaluate_statements, statement_flags
+from engine.reload import register, register_loader, watch
 from engine.periods import (
     annual_month_range, construction_end_index, construction_period_labels,
     period_lookup, period_start_month, repayment_start_index,
     repayment_start_month, total_periods, total_years,
 )
-from entities.nwl import build_nwl_sensitivity
+from entities.nwl import build_nwl_sensitivity_grid
+from entities.nwl_ops import NwlOpsDrivers, build_nwl_ops_vectors
 
 # Heritage / lineage UI (formula provenance for displayed values)
 from views.heritage import (
@@ -41,6 +47,16 @@ from views.heritage import (
     inject_df_heritage,
     inject_pnl_heritage,
 )
+# Plotly figure cache (rebuild charts only when their inputs change)
+from views.figures import clear_figure_cache, plot_cached
+# Cached, join-based statement / table HTML
+from views.statements import (
+    cached_html,
+    digest as statement_digest,
+    fin_table_html,
+    md_to_html,
+    table_html,
+)
 
 # Guarantor analysis engine
 ga = None
@@ -57,6 +73,10 @@ try:
     import guarantor_analysis as ga
 except ImportError:
     ga = None
+try:
+    import guarantor_store as gstore
+except ImportError:
+    gstore = None
 
 # Config directory
 CONFIG_DIR = Path(__file__).parent / "config"
@@ -102,8 +122,13 @@ def _run_engine_model(_session_hash: str) -> dict:
     The _session_hash parameter is a fingerprint of scenario-relevant
     session_state keys so Streamlit re-runs when inputs change.
     """
-    cfg = ModelConfig.load()
     inputs = ScenarioInputs.from_session_state(dict(st.session_state))
+    # Shared warm compute pool (python -m engine serve) when configured
+    _svc_url = os.environ.get("MODEL_SERVICE_URL")
+    if _svc_url:
+        from engine.service import ModelServiceClient
+        return ModelServiceClient(_svc_url).model(inputs)
+    cfg = ModelConfig.load()
     result = run_model(cfg, inputs)
     # Serialize to plain dicts for Streamlit caching (dataclasses aren't hashable)
     return _serialize_model_result(result)
@@ -135,31 +160,7 @@ def _session_input_hash() -> str:
 
 def _serialize_model_result(result: ModelResult) -> dict:
     """Convert ModelResult to plain dict for Streamlit cache."""
-    entities = {}
-    for key, er in result.entities.items():
-        entities[key] = {
-            "annual": er.annual,
-            "sr_schedule": er.sr_schedule,
-            "mz_schedule": er.mz_schedule,
-            "waterfall_semi": er.waterfall_semi,
-            "waterfall_annual": er.waterfall_annual,
-            "semi_annual_pl": er.semi_annual_pl,
-            "semi_annual_tax": er.semi_annual_tax,
-            "ops_annual": er.ops_annual,
-            "ops_semi_annual": er.ops_semi_annual,
-            "registry": er.registry,
-            "depreciable_base": er.depreciable_base,
-            "entity_equity": er.entity_equity,
-            "swap_schedule": er.swap_schedule.to_dict() if er.swap_schedule else None,
-            "swap_active": er.swap_active,
-            "cash_inflows": er.cash_inflows,
-            "pre_revenue_hedge_total": er.pre_revenue_hedge_total,
-        }
-    return {
-        "entities": entities,
-        "holding": result.holding,
-        "ic_semi": result.ic_semi,
-    }
+    return result.to_dict()
 
 
 # Field name mapping: engine NEW names -> app.py OLD names (compatibility)
@@ -435,16 +436,25 @@ def load_content_md(filename: str) -> dict:
     return sections
 
 
+_svg_md_cache: dict[str, tuple[int, dict]] = {}
+
+
 def _parse_svg_content_md(filename: str) -> dict:
     """Parse an SVG content MD file into id→text mapping.
 
     Files use the pattern:  ## element_id\\nText value
     Returns dict mapping element IDs to their text content.
+    Parsed once per file mtime.
     """
     model_dir = Path(__file__).parent
     md_file = model_dir / "content" / filename
-    if not md_file.exists():
+    try:
+        mtime = md_file.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
+    hit = _svg_md_cache.get(filename)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
     with open(md_file, 'r', encoding='utf-8') as f:
         content = f.read()
     mapping = {}
@@ -455,11 +465,11 @@ def _parse_svg_content_md(filename: str) -> dict:
         elif current_id and line.strip() and not line.startswith('**') and not line.startswith('---'):
             mapping[current_id] = line.strip()
             current_id = None
+    _svg_md_cache[filename] = (mtime, mapping)
     return mapping
 
 
 import re as _re
-import html as _html_mod
 
 def load_svg_patched(svg_filename: str, md_filename: str, overrides: dict | None = None) -> str:
     """Load an SVG and patch text elements using content from an MD file.
@@ -471,31 +481,15 @@ def load_svg_patched(svg_filename: str, md_filename: str, overrides: dict | None
                    Applied after MD patching, so overrides take precedence.
 
     Returns SVG string with text content replaced, or empty string if file missing.
+    Rendered from a precompiled template and cached on the SVG / MD file
+    mtimes and the patch values (svg_generators.patch_svg_asset).
     """
-    model_dir = Path(__file__).parent
-    svg_path = model_dir / "assets" / svg_filename
-    if not svg_path.exists():
-        return ""
-    with open(svg_path, 'r', encoding='utf-8') as f:
-        svg = f.read()
-    # Apply MD file patches
-    mapping = _parse_svg_content_md(md_filename)
-    if mapping:
-        for elem_id, new_text in mapping.items():
-            escaped = _html_mod.escape(new_text)
-            pattern = _re.compile(
-                r'(<text\b[^>]*\bid="' + _re.escape(elem_id) + r'"[^>]*>)([^<]*)(</text>)'
-            )
-            svg = pattern.sub(r'\g<1>' + escaped + r'\3', svg)
-    # Apply runtime overrides (take precedence over MD content)
+    from svg_generators import patch_svg_asset
+
+    patches = dict(_parse_svg_content_md(md_filename))
     if overrides:
-        for elem_id, new_text in overrides.items():
-            escaped = _html_mod.escape(str(new_text))
-            pattern = _re.compile(
-                r'(<text\b[^>]*\bid="' + _re.escape(elem_id) + r'"[^>]*>)([^<]*)(</text>)'
-            )
-            svg = pattern.sub(r'\g<1>' + escaped + r'\3', svg)
-    return svg
+        patches.update(overrides)
+    return patch_svg_asset(Path(__file__).parent / "assets" / svg_filename, patches)
 
 
 def render_svg(svg_filename: str, md_filename: str, overrides: dict | None = None):
@@ -561,10 +555,7 @@ def _render_logo_dark_bg(logo_path, width=100):
 
 def _md_to_html(text: str) -> str:
     """Convert simple markdown bold/italic to HTML."""
-    import re
-    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-    text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
-    return text
+    return md_to_html(text)
 
 
 def render_table(df: pd.DataFrame, formats: dict | None = None,
@@ -573,80 +564,41 @@ def render_table(df: pd.DataFrame, formats: dict | None = None,
 
     Numeric/formatted columns are right-aligned. Supports **bold** and *italic*
     markdown in cell values. Scrollable horizontally for wide tables.
+    The HTML is cached on the table content (views/statements.py).
 
     Args:
         formats: dict of {col: fmt_string} for numeric formatting + right-align.
         right_align: list of column names to right-align (for pre-formatted strings).
     """
-    df_display = df.copy()
-    right_cols: set[str] = set()
-    if formats:
-        for col, fmt in formats.items():
-            if col in df_display.columns:
-                right_cols.add(col)
-                df_display[col] = df_display[col].apply(
-                    lambda x, f=fmt: f.format(x) if pd.notna(x) and not isinstance(x, str) else x
-                )
-    if right_align:
-        for col in right_align:
-            if col in df_display.columns:
-                right_cols.add(col)
+    right_cols: set[str] = {c for c in (formats or {}) if c in df.columns}
+    right_cols.update(c for c in (right_align or ()) if c in df.columns)
 
     # If no formatted columns, fall back to plain st.table
     if not right_cols:
-        st.table(df_display)
+        st.table(df)
         return
 
-    # Build HTML table with right-alignment, markdown support, and scroll wrapper
-    html_parts = [
-        '<div style="overflow-x: auto; width: 100%;">',
-        '<table style="border-collapse: collapse; width: 100%; font-size: 13px; white-space: nowrap;">',
-        '<thead><tr>',
-    ]
-    for col in df_display.columns:
-        align = 'right' if col in right_cols else 'left'
-        html_parts.append(
-            f'<th style="text-align: {align}; padding: 5px 8px; '
-            f'border-bottom: 2px solid #ddd; font-weight: 600;">{col}</th>'
+    def _build() -> str:
+        df_display = df.copy()
+        for col, fmt in (formats or {}).items():
+            if col in df_display.columns:
+                df_display[col] = df_display[col].apply(
+                    lambda x, f=fmt: f.format(x) if pd.notna(x) and not isinstance(x, str) else x
+                )
+        cells = (
+            [_md_to_html(str(val)) if pd.notna(val) else '' for val in row]
+            for row in df_display.itertuples(index=False, name=None)
         )
-    html_parts.append('</tr></thead><tbody>')
-    for _, row in df_display.iterrows():
-        html_parts.append('<tr>')
-        for col in df_display.columns:
-            align = 'right' if col in right_cols else 'left'
-            val = row[col]
-            cell = str(val) if pd.notna(val) else ''
-            cell = _md_to_html(cell)
-            # Bold rows get slightly different styling
-            weight = 'font-weight: 600;' if '<b>' in cell else ''
-            html_parts.append(
-                f'<td style="text-align: {align}; padding: 4px 8px; '
-                f'border-bottom: 1px solid #eee; {weight}">{cell}</td>'
-            )
-        html_parts.append('</tr>')
-    html_parts.append('</tbody></table></div>')
-    st.markdown(''.join(html_parts), unsafe_allow_html=True)
+        return table_html([str(c) for c in df_display.columns], cells,
+                          [c in right_cols for c in df_display.columns])
+
+    html = cached_html("table:" + statement_digest(df, formats, right_align), _build)
+    st.markdown(html, unsafe_allow_html=True)
 
 
 def _render_fin_table(rows: list[tuple], columns: list[str]):
     """Render financial table: first col left-aligned, rest right-aligned, markdown bold/italic."""
-    html = ['<div style="overflow-x:auto;width:100%;">',
-            '<table style="border-collapse:collapse;width:100%;font-size:13px;white-space:nowrap;">',
-            '<thead><tr>']
-    for i, col in enumerate(columns):
-        align = 'left' if i == 0 else 'right'
-        html.append(f'<th style="text-align:{align};padding:5px 8px;border-bottom:2px solid #ddd;font-weight:600;">{col}</th>')
-    html.append('</tr></thead><tbody>')
-    for row in rows:
-        html.append('<tr>')
-        for i, val in enumerate(row):
-            align = 'left' if i == 0 else 'right'
-            cell = _md_to_html(str(val)) if val else ''
-            weight = 'font-weight:600;' if '<b>' in cell else ''
-            html.append(f'<td style="text-align:{align};padding:4px 8px;border-bottom:1px solid #eee;{weight}">{cell}</td>')
-        html.append('</tr>')
-    html.append('</tbody></table></div>')
-    st.markdown(''.join(html), unsafe_allow_html=True)
+    st.markdown(fin_table_html(rows, columns), unsafe_allow_html=True)
 
 
 _eur_fmt = "€{:,.0f}"
@@ -1766,14 +1718,17 @@ def _eca_default(entity_key: str) -> bool:
     return True
 
 
-def _apply_eca_fee_adjustments():
-    """Patch entity loan allocations based on ECA toggle state.
+def _apply_eca_fee_adjustments(cfg: ModelConfig) -> ModelConfig:
+    """Config with entity loan allocations adjusted for the ECA toggle state.
 
-    Safe: @st.cache_data returns deserialized copies, so in-place
-    modifications don't affect the cache. Each rerun starts fresh.
+    Copy-on-write: returns cfg.with_overrides(...), so the shared config
+    snapshot is never modified and each rerun starts from it.
     """
+    _loans_path = "structure.uses.loans_to_subsidiaries"
+    all_loans = dict(cfg.entity_loans())
+    overrides: dict = {}
     for ek in ['nwl', 'lanred', 'timberworx']:
-        ed = structure['uses']['loans_to_subsidiaries'][ek]
+        ed = all_loans[ek]
         assets_base = ed['assets_base']
         adj_sr = 0.0
         adj_mz = 0.0
@@ -1791,346 +1746,71 @@ def _apply_eca_fee_adjustments():
 
         adj_total = adj_sr + adj_mz
         if adj_total > 0:
-            ed['fees_allocated'] = max(0, ed['fees_allocated'] - adj_total)
-            ed['total_loan'] = max(0, ed['total_loan'] - adj_total)
-            ed['senior_portion'] = max(0, ed['senior_portion'] - adj_sr)
-            ed['mezz_portion'] = max(0, ed['mezz_portion'] - adj_mz)
+            patch = {
+                'fees_allocated': max(0, ed['fees_allocated'] - adj_total),
+                'total_loan': max(0, ed['total_loan'] - adj_total),
+                'senior_portion': max(0, ed['senior_portion'] - adj_sr),
+                'mezz_portion': max(0, ed['mezz_portion'] - adj_mz),
+            }
+            all_loans[ek] = {**ed, **patch}
+            overrides.update({f"{_loans_path}.{ek}.{k}": v for k, v in patch.items()})
 
     # Re-sync facility totals so balance checks pass
-    all_loans = structure['uses']['loans_to_subsidiaries']
     new_sr = sum(v['senior_portion'] for v in all_loans.values())
     new_mz = sum(v['mezz_portion'] for v in all_loans.values())
     new_total = new_sr + new_mz
-    structure['sources']['senior_debt']['amount'] = new_sr
-    structure['sources']['mezzanine']['amount_eur'] = new_mz
-    structure['sources']['total'] = new_total
-    structure['uses']['total'] = new_total
-    structure['balance_check']['sources_total'] = new_total
-    structure['balance_check']['uses_total'] = new_total
-    structure['balance_check']['senior_sources'] = new_sr
-    structure['balance_check']['senior_uses'] = new_sr
-    structure['balance_check']['mezz_sources'] = new_mz
-    structure['balance_check']['mezz_uses'] = new_mz
+    overrides.update({
+        "structure.sources.senior_debt.amount": new_sr,
+        "structure.sources.mezzanine.amount_eur": new_mz,
+        "structure.sources.total": new_total,
+        "structure.uses.total": new_total,
+        "structure.balance_check.sources_total": new_total,
+        "structure.balance_check.uses_total": new_total,
+        "structure.balance_check.senior_sources": new_sr,
+        "structure.balance_check.senior_uses": new_sr,
+        "structure.balance_check.mezz_sources": new_mz,
+        "structure.balance_check.mezz_uses": new_mz,
+    })
+    return cfg.with_overrides(overrides)
 
 
 # Apply ECA fee adjustments (reads session_state from previous rerun)
-_apply_eca_fee_adjustments()
-
-
-def _extrapolate_piecewise_linear(base_months: list[int], base_values: list[float], target_months: list[int], floor: float | None = None) -> list[float]:
-    """Piecewise-linear interpolation/extrapolation on semi-annual anchors."""
-    if not base_months or not base_values or len(base_months) != len(base_values):
-        return [0.0 for _ in target_months]
-
-    pairs = sorted(zip(base_months, base_values), key=lambda x: x[0])
-    xs = [int(p[0]) for p in pairs]
-    ys = [float(p[1]) for p in pairs]
-
-    if len(xs) >= 2:
-        left_dx = xs[1] - xs[0]
-        left_slope = ((ys[1] - ys[0]) / left_dx) if left_dx else 0.0
-        right_dx = xs[-1] - xs[-2]
-        right_slope = ((ys[-1] - ys[-2]) / right_dx) if right_dx else 0.0
-    else:
-        left_slope = 0.0
-        right_slope = 0.0
-
-    out = []
-    for t in target_months:
-        if t <= xs[0]:
-            v = ys[0] + left_slope * (t - xs[0])
-        elif t >= xs[-1]:
-            v = ys[-1] + right_slope * (t - xs[-1])
-        else:
-            v = ys[-1]
-            for i in range(len(xs) - 1):
-                x0, x1 = xs[i], xs[i + 1]
-                if x0 <= t <= x1:
-                    y0, y1 = ys[i], ys[i + 1]
-                    ratio = (t - x0) / (x1 - x0) if x1 != x0 else 0.0
-                    v = y0 + (y1 - y0) * ratio
-                    break
-        if floor is not None:
-            v = max(v, floor)
-        out.append(v)
-    return out
+structure = _apply_eca_fee_adjustments(ModelConfig.load()).structure
+
+
+# Session-state slider key -> NWL ops kernel driver field
+_NWL_OPS_STATE_KEYS = {
+    "nwl_greenfield_growth_pct": "growth_pct",
+    "nwl_greenfield_brine_pct": "brine_pct",
+    "nwl_greenfield_sewage_rate_2025": "sewage_rate_2025",
+    "nwl_greenfield_water_rate_2025": "water_rate_2025",
+    "nwl_greenfield_reuse_ratio": "reuse_ratio",
+    "nwl_srv_growth_pct": "srv_growth_pct",
+    "nwl_srv_transport_r_km": "srv_transport_r_km",
+    "nwl_srv_truck_capacity_m3": "srv_truck_capacity_m3",
+    "nwl_srv_nwl_distance_km": "srv_nwl_distance_km",
+    "nwl_srv_gov_distance_km": "srv_gov_distance_km",
+    "nwl_srv_saving_to_market_pct": "srv_saving_to_market_pct",
+    "nwl_power_kwh_per_m3": "power_kwh_per_m3",
+    "nwl_power_eskom_base": "power_eskom_base",
+    "nwl_power_ic_discount": "power_ic_discount",
+    "nwl_power_escalation": "power_escalation",
+}
 
 
-def _month_to_year_idx(month: int) -> int | None:
-    """Map month 0..119 to year index 0..9 (start-month convention).
+def _build_nwl_operating_annual_model() -> tuple[list[dict], list[dict]]:
+    """Build NWL 10-year annual operating model in EUR (config-driven + UI overrides).
 
-    M0-M11 -> Y0, M12-M23 -> Y1, ... M108-M119 -> Y9.
+    Thin wrapper over the engine NWL ops kernel (entities/nwl_ops.py):
+    session-state sliders override the operations.json defaults.
     """
-    if month < 0:
-        return None
-    idx = month // 12
-    return idx if 0 <= idx < 10 else None
-
-
-def _build_nwl_operating_annual_model() -> list[dict]:
-    """Build NWL 10-year annual operating model in EUR (config-driven + UI overrides)."""
-    cfg = operations_config.get("nwl", {})
-    on_ramp_cfg = cfg.get("on_ramp", {})
-    greenfield_cfg = cfg.get("greenfield", {})
-    brownfield_cfg = cfg.get("brownfield", {})
-    bulk_cfg = cfg.get("bulk_services", {})
-    om_cfg = cfg.get("om", {})
-    srv_cfg = cfg.get("sewerage_revenue_sharing", {})
-
-    months_semi = [period_start_month(si) for si in range(total_periods())]  # M0, M6, ..., M114
-    month_to_idx = {m: i for i, m in enumerate(months_semi)}
-
-    ramp_rows = on_ramp_cfg.get("rows", [])
-    cap_points = [(int(r.get("period_months", 0)), r.get("capacity_available_mld")) for r in ramp_rows]
-    cap_points = [(m, float(v)) for m, v in cap_points if v is not None]
-    if not any(m == 6 for m, _ in cap_points):
-        cap_points.append((6, 0.0))
-    if not any(m == 12 for m, _ in cap_points):
-        cap_points.append((12, 0.0))
-    cap_points = sorted(cap_points, key=lambda x: x[0])
-    cap_months = [m for m, _ in cap_points]
-    cap_vals = [v for _, v in cap_points]
-    sewage_capacity = _extrapolate_piecewise_linear(cap_months, cap_vals, months_semi, floor=0.0)
-
-    demand_months = [18, 24, 30, 36, 42, 48, 54, 60, 66, 72]
-    piped_sewage_base = [float(x) for x in greenfield_cfg.get("piped_sewage_topcos_mld", [0.0] * 10)]
-    construction_base = [float(x) for x in greenfield_cfg.get("construction_water_demand_topcos_mld", [0.0] * 10)]
-    latent_base = [float(x) for x in brownfield_cfg.get("latent_demand_quantified", [0.0] * 10)]
-
-    piped_sewage_demand = _extrapolate_piecewise_linear(demand_months, piped_sewage_base, months_semi, floor=0.0)
-    construction_demand = _extrapolate_piecewise_linear(demand_months, construction_base, months_semi, floor=0.0)
-    latent_demand = _extrapolate_piecewise_linear(demand_months, latent_base, months_semi, floor=0.0)
-
-    annual_growth_pct = _state_float("nwl_greenfield_growth_pct", greenfield_cfg.get("annual_growth_pct_default", 7.7))
-    brine_pct = _state_float("nwl_greenfield_brine_pct", greenfield_cfg.get("brine_pct_default", 10.0))
-    sewage_rate_2025 = _state_float("nwl_greenfield_sewage_rate_2025", greenfield_cfg.get("sewage_rate_2025_r_per_kl", 46.40))
-    water_rate_2025 = _state_float("nwl_greenfield_water_rate_2025", greenfield_cfg.get("water_rate_2025_r_per_kl", 62.05))
-    reuse_ratio = _state_float("nwl_greenfield_reuse_ratio", greenfield_cfg.get("reuse_ratio_default", 0.80))
-
-    srv_joburg_price = _state_float("nwl_srv_joburg_price", srv_cfg.get("joburg_price_r_per_kl_default", 46.40))
-    srv_growth_pct = _state_float("nwl_srv_growth_pct", srv_cfg.get("growth_pct_default", 7.70))
-    srv_transport_r_km = _state_float("nwl_srv_transport_r_km", srv_cfg.get("transport_r_per_km_default", 28.0))
-    srv_truck_capacity_m3 = max(_state_float("nwl_srv_truck_capacity_m3", srv_cfg.get("truck_capacity_m3_default", 10.0)), 1.0)
-    srv_nwl_distance_km = _state_float("nwl_srv_nwl_distance_km", srv_cfg.get("nwl_roundtrip_km_default", 10.0))
-    srv_gov_distance_km = _state_float("nwl_srv_gov_distance_km", srv_cfg.get("gov_roundtrip_km_default", 100.0))
-    srv_saving_to_market_pct = _state_float("nwl_srv_saving_to_market_pct", srv_cfg.get("saving_to_market_pct_default", 40.0))
-
-    sewage_sold = [min(cap, dem) for cap, dem in zip(sewage_capacity, piped_sewage_demand)]
-    overflow_brownfield = [max(cap - sold, 0.0) for cap, sold in zip(sewage_capacity, sewage_sold)]
-    reuse_capacity = [cap * (1.0 - brine_pct / 100.0) for cap in sewage_capacity]
-    reuse_topcos_demand = [sold * reuse_ratio for sold in sewage_sold]
-    reuse_sold_topcos = [min(cap, dem) for cap, dem in zip(reuse_capacity, reuse_topcos_demand)]
-    reuse_after_topcos = [max(cap - sold, 0.0) for cap, sold in zip(reuse_capacity, reuse_sold_topcos)]
-    reuse_sold_construction = [min(rem, dem) for rem, dem in zip(reuse_after_topcos, construction_demand)]
-    reuse_overflow_agri = [max(cap - sold1 - sold2, 0.0) for cap, sold1, sold2 in zip(reuse_capacity, reuse_sold_topcos, reuse_sold_construction)]
-    brownfield_served = [min(cap, dem) for cap, dem in zip(overflow_brownfield, latent_demand)]
-
-    growth_factor = 1.0 + (annual_growth_pct / 100.0)
-    sewage_rates = [sewage_rate_2025 * (growth_factor ** (m / 12.0)) for m in months_semi]
-    water_rates = [water_rate_2025 * (growth_factor ** (m / 12.0)) for m in months_semi]
-    agri_base = float(brownfield_cfg.get("agri_base_2025_r_per_kl", 37.70))
-    agri_rates = [agri_base * (growth_factor ** (m / 12.0)) for m in months_semi]
-
-    srv_processing_fee_truck = srv_joburg_price * srv_truck_capacity_m3
-    srv_transport_nwl = srv_transport_r_km * srv_nwl_distance_km
-    srv_transport_gov = srv_transport_r_km * srv_gov_distance_km
-    srv_saving_per_m3_transport = (srv_transport_gov - srv_transport_nwl) / srv_truck_capacity_m3
-    srv_market_price = max(srv_saving_per_m3_transport * (srv_saving_to_market_pct / 100.0), 0.0)
-    srv_growth_factor = 1.0 + (srv_growth_pct / 100.0)
-    honeysucker_rates = [srv_market_price * (srv_growth_factor ** (m / 12.0)) for m in months_semi]
-
-    half_year_kl_per_mld = 1000.0 * 365.0 / 2.0
-    rev_gf_sewage_zar = [v * half_year_kl_per_mld * p for v, p in zip(sewage_sold, sewage_rates)]
-    rev_bf_sewage_zar = [v * half_year_kl_per_mld * p for v, p in zip(brownfield_served, honeysucker_rates)]
-    rev_gf_reuse_zar = [v * half_year_kl_per_mld * p for v, p in zip(reuse_sold_topcos, water_rates)]
-    rev_construction_zar = [v * half_year_kl_per_mld * p for v, p in zip(reuse_sold_construction, water_rates)]
-    rev_agri_zar = [v * half_year_kl_per_mld * p for v, p in zip(reuse_overflow_agri, agri_rates)]
-
-    def _month_to_semi_idx(m: int) -> int | None:
-        """Map month 0..119 to semi-annual index 0..19 (start-month convention).
-
-        M0-M5 -> 0 (C1), M6-M11 -> 1 (C2), M12-M17 -> 2 (C3), ...
-        """
-        if m < 0:
-            return None
-        si = m // 6
-        return si if 0 <= si < 20 else None
-
-    rev_bulk_zar_year = [0.0 for _ in range(total_years())]
-    rev_bulk_zar_semi = [0.0 for _ in range(total_periods())]
-    for row in bulk_cfg.get("rows", []):
-        amount = float(row.get("price_zar", 0.0))
-        if amount <= 0.0:
-            continue
-        # Bulk services: lump-sum at M12 (all revenue recognised in Y1 H2)
-        yi = _month_to_year_idx(12)
-        if yi is not None:
-            rev_bulk_zar_year[yi] += amount
-        si = _month_to_semi_idx(12)
-        if si is not None:
-            rev_bulk_zar_semi[si] += amount
-
-    om_monthly_fee = float(om_cfg.get("flat_fee_per_month_zar", 0.0))
-    om_index_pa = float(om_cfg.get("annual_indexation_pa", 0.0))
-    om_start_month = int(om_cfg.get("opex_start_month", 12))
-    om_zar_year = [0.0 for _ in range(total_years())]
-    om_zar_semi = [0.0 for _ in range(total_periods())]
-    for mi in range(120):  # M0..M119 (0-based months matching _month_to_year/semi_idx)
-        yi = _month_to_year_idx(mi)
-        if mi < om_start_month:
-            continue
-        years_from_start = (mi - om_start_month) / 12.0
-        monthly_cost = om_monthly_fee * ((1.0 + om_index_pa) ** years_from_start)
-        if yi is not None:
-            om_zar_year[yi] += monthly_cost
-        si = _month_to_semi_idx(mi)
-        if si is not None:
-            om_zar_semi[si] += monthly_cost
-
-    # Power / electricity cost (inter-company from LanRED solar at Eskom -10%)
-    power_cfg = cfg.get("power", {})
-    power_kwh_per_m3 = _state_float("nwl_power_kwh_per_m3", float(power_cfg.get("kwh_per_m3", 0.4)))
-    eskom_base = _state_float("nwl_power_eskom_base", float(power_cfg.get("eskom_base_rate_r_per_kwh", 2.81)))
-    ic_discount = _state_float("nwl_power_ic_discount", float(power_cfg.get("ic_discount_pct", 10.0)))
-    power_rate = eskom_base * (1.0 - ic_discount / 100.0)
-    power_escalation = _state_float("nwl_power_escalation", float(power_cfg.get("annual_escalation_pct", 10.0))) / 100.0
-    power_start_month = int(power_cfg.get("start_month", 18))
-    power_zar_year = [0.0 for _ in range(total_years())]
-    power_zar_semi = [0.0 for _ in range(total_periods())]
-    for mi in range(120):  # M0..M119 (0-based months)
-        yi = _month_to_year_idx(mi)
-        if mi < power_start_month:
-            continue
-        # Get capacity at this month via interpolation
-        cap_mld = 0.0
-        for ci in range(len(cap_months) - 1):
-            if cap_months[ci] <= mi <= cap_months[ci + 1]:
-                frac = (mi - cap_months[ci]) / max(cap_months[ci + 1] - cap_months[ci], 1)
-                cap_mld = cap_vals[ci] + frac * (cap_vals[ci + 1] - cap_vals[ci])
-                break
-        else:
-            if mi >= cap_months[-1]:
-                cap_mld = cap_vals[-1]
-        volume_m3_per_day = cap_mld * 1000.0
-        kwh_per_day = volume_m3_per_day * power_kwh_per_m3
-        years_from_start = (mi - power_start_month) / 12.0
-        rate_indexed = power_rate * ((1.0 + power_escalation) ** years_from_start)
-        _power_monthly = kwh_per_day * rate_indexed * 30.44  # avg days per month
-        if yi is not None:
-            power_zar_year[yi] += _power_monthly
-        si = _month_to_semi_idx(mi)
-        if si is not None:
-            power_zar_semi[si] += _power_monthly
-
-    # CoE rent (capital-recovery: CapEx x (WACC + O&M) -- mirrors TWX coe_lease revenue)
-    # After CoE sale to LLC, NWL continues paying rent -- recipient changes (TWX -> LLC), cost unchanged
-    rent_cfg = cfg.get("coe_rent", {})
-    rent_om_pct = float(rent_cfg.get("om_overhead_pct", 2.0))
-    rent_monthly_eur, rent_annual_eur, _rent_wacc, _rent_coe_capex = compute_coe_rent_monthly_eur(rent_om_pct)
-    rent_monthly_zar = rent_monthly_eur * FX_RATE
-    rent_esc_pct = float(rent_cfg.get("annual_escalation_pct", 5.0)) / 100.0
-    rent_start_month = int(rent_cfg.get("start_month", 24))
-    rent_zar_year = [0.0 for _ in range(total_years())]
-    rent_zar_semi = [0.0 for _ in range(total_periods())]
-    for mi in range(120):  # M0..M119 (0-based months)
-        yi = _month_to_year_idx(mi)
-        if mi < rent_start_month:
-            continue
-        years_from_start = (mi - rent_start_month) / 12.0
-        rent_indexed = rent_monthly_zar * ((1.0 + rent_esc_pct) ** years_from_start)
-        if yi is not None:
-            rent_zar_year[yi] += rent_indexed
-        si = _month_to_semi_idx(mi)
-        if si is not None:
-            rent_zar_semi[si] += rent_indexed
-
-    annual_rows = []
-    for yi in range(total_years()):
-        m1 = yi * 12        # H1 start_month (M0, M12, M24, ...)
-        m2 = yi * 12 + 6   # H2 start_month (M6, M18, M30, ...)
-        i1 = month_to_idx.get(m1)
-        i2 = month_to_idx.get(m2)
-        if i1 is None or i2 is None:
-            semi_idx = []
-        else:
-            semi_idx = [i1, i2]
-
-        def ysum(arr: list[float]) -> float:
-            return sum(arr[i] for i in semi_idx) if semi_idx else 0.0
-
-        gf_sewage_eur = ysum(rev_gf_sewage_zar) / FX_RATE
-        bf_sewage_eur = ysum(rev_bf_sewage_zar) / FX_RATE
-        gf_reuse_eur = ysum(rev_gf_reuse_zar) / FX_RATE
-        construction_eur = ysum(rev_construction_zar) / FX_RATE
-        agri_eur = ysum(rev_agri_zar) / FX_RATE
-        bulk_eur = rev_bulk_zar_year[yi] / FX_RATE
-        om_eur = om_zar_year[yi] / FX_RATE
-
-        # Volume tracking (for levelized cost, capacity graphs)
-        vol_capacity_avg = sum(sewage_capacity[i] for i in semi_idx) / len(semi_idx) if semi_idx else 0.0
-        vol_treated_avg = sum(sewage_sold[i] for i in semi_idx) / len(semi_idx) if semi_idx else 0.0
-        vol_annual_m3 = vol_treated_avg * 1000.0 * 365.0
-        # Product-specific volumes for LCOW benchmarking
-        vol_reuse_avg = sum(
-            reuse_sold_topcos[i] + reuse_sold_construction[i] + reuse_overflow_agri[i]
-            for i in semi_idx
-        ) / len(semi_idx) if semi_idx else 0.0
-        vol_brownfield_avg = sum(brownfield_served[i] for i in semi_idx) / len(semi_idx) if semi_idx else 0.0
-        vol_reuse_annual_m3 = vol_reuse_avg * 1000.0 * 365.0
-        vol_brownfield_annual_m3 = vol_brownfield_avg * 1000.0 * 365.0
-
-        rent_eur = rent_zar_year[yi] / FX_RATE
-
-        annual_rows.append({
-            "year": yi + 1,
-            "rev_greenfield_sewage": gf_sewage_eur,
-            "rev_brownfield_sewage": bf_sewage_eur,
-            "rev_sewage": gf_sewage_eur + bf_sewage_eur,
-            "rev_greenfield_reuse": gf_reuse_eur,
-            "rev_construction": construction_eur,
-            "rev_agri": agri_eur,
-            "rev_reuse": gf_reuse_eur + construction_eur + agri_eur,
-            "rev_operating": gf_sewage_eur + bf_sewage_eur + gf_reuse_eur + construction_eur + agri_eur,
-            "rev_bulk_services": bulk_eur,
-            "rev_total": gf_sewage_eur + bf_sewage_eur + gf_reuse_eur + construction_eur + agri_eur + bulk_eur,
-            "om_cost": om_eur,
-            "power_cost": power_zar_year[yi] / FX_RATE,
-            "rent_cost": rent_eur,
-            "vol_capacity_mld": vol_capacity_avg,
-            "vol_treated_mld": vol_treated_avg,
-            "vol_annual_m3": vol_annual_m3,
-            "vol_reuse_annual_m3": vol_reuse_annual_m3,
-            "vol_brownfield_annual_m3": vol_brownfield_annual_m3,
-            "power_zar": power_zar_year[yi],
-            "om_zar": om_zar_year[yi],
-            "rent_zar": rent_zar_year[yi],
-        })
-
-    # Build 20 semi-annual rows (M6..M120) for waterfall engine
-    semi_annual_rows = []
-    for si in range(total_periods()):
-        _s_gf_sew = rev_gf_sewage_zar[si] / FX_RATE
-        _s_bf_sew = rev_bf_sewage_zar[si] / FX_RATE
-        _s_gf_reu = rev_gf_reuse_zar[si] / FX_RATE
-        _s_constr = rev_construction_zar[si] / FX_RATE
-        _s_agri = rev_agri_zar[si] / FX_RATE
-        _s_bulk = rev_bulk_zar_semi[si] / FX_RATE
-        _s_rev_op = _s_gf_sew + _s_bf_sew + _s_gf_reu + _s_constr + _s_agri
-        _s_rev_tot = _s_rev_op + _s_bulk
-        _s_om = om_zar_semi[si] / FX_RATE
-        _s_pow = power_zar_semi[si] / FX_RATE
-        _s_rent = rent_zar_semi[si] / FX_RATE
-        semi_annual_rows.append({
-            "month": months_semi[si],
-            "rev_operating": _s_rev_op,
-            "rev_bulk_services": _s_bulk,
-            "rev_total": _s_rev_tot,
-            "om_cost": _s_om,
-            "power_cost": _s_pow,
-            "rent_cost": _s_rent,
-        })
-
-    return annual_rows, semi_annual_rows
+    _cfg = ModelConfig.load()
+    _base = NwlOpsDrivers.from_config(_cfg)
+    _drivers = _dc_replace(_base, **{
+        field: _state_float(key, getattr(_base, field))
+        for key, field in _NWL_OPS_STATE_KEYS.items()
+    })
+    return build_nwl_ops_vectors(_cfg, _drivers).ops_rows(0)
 
 
 def _build_lanred_operating_annual_model() -> list[dict]:
@@ -2625,6 +2305,29 @@ def _build_twx_operating_annual_model() -> list[dict]:
     return annual_rows
 
 
+def _proof_error(category, exc):
+    import traceback as _tb
+    st.error(f"Proof computation failed ({category}): {type(exc).__name__}: {exc}")
+    st.code("".join(_tb.format_exception(type(exc), exc, exc.__traceback__)))
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _entity_proofs(session_hash: str, entity_key: str):
+    """Lazy engine proofs for one entity of the current scenario (per-category memo).
+
+    A cache_resource (not a module-level lru_cache, which every rerun of
+    this script would rebuild empty): the same EntityProofs object, and the
+    categories it has computed, is reused across reruns and sessions.
+    session_hash has no leading underscore so Streamlit keys on it.
+    """
+    from engine.proofs import EntityProofs
+
+    er = _run_engine_model(session_hash)["entities"][entity_key]
+    return EntityProofs.from_entity(
+        er, entity_key, tax_rate=_TAX_RATE, structure=structure, on_error=_proof_error,
+    )
+
+
 def build_sub_annual_model(entity_key):
     """Build 10-year annual P&L, Cash Flow, Balance Sheet for a subsidiary.
 
@@ -2632,10 +2335,10 @@ def build_sub_annual_model(entity_key):
     shape as the original implementation for display code compatibility.
 
     Includes engine-computed proofs (audit cross-checks) under the "proofs"
-    key so the UI only needs to display them, never compute them.
+    key so the UI only needs to display them, never compute them.  Proofs
+    are lazy: a category is computed the first time a page reads it, and
+    kept per (scenario, entity).
     """
-    from engine.proofs import build_entity_proofs
-
     model_data = _run_engine_model(_session_input_hash())
     er = model_data["entities"][entity_key]
 
@@ -2644,26 +2347,7 @@ def build_sub_annual_model(entity_key):
     wf_semi = [_add_compat_fields(dict(w)) for w in er["waterfall_semi"]]
     wf_annual = [_add_compat_fields(dict(w)) for w in er["waterfall_annual"]]
 
-    # Compute engine proofs (all categories) — UI just displays these
-    entity_data = structure['uses']['loans_to_subsidiaries'].get(entity_key)
-    try:
-        _proofs = build_entity_proofs(
-            annual=annual,
-            waterfall_semi=wf_semi,
-            entity_key=entity_key,
-            ops_annual=er["ops_annual"],
-            depr_base=er["depreciable_base"],
-            tax_rate=_TAX_RATE,
-            entity_data=entity_data,
-            structure=structure,
-            sr_schedule=er["sr_schedule"],
-            semi_annual_pl=er.get("semi_annual_pl"),
-        )
-    except Exception as _proof_err:
-        import traceback as _tb
-        st.error(f"Proof computation failed: {type(_proof_err).__name__}: {_proof_err}")
-        st.code(_tb.format_exc())
-        _proofs = {}
+    _proofs = _entity_proofs(_session_input_hash(), entity_key)
 
     return {
         "annual": annual,
@@ -2691,6 +2375,7 @@ def build_sub_annual_model(entity_key):
 # ============================================================
 def render_subsidiary(entity_key, icon, name):
     """Render a subsidiary entity view with sub-tabs."""
+    _fig_fp = f"{entity_key}:{_session_input_hash()}"      # plot_cached key prefix
     entity_data = structure['uses']['loans_to_subsidiaries'][entity_key]
     senior = structure['sources']['senior_debt']
     mezz = structure['sources']['mezzanine']
@@ -2740,6 +2425,12 @@ def render_subsidiary(entity_key, icon, name):
     _sub_semi_annual_tax = _sub_model.get("semi_annual_tax")
     _sub_proofs = _sub_model.get("proofs", {})
     _years = [f"Y{a['year']}" for a in _sub_annual]
+    # P&L / CF / BS lines for this entity, one pass over the annual model
+    _sub_statements = evaluate_statements(
+        {entity_key: _sub_annual},
+        flags=statement_flags({entity_key: _sub_swap_active}, _state_str("lanred_scenario", "Brownfield+")),
+        context={"tax_rate": _TAX_RATE},
+    )
 
     # --- OVERVIEW ---
     if "Overview" in _tab_map:
@@ -2957,42 +2648,8 @@ def render_subsidiary(entity_key, icon, name):
                 _about_svg_generators = {}
                 if entity_key in ("nwl", "lanred", "timberworx"):
                     try:
-                        from svg_generators import (
-                            generate_nwl_crisis_svg, generate_nwl_financing_svg,
-                            generate_lanred_tariff_svg,
-                            generate_twx_velocity_svg, generate_twx_jv_svg,
-                        )
-                        _pi = load_config("project_intelligence")
-                        _fin = load_config("financing")
-                        _ops = load_config("operations")
-                        _struct = load_config("structure")
-                        if entity_key == "nwl":
-                            _trend = _pi.get("south_africa_crisis_context", {}).get("sewage_treatment", {}).get("green_drop_compliance_trend", [])
-                            if _trend:
-                                _about_svg_generators["The Crisis"] = generate_nwl_crisis_svg(_trend)
-                            _sr = _fin.get("senior_debt", {})
-                            _grants_eur = _sr.get("grant_proceeds_to_early_repayment", 0) + _sr.get("gepf_bulk_proceeds", 0)
-                            _fac_eur = _sr.get("loan_drawdown_total", 0)
-                            _nwl_sr = _struct.get("uses", {}).get("loans_to_subsidiaries", {}).get("nwl", {}).get("senior_portion", 0)
-                            _about_svg_generators["The Financing"] = generate_nwl_financing_svg(
-                                grants_eur=_grants_eur, dsra_start=24, dsra_end=36,
-                                exposure_m36_eur=_nwl_sr - _grants_eur,
-                                facility_eur=_fac_eur, grace_end=24, maturity=120,
-                            )
-                        elif entity_key == "lanred":
-                            _lr_ps = _ops.get("lanred", {}).get("power_sales", {})
-                            _eskom = _lr_ps.get("smart_city_offtake", {}).get("joburg_business_tariff_r_per_kwh", 2.29)
-                            _disc = _lr_ps.get("smart_city_offtake", {}).get("discount_pct", 10)
-                            _lcoe = 0.80
-                            _about_svg_generators["The Solution"] = generate_lanred_tariff_svg(_eskom, _disc, _lcoe)
-                        elif entity_key == "timberworx":
-                            _hsg = _pi.get("south_africa_crisis_context", {}).get("housing", {})
-                            _about_svg_generators["The Crisis"] = generate_twx_velocity_svg(
-                                _hsg.get("annual_need", 178000),
-                                _hsg.get("annual_delivered", 25000),
-                                _hsg.get("backlog_units", 3700000),
-                            )
-                            _about_svg_generators["Joint Venture"] = generate_twx_jv_svg()
+                        from svg_generators import entity_about_svgs
+                        _about_svg_generators = entity_about_svgs(entity_key)
                     except Exception:
                         pass
 
@@ -3837,6 +3494,37 @@ This means:
                     with st.container(border=True):
                         st.subheader("PV / BESS Budget Allocation")
                         st.caption(f"Total solar envelope: **€{_a_total:,.0f}**. Drag to reallocate between PV generation and battery storage.")
+
+                        # Optimiser runs LanRED-only probes; the app's engine run
+                        # picks up the new slider value on the next rerun.
+                        def _on_optimise_bess_split():
+                            from engine.optimise import optimise_lanred_split
+                            _opt = optimise_lanred_split(
+                                ModelConfig.load(),
+                                ScenarioInputs.from_session_state(dict(st.session_state)),
+                                objective=st.session_state.get("_lanred_bess_opt_objective", "equity_irr"),
+                                rerun_full_model=False,
+                            )
+                            st.session_state["lanred_bess_alloc_pct"] = int(round(_opt.value))
+                            st.session_state["_lanred_bess_opt_result"] = (_opt.objective, _opt.value, _opt.score)
+
+                        _aop1, _aop2, _aop3 = st.columns([2, 1, 3])
+                        with _aop1:
+                            st.selectbox(
+                                "Optimise for",
+                                ["equity_irr", "min_dscr"],
+                                format_func={"equity_irr": "LanRED equity IRR", "min_dscr": "LanRED minimum DSCR"}.get,
+                                key="_lanred_bess_opt_objective",
+                            )
+                        with _aop2:
+                            st.button("Optimise split", key="_lanred_bess_opt_btn",
+                                      on_click=_on_optimise_bess_split)
+                        with _aop3:
+                            _aop_res = st.session_state.get("_lanred_bess_opt_result")
+                            if _aop_res:
+                                _aop_fmt = f"{_aop_res[2]*100:.1f}%" if _aop_res[0] == "equity_irr" else f"{_aop_res[2]:.2f}x"
+                                st.caption(f"Optimum: **{_aop_res[1]:.0f}% BESS** → {_aop_fmt}")
+
                         _asl1, _asl2, _asl3 = st.columns([4, 1, 1])
                         with _asl1:
                             _a_bess_pct = st.slider(
@@ -4535,38 +4223,40 @@ This means:
 
                     with col_chart:
                         cap = df_ramp["Capacity Available (MLD)"].fillna(0)
-                        fig = go.Figure()
-                        fig.add_trace(go.Scatter(
-                            x=df_ramp["Period (months)"],
-                            y=cap,
-                            name="Capacity (MLD)",
-                            mode="lines+markers",
-                            line=dict(color="#10B981", width=3),
-                            marker=dict(size=7),
-                        ))
-                        fig.add_trace(go.Scatter(
-                            x=df_ramp["Period (months)"],
-                            y=[2.0] * len(df_ramp),
-                            name="Max (2.0 MLD)",
-                            mode="lines",
-                            line=dict(color="#1F2937", width=2, dash="dash"),
-                        ))
-                        fig.add_trace(go.Scatter(
-                            x=df_ramp["Period (months)"],
-                            y=[1.9] * len(df_ramp),
-                            name="1.9 MLD = 95% max utilization",
-                            mode="lines",
-                            line=dict(color="#F59E0B", width=2, dash="dot"),
-                        ))
-                        fig.update_layout(
-                            height=300,
-                            margin=dict(l=10, r=10, t=10, b=10),
-                            xaxis_title="Period (months)",
-                            yaxis_title="Capacity (MLD)",
-                            yaxis=dict(range=[0, 2.1]),
-                            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
+                        def _build_ramp_fig():
+                            fig = go.Figure()
+                            fig.add_trace(go.Scatter(
+                                x=df_ramp["Period (months)"],
+                                y=cap,
+                                name="Capacity (MLD)",
+                                mode="lines+markers",
+                                line=dict(color="#10B981", width=3),
+                                marker=dict(size=7),
+                            ))
+                            fig.add_trace(go.Scatter(
+                                x=df_ramp["Period (months)"],
+                                y=[2.0] * len(df_ramp),
+                                name="Max (2.0 MLD)",
+                                mode="lines",
+                                line=dict(color="#1F2937", width=2, dash="dash"),
+                            ))
+                            fig.add_trace(go.Scatter(
+                                x=df_ramp["Period (months)"],
+                                y=[1.9] * len(df_ramp),
+                                name="1.9 MLD = 95% max utilization",
+                                mode="lines",
+                                line=dict(color="#F59E0B", width=2, dash="dot"),
+                            ))
+                            fig.update_layout(
+                                height=300,
+                                margin=dict(l=10, r=10, t=10, b=10),
+                                xaxis_title="Period (months)",
+                                yaxis_title="Capacity (MLD)",
+                                yaxis=dict(range=[0, 2.1]),
+                                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
+                            )
+                            return fig
+                        plot_cached("capacity_ramp", _build_ramp_fig, fingerprint=_fig_fp, use_container_width=True)
 
                 st.divider()
                 with st.container(border=True):
@@ -4606,22 +4296,24 @@ This means:
                     """)
 
                     with _bd_col:
-                        fig_bulk = go.Figure(data=[go.Pie(
-                            labels=["GEPF (PTN 39)", "Social Housing (PTN 72/76)"],
-                            values=[_gepf_price, _social_price],
-                            hole=0.55,
-                            marker=dict(colors=["#2563EB", "#60A5FA"]),
-                            textinfo="label+percent",
-                            textposition="outside",
-                            textfont_size=11,
-                        )])
-                        fig_bulk.update_layout(
-                            height=250,
-                            margin=dict(l=0, r=0, t=10, b=10),
-                            showlegend=False,
-                            annotations=[dict(text=f"R{_bulk_total/1e6:.1f}M", x=0.5, y=0.5, font_size=16, showarrow=False)],
-                        )
-                        st.plotly_chart(fig_bulk, use_container_width=True)
+                        def _build_fig_bulk():
+                            fig_bulk = go.Figure(data=[go.Pie(
+                                labels=["GEPF (PTN 39)", "Social Housing (PTN 72/76)"],
+                                values=[_gepf_price, _social_price],
+                                hole=0.55,
+                                marker=dict(colors=["#2563EB", "#60A5FA"]),
+                                textinfo="label+percent",
+                                textposition="outside",
+                                textfont_size=11,
+                            )])
+                            fig_bulk.update_layout(
+                                height=250,
+                                margin=dict(l=0, r=0, t=10, b=10),
+                                showlegend=False,
+                                annotations=[dict(text=f"R{_bulk_total/1e6:.1f}M", x=0.5, y=0.5, font_size=16, showarrow=False)],
+                            )
+                            return fig_bulk
+                        plot_cached("fig_bulk", _build_fig_bulk, fingerprint=_fig_fp, use_container_width=True)
 
                 st.divider()
                 greenfield_box = st.container(border=True)
@@ -4711,41 +4403,45 @@ This means:
 
                     col_s_chart, col_r_chart = st.columns(2)
                     with col_s_chart:
-                        fig_sewage = go.Figure()
-                        fig_sewage.add_trace(go.Bar(
-                            x=month_cols, y=sewage_sold_topcos, name="Sold - TopCos", marker_color="#2563EB"
-                        ))
-                        fig_sewage.add_trace(go.Bar(
-                            x=month_cols, y=sewage_overflow_brownfield, name="Overflow - BrownField", marker_color="#94A3B8"
-                        ))
-                        fig_sewage.update_layout(
-                            barmode="stack",
-                            title="Sewage Split",
-                            yaxis_title="MLD",
-                            height=300,
-                            margin=dict(l=10, r=10, t=40, b=10),
-                        )
-                        st.plotly_chart(fig_sewage, use_container_width=True)
+                        def _build_fig_sewage():
+                            fig_sewage = go.Figure()
+                            fig_sewage.add_trace(go.Bar(
+                                x=month_cols, y=sewage_sold_topcos, name="Sold - TopCos", marker_color="#2563EB"
+                            ))
+                            fig_sewage.add_trace(go.Bar(
+                                x=month_cols, y=sewage_overflow_brownfield, name="Overflow - BrownField", marker_color="#94A3B8"
+                            ))
+                            fig_sewage.update_layout(
+                                barmode="stack",
+                                title="Sewage Split",
+                                yaxis_title="MLD",
+                                height=300,
+                                margin=dict(l=10, r=10, t=40, b=10),
+                            )
+                            return fig_sewage
+                        plot_cached("fig_sewage", _build_fig_sewage, fingerprint=_fig_fp, use_container_width=True)
 
                     with col_r_chart:
-                        fig_reuse = go.Figure()
-                        fig_reuse.add_trace(go.Bar(
-                            x=month_cols, y=reuse_sold_topcos, name="Sold - TopCos", marker_color="#059669"
-                        ))
-                        fig_reuse.add_trace(go.Bar(
-                            x=month_cols, y=reuse_sold_construction, name="Sold - Construction", marker_color="#F59E0B"
-                        ))
-                        fig_reuse.add_trace(go.Bar(
-                            x=month_cols, y=reuse_overflow_agri, name="Overflow - Agri", marker_color="#94A3B8"
-                        ))
-                        fig_reuse.update_layout(
-                            barmode="stack",
-                            title="Re-use Split",
-                            yaxis_title="MLD",
-                            height=300,
-                            margin=dict(l=10, r=10, t=40, b=10),
-                        )
-                        st.plotly_chart(fig_reuse, use_container_width=True)
+                        def _build_fig_reuse():
+                            fig_reuse = go.Figure()
+                            fig_reuse.add_trace(go.Bar(
+                                x=month_cols, y=reuse_sold_topcos, name="Sold - TopCos", marker_color="#059669"
+                            ))
+                            fig_reuse.add_trace(go.Bar(
+                                x=month_cols, y=reuse_sold_construction, name="Sold - Construction", marker_color="#F59E0B"
+                            ))
+                            fig_reuse.add_trace(go.Bar(
+                                x=month_cols, y=reuse_overflow_agri, name="Overflow - Agri", marker_color="#94A3B8"
+                            ))
+                            fig_reuse.update_layout(
+                                barmode="stack",
+                                title="Re-use Split",
+                                yaxis_title="MLD",
+                                height=300,
+                                margin=dict(l=10, r=10, t=40, b=10),
+                            )
+                            return fig_reuse
+                        plot_cached("fig_reuse", _build_fig_reuse, fingerprint=_fig_fp, use_container_width=True)
 
                     st.caption("Logic: Capacity is what can be sold. Sold demand is allocated first; unsold balance is overflow for later offtake.")
 
@@ -4840,25 +4536,27 @@ This means:
                     _rm4.metric("Avg per Half-Year", f"R{_total_10y / 20:,.0f}")
 
                     # Stacked bar chart — revenue by segment
-                    fig_rev = go.Figure()
-                    fig_rev.add_trace(go.Bar(x=_rev_labels, y=_rev_sewage_gf, name="Sewage — GreenField", marker_color="#2563EB"))
-                    fig_rev.add_trace(go.Bar(x=_rev_labels, y=_rev_sewage_bf, name="Sewage — BrownField", marker_color="#93C5FD"))
-                    fig_rev.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_gf, name="Re-use — GreenField", marker_color="#059669"))
-                    fig_rev.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_con, name="Re-use — Construction", marker_color="#F59E0B"))
-                    fig_rev.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_agri, name="Re-use — Agri", marker_color="#A3E635"))
-                    fig_rev.add_trace(go.Scatter(
-                        x=_rev_labels, y=_rev_total, name="Total Revenue",
-                        mode="lines+markers", line=dict(color="#1F2937", width=2, dash="dot"), marker=dict(size=4),
-                    ))
-                    fig_rev.update_layout(
-                        barmode="stack",
-                        title="Semi-Annual Revenue by Segment (ZAR)",
-                        yaxis_title="ZAR",
-                        height=450,
-                        margin=dict(l=10, r=10, t=80, b=10),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.05, xanchor="center", x=0.5),
-                    )
-                    st.plotly_chart(fig_rev, use_container_width=True)
+                    def _build_fig_rev():
+                        fig_rev = go.Figure()
+                        fig_rev.add_trace(go.Bar(x=_rev_labels, y=_rev_sewage_gf, name="Sewage — GreenField", marker_color="#2563EB"))
+                        fig_rev.add_trace(go.Bar(x=_rev_labels, y=_rev_sewage_bf, name="Sewage — BrownField", marker_color="#93C5FD"))
+                        fig_rev.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_gf, name="Re-use — GreenField", marker_color="#059669"))
+                        fig_rev.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_con, name="Re-use — Construction", marker_color="#F59E0B"))
+                        fig_rev.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_agri, name="Re-use — Agri", marker_color="#A3E635"))
+                        fig_rev.add_trace(go.Scatter(
+                            x=_rev_labels, y=_rev_total, name="Total Revenue",
+                            mode="lines+markers", line=dict(color="#1F2937", width=2, dash="dot"), marker=dict(size=4),
+                        ))
+                        fig_rev.update_layout(
+                            barmode="stack",
+                            title="Semi-Annual Revenue by Segment (ZAR)",
+                            yaxis_title="ZAR",
+                            height=450,
+                            margin=dict(l=10, r=10, t=80, b=10),
+                            legend=dict(orientation="h", yanchor="bottom", y=1.05, xanchor="center", x=0.5),
+                        )
+                        return fig_rev
+                    plot_cached("fig_rev", _build_fig_rev, fingerprint=_fig_fp, use_container_width=True)
 
                     st.markdown(
                         "**Why the dip?** Honeysucker revenue sharing (R{:.2f}/KL) is over **2x more profitable** "
@@ -4973,31 +4671,33 @@ This means:
                     _bm4.metric("Cost saving vs Govt", f"{srv_saving_pct:.0f}%")
 
                     # --- Combined chart: dual-axis (demand/supply bars + oversubscription line) ---
-                    from plotly.subplots import make_subplots
-                    fig_bf = make_subplots(specs=[[{"secondary_y": True}]])
-                    fig_bf.add_trace(go.Bar(
-                        x=month_cols, y=brownfield_latent_demand,
-                        name="Latent demand", marker_color="#E2E8F0", opacity=0.7,
-                    ), secondary_y=False)
-                    fig_bf.add_trace(go.Bar(
-                        x=month_cols, y=brownfield_capacity,
-                        name="NWL overflow", marker_color="#10B981",
-                    ), secondary_y=False)
-                    fig_bf.add_trace(go.Scatter(
-                        x=month_cols, y=brownfield_oversub_x,
-                        name="Oversubscription (x)", mode="lines+markers+text",
-                        line=dict(color="#DC2626", width=3), marker=dict(size=7, color="#DC2626"),
-                        text=[f"{x:,.0f}x" for x in brownfield_oversub_x],
-                        textposition="top center", textfont=dict(size=10, color="#DC2626"),
-                    ), secondary_y=True)
-                    fig_bf.update_layout(
-                        barmode="overlay", height=380,
-                        margin=dict(l=10, r=10, t=10, b=10),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
-                    )
-                    fig_bf.update_yaxes(title_text="MLD", secondary_y=False)
-                    fig_bf.update_yaxes(title_text="Oversubscription (x)", secondary_y=True, showgrid=False)
-                    st.plotly_chart(fig_bf, use_container_width=True)
+                    def _build_fig_bf():
+                        from plotly.subplots import make_subplots
+                        fig_bf = make_subplots(specs=[[{"secondary_y": True}]])
+                        fig_bf.add_trace(go.Bar(
+                            x=month_cols, y=brownfield_latent_demand,
+                            name="Latent demand", marker_color="#E2E8F0", opacity=0.7,
+                        ), secondary_y=False)
+                        fig_bf.add_trace(go.Bar(
+                            x=month_cols, y=brownfield_capacity,
+                            name="NWL overflow", marker_color="#10B981",
+                        ), secondary_y=False)
+                        fig_bf.add_trace(go.Scatter(
+                            x=month_cols, y=brownfield_oversub_x,
+                            name="Oversubscription (x)", mode="lines+markers+text",
+                            line=dict(color="#DC2626", width=3), marker=dict(size=7, color="#DC2626"),
+                            text=[f"{x:,.0f}x" for x in brownfield_oversub_x],
+                            textposition="top center", textfont=dict(size=10, color="#DC2626"),
+                        ), secondary_y=True)
+                        fig_bf.update_layout(
+                            barmode="overlay", height=380,
+                            margin=dict(l=10, r=10, t=10, b=10),
+                            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
+                        )
+                        fig_bf.update_yaxes(title_text="MLD", secondary_y=False)
+                        fig_bf.update_yaxes(title_text="Oversubscription (x)", secondary_y=True, showgrid=False)
+                        return fig_bf
+                    plot_cached("fig_bf", _build_fig_bf, fingerprint=_fig_fp, use_container_width=True)
                     st.caption(
                         "Latent demand = quantified existing demand in the Lanseria corridor (~10% p.a. growth). "
                         "NWL overflow = capacity not yet absorbed by GreenField. "
@@ -5226,29 +4926,31 @@ This means:
                     st.metric("10-Year Lifetime Saving", f"R{_lifetime_saving:,.0f}", delta=f"\u20ac{_lifetime_saving / FX_RATE:,.0f}")
 
                     # Dual chart: annual cost comparison bars + cumulative saving line
-                    from plotly.subplots import make_subplots
-                    _fig_pw = make_subplots(specs=[[{"secondary_y": True}]])
-                    _fig_pw.add_trace(go.Bar(
-                        x=_years_lbl, y=[v / 1e6 for v in _cas_annual_zar],
-                        name='Conventional CAS (full Eskom)', marker_color='#EF4444', opacity=0.7,
-                    ), secondary_y=False)
-                    _fig_pw.add_trace(go.Bar(
-                        x=_years_lbl, y=[v / 1e6 for v in _mabr_annual_zar],
-                        name='MABR + LanRED Solar (-10%)', marker_color='#10B981', opacity=0.85,
-                    ), secondary_y=False)
-                    _fig_pw.add_trace(go.Scatter(
-                        x=_years_lbl, y=[v / 1e6 for v in _cum_saving_zar],
-                        name='Cumulative Saving', mode='lines+markers',
-                        line=dict(color='#2563EB', width=3), marker=dict(size=7),
-                    ), secondary_y=True)
-                    _fig_pw.update_layout(
-                        barmode='group', height=380,
-                        margin=dict(l=10, r=10, t=40, b=10),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-                    )
-                    _fig_pw.update_yaxes(title_text="Annual Cost (R millions)", secondary_y=False)
-                    _fig_pw.update_yaxes(title_text="Cumulative Saving (R millions)", secondary_y=True)
-                    st.plotly_chart(_fig_pw, use_container_width=True)
+                    def _build_fig_pw():
+                        from plotly.subplots import make_subplots
+                        _fig_pw = make_subplots(specs=[[{"secondary_y": True}]])
+                        _fig_pw.add_trace(go.Bar(
+                            x=_years_lbl, y=[v / 1e6 for v in _cas_annual_zar],
+                            name='Conventional CAS (full Eskom)', marker_color='#EF4444', opacity=0.7,
+                        ), secondary_y=False)
+                        _fig_pw.add_trace(go.Bar(
+                            x=_years_lbl, y=[v / 1e6 for v in _mabr_annual_zar],
+                            name='MABR + LanRED Solar (-10%)', marker_color='#10B981', opacity=0.85,
+                        ), secondary_y=False)
+                        _fig_pw.add_trace(go.Scatter(
+                            x=_years_lbl, y=[v / 1e6 for v in _cum_saving_zar],
+                            name='Cumulative Saving', mode='lines+markers',
+                            line=dict(color='#2563EB', width=3), marker=dict(size=7),
+                        ), secondary_y=True)
+                        _fig_pw.update_layout(
+                            barmode='group', height=380,
+                            margin=dict(l=10, r=10, t=40, b=10),
+                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                        )
+                        _fig_pw.update_yaxes(title_text="Annual Cost (R millions)", secondary_y=False)
+                        _fig_pw.update_yaxes(title_text="Cumulative Saving (R millions)", secondary_y=True)
+                        return _fig_pw
+                    plot_cached("fig_pw", _build_fig_pw, fingerprint=_fig_fp, use_container_width=True)
 
                     _mabr_kwh = operations_config['nwl']['power']['kwh_per_m3']
                     _cas_kwh = operations_config['nwl']['power'].get('cas_benchmark_kwh_per_m3', 1.2)
@@ -5304,17 +5006,19 @@ This means:
                     _rent_total_10yr = sum(_rent_annual_zar_actual)
                     _years_lbl_rent = [f"Y{i+1}" for i in range(total_years())]
 
-                    fig_rent = go.Figure()
-                    fig_rent.add_trace(go.Bar(
-                        x=_years_lbl_rent, y=[v / 1e6 for v in _rent_annual_zar_actual],
-                        name='CoE Rent Cost', marker_color='#F59E0B',
-                    ))
-                    fig_rent.update_layout(
-                        height=300, yaxis_title='R millions',
-                        margin=dict(l=10, r=10, t=30, b=10),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-                    )
-                    st.plotly_chart(fig_rent, use_container_width=True)
+                    def _build_fig_rent():
+                        fig_rent = go.Figure()
+                        fig_rent.add_trace(go.Bar(
+                            x=_years_lbl_rent, y=[v / 1e6 for v in _rent_annual_zar_actual],
+                            name='CoE Rent Cost', marker_color='#F59E0B',
+                        ))
+                        fig_rent.update_layout(
+                            height=300, yaxis_title='R millions',
+                            margin=dict(l=10, r=10, t=30, b=10),
+                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                        )
+                        return fig_rent
+                    plot_cached("fig_rent", _build_fig_rent, fingerprint=_fig_fp, use_container_width=True)
                     _nwl_coe_sale_yr = int(operations_config.get("timberworx", {}).get("coe_sale_to_llc", {}).get("sale_year", 4))
                     st.caption(
                         f"Total: R{_rent_total_10yr:,.0f} "
@@ -5361,30 +5065,32 @@ This means:
                         _d3.metric("Phase 2 (this application)", f"{_ph2_cap}/yr", f"{_ph2_cap / _avg_demand_5yr * 100:.1f}% of avg demand")
                         _d4.metric("Phase 3 (future)", f"{_ph3_cap}/yr", f"{_ph3_cap / _avg_demand_10yr * 100:.0f}% of avg demand")
 
-                        fig_demand = go.Figure()
-                        fig_demand.add_trace(go.Bar(
-                            x=_years_lbl_d, y=_demand_incr,
-                            name='Lanseria demand (houses/yr)', marker_color='#DC2626', opacity=0.7,
-                            text=[f"{int(v):,}" for v in _demand_incr], textposition='outside',
-                        ))
-                        fig_demand.add_trace(go.Scatter(x=_years_lbl_d, y=[_ph2_cap]*10,
-                            name=f'Phase 2: {_ph2_cap}/yr', mode='lines',
-                            line=dict(color='#F59E0B', width=2, dash='dash')))
-                        fig_demand.add_trace(go.Scatter(x=_years_lbl_d, y=[_ph3_cap]*10,
-                            name=f'Phase 3: {_ph3_cap}/yr', mode='lines',
-                            line=dict(color='#10B981', width=2)))
-                        # Pill annotations on the phase lines
-                        fig_demand.add_annotation(x='Y1', y=_ph2_cap, text=f"<b>Phase 2: {_ph2_cap}/yr</b>",
-                            showarrow=False, yshift=14, bgcolor='#F59E0B', font=dict(size=10, color='white'),
-                            bordercolor='#F59E0B', borderwidth=1, borderpad=4)
-                        fig_demand.add_annotation(x='Y1', y=_ph3_cap, text=f"<b>Phase 3: {_ph3_cap}/yr</b>",
-                            showarrow=False, yshift=14, bgcolor='#10B981', font=dict(size=10, color='white'),
-                            bordercolor='#10B981', borderwidth=1, borderpad=4)
-                        fig_demand.update_layout(height=350, yaxis_title='Houses per Year',
-                            yaxis_range=[0, max(_demand_incr) * 1.2],
-                            margin=dict(l=10, r=10, t=40, b=10),
-                            legend=dict(orientation="h", yanchor="bottom", y=1.04, xanchor="center", x=0.5))
-                        st.plotly_chart(fig_demand, use_container_width=True)
+                        def _build_fig_demand():
+                            fig_demand = go.Figure()
+                            fig_demand.add_trace(go.Bar(
+                                x=_years_lbl_d, y=_demand_incr,
+                                name='Lanseria demand (houses/yr)', marker_color='#DC2626', opacity=0.7,
+                                text=[f"{int(v):,}" for v in _demand_incr], textposition='outside',
+                            ))
+                            fig_demand.add_trace(go.Scatter(x=_years_lbl_d, y=[_ph2_cap]*10,
+                                name=f'Phase 2: {_ph2_cap}/yr', mode='lines',
+                                line=dict(color='#F59E0B', width=2, dash='dash')))
+                            fig_demand.add_trace(go.Scatter(x=_years_lbl_d, y=[_ph3_cap]*10,
+                                name=f'Phase 3: {_ph3_cap}/yr', mode='lines',
+                                line=dict(color='#10B981', width=2)))
+                            # Pill annotations on the phase lines
+                            fig_demand.add_annotation(x='Y1', y=_ph2_cap, text=f"<b>Phase 2: {_ph2_cap}/yr</b>",
+                                showarrow=False, yshift=14, bgcolor='#F59E0B', font=dict(size=10, color='white'),
+                                bordercolor='#F59E0B', borderwidth=1, borderpad=4)
+                            fig_demand.add_annotation(x='Y1', y=_ph3_cap, text=f"<b>Phase 3: {_ph3_cap}/yr</b>",
+                                showarrow=False, yshift=14, bgcolor='#10B981', font=dict(size=10, color='white'),
+                                bordercolor='#10B981', borderwidth=1, borderpad=4)
+                            fig_demand.update_layout(height=350, yaxis_title='Houses per Year',
+                                yaxis_range=[0, max(_demand_incr) * 1.2],
+                                margin=dict(l=10, r=10, t=40, b=10),
+                                legend=dict(orientation="h", yanchor="bottom", y=1.04, xanchor="center", x=0.5))
+                            return fig_demand
+                        plot_cached("fig_demand", _build_fig_demand, fingerprint=_fig_fp, use_container_width=True)
                         st.caption("Annual new housing starts per GEPF township development plan. Variance reflects phased land release and infrastructure readiness.")
 
                         st.markdown("**What 15,000 houses means for Lanseria:**")
@@ -5543,16 +5249,18 @@ Only house sales continue permanently.
                     _lease_total = sum(_lease_annual_zar_actual)
                     _years_lbl_lease = [f"Y{i+1}" for i in range(total_years())]
 
-                    fig_lease = go.Figure()
-                    fig_lease.add_trace(go.Bar(
-                        x=_years_lbl_lease, y=[v / 1e6 for v in _lease_annual_zar_actual],
-                        name='CoE Lease Revenue', marker_color='#34D399',
-                    ))
-                    fig_lease.update_layout(
-                        height=250, yaxis_title='ZAR (millions)',
-                        margin=dict(l=10, r=10, t=30, b=10),
-                    )
-                    st.plotly_chart(fig_lease, use_container_width=True)
+                    def _build_fig_lease():
+                        fig_lease = go.Figure()
+                        fig_lease.add_trace(go.Bar(
+                            x=_years_lbl_lease, y=[v / 1e6 for v in _lease_annual_zar_actual],
+                            name='CoE Lease Revenue', marker_color='#34D399',
+                        ))
+                        fig_lease.update_layout(
+                            height=250, yaxis_title='ZAR (millions)',
+                            margin=dict(l=10, r=10, t=30, b=10),
+                        )
+                        return fig_lease
+                    plot_cached("fig_lease", _build_fig_lease, fingerprint=_fig_fp, use_container_width=True)
                     st.caption(f"Total: R{_lease_total:,.0f} (\u20ac{_lease_total / FX_RATE:,.0f}). **Ends Y{_coe_sale_yr} (CoE sold to LLC).**")
 
                 # --- SETA TRAINING PROGRAMS (CoE COD → sale year) ---
@@ -5627,23 +5335,25 @@ Accredited training providers receive **R{_seta_subsidy:,.0f}/student subsidy**
                     st.caption("House sales = core permanent revenue. CoE lease, training, and CoE sale revenue all stop after Year 4 (LLC sale).")
 
                     # Revenue mix pie chart
-                    fig_mix = go.Figure(data=[go.Pie(
-                        labels=['House Sales (core)', 'CoE Sale (Y4)', 'CoE Lease (Y1-4)', 'Training (Y1-4)'],
-                        values=[_rev_timber_10y, _rev_coe_sale_10y, _rev_lease_10y, _rev_training_10y],
-                        hole=0.5,
-                        marker=dict(colors=["#3B82F6", "#F59E0B", "#34D399", "#60A5FA"]),
-                        textinfo='percent',
-                        textposition='inside',
-                        insidetextorientation='radial',
-                    )])
-                    fig_mix.update_layout(
-                        height=350,
-                        margin=dict(l=0, r=0, t=10, b=10),
-                        showlegend=True,
-                        legend=dict(orientation="h", yanchor="bottom", y=-0.15, xanchor="center", x=0.5),
-                        annotations=[dict(text=f"\u20ac{_rev_total_10y/1e3:.0f}k<br>10-Year", x=0.5, y=0.5, font_size=14, showarrow=False)],
-                    )
-                    st.plotly_chart(fig_mix, use_container_width=True)
+                    def _build_fig_mix():
+                        fig_mix = go.Figure(data=[go.Pie(
+                            labels=['House Sales (core)', 'CoE Sale (Y4)', 'CoE Lease (Y1-4)', 'Training (Y1-4)'],
+                            values=[_rev_timber_10y, _rev_coe_sale_10y, _rev_lease_10y, _rev_training_10y],
+                            hole=0.5,
+                            marker=dict(colors=["#3B82F6", "#F59E0B", "#34D399", "#60A5FA"]),
+                            textinfo='percent',
+                            textposition='inside',
+                            insidetextorientation='radial',
+                        )])
+                        fig_mix.update_layout(
+                            height=350,
+                            margin=dict(l=0, r=0, t=10, b=10),
+                            showlegend=True,
+                            legend=dict(orientation="h", yanchor="bottom", y=-0.15, xanchor="center", x=0.5),
+                            annotations=[dict(text=f"\u20ac{_rev_total_10y/1e3:.0f}k<br>10-Year", x=0.5, y=0.5, font_size=14, showarrow=False)],
+                        )
+                        return fig_mix
+                    plot_cached("fig_mix", _build_fig_mix, fingerprint=_fig_fp, use_container_width=True)
 
             elif entity_key == "lanred":
                 _lr_scenario = _state_str("lanred_scenario", "Brownfield+")
@@ -5698,24 +5408,26 @@ Accredited training providers receive **R{_seta_subsidy:,.0f}/student subsidy**
                         _bf_r2.metric("Y1 Net Profit", f"R{_bf_ann_net[0]:,.0f}", f"\u20ac{_bf_ann_net[0]/FX_RATE:,.0f}")
                         _bf_r3.metric("10-Yr Revenue", f"R{sum(_bf_ann_rev):,.0f}", f"\u20ac{sum(_bf_ann_rev)/FX_RATE:,.0f}")
 
-                        fig_bf_rev = go.Figure()
-                        fig_bf_rev.add_trace(go.Bar(
-                            x=_bf_years_lbl, y=[r / 1e6 for r in _bf_ann_rev],
-                            name='Revenue', marker_color='#3B82F6',
-                            text=[f"R{r/1e6:.1f}M" for r in _bf_ann_rev], textposition='outside',
-                        ))
-                        fig_bf_rev.add_trace(go.Scatter(
-                            x=_bf_years_lbl, y=[n / 1e6 for n in _bf_ann_net],
-                            name='Net Profit', mode='lines+markers',
-                            line=dict(color='#10B981', width=3),
-                            marker=dict(size=8),
-                        ))
-                        fig_bf_rev.update_layout(
-                            height=320, margin=dict(l=10, r=10, t=40, b=10),
-                            yaxis_title='ZAR (millions)',
-                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-                        )
-                        st.plotly_chart(fig_bf_rev, use_container_width=True)
+                        def _build_fig_bf_rev():
+                            fig_bf_rev = go.Figure()
+                            fig_bf_rev.add_trace(go.Bar(
+                                x=_bf_years_lbl, y=[r / 1e6 for r in _bf_ann_rev],
+                                name='Revenue', marker_color='#3B82F6',
+                                text=[f"R{r/1e6:.1f}M" for r in _bf_ann_rev], textposition='outside',
+                            ))
+                            fig_bf_rev.add_trace(go.Scatter(
+                                x=_bf_years_lbl, y=[n / 1e6 for n in _bf_ann_net],
+                                name='Net Profit', mode='lines+markers',
+                                line=dict(color='#10B981', width=3),
+                                marker=dict(size=8),
+                            ))
+                            fig_bf_rev.update_layout(
+                                height=320, margin=dict(l=10, r=10, t=40, b=10),
+                                yaxis_title='ZAR (millions)',
+                                legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                            )
+                            return fig_bf_rev
+                        plot_cached("fig_bf_rev", _build_fig_bf_rev, fingerprint=_fig_fp, use_container_width=True)
 
                     # ── SECTION 3: Cost Structure ──
                     with st.container(border=True):
@@ -5731,16 +5443,18 @@ Accredited training providers receive **R{_seta_subsidy:,.0f}/student subsidy**
                         _bc3.metric("Y1 O&M", f"R{_bf_ann_om[0]:,.0f}")
                         _bc4.metric("Margin Expansion", f"{_bf_y1_margin:.0f}% \u2192 {_bf_y10_margin:.0f}%", f"+{_bf_y10_margin - _bf_y1_margin:.0f}pp over 10yr")
 
-                        fig_bf_cost = go.Figure()
-                        fig_bf_cost.add_trace(go.Bar(x=_bf_years_lbl, y=[c / 1e6 for c in _bf_ann_cogs], name='COGS', marker_color='#DC2626'))
-                        fig_bf_cost.add_trace(go.Bar(x=_bf_years_lbl, y=[i / 1e6 for i in _bf_ann_ins], name='Insurance', marker_color='#F59E0B'))
-                        fig_bf_cost.add_trace(go.Bar(x=_bf_years_lbl, y=[o / 1e6 for o in _bf_ann_om], name='O&M', marker_color='#6366F1'))
-                        fig_bf_cost.update_layout(
-                            barmode='stack', height=320, margin=dict(l=10, r=10, t=40, b=10),
-                            yaxis_title='ZAR (millions)',
-                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-                        )
-                        st.plotly_chart(fig_bf_cost, use_container_width=True)
+                        def _build_fig_bf_cost():
+                            fig_bf_cost = go.Figure()
+                            fig_bf_cost.add_trace(go.Bar(x=_bf_years_lbl, y=[c / 1e6 for c in _bf_ann_cogs], name='COGS', marker_color='#DC2626'))
+                            fig_bf_cost.add_trace(go.Bar(x=_bf_years_lbl, y=[i / 1e6 for i in _bf_ann_ins], name='Insurance', marker_color='#F59E0B'))
+                            fig_bf_cost.add_trace(go.Bar(x=_bf_years_lbl, y=[o / 1e6 for o in _bf_ann_om], name='O&M', marker_color='#6366F1'))
+                            fig_bf_cost.update_layout(
+                                barmode='stack', height=320, margin=dict(l=10, r=10, t=40, b=10),
+                                yaxis_title='ZAR (millions)',
+                                legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                            )
+                            return fig_bf_cost
+                        plot_cached("fig_bf_cost", _build_fig_bf_cost, fingerprint=_fig_fp, use_container_width=True)
 
                     # ── SECTION 4: Risk Factors ──
                     with st.container(border=True):
@@ -5774,18 +5488,20 @@ Accredited training providers receive **R{_seta_subsidy:,.0f}/student subsidy**
                         _bf_margin = _bf_10y_ebitda / _bf_10y_rev * 100 if _bf_10y_rev else 0
                         _sc3.metric("EBITDA Margin", f"{_bf_margin:.0f}%")
 
-                        fig_bf_ebitda = go.Figure()
-                        fig_bf_ebitda.add_trace(go.Bar(
-                            x=_bf_years_lbl, y=[e / 1e3 for e in _bf_ebitda],
-                            name='Brownfield+ EBITDA', marker_color='#10B981',
-                            text=[f"\u20ac{e/1e3:.0f}k" for e in _bf_ebitda], textposition='outside',
-                        ))
-                        fig_bf_ebitda.update_layout(
-                            height=320, margin=dict(l=10, r=10, t=40, b=10),
-                            yaxis_title='EBITDA (\u20ac thousands)',
-                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-                        )
-                        st.plotly_chart(fig_bf_ebitda, use_container_width=True)
+                        def _build_fig_bf_ebitda():
+                            fig_bf_ebitda = go.Figure()
+                            fig_bf_ebitda.add_trace(go.Bar(
+                                x=_bf_years_lbl, y=[e / 1e3 for e in _bf_ebitda],
+                                name='Brownfield+ EBITDA', marker_color='#10B981',
+                                text=[f"\u20ac{e/1e3:.0f}k" for e in _bf_ebitda], textposition='outside',
+                            ))
+                            fig_bf_ebitda.update_layout(
+                                height=320, margin=dict(l=10, r=10, t=40, b=10),
+                                yaxis_title='EBITDA (\u20ac thousands)',
+                                legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                            )
+                            return fig_bf_ebitda
+                        plot_cached("fig_bf_ebitda", _build_fig_bf_ebitda, fingerprint=_fig_fp, use_container_width=True)
 
                         st.markdown("""
 **Key advantages of Brownfield+:**
@@ -5875,27 +5591,29 @@ Accredited training providers receive **R{_seta_subsidy:,.0f}/student subsidy**
                         _cf_data = [a.get('capacity_factor_pct', 0) for a in _sub_annual]
                         _years_lbl = [f"Y{i+1}" for i in range(total_years())]
 
-                        fig_gen = go.Figure()
-                        fig_gen.add_trace(go.Bar(
-                            x=_years_lbl, y=[g / 1000 for g in _gen_data],
-                            name='Solar Generation (MWh)', marker_color='#F59E0B', opacity=0.8,
-                            text=[f"{g/1000:,.0f}" for g in _gen_data], textposition='outside',
-                        ))
-                        fig_gen.add_trace(go.Scatter(
-                            x=_years_lbl, y=_cf_data,
-                            name='Capacity Factor (%)', mode='lines+markers',
-                            line=dict(color='#DC2626', width=2, dash='dash'),
-                            marker=dict(size=6), yaxis='y2',
-                        ))
-                        fig_gen.update_layout(
-                            height=320,
-                            margin=dict(l=10, r=60, t=40, b=10),
-                            yaxis=dict(title='Generation (MWh)'),
-                            yaxis2=dict(title='CF (%)', overlaying='y', side='right', showgrid=False,
-                                range=[0, max(_cf_data) * 1.3] if _cf_data else [0, 30]),
-                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-                        )
-                        st.plotly_chart(fig_gen, use_container_width=True)
+                        def _build_fig_gen():
+                            fig_gen = go.Figure()
+                            fig_gen.add_trace(go.Bar(
+                                x=_years_lbl, y=[g / 1000 for g in _gen_data],
+                                name='Solar Generation (MWh)', marker_color='#F59E0B', opacity=0.8,
+                                text=[f"{g/1000:,.0f}" for g in _gen_data], textposition='outside',
+                            ))
+                            fig_gen.add_trace(go.Scatter(
+                                x=_years_lbl, y=_cf_data,
+                                name='Capacity Factor (%)', mode='lines+markers',
+                                line=dict(color='#DC2626', width=2, dash='dash'),
+                                marker=dict(size=6), yaxis='y2',
+                            ))
+                            fig_gen.update_layout(
+                                height=320,
+                                margin=dict(l=10, r=60, t=40, b=10),
+                                yaxis=dict(title='Generation (MWh)'),
+                                yaxis2=dict(title='CF (%)', overlaying='y', side='right', showgrid=False,
+                                    range=[0, max(_cf_data) * 1.3] if _cf_data else [0, 30]),
+                                legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                            )
+                            return fig_gen
+                        plot_cached("fig_gen", _build_fig_gen, fingerprint=_fig_fp, use_container_width=True)
 
                     # ============================================================
                     # SECTION 2: REVENUE — 2 streams: PPA Sales + BESS Arbitrage
@@ -5951,24 +5669,26 @@ Accredited training providers receive **R{_seta_subsidy:,.0f}/student subsidy**
                             f"PPA {_ppa_10y / max(_rev_10y, 1) * 100:.0f}% / BESS {_bess_10y / max(_rev_10y, 1) * 100:.0f}%")
 
                         # Revenue chart: PPA + BESS stacked
-                        fig_rev = go.Figure()
-                        fig_rev.add_trace(go.Bar(
-                            x=_years_lbl, y=[r / 1e3 for r in _ppa_rev],
-                            name='PPA Sales', marker_color='#3B82F6',
-                            text=[f"\u20ac{r/1e3:.0f}k" for r in _ppa_rev], textposition='inside',
-                        ))
-                        fig_rev.add_trace(go.Bar(
-                            x=_years_lbl, y=[r / 1e3 for r in _bess_rev],
-                            name='BESS Arbitrage', marker_color='#F59E0B',
-                            text=[f"\u20ac{r/1e3:.0f}k" for r in _bess_rev], textposition='inside',
-                        ))
-                        fig_rev.update_layout(
-                            barmode='stack', height=320,
-                            margin=dict(l=10, r=10, t=40, b=10),
-                            yaxis_title='Revenue (\u20ac thousands)',
-                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-                        )
-                        st.plotly_chart(fig_rev, use_container_width=True)
+                        def _build_fig_rev():
+                            fig_rev = go.Figure()
+                            fig_rev.add_trace(go.Bar(
+                                x=_years_lbl, y=[r / 1e3 for r in _ppa_rev],
+                                name='PPA Sales', marker_color='#3B82F6',
+                                text=[f"\u20ac{r/1e3:.0f}k" for r in _ppa_rev], textposition='inside',
+                            ))
+                            fig_rev.add_trace(go.Bar(
+                                x=_years_lbl, y=[r / 1e3 for r in _bess_rev],
+                                name='BESS Arbitrage', marker_color='#F59E0B',
+                                text=[f"\u20ac{r/1e3:.0f}k" for r in _bess_rev], textposition='inside',
+                            ))
+                            fig_rev.update_layout(
+                                barmode='stack', height=320,
+                                margin=dict(l=10, r=10, t=40, b=10),
+                                yaxis_title='Revenue (\u20ac thousands)',
+                                legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                            )
+                            return fig_rev
+                        plot_cached("fig_rev", _build_fig_rev, fingerprint=_fig_fp, use_container_width=True)
 
                         st.markdown(f"""
 **PPA Sales** — Electricity sold via Power Purchase Agreements:
@@ -6029,20 +5749,22 @@ Accredited training providers receive **R{_seta_subsidy:,.0f}/student subsidy**
                             _pwr_demand_mw = [h * _mw_per_house for h in _twx_demand_houses]
                             _pwr_years = [f"Y{i+1}" for i in range(len(_pwr_demand_mw))]
 
-                            fig_pwr = go.Figure()
-                            fig_pwr.add_trace(go.Bar(
-                                x=_pwr_years, y=_pwr_demand_mw,
-                                name='SC Power Demand (MW)', marker_color='#DC2626', opacity=0.7,
-                                text=[f"{v:.0f}" for v in _pwr_demand_mw], textposition='outside',
-                            ))
-                            fig_pwr.add_hline(y=_lr_installed_mwp, line_dash="dash", line_color="#10B981",
-                                annotation_text=f"LanRED Phase 1: {_lr_installed_mwp:.1f} MWp",
-                                annotation_position="top right")
-                            fig_pwr.update_layout(height=320, yaxis_title='MW',
-                                yaxis_range=[0, max(_pwr_demand_mw) * 1.15],
-                                margin=dict(l=10, r=10, t=40, b=10),
-                                legend=dict(orientation="h", yanchor="bottom", y=1.04, xanchor="center", x=0.5))
-                            st.plotly_chart(fig_pwr, use_container_width=True)
+                            def _build_fig_pwr():
+                                fig_pwr = go.Figure()
+                                fig_pwr.add_trace(go.Bar(
+                                    x=_pwr_years, y=_pwr_demand_mw,
+                                    name='SC Power Demand (MW)', marker_color='#DC2626', opacity=0.7,
+                                    text=[f"{v:.0f}" for v in _pwr_demand_mw], textposition='outside',
+                                ))
+                                fig_pwr.add_hline(y=_lr_installed_mwp, line_dash="dash", line_color="#10B981",
+                                    annotation_text=f"LanRED Phase 1: {_lr_installed_mwp:.1f} MWp",
+                                    annotation_position="top right")
+                                fig_pwr.update_layout(height=320, yaxis_title='MW',
+                                    yaxis_range=[0, max(_pwr_demand_mw) * 1.15],
+                                    margin=dict(l=10, r=10, t=40, b=10),
+                                    legend=dict(orientation="h", yanchor="bottom", y=1.04, xanchor="center", x=0.5))
+                                return fig_pwr
+                            plot_cached("fig_pwr", _build_fig_pwr, fingerprint=_fig_fp, use_container_width=True)
 
                     # ============================================================
                     # SECTION 5: 10-YEAR EBITDA SUMMARY
@@ -6100,24 +5822,26 @@ Accredited training providers receive **R{_seta_subsidy:,.0f}/student subsidy**
                             f"+{_spread:.0f}pp spread")
 
                         # Comparison chart: PV vs BESS annual revenue
-                        fig_compare = go.Figure()
-                        fig_compare.add_trace(go.Bar(
-                            x=_years_lbl, y=[r / 1e3 for r in _ppa_rev],
-                            name=f'PV (PPA) — \u20ac{_lr_pv_budget:,.0f}', marker_color='#3B82F6',
-                            text=[f"\u20ac{r/1e3:.0f}k" for r in _ppa_rev], textposition='outside',
-                        ))
-                        fig_compare.add_trace(go.Bar(
-                            x=_years_lbl, y=[r / 1e3 for r in _bess_rev],
-                            name=f'BESS (Arb) — \u20ac{_lr_bess_budget:,.0f}', marker_color='#F59E0B',
-                            text=[f"\u20ac{r/1e3:.0f}k" for r in _bess_rev], textposition='outside',
-                        ))
-                        fig_compare.update_layout(
-                            barmode='group', height=320,
-                            margin=dict(l=10, r=10, t=40, b=10),
-                            yaxis_title='Annual Revenue (\u20ac thousands)',
-                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-                        )
-                        st.plotly_chart(fig_compare, use_container_width=True)
+                        def _build_fig_compare():
+                            fig_compare = go.Figure()
+                            fig_compare.add_trace(go.Bar(
+                                x=_years_lbl, y=[r / 1e3 for r in _ppa_rev],
+                                name=f'PV (PPA) — \u20ac{_lr_pv_budget:,.0f}', marker_color='#3B82F6',
+                                text=[f"\u20ac{r/1e3:.0f}k" for r in _ppa_rev], textposition='outside',
+                            ))
+                            fig_compare.add_trace(go.Bar(
+                                x=_years_lbl, y=[r / 1e3 for r in _bess_rev],
+                                name=f'BESS (Arb) — \u20ac{_lr_bess_budget:,.0f}', marker_color='#F59E0B',
+                                text=[f"\u20ac{r/1e3:.0f}k" for r in _bess_rev], textposition='outside',
+                            ))
+                            fig_compare.update_layout(
+                                barmode='group', height=320,
+                                margin=dict(l=10, r=10, t=40, b=10),
+                                yaxis_title='Annual Revenue (\u20ac thousands)',
+                                legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                            )
+                            return fig_compare
+                        plot_cached("fig_compare", _build_fig_compare, fingerprint=_fig_fp, use_container_width=True)
 
                         st.markdown(f"""
 | Metric | PV (Solar) | BESS (Battery) |
@@ -6255,84 +5979,9 @@ split is well-balanced: BESS provides grid independence and peak shaving while P
             st.plotly_chart(fig_pnl, use_container_width=True)
 
             # --- Transposed P&L table with section headers ---
-            _pnl_cols = _years + ['Total']
-            _ncols = len(_pnl_cols)
-            # Row types: 'section' = header, 'line' = normal, 'sub' = subtotal (*), 'total' = bold (**), 'grand' = bottom line, 'spacer' = gap
-            _pnl_rows = []  # list of (label, values, row_type, key)
-
-            def _pnl_line(label, key, sign=1.0, row_type='line'):
-                vals = [sign * a.get(key, 0.0) for a in _sub_annual]
-                _pnl_rows.append((label, vals + [sum(vals)], row_type, key))
-
-            def _pnl_section(label):
-                _pnl_rows.append((label, [None] * _ncols, 'section', ''))
-
-            def _pnl_spacer():
-                _pnl_rows.append(('', [None] * _ncols, 'spacer', ''))
-
-            # REVENUE
-            _pnl_section('REVENUE')
-            if entity_key == "nwl":
-                _pnl_line('GF Sewage', 'rev_greenfield_sewage')
-                _pnl_line('BF Sewage (honeysucker)', 'rev_brownfield_sewage')
-                _pnl_line('Sewage Revenue', 'rev_sewage', row_type='sub')
-                _pnl_line('GF Re-use', 'rev_greenfield_reuse')
-                _pnl_line('Construction re-use', 'rev_construction')
-                _pnl_line('Agri-water', 'rev_agri')
-                _pnl_line('Re-use Revenue', 'rev_reuse', row_type='sub')
-            elif entity_key == "lanred":
-                if _state_str("lanred_scenario", "Brownfield+") == "Brownfield+":
-                    _pnl_line('Northlands PPA income', 'rev_total')
-                else:
-                    _pnl_line('NWL IC power sales', 'rev_ic_nwl')
-                    _pnl_line('Smart City off-take', 'rev_smart_city')
-                    _pnl_line('Open market sales', 'rev_open_market')
-                    _pnl_line('BESS TOU arbitrage', 'rev_bess_arbitrage')
-            elif entity_key == "timberworx":
-                _pnl_line('CoE Lease income', 'rev_lease')
-                _pnl_line('Training programs', 'rev_training')
-                _pnl_line('House sales (net of labor)', 'rev_timber_sales')
-                _pnl_line('CoE sale to LLC', 'rev_coe_sale')
-            _pnl_line('Operating Revenue', 'rev_operating', row_type='total')
-            if entity_key == 'nwl':
-                _pnl_line('Bulk services', 'rev_bulk_services')
-            _pnl_line('Total Revenue', 'rev_total', row_type='total')
-
-            # OPERATING COSTS (entity-specific lines)
-            _pnl_spacer()
-            _pnl_section('OPERATING COSTS')
-            _pnl_line('O&M expense', 'om_cost', -1.0)
-            if entity_key == 'nwl':
-                _pnl_line('Power / electricity', 'power_cost', -1.0)
-                _pnl_line('CoE rent (IC to TWX)', 'rent_cost', -1.0)
-            if entity_key == 'lanred' and _state_str("lanred_scenario", "Brownfield+") == "Brownfield+":
-                _pnl_line('COGS (grid purchases)', 'power_cost', -1.0)
-            _pnl_line('EBITDA', 'ebitda', row_type='total')
-            _pnl_line('Depreciation', 'depr', -1.0)
-            _pnl_line('EBIT', 'ebit', row_type='total')
-
-            # FINANCE COSTS
-            _pnl_spacer()
-            _pnl_section('FINANCE COSTS')
-            _pnl_line('Senior interest', 'ie_sr', -1.0)
-            _pnl_line('Mezz interest', 'ie_mz', -1.0)
-            if _sub_swap_active:
-                _pnl_line('Swap ZAR interest', 'cf_swap_zar_i', -1.0)
-                _pnl_line('Swap EUR interest income', 'swap_eur_interest_cash')
-            _pnl_line('Finance Costs', 'ie', -1.0, row_type='total')
-            _pnl_line('IDC capitalised (memo)', 'idc_memo', -1.0, row_type='memo')
-
-            # FINANCE INCOME
-            _pnl_spacer()
-            _pnl_section('FINANCE INCOME')
-            _pnl_line('FD Interest Income', 'ii_dsra')
-
-            # BOTTOM LINE
-            _pnl_spacer()
-            _pnl_section('BOTTOM LINE')
-            _pnl_line('Profit Before Tax', 'pbt', row_type='total')
-            _pnl_line(f'Tax ({_TAX_RATE:.0%})', 'tax', -1.0)
-            _pnl_line('Net Result', 'pat', row_type='grand')
+            # Lines from config/templates/pnl.json (engine.statements); row types:
+            # 'section' = header, 'line', 'sub' = subtotal, 'total', 'grand' = bottom line, 'memo', 'spacer'
+            _pnl_rows = _sub_statements[entity_key, "pnl"].rows(_eur_fmt)
 
             # Build and render styled HTML table with heritage tooltips.
             # inject_pnl_heritage() renders via st.html() internally --
@@ -6340,6 +5989,7 @@ split is well-balanced: BESS provides grid independence and peak shaving while P
             inject_pnl_heritage(
                 _pnl_rows, _sub_annual, len(_years), _eur_fmt,
                 year_labels=_years,
+                entity=entity_key, statement="pnl",
             )
 
             # ── AUDIT: P&L (engine-computed) ──
@@ -6428,112 +6078,116 @@ split is well-balanced: BESS provides grid independence and peak shaving while P
             # CHART 2: Comprehensive Cash Flow (all flows)
             # ======================================================
             st.subheader("2. Comprehensive Cash Flow")
-            fig_ccf = go.Figure()
-            # Inflows: Equity + Drawdowns + Grants + Revenue (stacked, left)
-            fig_ccf.add_trace(go.Bar(
-                x=_years, y=[a.get('cf_equity', 0) for a in _sub_annual],
-                name='Equity Injection', marker_color='#0D9488',
-                offsetgroup='in', legendgroup='Inflows'
-            ))
-            fig_ccf.add_trace(go.Bar(
-                x=_years, y=[a.get('cf_draw', 0) for a in _sub_annual],
-                name='IC Loan Drawdowns', marker_color='#2563EB',
-                offsetgroup='in', legendgroup='Inflows'
-            ))
-            fig_ccf.add_trace(go.Bar(
-                x=_years, y=[a.get('cf_grants', 0) for a in _sub_annual],
-                name='Grants & Subsidies', marker_color='#8B5CF6',
-                offsetgroup='in', legendgroup='Inflows'
-            ))
-            fig_ccf.add_trace(go.Bar(
-                x=_years, y=[a.get('rev_bulk_services', 0) for a in _sub_annual],
-                name='Bulk Services Revenue', marker_color='#047857',
-                offsetgroup='in', legendgroup='Inflows'
-            ))
-            fig_ccf.add_trace(go.Bar(
-                x=_years, y=[a.get('rev_operating', 0) for a in _sub_annual],
-                name='Operating Revenue', marker_color='#10B981',
-                offsetgroup='in', legendgroup='Inflows'
-            ))
-            # Outflows: Capex + Grant Prepayment (M12) + Opex + Tax + Debt Service (stacked, right)
-            fig_ccf.add_trace(go.Bar(
-                x=_years, y=[a.get('cf_capex', 0) for a in _sub_annual],
-                name='Capital Expenditure', marker_color='#1E3A5F',
-                offsetgroup='out', legendgroup='Outflows'
-            ))
-            fig_ccf.add_trace(go.Bar(
-                x=_years, y=[a.get('cf_grant_accel', a.get('cf_prepay', 0)) for a in _sub_annual],
-                name='Grant Prepayment (M12)', marker_color='#7C3AED',
-                offsetgroup='out', legendgroup='Outflows'
-            ))
-            fig_ccf.add_trace(go.Bar(
-                x=_years, y=[a.get('om_cost', 0) + a.get('power_cost', 0) + a.get('rent_cost', 0) for a in _sub_annual],
-                name='Operating Costs', marker_color='#F59E0B',
-                offsetgroup='out', legendgroup='Outflows'
-            ))
-            fig_ccf.add_trace(go.Bar(
-                x=_years, y=[a.get('cf_tax', 0) for a in _sub_annual],
-                name='Tax', marker_color='#78716C',
-                offsetgroup='out', legendgroup='Outflows'
-            ))
-            fig_ccf.add_trace(go.Bar(
-                x=_years, y=[a.get('cf_ie', 0) for a in _sub_annual],
-                name='Interest Payments', marker_color='#EF4444',
-                offsetgroup='out', legendgroup='Outflows'
-            ))
-            fig_ccf.add_trace(go.Bar(
-                x=_years, y=[a.get('cf_pr', 0) for a in _sub_annual],
-                name='Principal Repayments', marker_color='#6366F1',
-                offsetgroup='out', legendgroup='Outflows'
-            ))
-            # FD balances shown in dedicated chart below
-            fig_ccf.update_layout(
-                barmode='stack', height=420,
-                margin=dict(l=10, r=10, t=40, b=10),
-                xaxis=dict(dtick=1), yaxis_title='EUR',
-                legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5)
-            )
-            st.plotly_chart(fig_ccf, use_container_width=True)
+            def _build_fig_ccf():
+                fig_ccf = go.Figure()
+                # Inflows: Equity + Drawdowns + Grants + Revenue (stacked, left)
+                fig_ccf.add_trace(go.Bar(
+                    x=_years, y=[a.get('cf_equity', 0) for a in _sub_annual],
+                    name='Equity Injection', marker_color='#0D9488',
+                    offsetgroup='in', legendgroup='Inflows'
+                ))
+                fig_ccf.add_trace(go.Bar(
+                    x=_years, y=[a.get('cf_draw', 0) for a in _sub_annual],
+                    name='IC Loan Drawdowns', marker_color='#2563EB',
+                    offsetgroup='in', legendgroup='Inflows'
+                ))
+                fig_ccf.add_trace(go.Bar(
+                    x=_years, y=[a.get('cf_grants', 0) for a in _sub_annual],
+                    name='Grants & Subsidies', marker_color='#8B5CF6',
+                    offsetgroup='in', legendgroup='Inflows'
+                ))
+                fig_ccf.add_trace(go.Bar(
+                    x=_years, y=[a.get('rev_bulk_services', 0) for a in _sub_annual],
+                    name='Bulk Services Revenue', marker_color='#047857',
+                    offsetgroup='in', legendgroup='Inflows'
+                ))
+                fig_ccf.add_trace(go.Bar(
+                    x=_years, y=[a.get('rev_operating', 0) for a in _sub_annual],
+                    name='Operating Revenue', marker_color='#10B981',
+                    offsetgroup='in', legendgroup='Inflows'
+                ))
+                # Outflows: Capex + Grant Prepayment (M12) + Opex + Tax + Debt Service (stacked, right)
+                fig_ccf.add_trace(go.Bar(
+                    x=_years, y=[a.get('cf_capex', 0) for a in _sub_annual],
+                    name='Capital Expenditure', marker_color='#1E3A5F',
+                    offsetgroup='out', legendgroup='Outflows'
+                ))
+                fig_ccf.add_trace(go.Bar(
+                    x=_years, y=[a.get('cf_grant_accel', a.get('cf_prepay', 0)) for a in _sub_annual],
+                    name='Grant Prepayment (M12)', marker_color='#7C3AED',
+                    offsetgroup='out', legendgroup='Outflows'
+                ))
+                fig_ccf.add_trace(go.Bar(
+                    x=_years, y=[a.get('om_cost', 0) + a.get('power_cost', 0) + a.get('rent_cost', 0) for a in _sub_annual],
+                    name='Operating Costs', marker_color='#F59E0B',
+                    offsetgroup='out', legendgroup='Outflows'
+                ))
+                fig_ccf.add_trace(go.Bar(
+                    x=_years, y=[a.get('cf_tax', 0) for a in _sub_annual],
+                    name='Tax', marker_color='#78716C',
+                    offsetgroup='out', legendgroup='Outflows'
+                ))
+                fig_ccf.add_trace(go.Bar(
+                    x=_years, y=[a.get('cf_ie', 0) for a in _sub_annual],
+                    name='Interest Payments', marker_color='#EF4444',
+                    offsetgroup='out', legendgroup='Outflows'
+                ))
+                fig_ccf.add_trace(go.Bar(
+                    x=_years, y=[a.get('cf_pr', 0) for a in _sub_annual],
+                    name='Principal Repayments', marker_color='#6366F1',
+                    offsetgroup='out', legendgroup='Outflows'
+                ))
+                # FD balances shown in dedicated chart below
+                fig_ccf.update_layout(
+                    barmode='stack', height=420,
+                    margin=dict(l=10, r=10, t=40, b=10),
+                    xaxis=dict(dtick=1), yaxis_title='EUR',
+                    legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5)
+                )
+                return fig_ccf
+            plot_cached("fig_ccf", _build_fig_ccf, fingerprint=_fig_fp, use_container_width=True)
             st.caption("Left bars = sources of cash (drawdowns, revenue, grants). Right bars = uses of cash (capex, opex, debt service).")
 
             # ======================================================
             # CHART 3: Fixed Deposit — Balance & Interest
             # ======================================================
             st.subheader("3. Fixed Deposits (4 Buckets)")
-            fig_dsra = go.Figure()
-            # Stacked bars: 4 reserve buckets
-            fig_dsra.add_trace(go.Bar(
-                x=_years, y=[a.get('bs_ops_reserve', 0) for a in _sub_annual],
-                name='Ops Reserve', marker_color='#3B82F6'
-            ))
-            fig_dsra.add_trace(go.Bar(
-                x=_years, y=[a.get('bs_opco_dsra', 0) for a in _sub_annual],
-                name='OpCo DSRA', marker_color='#8B5CF6'
-            ))
-            fig_dsra.add_trace(go.Bar(
-                x=_years, y=[a.get('bs_mz_div_fd', 0) for a in _sub_annual],
-                name='Mezz Dividend FD', marker_color='#F59E0B'
-            ))
-            fig_dsra.add_trace(go.Bar(
-                x=_years, y=[a.get('bs_entity_fd', 0) for a in _sub_annual],
-                name='Surplus Cash FD', marker_color='#10B981'
-            ))
-            # Total line overlay — sum of 4 reserve buckets from waterfall
-            fig_dsra.add_trace(go.Scatter(
-                x=_years, y=[a.get('bs_ops_reserve', 0) + a.get('bs_opco_dsra', 0) + a.get('bs_mz_div_fd', 0) + a.get('bs_entity_fd', 0) for a in _sub_annual],
-                name='Total FD Balance', mode='lines+markers',
-                line=dict(color='#1E293B', width=2.5, dash='dot'),
-                marker=dict(size=7, color='#1E293B')
-            ))
-            fig_dsra.update_layout(
-                barmode='stack',
-                height=380,
-                margin=dict(l=10, r=10, t=40, b=10),
-                xaxis=dict(dtick=1),
-                yaxis=dict(title='FD Balance (EUR)'),
-                legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-            )
-            st.plotly_chart(fig_dsra, use_container_width=True)
+            def _build_fig_dsra():
+                fig_dsra = go.Figure()
+                # Stacked bars: 4 reserve buckets
+                fig_dsra.add_trace(go.Bar(
+                    x=_years, y=[a.get('bs_ops_reserve', 0) for a in _sub_annual],
+                    name='Ops Reserve', marker_color='#3B82F6'
+                ))
+                fig_dsra.add_trace(go.Bar(
+                    x=_years, y=[a.get('bs_opco_dsra', 0) for a in _sub_annual],
+                    name='OpCo DSRA', marker_color='#8B5CF6'
+                ))
+                fig_dsra.add_trace(go.Bar(
+                    x=_years, y=[a.get('bs_mz_div_fd', 0) for a in _sub_annual],
+                    name='Mezz Dividend FD', marker_color='#F59E0B'
+                ))
+                fig_dsra.add_trace(go.Bar(
+                    x=_years, y=[a.get('bs_entity_fd', 0) for a in _sub_annual],
+                    name='Surplus Cash FD', marker_color='#10B981'
+                ))
+                # Total line overlay — sum of 4 reserve buckets from waterfall
+                fig_dsra.add_trace(go.Scatter(
+                    x=_years, y=[a.get('bs_ops_reserve', 0) + a.get('bs_opco_dsra', 0) + a.get('bs_mz_div_fd', 0) + a.get('bs_entity_fd', 0) for a in _sub_annual],
+                    name='Total FD Balance', mode='lines+markers',
+                    line=dict(color='#1E293B', width=2.5, dash='dot'),
+                    marker=dict(size=7, color='#1E293B')
+                ))
+                fig_dsra.update_layout(
+                    barmode='stack',
+                    height=380,
+                    margin=dict(l=10, r=10, t=40, b=10),
+                    xaxis=dict(dtick=1),
+                    yaxis=dict(title='FD Balance (EUR)'),
+                    legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                )
+                return fig_dsra
+            plot_cached("fig_dsra", _build_fig_dsra, fingerprint=_fig_fp, use_container_width=True)
             st.caption("Fixed Deposits: Ops Reserve + OpCo DSRA + Mezz Dividend FD + Surplus Cash FD. Dotted line = total.")
 
             st.divider()
@@ -6542,138 +6196,14 @@ split is well-balanced: BESS provides grid independence and peak shaving while P
             # CASH FLOW TABLE — Full lifecycle
             # ======================================================
             st.subheader("Cash Flow Statement")
-            _cf_cols = _years + ['Total']
-            _ncols_cf = len(_cf_cols)
-            _cf_rows = []
-
-            def _cf_line(label, key, sign=1.0, row_type='line', point_in_time=False):
-                vals = [sign * a.get(key, 0.0) for a in _sub_annual]
-                total = vals[-1] if point_in_time else sum(vals)
-                _cf_rows.append((label, vals + [total], row_type, key))
-
-            def _cf_computed(label, vals_list, row_type='line'):
-                _cf_rows.append((label, vals_list + [sum(vals_list)], row_type, ''))
-
-            def _cf_section(label):
-                _cf_rows.append((label, [None] * _ncols_cf, 'section', ''))
-
-            def _cf_spacer():
-                _cf_rows.append(('', [None] * _ncols_cf, 'spacer', ''))
-
-            # --- OPERATING CASH FLOW ---
-            _cf_section('OPERATING CASH FLOW')
-            _cf_line('EBITDA', 'ebitda')
-            _cf_line('FD Interest Income', 'ii_dsra')
-            _cf_line('Tax', 'cf_tax', -1.0)
-            _cf_line('Cash from Operations', 'cf_ops', row_type='total')
-            _cf_spacer()
-
-            # --- CONSTRUCTION ---
-            _cf_section('CONSTRUCTION')
-            _cf_line('IC Loan Drawdowns', 'cf_draw')
-            _cf_line('Capital Expenditure', 'cf_capex', -1.0)
-            _cf_computed('Net Construction',
-                         [a.get('cf_draw', 0) - a.get('cf_capex', 0) for a in _sub_annual], row_type='sub')
-            _cf_spacer()
-
-            # --- GRANTS & EQUITY ---
-            _cf_section('GRANTS & EQUITY')
-            _cf_line('Shareholder Equity', 'cf_equity')
-            _cf_line('DTIC Grant', 'cf_grant_dtic')
-            _cf_line('IIC Technical Assistance', 'cf_grant_iic')
-            _cf_line('Total Grants', 'cf_grants', row_type='sub')
-            _cf_spacer()
-
-            # --- GRANT PREPAYMENT (one-off at M12, not ongoing waterfall acceleration) ---
-            _cf_section('GRANT PREPAYMENT (one-off, M12)')
-            _cf_line('DTIC Grant Prepayment', 'cf_prepay_dtic', -1.0)
-            _cf_line('Bulk Services (GEPF) Prepayment', 'cf_prepay_gepf', -1.0)
-            _cf_line('Total Grant Prepayment', 'cf_prepay', -1.0, row_type='sub')
-            _cf_computed('Net Grants & Equity',
-                         [a.get('cf_equity', 0) + a.get('cf_grants', 0) - a.get('cf_grant_accel', a.get('cf_prepay', 0)) for a in _sub_annual], row_type='sub')
-            _cf_spacer()
-
-            # --- DEBT SERVICE ---
-            _cf_section('DEBT SERVICE')
-            _cf_line('Senior interest', 'cf_ie_sr', -1.0)
-            _cf_line('Mezz interest', 'cf_ie_mz', -1.0)
-            _cf_line('Total Interest', 'cf_ie', -1.0, row_type='sub')
-            _cf_line('Senior principal', 'cf_pr_sr', -1.0)
-            _cf_line('Mezz principal', 'cf_pr_mz', -1.0)
-            _cf_line('Total Principal', 'cf_pr', -1.0, row_type='sub')
-            _cf_line('Total Debt Service', 'cf_ds', -1.0, row_type='total')
-            _cf_spacer()
-
-            # --- SWAP HEDGE (only when swap active) ---
-            if _sub_swap_active:
-                _cf_section('SWAP HEDGE')
-                _cf_line('Swap ZAR Interest', 'cf_swap_zar_i', -1.0)
-                _cf_line('Swap ZAR Principal', 'cf_swap_zar_p', -1.0)
-                _cf_line('Total Swap Payment', 'cf_swap_zar', -1.0, row_type='total')
-                _cf_spacer()
-
-            # --- NET CASH FLOW ---
-            # cf_after_debt_service = EBITDA - debt service (- swap if active): surplus available for waterfall allocation
-            # cf_net = final cash flow after all waterfall allocations (reserves, acceleration, entity FD)
-            _cf_section('NET CASH FLOW')
-            _cf_line('Free CF (Ops − DS − Swap)', 'cf_after_debt_service', row_type='total') if _sub_swap_active else _cf_line('Free CF (Ops − DS)', 'cf_after_debt_service', row_type='total')
-            _cf_line('Dividends paid', 'cf_dividend', -1.0)
-            _cf_line('Period Cash Flow', 'cf_net', row_type='total')
-            _cf_spacer()
-
-            # --- SURPLUS ALLOCATION (waterfall) or FIXED DEPOSIT (pre-waterfall) ---
-            _has_wf_cf = any(a.get('cf_ops_reserve_fill', 0) > 0.01
-                             or a.get('cf_entity_fd_fill', 0) > 0.01
-                             or a.get('cf_sr_accel', 0) > 0.01
-                             for a in _sub_annual)
-            if _has_wf_cf:
-                _cf_section('SURPLUS ALLOCATION (Waterfall)')
-                _cf_line('Ops Reserve Fill', 'cf_ops_reserve_fill', -1.0)
-                _cf_line('OpCo DSRA Fill', 'cf_opco_dsra_fill', -1.0)
-                _cf_line('DSRA Release', 'cf_opco_dsra_release')
-                _cf_line('Mezz Div FD Fill', 'cf_mz_div_fd_fill', -1.0)
-                _cf_line('OD → LanRED', 'cf_od_lent', -1.0)
-                _cf_spacer()
-                _cf_section('ACCELERATION')
-                _cf_line('Mezz IC Accel', 'cf_mz_accel', -1.0)
-                _cf_line('ZAR Rand Accel', 'cf_zar_accel', -1.0)
-                _cf_line('Sr IC Accel', 'cf_sr_accel', -1.0)
-                _cf_spacer()
-                _cf_section('ENTITY RESERVES')
-                _cf_line('Entity FD Fill', 'cf_entity_fd_fill', -1.0)
-                _cf_line('Unallocated', 'cf_free_surplus')
-                _cf_spacer()
-                _cf_section('RESERVE BALANCES')
-                _cf_line('Ops Reserve FD', 'bs_ops_reserve', point_in_time=True)
-                _cf_line('OpCo DSRA', 'bs_opco_dsra', point_in_time=True)
-                _cf_line('Mezz Div FD', 'bs_mz_div_fd', point_in_time=True)
-                _cf_line('Entity FD', 'bs_entity_fd', point_in_time=True)
-                _cf_line('Total Reserves', 'bs_reserves_total', row_type='grand', point_in_time=True)
-            else:
-                _cf_section('FIXED DEPOSIT')
-                _cf_line('Opening Balance', 'dsra_opening', point_in_time=True)
-                _cf_line('Deposit (Net CF)', 'dsra_deposit')
-                _cf_line('Interest Earned (9%)', 'dsra_interest')
-                _cf_line('Closing Balance', 'dsra_bal', row_type='grand', point_in_time=True)
-            _cf_spacer()
-
-            # --- COVERAGE ---
-            _cf_section('COVERAGE')
-            dscr_display = []
-            for a in _sub_annual:
-                _total_ds_swap = a['cf_ds'] + a.get('cf_swap_zar', 0)
-                if _total_ds_swap > 0:
-                    dscr_display.append(f"{a['cf_ops'] / _total_ds_swap:.2f}x")
-                else:
-                    dscr_display.append('n/a')
-            avg_dscr_str = f"{avg_dscr:.2f}x" if dscr_valid else 'n/a'
-            _dscr_label = 'DSCR (Ops CF / (DS + Swap))' if _sub_swap_active else 'DSCR (Ops CF / Debt Service)'
-            _cf_rows.append((_dscr_label, dscr_display + [avg_dscr_str], 'line', ''))
+            # Lines (incl. swap / waterfall sections and DSCR) from config/templates/cf.json
+            _cf_rows = _sub_statements[entity_key, "cf"].rows(_eur_fmt)
 
             # Build and render styled HTML table with heritage tooltips.
             inject_pnl_heritage(
                 _cf_rows, _sub_annual, len(_years), _eur_fmt,
                 year_labels=_years,
+                entity=entity_key, statement="cf",
             )
 
             # ── AUDIT: Cash Flow (engine-computed) ──
@@ -6864,8 +6394,43 @@ NWL benefits from **two grant-funded accelerations** that reduce Senior IC expos
                         if "nwl_swap_notional" not in st.session_state:
                             st.session_state["nwl_swap_notional"] = _slider_min
 
+                        def _on_optimise_swap_notional():
+                            from engine.optimise import optimise_nwl_swap_notional
+                            _opt = optimise_nwl_swap_notional(
+                                ModelConfig.load(),
+                                ScenarioInputs.from_session_state(dict(st.session_state)),
+                                objective=st.session_state.get("_nwl_swap_opt_objective", "min_dscr"),
+                                rerun_full_model=False,
+                            )
+                            st.session_state["nwl_swap_notional"] = max(_slider_min, min(_slider_max, int(round(_opt.value))))
+                            st.session_state["_nwl_swap_opt_result"] = (_opt.objective, _opt.value, _opt.score)
+
                         with st.container(border=True):
                             st.markdown("**Swap Notional** — Adjust between 2×(P+I) SCLCA loan M24 and Local Content ceiling")
+                            _no1, _no2, _no3 = st.columns([2, 1, 3])
+                            with _no1:
+                                st.selectbox(
+                                    "Optimise for",
+                                    ["min_dscr", "swap_cost", "sclca_net_interest"],
+                                    format_func={
+                                        "min_dscr": "NWL minimum DSCR",
+                                        "swap_cost": "Lowest swap cost",
+                                        "sclca_net_interest": "SCLCA net interest",
+                                    }.get,
+                                    key="_nwl_swap_opt_objective",
+                                )
+                            with _no2:
+                                st.button("Optimise notional", key="_nwl_swap_opt_btn",
+                                          on_click=_on_optimise_swap_notional)
+                            with _no3:
+                                _no_res = st.session_state.get("_nwl_swap_opt_result")
+                                if _no_res:
+                                    _no_fmt = {
+                                        "min_dscr": f"{_no_res[2]:.2f}x",
+                                        "swap_cost": f"€{-_no_res[2]:,.0f} cost",
+                                        "sclca_net_interest": f"€{_no_res[2]:,.0f} NI",
+                                    }[_no_res[0]]
+                                    st.caption(f"Optimum: **€{_no_res[1]:,.0f}** → {_no_fmt}")
                             _nc1, _nc2, _nc3 = st.columns([3, 1, 1])
                             with _nc1:
                                 _selected_notional = st.slider(
@@ -6981,20 +6546,22 @@ NWL benefits from **two grant-funded accelerations** that reduce Senior IC expos
                             _eur_vals = [_eur_pi_map.get(_m, 0) for _m in _all_months]
                             _eur_colors_list = [_eur_rd if v < -0.01 else _eur_gn if v > 0.01 else "rgba(0,0,0,0)" for v in _eur_vals]
                             _eur_texts = [f"€{abs(v):,.0f}" if abs(v) > 0.01 else "" for v in _eur_vals]
-                            _fig_eur = go.Figure(go.Bar(
-                                x=_eur_labels, y=_eur_vals,
-                                marker_color=_eur_colors_list,
-                                text=_eur_texts,
-                                textposition="outside", textfont=dict(size=8, color=_sw_txt_clr),
-                            ))
-                            _fig_eur.update_layout(
-                                height=220, margin=dict(l=10, r=10, t=30, b=30),
-                                yaxis=dict(title="EUR", zeroline=True, zerolinecolor="#94A3B8", zerolinewidth=2, showgrid=False),
-                                xaxis=dict(showgrid=False, tickangle=-45, dtick=1),
-                                plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
-                                title=dict(text="EUR Leg Cash Flows", font=dict(size=11)),
-                            )
-                            st.plotly_chart(_fig_eur, use_container_width=True, key="eur_leg_timeline")
+                            def _build_fig_eur():
+                                _fig_eur = go.Figure(go.Bar(
+                                    x=_eur_labels, y=_eur_vals,
+                                    marker_color=_eur_colors_list,
+                                    text=_eur_texts,
+                                    textposition="outside", textfont=dict(size=8, color=_sw_txt_clr),
+                                ))
+                                _fig_eur.update_layout(
+                                    height=220, margin=dict(l=10, r=10, t=30, b=30),
+                                    yaxis=dict(title="EUR", zeroline=True, zerolinecolor="#94A3B8", zerolinewidth=2, showgrid=False),
+                                    xaxis=dict(showgrid=False, tickangle=-45, dtick=1),
+                                    plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
+                                    title=dict(text="EUR Leg Cash Flows", font=dict(size=11)),
+                                )
+                                return _fig_eur
+                            plot_cached("fig_eur", _build_fig_eur, fingerprint=_fig_fp, use_container_width=True, key="eur_leg_timeline")
 
                             # ZAR Leg — full M0-M102 timeline (all months, zeros shown empty)
                             st.markdown("**ZAR Leg (Liability)**")
@@ -7004,20 +6571,22 @@ NWL benefits from **two grant-funded accelerations** that reduce Senior IC expos
                             _zar_vals_list = [_zar_pi_map.get(_m, 0) for _m in _all_months]
                             _zar_colors_list = [_zar_rd if v < -0.01 else _zar_gn if v > 0.01 else "rgba(0,0,0,0)" for v in _zar_vals_list]
                             _zar_texts = [f"R{abs(v):,.0f}" if abs(v) > 0.01 else "" for v in _zar_vals_list]
-                            _fig_zar = go.Figure(go.Bar(
-                                x=_zar_labels, y=_zar_vals_list,
-                                marker_color=_zar_colors_list,
-                                text=_zar_texts,
-                                textposition="outside", textfont=dict(size=7, color=_sw_txt_clr),
-                            ))
-                            _fig_zar.update_layout(
-                                height=220, margin=dict(l=10, r=10, t=30, b=30),
-                                yaxis=dict(title="ZAR", zeroline=True, zerolinecolor="#94A3B8", zerolinewidth=2, showgrid=False),
-                                xaxis=dict(showgrid=False, tickangle=-45, dtick=1),
-                                plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
-                                title=dict(text="ZAR Leg Cash Flows", font=dict(size=11)),
-                            )
-                            st.plotly_chart(_fig_zar, use_container_width=True, key="zar_leg_timeline")
+                            def _build_fig_zar():
+                                _fig_zar = go.Figure(go.Bar(
+                                    x=_zar_labels, y=_zar_vals_list,
+                                    marker_color=_zar_colors_list,
+                                    text=_zar_texts,
+                                    textposition="outside", textfont=dict(size=7, color=_sw_txt_clr),
+                                ))
+                                _fig_zar.update_layout(
+                                    height=220, margin=dict(l=10, r=10, t=30, b=30),
+                                    yaxis=dict(title="ZAR", zeroline=True, zerolinecolor="#94A3B8", zerolinewidth=2, showgrid=False),
+                                    xaxis=dict(showgrid=False, tickangle=-45, dtick=1),
+                                    plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
+                                    title=dict(text="ZAR Leg Cash Flows", font=dict(size=11)),
+                                )
+                                return _fig_zar
+                            plot_cached("fig_zar", _build_fig_zar, fingerprint=_fig_fp, use_container_width=True, key="zar_leg_timeline")
 
                             st.markdown(f"**Cost**: {_ZAR_SWAP_RATE:.2%} — below Mezz effective cost ({_CC_IRR_TARGET:.0%}: {_CC_CONTRACTUAL:.2%} CC rate + {_CC_DIV_GAP:.2%} dividend accrual), no dividend obligation. "
                                         "Paid contractually on schedule, or accelerated from NWL surplus.")
@@ -7418,32 +6987,34 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) →
                 _lr_mz_closing      = [_ent_wf[yi].get('mz_ic_bal', 0) for yi in range(total_years())]
                 _lr_div_years       = [f"Y{yi+1}" for yi in range(total_years())]
 
-                _lr_fig_div = go.Figure()
-                _lr_fig_div.add_trace(go.Scatter(
-                    x=_lr_div_years, y=_lr_mz_closing,
-                    mode='lines+markers', name='Mezz IC Balance',
-                    line=dict(color='#7C3AED', width=2)))
-                _lr_fig_div.add_trace(go.Bar(
-                    x=_lr_div_years, y=_lr_mz_div_accruals,
-                    name=f'Dividend Accrual ({_lr_cc_gap:.2%})',
-                    marker_color='#F59E0B', opacity=0.7))
-                _lr_fig_div.add_trace(go.Scatter(
-                    x=_lr_div_years, y=_lr_mz_div_liab,
-                    mode='lines+markers', name='Liability (cum)',
-                    line=dict(color='#EF4444', width=2, dash='dot')))
-                _lr_fig_div.add_trace(go.Scatter(
-                    x=_lr_div_years, y=_lr_mz_div_fd,
-                    mode='lines+markers', name='FD Balance',
-                    line=dict(color='#059669', width=2, dash='dash')))
-                _lr_fig_div.update_layout(
-                    height=320, barmode='overlay',
-                    title='Mezz Dividend Reserve — LanRED',
-                    yaxis=dict(title='EUR', showgrid=True, gridcolor='#E2E8F0'),
-                    xaxis=dict(showgrid=False),
-                    plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                    legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
-                )
-                st.plotly_chart(_lr_fig_div, use_container_width=True, key='lr_mz_div_graph')
+                def _build_lr_fig_div():
+                    _lr_fig_div = go.Figure()
+                    _lr_fig_div.add_trace(go.Scatter(
+                        x=_lr_div_years, y=_lr_mz_closing,
+                        mode='lines+markers', name='Mezz IC Balance',
+                        line=dict(color='#7C3AED', width=2)))
+                    _lr_fig_div.add_trace(go.Bar(
+                        x=_lr_div_years, y=_lr_mz_div_accruals,
+                        name=f'Dividend Accrual ({_lr_cc_gap:.2%})',
+                        marker_color='#F59E0B', opacity=0.7))
+                    _lr_fig_div.add_trace(go.Scatter(
+                        x=_lr_div_years, y=_lr_mz_div_liab,
+                        mode='lines+markers', name='Liability (cum)',
+                        line=dict(color='#EF4444', width=2, dash='dot')))
+                    _lr_fig_div.add_trace(go.Scatter(
+                        x=_lr_div_years, y=_lr_mz_div_fd,
+                        mode='lines+markers', name='FD Balance',
+                        line=dict(color='#059669', width=2, dash='dash')))
+                    _lr_fig_div.update_layout(
+                        height=320, barmode='overlay',
+                        title='Mezz Dividend Reserve — LanRED',
+                        yaxis=dict(title='EUR', showgrid=True, gridcolor='#E2E8F0'),
+                        xaxis=dict(showgrid=False),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
+                    )
+                    return _lr_fig_div
+                plot_cached("lr_fig_div", _build_lr_fig_div, fingerprint=_fig_fp, use_container_width=True, key='lr_mz_div_graph')
 
                 with st.expander("LanRED Mezz Dividend Reserve Detail", expanded=False):
                     _lr_mz_openings = [_lr_mz_closing[yi-1] if yi > 0 else
@@ -7622,44 +7193,11 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
             st.divider()
 
             # --- Styled BS table (point-in-time; Total = Y10 balance) ---
-            _bs_cols = _years + ['Total']
-            _ncols_bs = len(_bs_cols)
-            _bs_rows = []
-
-            def _bs_line(label, key, sign=1.0, row_type='line'):
-                vals = [sign * a.get(key, 0.0) for a in _sub_annual]
-                _bs_rows.append((label, vals + [vals[-1]], row_type, key))
-
-            def _bs_section(label):
-                _bs_rows.append((label, [None] * _ncols_bs, 'section', ''))
-
-            def _bs_spacer():
-                _bs_rows.append(('', [None] * _ncols_bs, 'spacer', ''))
-
-            # --- BS is a LISTENER: reads pre-computed values from annual model ---
-            _bs_section('OPERATING ASSETS')
-            _bs_line('Fixed Assets (Net)', 'bs_fixed_assets')
-            _bs_line('Total Operating Assets', 'bs_fixed_assets', row_type='total')
+            # BS is a LISTENER: lines from config/templates/bs.json read the annual model.
+            # Total Reserves & FD uses bs_dsra (CF accumulator) to keep A = D + E;
+            # bs_reserves_total (sum of the 4 FD buckets) is used in charts only.
+            _bs_rows = _sub_statements[entity_key, "bs"].rows(_eur_fmt)
             st.caption("Fixed assets include capitalised interest during construction (IDC) per IAS 23.")
-
-            if _sub_swap_active:
-                _bs_spacer()
-                _bs_section('SWAP EUR LEG (Asset)')
-                _bs_line('Currency Swap: EUR Leg', 'bs_swap_eur')
-
-            _bs_spacer()
-            _bs_section('RESERVES & FIXED DEPOSITS')
-            _bs_line('Ops Reserve FD', 'bs_ops_reserve')
-            _bs_line('OpCo DSRA', 'bs_opco_dsra')
-            _bs_line('Mezz Div Reserve FD', 'bs_mz_div_fd')
-            _bs_line('Entity FD', 'bs_entity_fd')
-            # Show catch-all DSRA only when no structured reserves (non-NWL entities)
-            _has_reserves = any(a.get('bs_reserves_total', 0) > 0.01 for a in _sub_annual)
-            if not _has_reserves:
-                _bs_line('DSRA FD', 'bs_dsra')
-            # BS total uses bs_dsra (CF accumulator) to maintain A = D + E identity;
-            # bs_reserves_total (sum of 4 FD buckets) is used in charts only.
-            _bs_line('Total Reserves & FD', 'bs_dsra', row_type='total')
             with st.expander("Reserve bucket definitions", expanded=False):
                 st.markdown(
                     "**Ops Reserve** -- Operating reserve funded from waterfall surplus (1x semi-annual opex).  \n"
@@ -7667,36 +7205,14 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
                     "**Mezz Div Reserve FD** -- Accumulates to fund semi-annual Mezzanine dividend payout.  \n"
                     "**Entity FD** -- General entity savings after all obligations are met."
                 )
-
-            _bs_spacer()
-            _bs_line('Total Assets', 'bs_assets', row_type='grand')
-
-            _bs_spacer()
-            _bs_section('LIABILITIES')
-            _bs_line('Senior IC Loan', 'bs_sr')
-            _bs_line('Mezz IC Loan', 'bs_mz')
-            if _sub_swap_active:
-                _bs_line('Currency Swap: ZAR Leg', 'bs_swap_zar')
-            _bs_line('Total Debt', 'bs_debt', row_type='total')
-
-            _bs_spacer()
-            _bs_section('EQUITY')
-            _bs_line('Shareholder Equity', 'bs_equity_sh')
-            _bs_line('Retained Earnings', 'bs_retained')
-            _bs_line('Total Equity', 'bs_equity', row_type='total')
             st.caption("Equity may appear negative in Y1-Y2 due to S12C depreciation claiming tax losses before revenue commences. This is normal and resolves once operations begin.")
-
-            _bs_spacer()
-            _bs_section('CHECK')
-            check_vals = [a['bs_assets'] - (a['bs_debt'] + a['bs_equity']) for a in _sub_annual]
-            check_display = [f"{'OK' if abs(v) < 0.01 else _eur_fmt.format(v)}" for v in check_vals]
-            _bs_rows.append(('Assets = Debt + Equity', check_display + [check_display[-1]], 'grand', ''))
             # RE vs CumPAT check removed from UI — engine proofs handle this internally
 
             # Build and render styled HTML table with heritage tooltips.
             inject_pnl_heritage(
                 _bs_rows, _sub_annual, len(_years), _eur_fmt,
                 year_labels=_years,
+                entity=entity_key, statement="bs",
             )
 
             # BS chart — Asset breakdown (stacked) vs Debt + Equity
@@ -7740,40 +7256,42 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
 
             # Chart 2: Cash Reserves (DSRA + Ops Reserve + OpCo DSRA + Entity FD)
             st.subheader("2. Cash Reserves & Fixed Deposits")
-            fig_bs_dsra = go.Figure()
-            # Stacked bars: individual reserve buckets
-            fig_bs_dsra.add_trace(go.Bar(
-                x=_years, y=[a.get('bs_ops_reserve', 0) for a in _sub_annual],
-                name='Ops Reserve', marker_color='#3B82F6'
-            ))
-            fig_bs_dsra.add_trace(go.Bar(
-                x=_years, y=[a.get('bs_opco_dsra', 0) for a in _sub_annual],
-                name='OpCo DSRA', marker_color='#8B5CF6'
-            ))
-            fig_bs_dsra.add_trace(go.Bar(
-                x=_years, y=[a.get('bs_mz_div_fd', 0) for a in _sub_annual],
-                name='Mezz Dividend FD', marker_color='#F59E0B'
-            ))
-            fig_bs_dsra.add_trace(go.Bar(
-                x=_years, y=[a.get('bs_entity_fd', 0) for a in _sub_annual],
-                name='Entity FD', marker_color='#10B981'
-            ))
-            # Total line overlay — sum of 4 actual FD buckets (never negative)
-            fig_bs_dsra.add_trace(go.Scatter(
-                x=_years, y=[a.get('bs_ops_reserve', 0) + a.get('bs_opco_dsra', 0) + a.get('bs_mz_div_fd', 0) + a.get('bs_entity_fd', 0) for a in _sub_annual],
-                name='Total Reserves', mode='lines+markers',
-                line=dict(color='#1E293B', width=2.5, dash='dot'),
-                marker=dict(size=7, color='#1E293B')
-            ))
-            fig_bs_dsra.update_layout(
-                barmode='stack',
-                height=360,
-                margin=dict(l=10, r=10, t=40, b=10),
-                xaxis=dict(dtick=1),
-                yaxis=dict(title='EUR'),
-                legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-            )
-            st.plotly_chart(fig_bs_dsra, use_container_width=True)
+            def _build_fig_bs_dsra():
+                fig_bs_dsra = go.Figure()
+                # Stacked bars: individual reserve buckets
+                fig_bs_dsra.add_trace(go.Bar(
+                    x=_years, y=[a.get('bs_ops_reserve', 0) for a in _sub_annual],
+                    name='Ops Reserve', marker_color='#3B82F6'
+                ))
+                fig_bs_dsra.add_trace(go.Bar(
+                    x=_years, y=[a.get('bs_opco_dsra', 0) for a in _sub_annual],
+                    name='OpCo DSRA', marker_color='#8B5CF6'
+                ))
+                fig_bs_dsra.add_trace(go.Bar(
+                    x=_years, y=[a.get('bs_mz_div_fd', 0) for a in _sub_annual],
+                    name='Mezz Dividend FD', marker_color='#F59E0B'
+                ))
+                fig_bs_dsra.add_trace(go.Bar(
+                    x=_years, y=[a.get('bs_entity_fd', 0) for a in _sub_annual],
+                    name='Entity FD', marker_color='#10B981'
+                ))
+                # Total line overlay — sum of 4 actual FD buckets (never negative)
+                fig_bs_dsra.add_trace(go.Scatter(
+                    x=_years, y=[a.get('bs_ops_reserve', 0) + a.get('bs_opco_dsra', 0) + a.get('bs_mz_div_fd', 0) + a.get('bs_entity_fd', 0) for a in _sub_annual],
+                    name='Total Reserves', mode='lines+markers',
+                    line=dict(color='#1E293B', width=2.5, dash='dot'),
+                    marker=dict(size=7, color='#1E293B')
+                ))
+                fig_bs_dsra.update_layout(
+                    barmode='stack',
+                    height=360,
+                    margin=dict(l=10, r=10, t=40, b=10),
+                    xaxis=dict(dtick=1),
+                    yaxis=dict(title='EUR'),
+                    legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                )
+                return fig_bs_dsra
+            plot_cached("fig_bs_dsra", _build_fig_bs_dsra, fingerprint=_fig_fp, use_container_width=True)
 
             # (Removed: stale Pre-Revenue Hedge / DSRA FD explainer — needs rewrite)
 
@@ -7900,61 +7418,63 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
                 _wf_measures = ['relative'] * 7 + ['total']
                 _wf_text = [f"R{abs(v):.1f}" for v in _wf_y[:-1]] + [f"R{_lcow_zar:.1f}"]
 
-                fig_lcow = go.Figure()
-
-                # Waterfall for costs
-                fig_lcow.add_trace(go.Waterfall(
-                    x=_wf_x, y=_wf_y, measure=_wf_measures,
-                    connector=dict(line=dict(color='#CBD5E1', width=1)),
-                    increasing=dict(marker=dict(color='#DC2626')),
-                    decreasing=dict(marker=dict(color='#10B981')),
-                    totals=dict(marker=dict(color='#1E40AF')),
-                    textposition="outside", text=_wf_text,
-                    name='LCOW', showlegend=False,
-                ))
-
-                # -- Revenue stacked bars (blue shades, build from zero) --
-                fig_lcow.add_trace(go.Bar(
-                    x=['Revenue'], y=[_sewage_rkl],
-                    name='Piped Sewage', marker_color='#2563EB',
-                    text=[f"R{_sewage_rkl:.1f}"], textposition='inside',
-                    textfont=dict(color='white'),
-                ))
-                fig_lcow.add_trace(go.Bar(
-                    x=['Revenue'], y=[_reuse_rkl],
-                    name='Reuse Water', marker_color='#3B82F6',
-                    text=[f"R{_reuse_rkl:.1f}"], textposition='inside',
-                    textfont=dict(color='white'),
-                ))
-
-                # Horizontal LCOW line across entire chart — the gap tells the story
-                fig_lcow.add_hline(y=_lcow_zar, line_dash="dot", line_color="#DC2626", line_width=2,
-                    annotation_text=f"LCOW R{_lcow_zar:.1f}/kL",
-                    annotation_position="top left",
-                    annotation_font=dict(color='#DC2626', size=11))
+                def _build_fig_lcow():
+                    fig_lcow = go.Figure()
+
+                    # Waterfall for costs
+                    fig_lcow.add_trace(go.Waterfall(
+                        x=_wf_x, y=_wf_y, measure=_wf_measures,
+                        connector=dict(line=dict(color='#CBD5E1', width=1)),
+                        increasing=dict(marker=dict(color='#DC2626')),
+                        decreasing=dict(marker=dict(color='#10B981')),
+                        totals=dict(marker=dict(color='#1E40AF')),
+                        textposition="outside", text=_wf_text,
+                        name='LCOW', showlegend=False,
+                    ))
 
-                # Horizontal Revenue line — the gap between LCOW and Revenue = profitability
-                fig_lcow.add_hline(y=_total_income_rkl, line_dash="dot", line_color="#2563EB", line_width=2,
-                    annotation_text=f"Revenue R{_total_income_rkl:.1f}/kL",
-                    annotation_position="top right",
-                    annotation_font=dict(color='#2563EB', size=11))
+                    # -- Revenue stacked bars (blue shades, build from zero) --
+                    fig_lcow.add_trace(go.Bar(
+                        x=['Revenue'], y=[_sewage_rkl],
+                        name='Piped Sewage', marker_color='#2563EB',
+                        text=[f"R{_sewage_rkl:.1f}"], textposition='inside',
+                        textfont=dict(color='white'),
+                    ))
+                    fig_lcow.add_trace(go.Bar(
+                        x=['Revenue'], y=[_reuse_rkl],
+                        name='Reuse Water', marker_color='#3B82F6',
+                        text=[f"R{_reuse_rkl:.1f}"], textposition='inside',
+                        textfont=dict(color='white'),
+                    ))
 
-                # Margin annotation in the gap between the two lines
-                fig_lcow.add_annotation(
-                    x='Finance', y=_lcow_zar + (_total_income_rkl - _lcow_zar) / 2,
-                    text=f"<b>Margin R{_margin_rkl:.1f}/kL ({_margin_pct:.0f}%)</b>",
-                    showarrow=False, font=dict(size=13, color='#16A34A'),
-                    bgcolor='rgba(255,255,255,0.9)', bordercolor='#16A34A', borderwidth=1,
-                )
+                    # Horizontal LCOW line across entire chart — the gap tells the story
+                    fig_lcow.add_hline(y=_lcow_zar, line_dash="dot", line_color="#DC2626", line_width=2,
+                        annotation_text=f"LCOW R{_lcow_zar:.1f}/kL",
+                        annotation_position="top left",
+                        annotation_font=dict(color='#DC2626', size=11))
+
+                    # Horizontal Revenue line — the gap between LCOW and Revenue = profitability
+                    fig_lcow.add_hline(y=_total_income_rkl, line_dash="dot", line_color="#2563EB", line_width=2,
+                        annotation_text=f"Revenue R{_total_income_rkl:.1f}/kL",
+                        annotation_position="top right",
+                        annotation_font=dict(color='#2563EB', size=11))
+
+                    # Margin annotation in the gap between the two lines
+                    fig_lcow.add_annotation(
+                        x='Finance', y=_lcow_zar + (_total_income_rkl - _lcow_zar) / 2,
+                        text=f"<b>Margin R{_margin_rkl:.1f}/kL ({_margin_pct:.0f}%)</b>",
+                        showarrow=False, font=dict(size=13, color='#16A34A'),
+                        bgcolor='rgba(255,255,255,0.9)', bordercolor='#16A34A', borderwidth=1,
+                    )
 
-                fig_lcow.update_layout(
-                    barmode='stack', height=500,
-                    margin=dict(l=10, r=10, t=40, b=10),
-                    yaxis_title='R / kL (NPV basis)',
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
-                    xaxis=dict(categoryorder='array', categoryarray=_x_all),
-                )
-                st.plotly_chart(fig_lcow, use_container_width=True)
+                    fig_lcow.update_layout(
+                        barmode='stack', height=500,
+                        margin=dict(l=10, r=10, t=40, b=10),
+                        yaxis_title='R / kL (NPV basis)',
+                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
+                        xaxis=dict(categoryorder='array', categoryarray=_x_all),
+                    )
+                    return fig_lcow
+                plot_cached("fig_lcow", _build_fig_lcow, fingerprint=_fig_fp, use_container_width=True)
 
                 # Toggle for calculation details
                 st.checkbox("Show LCOW calculation details", value=False, key="lcow_details_toggle")
@@ -8026,20 +7546,22 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
                 _ec2.metric("CAS Benchmark", f"{_cas_kwh_m3} kWh/m\u00b3")
                 _ec3.metric("10-Year Saving", f"R{_cum_sav[-1]:,.0f}")
 
-                from plotly.subplots import make_subplots
-                fig_energy = make_subplots(specs=[[{"secondary_y": True}]])
-                fig_energy.add_trace(go.Bar(x=_years, y=[v / 1e6 for v in _cas_ann],
-                    name='Conventional CAS (Eskom)', marker_color='#EF4444', opacity=0.7), secondary_y=False)
-                fig_energy.add_trace(go.Bar(x=_years, y=[v / 1e6 for v in _mabr_ann],
-                    name='MABR + LanRED Solar (-10%)', marker_color='#10B981', opacity=0.85), secondary_y=False)
-                fig_energy.add_trace(go.Scatter(x=_years, y=[v / 1e6 for v in _cum_sav],
-                    name='Cumulative Saving', mode='lines+markers', line=dict(color='#2563EB', width=3)), secondary_y=True)
-                fig_energy.update_layout(barmode='group', height=380,
-                    margin=dict(l=10, r=10, t=40, b=10),
-                    legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
-                fig_energy.update_yaxes(title_text="Annual Cost (R millions)", secondary_y=False)
-                fig_energy.update_yaxes(title_text="Cumulative Saving (R millions)", secondary_y=True)
-                st.plotly_chart(fig_energy, use_container_width=True)
+                def _build_fig_energy():
+                    from plotly.subplots import make_subplots
+                    fig_energy = make_subplots(specs=[[{"secondary_y": True}]])
+                    fig_energy.add_trace(go.Bar(x=_years, y=[v / 1e6 for v in _cas_ann],
+                        name='Conventional CAS (Eskom)', marker_color='#EF4444', opacity=0.7), secondary_y=False)
+                    fig_energy.add_trace(go.Bar(x=_years, y=[v / 1e6 for v in _mabr_ann],
+                        name='MABR + LanRED Solar (-10%)', marker_color='#10B981', opacity=0.85), secondary_y=False)
+                    fig_energy.add_trace(go.Scatter(x=_years, y=[v / 1e6 for v in _cum_sav],
+                        name='Cumulative Saving', mode='lines+markers', line=dict(color='#2563EB', width=3)), secondary_y=True)
+                    fig_energy.update_layout(barmode='group', height=380,
+                        margin=dict(l=10, r=10, t=40, b=10),
+                        legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
+                    fig_energy.update_yaxes(title_text="Annual Cost (R millions)", secondary_y=False)
+                    fig_energy.update_yaxes(title_text="Cumulative Saving (R millions)", secondary_y=True)
+                    return fig_energy
+                plot_cached("fig_energy", _build_fig_energy, fingerprint=_fig_fp, use_container_width=True)
                 st.caption(f"MABR saves {_saving_pct:.0f}% vs conventional CAS. 10-year cumulative: R{_cum_sav[-1]:,.0f}")
 
                 st.divider()
@@ -8057,21 +7579,23 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
                 _accel_tot = _grant_eur + _gepf_eur
                 _sr_remaining = _sr_drawn - _accel_tot
 
-                fig_bridge = go.Figure(go.Waterfall(
-                    x=['Senior Loan', 'DTIC Grant', 'GEPF Bulk Services', 'Remaining Debt'],
-                    y=[_sr_drawn, -_grant_eur, -_gepf_eur, _sr_remaining],
-                    measure=['absolute', 'relative', 'relative', 'total'],
-                    connector=dict(line=dict(color='#CBD5E1', width=1)),
-                    increasing=dict(marker=dict(color='#3B82F6')),
-                    decreasing=dict(marker=dict(color='#10B981')),
-                    totals=dict(marker=dict(color='#1E3A5F')),
-                    textposition="outside",
-                    text=[f"\u20ac{_sr_drawn:,.0f}", f"-\u20ac{_grant_eur:,.0f}",
-                          f"-\u20ac{_gepf_eur:,.0f}", f"\u20ac{_sr_remaining:,.0f}"],
-                ))
-                fig_bridge.update_layout(height=400, yaxis_title='EUR', showlegend=False,
-                    margin=dict(l=10, r=10, t=40, b=10))
-                st.plotly_chart(fig_bridge, use_container_width=True)
+                def _build_fig_bridge():
+                    fig_bridge = go.Figure(go.Waterfall(
+                        x=['Senior Loan', 'DTIC Grant', 'GEPF Bulk Services', 'Remaining Debt'],
+                        y=[_sr_drawn, -_grant_eur, -_gepf_eur, _sr_remaining],
+                        measure=['absolute', 'relative', 'relative', 'total'],
+                        connector=dict(line=dict(color='#CBD5E1', width=1)),
+                        increasing=dict(marker=dict(color='#3B82F6')),
+                        decreasing=dict(marker=dict(color='#10B981')),
+                        totals=dict(marker=dict(color='#1E3A5F')),
+                        textposition="outside",
+                        text=[f"\u20ac{_sr_drawn:,.0f}", f"-\u20ac{_grant_eur:,.0f}",
+                              f"-\u20ac{_gepf_eur:,.0f}", f"\u20ac{_sr_remaining:,.0f}"],
+                    ))
+                    fig_bridge.update_layout(height=400, yaxis_title='EUR', showlegend=False,
+                        margin=dict(l=10, r=10, t=40, b=10))
+                    return fig_bridge
+                plot_cached("fig_bridge", _build_fig_bridge, fingerprint=_fig_fp, use_container_width=True)
 
                 _bc1, _bc2, _bc3 = st.columns(3)
                 _bc1.metric("DTIC Grant (NWL share)", f"\u20ac{_grant_eur:,.0f}")
@@ -8082,23 +7606,25 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
 
                 # --- 4. Revenue Breakdown ---
                 st.subheader("4. Revenue Breakdown")
-                fig_rev = go.Figure()
-                fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_greenfield_sewage', 0) for a in _sub_annual],
-                    name='Greenfield Sewage', marker_color='#2563EB'))
-                fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_brownfield_sewage', 0) for a in _sub_annual],
-                    name='Brownfield Sewage', marker_color='#60A5FA'))
-                fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_greenfield_reuse', 0) for a in _sub_annual],
-                    name='Reuse (Greenfield)', marker_color='#10B981'))
-                fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_construction', 0) for a in _sub_annual],
-                    name='Construction Water', marker_color='#6EE7B7'))
-                fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_agri', 0) for a in _sub_annual],
-                    name='Agricultural Reuse', marker_color='#A7F3D0'))
-                fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_bulk_services', 0) for a in _sub_annual],
-                    name='Bulk Services', marker_color='#8B5CF6'))
-                fig_rev.update_layout(barmode='stack', height=380, yaxis_title='EUR',
-                    margin=dict(l=10, r=10, t=40, b=10),
-                    legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
-                st.plotly_chart(fig_rev, use_container_width=True)
+                def _build_fig_rev():
+                    fig_rev = go.Figure()
+                    fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_greenfield_sewage', 0) for a in _sub_annual],
+                        name='Greenfield Sewage', marker_color='#2563EB'))
+                    fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_brownfield_sewage', 0) for a in _sub_annual],
+                        name='Brownfield Sewage', marker_color='#60A5FA'))
+                    fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_greenfield_reuse', 0) for a in _sub_annual],
+                        name='Reuse (Greenfield)', marker_color='#10B981'))
+                    fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_construction', 0) for a in _sub_annual],
+                        name='Construction Water', marker_color='#6EE7B7'))
+                    fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_agri', 0) for a in _sub_annual],
+                        name='Agricultural Reuse', marker_color='#A7F3D0'))
+                    fig_rev.add_trace(go.Bar(x=_years, y=[a.get('rev_bulk_services', 0) for a in _sub_annual],
+                        name='Bulk Services', marker_color='#8B5CF6'))
+                    fig_rev.update_layout(barmode='stack', height=380, yaxis_title='EUR',
+                        margin=dict(l=10, r=10, t=40, b=10),
+                        legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
+                    return fig_rev
+                plot_cached("fig_rev", _build_fig_rev, fingerprint=_fig_fp, use_container_width=True)
 
                 st.divider()
 
@@ -8354,17 +7880,19 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
             with _col_debt:
                 # --- 7/3. Debt Paydown ---
                 st.subheader(f"{_gn_offset + 3}. Debt Paydown")
-                fig_debt = go.Figure()
-                fig_debt.add_trace(go.Scatter(x=_years, y=[a['bs_sr'] for a in _sub_annual],
-                    name='Senior IC', mode='lines+markers', line=dict(color='#3B82F6')))
-                fig_debt.add_trace(go.Scatter(x=_years, y=[a['bs_mz'] for a in _sub_annual],
-                    name='Mezz IC', mode='lines+markers', line=dict(color='#F59E0B')))
-                fig_debt.add_trace(go.Scatter(x=_years, y=[a['bs_debt'] for a in _sub_annual],
-                    name='Total Debt', mode='lines+markers', line=dict(color='#EF4444', dash='dash')))
-                fig_debt.update_layout(height=350, yaxis_title='EUR',
-                    margin=dict(l=10, r=10, t=40, b=10),
-                    legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
-                st.plotly_chart(fig_debt, use_container_width=True, key="debt_paydown")
+                def _build_fig_debt():
+                    fig_debt = go.Figure()
+                    fig_debt.add_trace(go.Scatter(x=_years, y=[a['bs_sr'] for a in _sub_annual],
+                        name='Senior IC', mode='lines+markers', line=dict(color='#3B82F6')))
+                    fig_debt.add_trace(go.Scatter(x=_years, y=[a['bs_mz'] for a in _sub_annual],
+                        name='Mezz IC', mode='lines+markers', line=dict(color='#F59E0B')))
+                    fig_debt.add_trace(go.Scatter(x=_years, y=[a['bs_debt'] for a in _sub_annual],
+                        name='Total Debt', mode='lines+markers', line=dict(color='#EF4444', dash='dash')))
+                    fig_debt.update_layout(height=350, yaxis_title='EUR',
+                        margin=dict(l=10, r=10, t=40, b=10),
+                        legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
+                    return fig_debt
+                plot_cached("fig_debt", _build_fig_debt, fingerprint=_fig_fp, use_container_width=True, key="debt_paydown")
 
                 st.divider()
 
@@ -8372,13 +7900,15 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
             with _col_equity:
                 # --- 8/4. Equity Build-up ---
                 st.subheader(f"{_gn_offset + 4}. Equity Build-up")
-                fig_eq = go.Figure()
-                fig_eq.add_trace(go.Scatter(x=_years, y=[a['bs_equity'] for a in _sub_annual],
-                    name='Equity', mode='lines+markers', fill='tozeroy', line=dict(color='#8B5CF6')))
-                fig_eq.update_layout(height=350, yaxis_title='EUR',
-                    margin=dict(l=10, r=10, t=40, b=10),
-                    legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
-                st.plotly_chart(fig_eq, use_container_width=True, key="equity_buildup")
+                def _build_fig_eq():
+                    fig_eq = go.Figure()
+                    fig_eq.add_trace(go.Scatter(x=_years, y=[a['bs_equity'] for a in _sub_annual],
+                        name='Equity', mode='lines+markers', fill='tozeroy', line=dict(color='#8B5CF6')))
+                    fig_eq.update_layout(height=350, yaxis_title='EUR',
+                        margin=dict(l=10, r=10, t=40, b=10),
+                        legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
+                    return fig_eq
+                plot_cached("fig_eq", _build_fig_eq, fingerprint=_fig_fp, use_container_width=True, key="equity_buildup")
 
                 st.divider()
 
@@ -8391,16 +7921,18 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
                 rev = a.get('rev_total', 0)
                 _ebitda_margins.append(a['ebitda'] / rev * 100 if rev > 0 else 0)
                 _net_margins.append(a['pat'] / rev * 100 if rev > 0 else 0)
-            fig_margins = go.Figure()
-            fig_margins.add_trace(go.Scatter(x=_years, y=_ebitda_margins,
-                name='EBITDA Margin %', mode='lines+markers', line=dict(color='#10B981', width=2)))
-            fig_margins.add_trace(go.Scatter(x=_years, y=_net_margins,
-                name='Net Profit Margin %', mode='lines+markers', line=dict(color='#3B82F6', width=2)))
-            fig_margins.add_hline(y=0, line_dash="dash", line_color="#CBD5E1")
-            fig_margins.update_layout(height=350, yaxis_title='Margin (%)',
-                margin=dict(l=10, r=10, t=40, b=10),
-                legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
-            st.plotly_chart(fig_margins, use_container_width=True)
+            def _build_fig_margins():
+                fig_margins = go.Figure()
+                fig_margins.add_trace(go.Scatter(x=_years, y=_ebitda_margins,
+                    name='EBITDA Margin %', mode='lines+markers', line=dict(color='#10B981', width=2)))
+                fig_margins.add_trace(go.Scatter(x=_years, y=_net_margins,
+                    name='Net Profit Margin %', mode='lines+markers', line=dict(color='#3B82F6', width=2)))
+                fig_margins.add_hline(y=0, line_dash="dash", line_color="#CBD5E1")
+                fig_margins.update_layout(height=350, yaxis_title='Margin (%)',
+                    margin=dict(l=10, r=10, t=40, b=10),
+                    legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
+                return fig_margins
+            plot_cached("fig_margins", _build_fig_margins, fingerprint=_fig_fp, use_container_width=True)
 
             st.divider()
 
@@ -8491,20 +8023,22 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
                     _rev_total = [a + b + c + d + e for a, b, c, d, e in
                                   zip(_rev_sewage_gf, _rev_sewage_bf, _rev_reuse_gf, _rev_reuse_con, _rev_reuse_agri)]
 
-                    fig_rev_mix = go.Figure()
-                    fig_rev_mix.add_trace(go.Bar(x=_rev_labels, y=_rev_sewage_gf, name="Sewage — GreenField", marker_color="#2563EB"))
-                    fig_rev_mix.add_trace(go.Bar(x=_rev_labels, y=_rev_sewage_bf, name="Sewage — BrownField", marker_color="#93C5FD"))
-                    fig_rev_mix.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_gf, name="Re-use — GreenField", marker_color="#059669"))
-                    fig_rev_mix.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_con, name="Re-use — Construction", marker_color="#F59E0B"))
-                    fig_rev_mix.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_agri, name="Re-use — Agri", marker_color="#A3E635"))
-                    fig_rev_mix.update_layout(
-                        barmode="stack",
-                        height=350,
-                        yaxis_title="EUR",
-                        margin=dict(l=10, r=10, t=40, b=10),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-                    )
-                    st.plotly_chart(fig_rev_mix, use_container_width=True)
+                    def _build_fig_rev_mix():
+                        fig_rev_mix = go.Figure()
+                        fig_rev_mix.add_trace(go.Bar(x=_rev_labels, y=_rev_sewage_gf, name="Sewage — GreenField", marker_color="#2563EB"))
+                        fig_rev_mix.add_trace(go.Bar(x=_rev_labels, y=_rev_sewage_bf, name="Sewage — BrownField", marker_color="#93C5FD"))
+                        fig_rev_mix.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_gf, name="Re-use — GreenField", marker_color="#059669"))
+                        fig_rev_mix.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_con, name="Re-use — Construction", marker_color="#F59E0B"))
+                        fig_rev_mix.add_trace(go.Bar(x=_rev_labels, y=_rev_reuse_agri, name="Re-use — Agri", marker_color="#A3E635"))
+                        fig_rev_mix.update_layout(
+                            barmode="stack",
+                            height=350,
+                            yaxis_title="EUR",
+                            margin=dict(l=10, r=10, t=40, b=10),
+                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                        )
+                        return fig_rev_mix
+                    plot_cached("fig_rev_mix", _build_fig_rev_mix, fingerprint=_fig_fp, use_container_width=True)
                     st.caption("Semi-annual revenue by segment. BrownField provides early high-margin revenue before GreenField ramps up.")
 
                 with _col_cf_ops:
@@ -8573,6 +8107,17 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
                 _sens_cfg = ModelConfig.load()
                 _sens_srv = _sens_cfg.operations.get("nwl", {}).get("sewerage_revenue_sharing", {})
 
+                # One batched pass over every factor the tab renders (cached by config hash)
+                _sens_tariff_steps = [1.0 + p / 100.0 for p in range(-30, 35, 5)]
+                _sens_grid = build_nwl_sensitivity_grid(
+                    _sens_cfg,
+                    sewage_rate_factors=_sens_tariff_steps,
+                    water_rate_factors=_sens_tariff_steps,
+                    ramp_delay_months=[0, 6, 12, 18],
+                    piped_delay_months=[0, 6, 12, 18, 24],
+                    honey_share_pct=list(range(20, 65, 5)),
+                )
+
                 # --- Base case from the full model ---
                 _base = _sub_annual
                 _base_rev_10 = sum(a.get('rev_total', 0) for a in _base)
@@ -8618,7 +8163,7 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
                             format="%+d%%", key="sens_tariff_wat"
                         )
 
-                    _sens_tariff = build_nwl_sensitivity(_sens_cfg,
+                    _sens_tariff = _sens_grid.at(
                         sewage_rate_factor=1.0 + _tariff_sew / 100.0,
                         water_rate_factor=1.0 + _tariff_wat / 100.0,
                     )
@@ -8631,19 +8176,21 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
                     _tm3.metric("Delta", f"EUR {_delta_ebitda:+,.0f}",
                                 delta=f"{_delta_ebitda / max(abs(_base_ebitda_10), 1) * 100:+.1f}%")
 
-                    fig_t = go.Figure()
-                    fig_t.add_trace(go.Bar(
-                        x=_years, y=[a['ebitda'] for a in _base],
-                        name='Base Case', marker_color='#10B981', opacity=0.5))
-                    fig_t.add_trace(go.Bar(
-                        x=_years, y=[r['ebitda'] for r in _sens_tariff],
-                        name=f'Tariff {_tariff_sew:+d}% / {_tariff_wat:+d}%',
-                        marker_color='#3B82F6'))
-                    fig_t.update_layout(
-                        barmode='group', height=350, yaxis_title='EBITDA (EUR)',
-                        margin=dict(l=10, r=10, t=40, b=10),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
-                    st.plotly_chart(fig_t, use_container_width=True)
+                    def _build_fig_t():
+                        fig_t = go.Figure()
+                        fig_t.add_trace(go.Bar(
+                            x=_years, y=[a['ebitda'] for a in _base],
+                            name='Base Case', marker_color='#10B981', opacity=0.5))
+                        fig_t.add_trace(go.Bar(
+                            x=_years, y=[r['ebitda'] for r in _sens_tariff],
+                            name=f'Tariff {_tariff_sew:+d}% / {_tariff_wat:+d}%',
+                            marker_color='#3B82F6'))
+                        fig_t.update_layout(
+                            barmode='group', height=350, yaxis_title='EBITDA (EUR)',
+                            margin=dict(l=10, r=10, t=40, b=10),
+                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
+                        return fig_t
+                    plot_cached("fig_t", _build_fig_t, fingerprint=_fig_fp, use_container_width=True)
 
                 # =============================================================
                 # SCENARIO 2: Delayed Capacity On-ramp
@@ -8665,7 +8212,7 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
 
                     _sens_ramp_results = {}
                     for _rd in [0, 6, 12, 18]:
-                        _sens_ramp_results[_rd] = build_nwl_sensitivity(_sens_cfg,ramp_delay_months=_rd)
+                        _sens_ramp_results[_rd] = _sens_grid.at(ramp_delay_months=_rd)
 
                     _ramp_sel = _sens_ramp_results[_ramp_delay]
                     _ramp_ebitda = sum(r['ebitda'] for r in _ramp_sel)
@@ -8713,7 +8260,7 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
 
                     _sens_piped_results = {}
                     for _pd in [0, 6, 12, 18, 24]:
-                        _sens_piped_results[_pd] = build_nwl_sensitivity(_sens_cfg,piped_delay_months=_pd)
+                        _sens_piped_results[_pd] = _sens_grid.at(piped_delay_months=_pd)
 
                     _piped_sel = _sens_piped_results[_piped_delay]
                     _piped_rev = sum(r['rev_total'] for r in _piped_sel)
@@ -8727,26 +8274,28 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
                                 delta=f"{_piped_delta / max(abs(_base_ebitda_10), 1) * 100:+.1f}%")
 
                     # Stacked bar: GreenField vs BrownField revenue by year
-                    fig_p = go.Figure()
-                    fig_p.add_trace(go.Bar(
-                        x=_years, y=[r['rev_greenfield_sewage'] for r in _piped_sel],
-                        name='GreenField Sewage (piped)', marker_color='#10B981'))
-                    fig_p.add_trace(go.Bar(
-                        x=_years, y=[r['rev_brownfield_sewage'] for r in _piped_sel],
-                        name='BrownField Sewage (honeysucker)', marker_color='#F59E0B'))
-                    fig_p.add_trace(go.Bar(
-                        x=_years, y=[r['rev_reuse'] + r['rev_construction'] + r['rev_agri'] for r in _piped_sel],
-                        name='Reuse + Construction + Agri', marker_color='#6EE7B7'))
-                    # Base EBITDA line for comparison
-                    fig_p.add_trace(go.Scatter(
-                        x=_years, y=[a['ebitda'] for a in _base],
-                        mode='lines+markers', name='Base EBITDA',
-                        line=dict(color='#6366F1', width=2, dash='dash')))
-                    fig_p.update_layout(
-                        barmode='stack', height=380, yaxis_title='EUR',
-                        margin=dict(l=10, r=10, t=40, b=10),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
-                    st.plotly_chart(fig_p, use_container_width=True)
+                    def _build_fig_p():
+                        fig_p = go.Figure()
+                        fig_p.add_trace(go.Bar(
+                            x=_years, y=[r['rev_greenfield_sewage'] for r in _piped_sel],
+                            name='GreenField Sewage (piped)', marker_color='#10B981'))
+                        fig_p.add_trace(go.Bar(
+                            x=_years, y=[r['rev_brownfield_sewage'] for r in _piped_sel],
+                            name='BrownField Sewage (honeysucker)', marker_color='#F59E0B'))
+                        fig_p.add_trace(go.Bar(
+                            x=_years, y=[r['rev_reuse'] + r['rev_construction'] + r['rev_agri'] for r in _piped_sel],
+                            name='Reuse + Construction + Agri', marker_color='#6EE7B7'))
+                        # Base EBITDA line for comparison
+                        fig_p.add_trace(go.Scatter(
+                            x=_years, y=[a['ebitda'] for a in _base],
+                            mode='lines+markers', name='Base EBITDA',
+                            line=dict(color='#6366F1', width=2, dash='dash')))
+                        fig_p.update_layout(
+                            barmode='stack', height=380, yaxis_title='EUR',
+                            margin=dict(l=10, r=10, t=40, b=10),
+                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
+                        return fig_p
+                    plot_cached("fig_p", _build_fig_p, fingerprint=_fig_fp, use_container_width=True)
 
                     # Explanatory comparison table
                     _base_gf_10 = sum(a.get('rev_greenfield_sewage', 0) for a in _base)
@@ -8798,9 +8347,9 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
 
                     _sens_honey_results = {}
                     for _hp in range(20, 65, 10):
-                        _sens_honey_results[_hp] = build_nwl_sensitivity(_sens_cfg,honey_share_pct=float(_hp))
+                        _sens_honey_results[_hp] = _sens_grid.at(honey_share_pct=float(_hp))
 
-                    _honey_sel = _sens_honey_results.get(_honey_pct, build_nwl_sensitivity(_sens_cfg,honey_share_pct=float(_honey_pct)))
+                    _honey_sel = _sens_grid.at(honey_share_pct=float(_honey_pct))
                     _honey_bf_10 = sum(r['rev_brownfield_sewage'] for r in _honey_sel)
                     _honey_ebitda = sum(r['ebitda'] for r in _honey_sel)
                     _honey_delta = _honey_ebitda - _base_ebitda_10
@@ -8846,17 +8395,17 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
 
                 _tornado_vars = [
                     ("Tariff +20%", "Tariff -20%",
-                     sum(r['ebitda'] for r in build_nwl_sensitivity(_sens_cfg,sewage_rate_factor=1.20, water_rate_factor=1.20)),
-                     sum(r['ebitda'] for r in build_nwl_sensitivity(_sens_cfg,sewage_rate_factor=0.80, water_rate_factor=0.80))),
+                     sum(r['ebitda'] for r in _sens_grid.at(sewage_rate_factor=1.20, water_rate_factor=1.20)),
+                     sum(r['ebitda'] for r in _sens_grid.at(sewage_rate_factor=0.80, water_rate_factor=0.80))),
                     ("Capacity delay +0m", "Capacity delay +12m",
                      _base_ebitda_10,
-                     sum(r['ebitda'] for r in build_nwl_sensitivity(_sens_cfg,ramp_delay_months=12))),
+                     sum(r['ebitda'] for r in _sens_grid.at(ramp_delay_months=12))),
                     ("Piped delay +12m", "Piped delay +0m",
-                     sum(r['ebitda'] for r in build_nwl_sensitivity(_sens_cfg,piped_delay_months=12)),
+                     sum(r['ebitda'] for r in _sens_grid.at(piped_delay_months=12)),
                      _base_ebitda_10),
                     ("Sharing 30%", "Sharing 50%",
-                     sum(r['ebitda'] for r in build_nwl_sensitivity(_sens_cfg,honey_share_pct=30.0)),
-                     sum(r['ebitda'] for r in build_nwl_sensitivity(_sens_cfg,honey_share_pct=50.0))),
+                     sum(r['ebitda'] for r in _sens_grid.at(honey_share_pct=30.0)),
+                     sum(r['ebitda'] for r in _sens_grid.at(honey_share_pct=50.0))),
                 ]
 
                 # Sort by total spread (largest first)
@@ -8880,24 +8429,62 @@ Ops Reserve → OpCo DSRA → Mezz IC Accel ({_CC_IRR_TARGET:.0%} eff.) → Sr I
                     _t_up_vals.append(_up_v - _base_ebitda_10)
                     _t_down_vals.append(_down_v - _base_ebitda_10)
 
-                fig_tornado = go.Figure()
-                fig_tornado.add_trace(go.Bar(
-                    y=_t_labels, x=_t_up_vals,
-                    name='Upside', orientation='h',
-                    marker_color='#10B981', text=[f"EUR {v:+,.0f}" for v in _t_up_vals],
-                    textposition='outside'))
-                fig_tornado.add_trace(go.Bar(
-                    y=_t_labels, x=_t_down_vals,
-                    name='Downside', orientation='h',
-                    marker_color='#EF4444', text=[f"EUR {v:+,.0f}" for v in _t_down_vals],
-                    textposition='outside'))
-                fig_tornado.add_vline(x=0, line_width=2, line_color='#374151')
-                fig_tornado.update_layout(
-                    barmode='relative', height=300,
-                    xaxis_title='Change in 10-Year EBITDA (EUR)',
-                    margin=dict(l=10, r=10, t=40, b=10),
-                    legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
-                st.plotly_chart(fig_tornado, use_container_width=True)
+                def _build_fig_tornado():
+                    fig_tornado = go.Figure()
+                    fig_tornado.add_trace(go.Bar(
+                        y=_t_labels, x=_t_up_vals,
+                        name='Upside', orientation='h',
+                        marker_color='#10B981', text=[f"EUR {v:+,.0f}" for v in _t_up_vals],
+                        textposition='outside'))
+                    fig_tornado.add_trace(go.Bar(
+                        y=_t_labels, x=_t_down_vals,
+                        name='Downside', orientation='h',
+                        marker_color='#EF4444', text=[f"EUR {v:+,.0f}" for v in _t_down_vals],
+                        textposition='outside'))
+                    fig_tornado.add_vline(x=0, line_width=2, line_color='#374151')
+                    fig_tornado.update_layout(
+                        barmode='relative', height=300,
+                        xaxis_title='Change in 10-Year EBITDA (EUR)',
+                        margin=dict(l=10, r=10, t=40, b=10),
+                        legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5))
+                    return fig_tornado
+                plot_cached("fig_tornado", _build_fig_tornado, fingerprint=_fig_fp, use_container_width=True)
+
+                # =============================================================
+                # 2D HEATMAP -- combined factors from the same sensitivity grid
+                # =============================================================
+                st.subheader("Combined Sensitivity -- 10-Year EBITDA Heatmap")
+                _hm_axis_labels = {
+                    "ramp_delay_months": "Capacity delay (months)",
+                    "piped_delay_months": "Piped delay (months)",
+                    "honey_share_pct": "Market sharing (%)",
+                    "sewage_rate_factor": "Sewage tariff factor",
+                    "water_rate_factor": "Water tariff factor",
+                }
+                _hmc1, _hmc2 = st.columns(2)
+                with _hmc1:
+                    _hm_x = st.selectbox("X axis", list(_hm_axis_labels), index=0,
+                                         format_func=_hm_axis_labels.get, key="sens_hm_x")
+                with _hmc2:
+                    _hm_y = st.selectbox("Y axis", list(_hm_axis_labels), index=1,
+                                         format_func=_hm_axis_labels.get, key="sens_hm_y")
+                if _hm_x == _hm_y:
+                    st.info("Select two different factors for the heatmap.")
+                else:
+                    _hm_z = _sens_grid.surface(_hm_x, _hm_y, line="ebitda")
+                    def _build_fig_hm():
+                        fig_hm = go.Figure(go.Heatmap(
+                            x=[str(v) for v in _sens_grid.axes[_hm_x]],
+                            y=[str(v) for v in _sens_grid.axes[_hm_y]],
+                            z=(_hm_z - _base_ebitda_10).tolist(),
+                            colorscale='RdYlGn', zmid=0,
+                            colorbar=dict(title='Δ EBITDA (EUR)')))
+                        fig_hm.update_layout(
+                            height=400,
+                            xaxis_title=_hm_axis_labels[_hm_x], yaxis_title=_hm_axis_labels[_hm_y],
+                            margin=dict(l=10, r=10, t=40, b=10))
+                        return fig_hm
+                    plot_cached("fig_hm", _build_fig_hm, fingerprint=_fig_fp, use_container_width=True)
 
     # --- SECURITY ---
     if "Security" in _tab_map:
@@ -9226,19 +8813,21 @@ revenue contracts (Layer 3) upstream through SCLCA to Invest International Capit
                     _sec_sr_bal = [a['bs_sr'] for a in _sub_annual]
                     _sec_mz_bal = [a['bs_mz'] for a in _sub_annual]
 
-                    _fig_al = go.Figure()
-                    _fig_al.add_trace(go.Bar(x=_sec_years, y=[v / 1e6 for v in _sec_fixed],
-                        name='Fixed Assets', marker_color='#3B82F6'))
-                    _fig_al.add_trace(go.Bar(x=_sec_years, y=[v / 1e6 for v in _sec_dsra_fd],
-                        name='Fixed Deposit (Cash)', marker_color='#10B981'))
-                    _fig_al.add_trace(go.Scatter(x=_sec_years, y=[(s + m) / 1e6 for s, m in zip(_sec_sr_bal, _sec_mz_bal)],
-                        name='Total IC Debt', mode='lines+markers', line=dict(color='#EF4444', width=3)))
-                    _fig_al.update_layout(
-                        barmode='stack', height=380, yaxis_title='EUR (millions)',
-                        margin=dict(l=10, r=10, t=40, b=10),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
-                    )
-                    st.plotly_chart(_fig_al, use_container_width=True)
+                    def _build_fig_al():
+                        _fig_al = go.Figure()
+                        _fig_al.add_trace(go.Bar(x=_sec_years, y=[v / 1e6 for v in _sec_fixed],
+                            name='Fixed Assets', marker_color='#3B82F6'))
+                        _fig_al.add_trace(go.Bar(x=_sec_years, y=[v / 1e6 for v in _sec_dsra_fd],
+                            name='Fixed Deposit (Cash)', marker_color='#10B981'))
+                        _fig_al.add_trace(go.Scatter(x=_sec_years, y=[(s + m) / 1e6 for s, m in zip(_sec_sr_bal, _sec_mz_bal)],
+                            name='Total IC Debt', mode='lines+markers', line=dict(color='#EF4444', width=3)))
+                        _fig_al.update_layout(
+                            barmode='stack', height=380, yaxis_title='EUR (millions)',
+                            margin=dict(l=10, r=10, t=40, b=10),
+                            legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="center", x=0.5),
+                        )
+                        return _fig_al
+                    plot_cached("fig_al", _build_fig_al, fingerprint=_fig_fp, use_container_width=True)
                     st.caption("Stacked bars = entity assets (fixed + fixed deposit cash). Red line = IC debt declining over time.")
 
                     # Revenue contracts from security.json layer_3
@@ -9743,13 +9332,15 @@ the project integrator and wrapper across all three delivery scopes.
                                 _cb_labels = [c for c, _ in _cb_sorted]
                                 _cb_values = [v for _, v in _cb_sorted]
                                 _cb_clrs = [_pie_colors.get(c, "#94a3b8") for c in _cb_labels]
-                                fig_pie = go.Figure(data=[go.Pie(
-                                    labels=_cb_labels, values=_cb_values,
-                                    marker=dict(colors=_cb_clrs),
-                                    textinfo='label+percent', textfont=dict(size=11), hole=0.35,
-                                )])
-                                fig_pie.update_layout(showlegend=False, margin=dict(t=10, b=10, l=10, r=10), height=250)
-                                st.plotly_chart(fig_pie, use_container_width=True)
+                                def _build_fig_pie():
+                                    fig_pie = go.Figure(data=[go.Pie(
+                                        labels=_cb_labels, values=_cb_values,
+                                        marker=dict(colors=_cb_clrs),
+                                        textinfo='label+percent', textfont=dict(size=11), hole=0.35,
+                                    )])
+                                    fig_pie.update_layout(showlegend=False, margin=dict(t=10, b=10, l=10, r=10), height=250)
+                                    return fig_pie
+                                plot_cached("fig_pie", _build_fig_pie, fingerprint=_fig_fp, use_container_width=True)
                 else:
                     _country_totals = {}
                     for _cr in _all_cost_rows:
@@ -9779,20 +9370,22 @@ the project integrator and wrapper across all three delivery scopes.
                         _pie_labels = [c for c, _ in _sorted_countries]
                         _pie_values = [v for _, v in _sorted_countries]
                         _pie_clrs = [_pie_colors.get(c, "#94a3b8") for c in _pie_labels]
-                        fig_pie = go.Figure(data=[go.Pie(
-                            labels=_pie_labels,
-                            values=_pie_values,
-                            marker=dict(colors=_pie_clrs),
-                            textinfo='label+percent',
-                            textfont=dict(size=12),
-                            hole=0.35,
-                        )])
-                        fig_pie.update_layout(
-                            showlegend=False,
-                            margin=dict(t=10, b=10, l=10, r=10),
-                            height=280,
-                        )
-                        st.plotly_chart(fig_pie, use_container_width=True)
+                        def _build_fig_pie():
+                            fig_pie = go.Figure(data=[go.Pie(
+                                labels=_pie_labels,
+                                values=_pie_values,
+                                marker=dict(colors=_pie_clrs),
+                                textinfo='label+percent',
+                                textfont=dict(size=12),
+                                hole=0.35,
+                            )])
+                            fig_pie.update_layout(
+                                showlegend=False,
+                                margin=dict(t=10, b=10, l=10, r=10),
+                                height=280,
+                            )
+                            return fig_pie
+                        plot_cached("fig_pie", _build_fig_pie, fingerprint=_fig_fp, use_container_width=True)
 
                 # ── ECA Content Compliance ──
                 st.divider()
@@ -9896,6 +9489,67 @@ the project integrator and wrapper across all three delivery scopes.
             _render_twx_pipeline_tab()
 
 
+# ── Scenario library browser ──────────────────────────────────
+_LIB_METRIC_LABELS = {
+    "dscr_min": "Min DSCR", "dscr_avg": "Avg DSCR", "llcr_min": "Min LLCR",
+    "equity_irr": "Equity IRR", "project_irr": "Project IRR",
+    "total_revenue": "Revenue (10y)", "total_ebitda": "EBITDA (10y)", "total_pat": "PAT (10y)",
+    "ebitda_margin": "EBITDA margin", "net_margin": "Net margin",
+}
+
+
+def _render_scenario_library():
+    """Filter and page through stored runs (engine/library.py)."""
+    from engine.library import DEFAULT_LIBRARY_PATH, ENTITIES, ScenarioLibrary
+
+    lib_path = Path(os.environ.get("SCENARIO_LIBRARY", DEFAULT_LIBRARY_PATH))
+    if not lib_path.exists():
+        st.info(f"No scenario library at `{lib_path}`. Populate one with "
+                "`python -m engine run --in scenarios.jsonl --out results.jsonl --library <path>`.")
+        return
+    lib = ScenarioLibrary(lib_path)
+    try:
+        filters = []
+        for i in range(3):
+            _c1, _c2, _c3, _c4 = st.columns([1, 1.4, 0.6, 1])
+            with _c1:
+                _ent = st.selectbox("Entity", ("—",) + ENTITIES, key=f"scnlib_ent_{i}")
+            with _c2:
+                _met = st.selectbox("Metric", list(_LIB_METRIC_LABELS), format_func=_LIB_METRIC_LABELS.get,
+                                    key=f"scnlib_met_{i}")
+            with _c3:
+                _op = st.selectbox("Op", ["<", "<=", ">", ">="], key=f"scnlib_op_{i}")
+            with _c4:
+                _val = st.number_input("Value", value=0.0, format="%.4f", key=f"scnlib_val_{i}")
+            if _ent != "—":
+                filters.append((_ent, _met, _op, _val))
+
+        _o1, _o2, _o3 = st.columns([1, 1.4, 1])
+        with _o1:
+            _ord_ent = st.selectbox("Sort entity", ENTITIES, key="scnlib_ord_ent")
+        with _o2:
+            _ord_met = st.selectbox("Sort metric", list(_LIB_METRIC_LABELS), index=3,
+                                    format_func=_LIB_METRIC_LABELS.get, key="scnlib_ord_met")
+        with _o3:
+            _ord_dir = st.selectbox("Direction", ["desc", "asc"], key="scnlib_ord_dir")
+
+        _cfg_fp = (ModelConfig.load().fingerprint
+                   if st.checkbox("Current config only", value=True, key="scnlib_cfg") else None)
+        _page_size = 50
+        _total = lib.count(filters, cap=10_000, config_fp=_cfg_fp)
+        _pages = max(1, -(-_total // _page_size))
+        _page = st.number_input(f"Page (of {_pages}{'+' if _total >= 10_000 else ''})",
+                                min_value=1, max_value=_pages, value=1, key="scnlib_page")
+        rows = lib.query(filters, order_by=(_ord_ent, _ord_met, _ord_dir),
+                         limit=_page_size, offset=(_page - 1) * _page_size, config_fp=_cfg_fp)
+        st.caption(f"{_total:,}{'+' if _total >= 10_000 else ''} matching scenarios "
+                   f"of {len(lib):,} stored")
+        if rows:
+            st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+    finally:
+        lib.close()
+
+
 # ── Pipeline tab renderer ─────────────────────────────────────
 def _render_twx_pipeline_tab():
     """CRM-light pipeline view for Timberworx sales projects."""
@@ -10324,6 +9978,31 @@ with st.sidebar:
 
 entity = st.session_state.nav_entity
 
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _excel_export_bytes(session_hash: str) -> bytes:
+    """Full-model .xlsx for the current inputs (engine/excel.py), cached per input hash."""
+    from engine.excel import write_model_workbook
+    inputs = ScenarioInputs.from_session_state(dict(st.session_state))
+    return write_model_workbook(_run_engine_model(session_hash), inputs=inputs)
+
+
+# --- Sidebar: Excel export of the current engine run ---
+with st.sidebar:
+    st.divider()
+    _xlsx_hash = _session_input_hash()
+    if st.session_state.get("_xlsx_ready_hash") == _xlsx_hash:
+        st.download_button(
+            "Download model (.xlsx)", data=_excel_export_bytes(_xlsx_hash),
+            file_name="SCLCA_Financial_Model.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            icon=":material/download:", use_container_width=True, key="dl_model_xlsx",
+        )
+    elif st.button("Export model to Excel", icon=":material/table_view:",
+                   use_container_width=True, key="prep_model_xlsx"):
+        st.session_state["_xlsx_ready_hash"] = _xlsx_hash
+        st.rerun()
+
 # --- Spacer: pushes account section to sidebar bottom ---
 st.sidebar.markdown(
     '<div style="min-height:calc(100vh - 480px)"></div>',
@@ -10350,15 +10029,54 @@ def _load_guarantor_config() -> dict:
             return json.load(fh)
     return {}
 
+def _guarantor_store():
+    """The prebuilt statement store (scripts/guarantor_store.py), read-only; None if not built."""
+    return gstore.open_readonly() if gstore is not None else None
+
+def _guarantor_docs(folder: Path, pattern: str = "*_structured.json") -> dict:
+    """{stem: parsed JSON} for folder/pattern; unreadable files are skipped.
+
+    Served from the prebuilt statement store when it is current for the
+    folder (a stat check, no sync); otherwise the files are parsed directly.
+    """
+    store = _guarantor_store()
+    if store is not None:
+        try:
+            with store:
+                if store.is_current(folder, pattern):
+                    return store.documents(folder, pattern)
+        except sqlite3.Error:
+            pass
+    out = {}
+    for fp in sorted(folder.glob(pattern)):
+        try:
+            with open(fp, 'r') as fh:
+                out[fp.stem] = json.load(fh)
+        except (json.JSONDecodeError, OSError):
+            pass
+    return out
+
 @st.cache_data(ttl=300)
 def _load_guarantor_jsons(subdir: str) -> dict:
     """Load all *_structured.json from a guarantor subdirectory."""
-    target = _GUARANTOR_ROOT / subdir if subdir else _GUARANTOR_ROOT
-    out = {}
-    for fp in sorted(target.glob("*_structured.json")):
-        with open(fp, 'r') as fh:
-            out[fp.stem] = json.load(fh)
-    return out
+    return _guarantor_docs(_GUARANTOR_ROOT / subdir if subdir else _GUARANTOR_ROOT)
+
+# ── Config hot-reload: config/*.json edits clear only the dependent caches ──
+def _forget_app_config(name: str) -> None:
+    load_config.clear(name)
+    if name == "project":
+        _load_project_params.clear()
+    elif name == "guarantor":
+        _load_guarantor_config.clear()
+    elif name == "roles":
+        _load_roles.clear()
+
+register_loader(_forget_app_config, name="app.config")
+register("results", _run_engine_model.clear, name="app.engine_model")
+register("results", _entity_proofs.clear, name="app.entity_proofs")
+register("results", _excel_export_bytes.clear, name="app.excel_export")
+register("results", clear_figure_cache, name="app.figures")
+watch()
 
 def _gval(data, *keys, idx=0, default=None):
     """Safely traverse nested dict → values[idx]."""
@@ -10679,15 +10397,7 @@ def _load_mgmt_reports(group_key):
         base = _CONTEXT_GUARANTOR_ROOT / "Structured Data" / "Veracity" / "AFS"
     else:
         return {}
-    result = {}
-    for p in sorted(base.glob("*_mgmt_report_structured.json")):
-        stem = p.stem
-        try:
-            with open(p, "r") as f:
-                result[stem] = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            pass
-    return result
+    return _guarantor_docs(base, "*_mgmt_report_structured.json")
 
 
 def _load_vph_3yr():
@@ -10695,7 +10405,9 @@ def _load_vph_3yr():
     FY2025 = 2025_structured → values[0]
     FY2024 = 2025_structured → values[1] (== 2024_structured → values[0])
     FY2023 = 2024_structured → values[1]
-    Returns dict with same structure but values arrays of length 3.
+    Returns (d25, d24): only the income statement and statement of financial
+    position, read as line-item slices from the statement store when it is
+    current for the file, else the parsed JSON.
     """
     # Primary: context folder (local dev). Fallback: data/guarantor/ (repo, Streamlit Cloud).
     _repo_root = Path(__file__).parent
@@ -10707,29 +10419,30 @@ def _load_vph_3yr():
         _CONTEXT_GUARANTOR_ROOT / "Structured Data" / "Veracity" / "AFS" / "VeracityPropertyHoldings_2024_structured.json",
         _repo_root / "data" / "guarantor" / "VeracityPropertyHoldings_2024_structured.json",
     ]
-    d25, d24 = {}, {}
-    for p in _candidates_25:
-        if p.exists():
-            with open(p, 'r') as f:
-                d25 = json.load(f)
-            break
-    for p in _candidates_24:
-        if p.exists():
-            with open(p, 'r') as f:
-                d24 = json.load(f)
-            break
-    return d25, d24
+    _statements = ("statement_of_comprehensive_income", "statement_of_financial_position")
+
+    def _read(candidates):
+        p = next((c for c in candidates if c.exists()), None)
+        if p is None:
+            return {}
+        store = _guarantor_store()
+        if store is not None:
+            try:
+                with store:
+                    if store.is_current(p.parent, p.name):
+                        return store.statements(p, _statements)
+            except sqlite3.Error:
+                pass
+        with open(p, 'r') as f:
+            return json.load(f)
+
+    return _read(_candidates_25), _read(_candidates_24)
 
 
 def _load_mgmt_accounts(group_key):
     """Load management account structured JSONs for a group. Returns dict {stem: data}."""
     target = _MGMT_VERACITY_DIR if group_key == "veracity" else _MGMT_PHOENIX_DIR
-    out = {}
-    if target.exists():
-        for fp in sorted(target.glob("*_structured.json")):
-            with open(fp, 'r') as fh:
-                out[fp.stem] = json.load(fh)
-    return out
+    return _guarantor_docs(target) if target.exists() else {}
 
 
 def _mgmt_extract_revenue(data):
@@ -11281,13 +10994,10 @@ def _compute_lifecycle_outputs(entity_name, afs_data=None, mgmt_data=None, mgmt_
 
     # Preferred unified engine
     if ga:
-        _ga_is = ga.analyse_is_monthly(mgmt_data) if mgmt_data and mgmt_data.get("general_ledger_detail") else None
-        _ga_bs = ga.analyse_bs_trajectory(mgmt_data) if mgmt_data and mgmt_data.get("statement_of_financial_position") else None
-        _ga_mr = ga.analyse_mgmt_report(mgmt_report_data) if mgmt_report_data else None
-        _ga_lc = ga.classify_lifecycle(afs_data=afs_data, mgmt_data=mgmt_data, is_analysis=_ga_is, bs_analysis=_ga_bs,
-                                       mgmt_report_analysis=_ga_mr)
-        _ga_story = ga.generate_story(_name, _ga_lc, is_analysis=_ga_is, bs_analysis=_ga_bs,
-                                      mgmt_report_analysis=_ga_mr) if _ga_lc else []
+        # Memoised on the input JSONs, so reruns and repeated cards reuse the analysis
+        _ga = ga.analyse_entity_cached(_name, afs_data, mgmt_data, mgmt_report_data)
+        _ga_lc = _ga["lifecycle"]
+        _ga_is, _ga_bs, _ga_mr, _ga_story = _ga["is_analysis"], _ga["bs_analysis"], _ga["mr_analysis"], _ga["story"]
         return {
             "label": _ga_lc.get("label", "Unknown"),
             "detail": _ga_lc.get("detail", "Insufficient data to classify."),
@@ -12526,7 +12236,9 @@ def _render_mgmt_accounts_tab(group_key, afs_dict):
             _m_bs = f["mdata"].get("statement_of_financial_position", {})
             if _m_bs and ga:
                 with st.expander("Balance Sheet Trajectory", expanded=False):
-                    _ga_bs = ga.analyse_bs_trajectory(f["mdata"])
+                    # Unified lifecycle output (mgmt-only in this view)
+                    _lc_out = _compute_lifecycle_outputs(f["name"], afs_data=None, mgmt_data=f["mdata"])
+                    _ga_bs = _lc_out["bs_analysis"]
                     if _ga_bs:
                         # Key BS metrics
                         _bs_cols = st.columns(4)
@@ -12552,8 +12264,6 @@ def _render_mgmt_accounts_tab(group_key, afs_dict):
                             if cash_first is not None and cash_last is not None:
                                 st.caption(f"Cash: {_fmtr(cash_first, millions=True)} -> {_fmtr(cash_last, millions=True)}")
 
-                        # Unified lifecycle output (mgmt-only in this view)
-                        _lc_out = _compute_lifecycle_outputs(f["name"], afs_data=None, mgmt_data=f["mdata"])
                         for s in _lc_out.get("story", []):
                             st.markdown(s, unsafe_allow_html=False)
                     else:
@@ -14785,6 +14495,7 @@ if entity == "Catalytic Assets":
             inject_pnl_heritage(
                 _pnl_rows, annual_model, len(annual_model), _eur_fmt,
                 year_labels=_sclca_pnl_year_labels,
+                entity="sclca", statement="pnl",
             )
 
             st.divider()
@@ -15022,6 +14733,7 @@ if entity == "Catalytic Assets":
             inject_pnl_heritage(
                 _cf_rows, annual_model, len(annual_model), _eur_fmt,
                 year_labels=_sclca_cf_year_labels,
+                entity="sclca", statement="cf",
             )
 
             st.divider()
@@ -15828,6 +15540,7 @@ Ops Reserve -> OpCo DSRA ->
             inject_pnl_heritage(
                 _bs_rows, annual_model, len(annual_model), _eur_fmt,
                 year_labels=_bs_year_labels,
+                entity="sclca", statement="bs",
             )
 
             # --- Balance Sheet Chart: A = D + E ---
@@ -16345,6 +16058,11 @@ Ops Reserve -> OpCo DSRA ->
         both facility costs and IC income proportionally - the margin is preserved.
         """)
 
+            st.divider()
+            st.subheader("Scenario Library")
+            st.caption("Stored batch / sweep runs — filter on any entity metric and page through matches")
+            _render_scenario_library()
+
     # --- SECURITY TAB ---
     if "Security" in _tab_map:
         with _tab_map["Security"]:
@@ -1,5 +1,5 @@
 """Standalone audit module — balance/reconciliation checks."""
 
-from audit.runner import run_all_checks
+from audit.runner import audit_batch, run_all_checks
 
-__all__ = ["run_all_checks"]
+__all__ = ["audit_batch", "run_all_checks"]
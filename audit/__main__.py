@@ -1,12 +1,45 @@
-"""CLI entry: python -m audit"""
+"""CLI entry: python -m audit [--batch scenarios.jsonl --workers N]"""
 
+import argparse
+import json
 from pathlib import Path
 
-from audit.runner import run_all_checks
-from audit.report import write_json_report, format_text_report
+from audit.runner import audit_batch, run_all_checks
+from audit.report import format_batch_report, write_json_report, format_text_report
 
 
-def main():
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m audit", description="Model audit checks.")
+    parser.add_argument("--batch", default=None,
+                        help="JSONL scenario book (python -m engine run format) to audit.")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (1 = in-process).")
+    parser.add_argument("--out", default=None, help="JSON report path.")
+    args = parser.parse_args(argv)
+
+    output_dir = Path(__file__).resolve().parent.parent / "output"
+    if args.batch:
+        from engine.batch import read_scenarios
+
+        bad: list[tuple[str, str]] = []
+
+        def _items():
+            for item in read_scenarios(src):
+                if item.error:
+                    bad.append((item.id, item.error))
+                    continue
+                yield item.id, item.overrides
+
+        with open(args.batch, "r") as src:
+            batch = audit_batch(_items(), workers=args.workers)
+        batch.total += len(bad)
+        batch.errors.extend(bad)
+        print(format_batch_report(batch))
+        json_path = Path(args.out or output_dir / "audit_batch.json")
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps(batch.to_dict(), indent=2, default=str))
+        print(f"\nJSON report written to: {json_path}")
+        return 1 if batch.errors or batch.failing_checks("arithmetic") else 0
+
     print("Running model...")
     audit_data = run_all_checks()
 
@@ -14,11 +47,11 @@ def main():
     print(format_text_report(audit_data))
 
     # Write JSON
-    output_dir = Path(__file__).resolve().parent.parent / "output"
     json_path = write_json_report(
-        audit_data, output_dir / "audit_report.json")
+        audit_data, args.out or output_dir / "audit_report.json")
     print(f"\nJSON report written to: {json_path}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,256 @@
+"""Property-based invariant fuzzer -- random valid scenarios vs the audit identities.
+
+Samples random but valid ScenarioInputs (domains follow the UI widgets:
+tariffs, growth, cash sweep %, hedge / ECA toggles, LanRED scenario and a
+swap notional inside compute_nwl_swap_bounds), audits them through
+audit_batch() (process pool, deduplicated) and asserts the arithmetic
+identities in INVARIANTS.  Each failing invariant is shrunk to a minimal
+counterexample: overrides are dropped back to their defaults one at a
+time, then the remaining numbers are bisected towards their defaults,
+keeping every step that still fails.
+
+CLI: python -m audit.fuzz --n 10000 --workers 8 [--seed 0] [--out fuzz.json]
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from dataclasses import dataclass, field, fields
+from typing import Callable
+
+from engine.config import ModelConfig, ScenarioInputs, resolve_overrides
+from engine.convergence import run_model
+from audit.checks import classify_check
+from audit.runner import BatchAudit, audit_batch, audit_result
+
+# Numeric domains: attr -> (low, high)
+FLOAT_DOMAINS: dict[str, tuple[float, float]] = {
+    "nwl_greenfield_growth_pct": (3.0, 12.0),
+    "nwl_greenfield_brine_pct": (5.0, 20.0),
+    "nwl_greenfield_sewage_rate_2025": (30.0, 60.0),
+    "nwl_greenfield_water_rate_2025": (40.0, 80.0),
+    "nwl_greenfield_reuse_ratio": (0.5, 1.0),
+    "nwl_srv_joburg_price": (30.0, 60.0),
+    "nwl_srv_growth_pct": (3.0, 12.0),
+    "nwl_srv_saving_to_market_pct": (0.0, 100.0),
+    "nwl_power_eskom_base": (2.0, 4.0),
+    "nwl_power_ic_discount": (0.0, 30.0),
+    "nwl_power_escalation": (5.0, 15.0),
+    "lanred_bess_alloc_pct": (0.0, 50.0),
+}
+
+# Discrete domains: attr -> options
+CHOICE_DOMAINS: dict[str, tuple] = {
+    "lanred_scenario": ("Brownfield+", "Greenfield"),
+    "nwl_cash_sweep_pct": (100.0, 90.0, 80.0, 70.0),
+    "sclca_nwl_hedge": ("Cross-Currency Swap", "CC DSRA → FEC"),
+    "sclca_lanred_hedge": ("No Hedging", "Cross-Currency Swap"),
+    "nwl_eca_atradius": (True, False),
+    "nwl_eca_exporter": (True, False),
+    "timberworx_eca_atradius": (True, False),
+    "timberworx_eca_exporter": (True, False),
+}
+
+# Invariant -> check-name fragments (arithmetic checks only)
+INVARIANTS: dict[str, tuple[str, ...]] = {
+    "bs_gap": ("Assets = Debt + Equity", "BS: A = L + E"),
+    "cf_net": ("CF: Net = reserve change", "Sum(CF Net)"),
+    "facility": ("Fac:", "Fac<>WF:"),
+    "ic_recon": ("SCLCA = Subs",),
+}
+
+_DEFAULTS = {f.name: f.default for f in fields(ScenarioInputs)}
+
+
+def invariant_of(section: str, name: str) -> str | None:
+    """The INVARIANTS key a check belongs to, or None."""
+    if classify_check(section, name) != "arithmetic":
+        return None
+    return next((inv for inv, parts in INVARIANTS.items() if any(p in name for p in parts)), None)
+
+
+def _is_invariant(section: str, name: str) -> bool:
+    return invariant_of(section, name) is not None
+
+
+# ── Sampling ────────────────────────────────────────────────────
+
+
+def sample_scenario(rng: random.Random, swap_bounds: dict) -> dict:
+    """One random, valid ScenarioInputs override dict."""
+    overrides: dict = {attr: rng.uniform(lo, hi) for attr, (lo, hi) in FLOAT_DOMAINS.items()}
+    overrides.update({attr: rng.choice(opts) for attr, opts in CHOICE_DOMAINS.items()})
+    if overrides["lanred_scenario"] == "Greenfield":
+        overrides["sclca_lanred_hedge"] = "No Hedging"     # UI resets the hedge on Greenfield
+    if overrides["sclca_nwl_hedge"] == "Cross-Currency Swap":
+        overrides["nwl_swap_notional"] = rng.uniform(swap_bounds["min"], swap_bounds["max"])
+    return overrides
+
+
+def sample_book(n: int, seed: int = 0, cfg: ModelConfig | None = None) -> list[dict]:
+    """n random scenarios (deterministic for a seed)."""
+    from engine.swap import compute_nwl_swap_bounds
+
+    bounds = compute_nwl_swap_bounds(cfg or ModelConfig.load())
+    rng = random.Random(seed)
+    return [sample_scenario(rng, bounds) for _ in range(n)]
+
+
+# ── Shrinking ───────────────────────────────────────────────────
+
+
+def shrink(overrides: dict, fails: Callable[[dict], bool], steps: int = 8) -> dict:
+    """Smallest override dict (fewest keys, numbers nearest default) that still fails."""
+    current = dict(overrides)
+    for key in list(current):
+        candidate = {k: v for k, v in current.items() if k != key}
+        if fails(candidate):
+            current = candidate
+    for key, value in list(current.items()):
+        default = _DEFAULTS.get(key)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) \
+                or not isinstance(default, (int, float)):
+            continue
+        lo, hi = float(default), float(value)      # lo passes (key dropped = default), hi fails
+        for _ in range(steps):
+            mid = (lo + hi) / 2
+            if fails({**current, key: mid}):
+                hi = mid
+            else:
+                lo = mid
+        current[key] = hi
+    return current
+
+
+def _violations(cfg: ModelConfig, overrides: dict) -> dict[str, tuple[str, str, float]]:
+    """{invariant: (section, name, delta)} of the first failing check per invariant."""
+    found: dict[str, tuple[str, str, float]] = {}
+    for section, name, _, _, delta, passed in audit_result(
+            run_model(*resolve_overrides(overrides, cfg))):
+        if not passed:
+            inv = invariant_of(section, name)
+            if inv is not None and inv not in found:
+                found[inv] = (section, name, delta)
+    return found
+
+
+def _error_of(cfg: ModelConfig, overrides: dict) -> str | None:
+    try:
+        run_model(*resolve_overrides(overrides, cfg))
+    except Exception as exc:
+        return type(exc).__name__
+    return None
+
+
+# ── Driver ──────────────────────────────────────────────────────
+
+
+@dataclass
+class Counterexample:
+    """A minimal failing scenario for one invariant (or engine error)."""
+    invariant: str
+    check: str
+    scenario_id: str
+    overrides: dict
+    original: dict
+    detail: str = ""
+
+
+@dataclass
+class FuzzReport:
+    n: int
+    seed: int
+    batch: BatchAudit
+    counterexamples: list[Counterexample] = field(default_factory=list)
+    elapsed_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.counterexamples
+
+    def to_dict(self) -> dict:
+        return {
+            "n": self.n,
+            "seed": self.seed,
+            "ok": self.ok,
+            "elapsed_s": self.elapsed_s,
+            "counterexamples": [vars(c) for c in self.counterexamples],
+            "batch": self.batch.to_dict(),
+        }
+
+
+def fuzz(
+    n: int = 1000,
+    *,
+    seed: int = 0,
+    workers: int = 1,
+    max_counterexamples: int = 5,
+    cfg: ModelConfig | None = None,
+) -> FuzzReport:
+    """Audit n random scenarios against INVARIANTS; shrink what fails.
+
+    One counterexample is shrunk per violated invariant (and per engine
+    exception type), up to max_counterexamples, in-process.
+    """
+    cfg = cfg or ModelConfig.load()
+    started = time.perf_counter()
+    book = sample_book(n, seed, cfg)
+    batch = audit_batch(
+        ((str(i), overrides) for i, overrides in enumerate(book)),
+        workers=workers, select=_is_invariant,
+    )
+    report = FuzzReport(n=n, seed=seed, batch=batch)
+
+    seen: set[str] = set()
+    for failure in batch.failures:
+        inv = invariant_of(failure["section"], failure["name"])
+        if inv in seen or len(report.counterexamples) >= max_counterexamples:
+            continue
+        seen.add(inv)
+        original = book[int(failure["id"])]
+        minimal = shrink(original, lambda o, inv=inv: inv in _violations(cfg, o))
+        section, name, delta = _violations(cfg, minimal)[inv]
+        report.counterexamples.append(Counterexample(
+            inv, f"{section}: {name}", failure["id"], minimal, original, f"delta {delta:,.2f}"))
+
+    for scenario_id, error in batch.errors:
+        kind = error.split(":", 1)[0]
+        if kind in seen or len(report.counterexamples) >= max_counterexamples:
+            continue
+        seen.add(kind)
+        original = book[int(scenario_id)]
+        minimal = shrink(original, lambda o, kind=kind: _error_of(cfg, o) == kind)
+        report.counterexamples.append(Counterexample("error", kind, scenario_id, minimal, original, error))
+
+    report.elapsed_s = time.perf_counter() - started
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m audit.fuzz", description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=1000, help="Random scenarios to run.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (1 = in-process).")
+    parser.add_argument("--out", default=None, help="JSON report path.")
+    args = parser.parse_args(argv)
+
+    report = fuzz(args.n, seed=args.seed, workers=args.workers)
+    rate = report.n / report.elapsed_s if report.elapsed_s > 0 else 0.0
+    print(f"{report.n} scenarios in {report.elapsed_s:.1f}s ({rate:.0f}/s), "
+          f"{len(report.batch.failing_checks())} failing invariant checks, "
+          f"{len(report.batch.errors)} errors")
+    for c in report.counterexamples:
+        print(f"  [{c.invariant}] {c.check} ({c.detail})")
+        print(f"    minimal: {json.dumps(c.overrides, default=str)}")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report.to_dict(), f, indent=2, default=str)
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
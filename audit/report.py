@@ -136,3 +136,37 @@ def format_text_report(audit_data: dict) -> str:
     lines.append("=" * 72)
 
     return "\n".join(lines)
+
+
+def format_batch_report(batch, top: int = 20) -> str:
+    """Format a BatchAudit (audit_batch) as human-readable text."""
+    lines: list[str] = []
+    lines.append("=" * 72)
+    lines.append("SCLCA FINANCIAL MODEL - BATCH AUDIT")
+    lines.append("=" * 72)
+    lines.append(
+        f"  Scenarios: {batch.total} ({batch.audited} audited, "
+        f"{batch.cached} duplicate, {len(batch.errors)} errors) "
+        f"in {batch.elapsed_s:.1f}s")
+    lines.append("")
+
+    for category, title in (("arithmetic", "ARITHMETIC CHECKS"),
+                            ("model_design", "MODEL DESIGN CHECKS")):
+        failing = batch.failing_checks(category)
+        lines.append(f"{title} ({len(failing)} failing in at least one scenario)")
+        lines.append("-" * 72)
+        for s in failing[:top]:
+            lines.append(f"  {s.section}: {s.name}")
+            lines.append(
+                f"    failed {s.failures}/{s.runs}  worst delta "
+                f"{s.worst_delta:>14,.2f}  ({s.worst_id})")
+        if len(failing) > top:
+            lines.append(f"  ... {len(failing) - top} more")
+        lines.append("")
+
+    for scenario_id, error in batch.errors[:top]:
+        lines.append(f"  ERROR {scenario_id}: {error}")
+    if batch.dropped_failures:
+        lines.append(f"  ({batch.dropped_failures} failure rows not kept)")
+    lines.append("=" * 72)
+    return "\n".join(lines)
@@ -1,9 +1,24 @@
-"""Audit runner -- orchestrates all checks against engine output."""
+"""Audit runner -- orchestrates all checks against engine output.
+
+Checks run in independent groups (one per entity, SCLCA, IC recon), which
+run_all_checks() can spread over a thread pool.  Audits of runs the runner
+starts itself are cached by scenario fingerprint.  audit_batch() audits a
+whole scenario book (sweep grid, Monte Carlo draws, JSONL) on a process
+pool and keeps only the failures and the worst delta per check.
+"""
 
 from __future__ import annotations
 
-from engine.config import ModelConfig, ScenarioInputs
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Iterable
+
+from engine.batch import ResultCache
+from engine.config import ModelConfig, ScenarioInputs, resolve_overrides, scenario_fingerprint
 from engine.convergence import run_model
+from engine.reload import register
 from engine.types import ModelResult
 from audit.checks import (
     check_entity_pnl,
@@ -16,14 +31,73 @@ from audit.checks import (
     classify_check,
 )
 
+AUDIT_CACHE_SIZE = 64
+
+_cache = ResultCache(AUDIT_CACHE_SIZE)
+
+
+# ── Check groups ────────────────────────────────────────────────
+
+
+def _entity_checks(entity_key: str, er) -> list[tuple]:
+    results: list[tuple] = []
+    results.extend(check_entity_pnl(entity_key, er.annual))
+    results.extend(check_entity_cf(entity_key, er.annual))
+    results.extend(check_entity_bs(entity_key, er.annual, er.depreciable_base))
+    results.extend(check_entity_facility(
+        entity_key, er.sr_schedule, er.mz_schedule, er.waterfall_semi, er.annual))
+    results.extend(check_entity_waterfall_consistency(
+        entity_key, er.annual, er.waterfall_semi))
+    return results
+
+
+def check_groups(result: ModelResult) -> list[tuple[str, Callable[[], list[tuple]]]]:
+    """Independent (group, run) pairs: one per entity, then SCLCA and IC recon."""
+    groups = [(key, partial(_entity_checks, key, er)) for key, er in result.entities.items()]
+    if result.holding:
+        groups.append(("sclca", partial(check_sclca, result.holding, result.entities)))
+        groups.append(("ic_recon", partial(check_ic_reconciliation, result.holding, result.entities)))
+    return groups
+
+
+def audit_result(result: ModelResult, workers: int = 1) -> list[tuple]:
+    """All check tuples for result, in group order; workers > 1 runs groups on threads."""
+    groups = check_groups(result)
+    if workers <= 1 or len(groups) < 2:
+        return [r for _, run in groups for r in run()]
+    with ThreadPoolExecutor(max_workers=min(workers, len(groups))) as pool:
+        parts = list(pool.map(lambda group: group[1](), groups))
+    return [r for part in parts for r in part]
+
+
+def summarise(results: list[tuple]) -> dict:
+    """Pass / fail counts split into arithmetic and model-design checks."""
+    summary = {"total": len(results), "arithmetic_pass": 0, "arithmetic_fail": 0,
+               "design_pass": 0, "design_fail": 0}
+    for r in results:
+        kind = "arithmetic" if classify_check(r[0], r[1]) == "arithmetic" else "design"
+        summary[f"{kind}_{'pass' if r[5] else 'fail'}"] += 1
+    return summary
+
+
+# ── Single run ──────────────────────────────────────────────────
+
 
 def run_all_checks(
     result: ModelResult | None = None,
     cfg: ModelConfig | None = None,
     inputs: ScenarioInputs | None = None,
+    *,
+    workers: int = 1,
+    fingerprint: str | None = None,
 ) -> dict:
     """Run all audit checks. If result is None, runs the model first.
 
+    Audits are cached by fingerprint: the (ModelConfig, ScenarioInputs)
+    fingerprints when the runner runs the model, or the fingerprint the
+    caller passes for its own result.  Cached audits are shared: treat the
+    returned lists as read-only.
+
     Returns dict with:
         results: list of (section, name, expected, actual, delta, passed)
         summary: dict with counts
@@ -34,42 +108,229 @@ def run_all_checks(
             cfg = ModelConfig.load()
         if inputs is None:
             inputs = ScenarioInputs.defaults()
-        result = run_model(cfg, inputs)
+        if fingerprint is None:
+            fingerprint = f"{cfg.fingerprint}:{inputs.fingerprint()}"
+    if fingerprint is not None:
+        hit = _cache.get(fingerprint)
+        if hit is not None:
+            return dict(hit)
 
-    all_results: list[tuple] = []
-
-    # Per-entity checks
-    for entity_key, er in result.entities.items():
-        all_results.extend(check_entity_pnl(entity_key, er.annual))
-        all_results.extend(check_entity_cf(entity_key, er.annual))
-        all_results.extend(check_entity_bs(
-            entity_key, er.annual, er.depreciable_base))
-        all_results.extend(check_entity_facility(
-            entity_key, er.sr_schedule, er.mz_schedule,
-            er.waterfall_semi, er.annual))
-        all_results.extend(check_entity_waterfall_consistency(
-            entity_key, er.annual, er.waterfall_semi))
-
-    # SCLCA holding company
-    if result.holding:
-        all_results.extend(check_sclca(result.holding, result.entities))
-        all_results.extend(check_ic_reconciliation(
-            result.holding, result.entities))
-
-    # Summary
-    arith = [r for r in all_results
-             if classify_check(r[0], r[1]) == "arithmetic"]
-    design = [r for r in all_results
-              if classify_check(r[0], r[1]) == "model_design"]
+    if result is None:
+        result = run_model(cfg, inputs)
 
-    return {
+    all_results = audit_result(result, workers)
+    audit_data = {
         "results": all_results,
-        "summary": {
-            "total": len(all_results),
-            "arithmetic_pass": sum(1 for r in arith if r[5]),
-            "arithmetic_fail": sum(1 for r in arith if not r[5]),
-            "design_pass": sum(1 for r in design if r[5]),
-            "design_fail": sum(1 for r in design if not r[5]),
-        },
+        "summary": summarise(all_results),
         "model_result": result,
     }
+    if fingerprint is not None:
+        _cache.put(fingerprint, audit_data)
+    return dict(audit_data)
+
+
+def clear_audit_cache() -> None:
+    global _cache
+    _cache = ResultCache(AUDIT_CACHE_SIZE)
+
+
+register("results", clear_audit_cache)
+
+
+# ── Scenario batch ──────────────────────────────────────────────
+
+
+@dataclass
+class CheckStat:
+    """One check across a batch: how often it ran / failed and its worst delta."""
+    section: str
+    name: str
+    category: str
+    runs: int = 0
+    failures: int = 0
+    worst_delta: float = 0.0
+    worst_id: str = ""
+
+
+@dataclass
+class BatchAudit:
+    """Failures and per-check worst deltas for a scenario book."""
+    total: int = 0
+    audited: int = 0
+    cached: int = 0
+    errors: list[tuple[str, str]] = field(default_factory=list)
+    failures: list[dict] = field(default_factory=list)
+    dropped_failures: int = 0
+    checks: dict[tuple[str, str], CheckStat] = field(default_factory=dict)
+    elapsed_s: float = 0.0
+
+    def worst(self, n: int = 20, category: str | None = None) -> list[CheckStat]:
+        """The n checks with the largest worst delta (optionally one category)."""
+        stats = [s for s in self.checks.values() if category in (None, s.category)]
+        return sorted(stats, key=lambda s: s.worst_delta, reverse=True)[:n]
+
+    def failing_checks(self, category: str | None = None) -> list[CheckStat]:
+        return [s for s in self.worst(len(self.checks), category) if s.failures]
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "audited": self.audited,
+            "cached": self.cached,
+            "errors": [{"id": i, "error": e} for i, e in self.errors],
+            "failures": self.failures,
+            "dropped_failures": self.dropped_failures,
+            "checks": [vars(s) for s in self.worst(len(self.checks))],
+            "elapsed_s": self.elapsed_s,
+        }
+
+    def _record(self, scenario_id: str, fingerprint: str, results: list[tuple],
+                max_failures: int, select: Callable[[str, str], bool] | None = None) -> None:
+        for section, name, expected, actual, delta, passed in results:
+            if select is not None and not select(section, name):
+                continue
+            stat = self.checks.get((section, name))
+            if stat is None:
+                stat = self.checks[section, name] = CheckStat(
+                    section, name, classify_check(section, name), worst_id=scenario_id)
+            stat.runs += 1
+            if delta > stat.worst_delta:
+                stat.worst_delta, stat.worst_id = delta, scenario_id
+            if passed:
+                continue
+            stat.failures += 1
+            if len(self.failures) < max_failures:
+                self.failures.append({
+                    "id": scenario_id, "fingerprint": fingerprint, "section": section,
+                    "name": name, "expected": expected, "actual": actual, "delta": delta,
+                    "category": stat.category,
+                })
+            else:
+                self.dropped_failures += 1
+
+
+_WORKER_CFG: ModelConfig | None = None
+
+
+def _init_worker() -> None:
+    """Pool initializer: load ModelConfig once per worker."""
+    global _WORKER_CFG
+    _WORKER_CFG = ModelConfig.load()
+
+
+def _audit_overrides(cfg: ModelConfig, overrides: dict) -> list[tuple]:
+    return audit_result(run_model(*resolve_overrides(overrides, cfg)))
+
+
+def _worker_audit(overrides: dict) -> list[tuple]:
+    return _audit_overrides(_WORKER_CFG, overrides)
+
+
+def _scenario_items(scenarios: Iterable) -> Iterable[tuple[str, dict]]:
+    """(id, overrides) from override dicts, {"id", "inputs"} dicts or (id, overrides) pairs."""
+    for n, item in enumerate(scenarios, start=1):
+        if isinstance(item, tuple):
+            yield str(item[0]), dict(item[1])
+        elif "inputs" in item:
+            yield str(item.get("id", n)), dict(item["inputs"])
+        else:
+            yield str(n), dict(item)
+
+
+def audit_batch(
+    scenarios: Iterable,
+    *,
+    workers: int = 1,
+    max_in_flight: int | None = None,
+    max_failures: int = 10_000,
+    cache_size: int = 1024,
+    select: Callable[[str, str], bool] | None = None,
+) -> BatchAudit:
+    """Audit every scenario in a book; only failures and worst deltas are kept.
+
+    scenarios yields flat override dicts — ScenarioInputs fields and/or
+    dotted config paths (e.g. engine.scenarios grid_overrides /
+    sample_overrides) — {"id", "inputs"} dicts or (id, overrides) pairs.
+    Scenarios are deduplicated by config + inputs fingerprint.
+    workers <= 1 runs in-process; otherwise a ProcessPoolExecutor is used
+    with at most max_in_flight (default 4 x workers) scenarios queued.
+    At most max_failures failure rows are kept (the rest are only counted);
+    select(section, name), if given, limits the batch to matching checks.
+    """
+    report = BatchAudit()
+    cache = ResultCache(cache_size)
+    started = time.perf_counter()
+    cfg = ModelConfig.load()
+
+    def _prepare(scenario_id: str, overrides: dict) -> str | None:
+        report.total += 1
+        try:
+            return scenario_fingerprint(*resolve_overrides(overrides, cfg))
+        except (ValueError, TypeError) as exc:
+            report.errors.append((scenario_id, f"{type(exc).__name__}: {exc}"))
+            return None
+
+    def _from_cache(scenario_id: str, fp: str) -> bool:
+        hit = cache.get(fp)
+        if hit is None:
+            return False
+        report.cached += 1
+        report.audited += 1
+        report._record(scenario_id, fp, hit, max_failures, select)
+        return True
+
+    def _done(ids: list[str], fp: str, results: list[tuple]) -> None:
+        cache.put(fp, results)
+        report.audited += 1
+        report._record(ids[0], fp, results, max_failures, select)
+        for scenario_id in ids[1:]:
+            _from_cache(scenario_id, fp)
+
+    if workers <= 1:
+        for scenario_id, overrides in _scenario_items(scenarios):
+            fp = _prepare(scenario_id, overrides)
+            if fp is None or _from_cache(scenario_id, fp):
+                continue
+            try:
+                results = _audit_overrides(cfg, overrides)
+            except Exception as exc:  # one failing case must not stop the book
+                report.errors.append((scenario_id, f"{type(exc).__name__}: {exc}"))
+                continue
+            _done([scenario_id], fp, results)
+        report.elapsed_s = time.perf_counter() - started
+        return report
+
+    limit = max_in_flight or 4 * workers
+    in_flight: dict[Future, str] = {}
+    waiting: dict[str, list[str]] = {}
+
+    def _drain(block_until: int) -> None:
+        while len(in_flight) > block_until:
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for fut in done:
+                fp = in_flight.pop(fut)
+                ids = waiting.pop(fp)
+                try:
+                    results = fut.result()
+                except Exception as exc:
+                    report.errors.extend((i, f"{type(exc).__name__}: {exc}") for i in ids)
+                    continue
+                _done(ids, fp, results)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for scenario_id, overrides in _scenario_items(scenarios):
+            fp = _prepare(scenario_id, overrides)
+            if fp is None:
+                continue
+            if fp in waiting:                         # coalesce with in-flight twin
+                waiting[fp].append(scenario_id)
+                continue
+            if _from_cache(scenario_id, fp):
+                continue
+            _drain(limit - 1)
+            waiting[fp] = [scenario_id]
+            in_flight[pool.submit(_worker_audit, overrides)] = fp
+        _drain(0)
+
+    report.elapsed_s = time.perf_counter() - started
+    return report
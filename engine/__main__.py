@@ -0,0 +1,149 @@
+"""CLI entry: python -m engine {run,serve,excel}
+
+    python -m engine run --in scenarios.jsonl --out results.jsonl --workers N [--library lib.db] [--export book/]
+    python -m engine serve --port 8765 --workers N
+    python -m engine excel --out model.xlsx [--in scenarios.jsonl]
+
+For run, use "-" for stdin / stdout; a summary line is printed to stderr.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from contextlib import ExitStack
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    from engine.batch import run_batch
+
+    with ExitStack() as stack:
+        src = sys.stdin if args.inp == "-" else stack.enter_context(open(args.inp, "r"))
+        dst = sys.stdout if args.out == "-" else stack.enter_context(open(args.out, "w"))
+        library = None
+        pending: list[dict] = []
+        if args.library:
+            from engine.library import ScenarioLibrary
+            library = stack.enter_context(ScenarioLibrary(args.library))
+        columnar = None
+        if args.export:
+            from engine.columnar import ColumnarWriter
+            columnar = stack.enter_context(ColumnarWriter(args.export, fmt=args.export_format))
+
+        def _emit(record: dict) -> None:
+            if columnar is not None and record["status"] == "ok":
+                if not record["cached"]:                   # duplicates already exported
+                    columnar.add_record(record)
+                if not args.statements:
+                    record = {k: v for k, v in record.items() if k != "statements"}
+            dst.write(json.dumps(record, default=str) + "\n")
+            if args.flush:
+                dst.flush()
+            if library is not None and record["status"] == "ok":
+                pending.append(record)
+                if len(pending) >= 1000:
+                    library.add_many(pending, label=args.label, analyze=False)
+                    pending.clear()
+
+        stats = run_batch(
+            src, _emit,
+            workers=args.workers,
+            statements="full" if args.export else args.statements,
+            discount_rate=args.discount_rate,
+            max_in_flight=args.max_in_flight,
+            cache_size=args.cache_size,
+        )
+        if library is not None:
+            library.add_many(pending, label=args.label, analyze=False)
+            library.analyze()                              # once, after the whole load
+
+    rate = stats.total / stats.elapsed_s if stats.elapsed_s > 0 else 0.0
+    print(
+        f"{stats.total} scenarios: {stats.ok} ok ({stats.cached} cached), "
+        f"{stats.errors} errors in {stats.elapsed_s:.1f}s ({rate:.1f}/s)",
+        file=sys.stderr,
+    )
+    return 1 if stats.errors else 0
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    from engine.service import serve
+
+    print(f"Model service on http://{args.host}:{args.port} ({args.workers} workers)", file=sys.stderr)
+    serve(host=args.host, port=args.port, workers=args.workers, cache_size=args.cache_size)
+    return 0
+
+
+def _cmd_excel(args: argparse.Namespace) -> int:
+    from engine.batch import read_scenarios
+    from engine.config import ModelConfig, ScenarioInputs, resolve_overrides
+    from engine.excel import write_model_workbook, write_scenario_book
+    from engine.orchestrator import run_model
+
+    cfg = ModelConfig.load()
+    if not args.inp:
+        inputs = ScenarioInputs()
+        write_model_workbook(run_model(cfg, inputs), args.out, inputs=inputs)
+        return 0
+
+    errors = 0
+
+    def _items():
+        nonlocal errors
+        with (sys.stdin if args.inp == "-" else open(args.inp, "r")) as src:
+            for item in read_scenarios(src, cfg):
+                if item.error:
+                    errors += 1
+                    print(f"{item.id}: {item.error}", file=sys.stderr)
+                    continue
+                item_cfg, inputs = resolve_overrides(item.overrides, cfg)
+                yield item.id, inputs, run_model(item_cfg, inputs)
+
+    write_scenario_book(_items(), args.out)
+    return 1 if errors else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m engine", description="Headless model runner.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Run a JSONL stream of ScenarioInputs overrides.")
+    run.add_argument("--in", dest="inp", required=True, help="Input JSONL path ('-' = stdin).")
+    run.add_argument("--out", required=True, help="Output JSONL path ('-' = stdout).")
+    run.add_argument("--workers", type=int, default=1, help="Worker processes (1 = in-process).")
+    run.add_argument("--statements", action="store_true",
+                     help="Include annual + semi-annual waterfall rows per entity.")
+    run.add_argument("--discount-rate", type=float, default=0.052, help="LLCR discount rate.")
+    run.add_argument("--max-in-flight", type=int, default=None,
+                     help="Max queued scenarios (default 4 x workers).")
+    run.add_argument("--cache-size", type=int, default=1024,
+                     help="Fingerprint result cache entries (0 disables).")
+    run.add_argument("--flush", action="store_true", help="Flush output after every record.")
+    run.add_argument("--library", default=None,
+                     help="Also store results in this SQLite scenario library (engine/library.py).")
+    run.add_argument("--label", default="", help="Label stored with library rows.")
+    run.add_argument("--export", default=None,
+                     help="Also stream all statements to a partitioned dataset here (engine/columnar.py).")
+    run.add_argument("--export-format", choices=("parquet", "arrow"), default="parquet")
+    run.set_defaults(func=_cmd_run)
+
+    srv = sub.add_parser("serve", help="Local HTTP/JSON model service (see engine/service.py).")
+    srv.add_argument("--host", default="127.0.0.1")
+    srv.add_argument("--port", type=int, default=8765)
+    srv.add_argument("--workers", type=int, default=2, help="Warm worker processes.")
+    srv.add_argument("--cache-size", type=int, default=512, help="Result cache entries.")
+    srv.set_defaults(func=_cmd_serve)
+
+    xl = sub.add_parser("excel", help="Excel workbook of the base run, or one sheet per scenario.")
+    xl.add_argument("--out", required=True, help="Output .xlsx path.")
+    xl.add_argument("--in", dest="inp", default=None,
+                    help="Scenario JSONL (same format as run); omit for the base case.")
+    xl.set_defaults(func=_cmd_excel)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+"""Headless batch runner — JSONL scenario stream in, JSONL results out.
+
+Each input line is either a flat override dict — ScenarioInputs fields
+and/or dotted config paths ("rates.fx.eur_zar": 21.0) — or
+{"id": ..., "inputs": {...}}.  Each output line is one result record,
+written as soon as its scenario completes (completion order, not input
+order — match on "id"):
+
+    {"id": ..., "fingerprint": ..., "status": "ok", "cached": false,
+     "inputs": {...overrides}, "elapsed_s": 0.05, "metrics": {entity: EntityMetrics.to_dict()},
+     "holding": {...}, "statements": {...}}          # statements optional
+
+Memory stays bounded: input is read lazily, at most `max_in_flight`
+scenarios are queued on the worker pool, and the fingerprint result cache
+is an LRU — one per run_batch call unless the caller passes a shared one.
+Duplicate scenarios (same config + ScenarioInputs fingerprint) are run
+once — in-flight duplicates wait on the first, later ones hit the cache.
+
+CLI: python -m engine run --in scenarios.jsonl --out results.jsonl --workers N
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+from engine.analytics import extract_metrics
+from engine.config import CONFIG_SECTIONS, ModelConfig, ScenarioInputs, resolve_overrides, scenario_fingerprint
+
+
+# ── Scenario evaluation ─────────────────────────────────────────
+
+
+_HOLDING_SUMMARY_KEYS = ("dscr_min", "dscr_avg", "total_ic_interest_income", "total_net_interest")
+
+
+def evaluate_scenario(
+    cfg: ModelConfig,
+    inputs: ScenarioInputs,
+    *,
+    statements: bool | str = False,
+    discount_rate: float = 0.052,
+) -> dict:
+    """Run the full model for one scenario and return a JSON-ready payload."""
+    from engine.orchestrator import run_model
+
+    return result_payload(run_model(cfg, inputs), statements=statements, discount_rate=discount_rate)
+
+
+def result_payload(result, *, statements: bool | str = False, discount_rate: float = 0.052) -> dict:
+    """JSON-ready payload (metrics per entity + holding summary) for a ModelResult.
+
+    statements=True adds annual + semi-annual waterfall rows; "full" adds
+    every statement and schedule table (engine.columnar table set).
+    """
+    payload = {
+        "metrics": {
+            key: extract_metrics(key, er.annual, discount_rate).to_dict()
+            for key, er in result.entities.items()
+        },
+        "holding": {
+            "ni_total": sum(a.get("ni", 0.0) for a in (result.holding or {}).get("annual", [])),
+            **{k: (result.holding or {}).get(k) for k in _HOLDING_SUMMARY_KEYS},
+        },
+    }
+    if statements == "full":
+        from engine.columnar import ENTITY_TABLES, HOLDING_TABLES
+        payload["statements"] = {
+            key: {t: getattr(er, t) for t in ENTITY_TABLES}
+            for key, er in result.entities.items()
+        }
+        payload["statements"]["sclca"] = {t: (result.holding or {}).get(t) for t in HOLDING_TABLES}
+    elif statements:
+        payload["statements"] = {
+            key: {"annual": er.annual, "waterfall_semi": er.waterfall_semi}
+            for key, er in result.entities.items()
+        }
+        payload["statements"]["sclca"] = {"annual": (result.holding or {}).get("annual", [])}
+    return payload
+
+
+# ── Worker process state ────────────────────────────────────────
+
+_WORKER_CFG: ModelConfig | None = None
+_WORKER_OPTS: dict = {}
+
+
+def _init_worker(statements: bool | str, discount_rate: float) -> None:
+    """Pool initializer: load ModelConfig once per worker (warm workers)."""
+    global _WORKER_CFG, _WORKER_OPTS
+    _WORKER_CFG = ModelConfig.load()
+    _WORKER_OPTS = {"statements": statements, "discount_rate": discount_rate}
+
+
+def _worker_config(base_fp: str | None) -> ModelConfig:
+    """The worker's snapshot, reloaded when the parent's config fingerprint moved.
+
+    A changed config file is only seen by the parent (its watcher); the
+    fingerprint it sends with each job tells a warm worker to re-read the
+    config sections and clear their dependent caches.
+    """
+    global _WORKER_CFG
+    if _WORKER_CFG is None or (base_fp is not None and _WORKER_CFG.fingerprint != base_fp):
+        from engine.reload import invalidate
+        invalidate(CONFIG_SECTIONS)
+        _WORKER_CFG = ModelConfig.load()
+        if base_fp is not None and _WORKER_CFG.fingerprint != base_fp:
+            raise RuntimeError("worker config does not match the caller's (config changed mid-request)")
+    return _WORKER_CFG
+
+
+def _worker_evaluate(overrides: dict, statements: bool | str, discount_rate: float,
+                     base_fp: str | None = None) -> dict:
+    """Evaluate one scenario in a warm worker with per-call options.
+
+    Dotted config paths in overrides are applied as a copy-on-write
+    overlay on the worker's snapshot (base_fp: see _worker_config).
+    """
+    t0 = time.perf_counter()
+    cfg, inputs = resolve_overrides(overrides, _worker_config(base_fp))
+    payload = evaluate_scenario(cfg, inputs, statements=statements, discount_rate=discount_rate)
+    payload["elapsed_s"] = time.perf_counter() - t0
+    return payload
+
+
+def _worker_run(overrides: dict, base_fp: str | None = None) -> dict:
+    return _worker_evaluate(overrides, base_fp=base_fp, **_WORKER_OPTS)
+
+
+def _worker_model(overrides: dict, base_fp: str | None = None) -> dict:
+    """Full ModelResult as a plain dict (ModelResult.to_dict layout)."""
+    from engine.orchestrator import run_model
+    return run_model(*resolve_overrides(overrides, _worker_config(base_fp))).to_dict()
+
+
+# ── Input parsing ───────────────────────────────────────────────
+
+
+@dataclass
+class ScenarioLine:
+    """One parsed input line."""
+    id: str
+    overrides: dict
+    fingerprint: str = ""
+    error: str = ""
+
+
+def read_scenarios(lines: Iterable[str], cfg: ModelConfig | None = None) -> Iterator[ScenarioLine]:
+    """Lazily parse JSONL lines; blank lines and #-comments are skipped.
+
+    The id defaults to the 1-based line number; the fingerprint covers the
+    config overlay on cfg (default: the loaded snapshot) and the inputs.
+    Lines that fail to parse or validate are yielded with `error` set
+    rather than raising, so one bad case does not abort an overnight book.
+    """
+    for lineno, raw in enumerate(lines, start=1):
+        text = raw.strip()
+        if not text or text.startswith("#"):
+            continue
+        item = ScenarioLine(id=str(lineno), overrides={})
+        try:
+            obj = json.loads(text)
+            if not isinstance(obj, dict):
+                raise ValueError("scenario line must be a JSON object")
+            if "inputs" in obj:
+                item.id = str(obj.get("id", lineno))
+                item.overrides = dict(obj["inputs"])
+            else:
+                item.overrides = obj
+            item.fingerprint = scenario_fingerprint(*resolve_overrides(item.overrides, cfg))
+        except (ValueError, TypeError) as exc:
+            item.error = f"{type(exc).__name__}: {exc}"
+        yield item
+
+
+# ── Batch driver ────────────────────────────────────────────────
+
+
+@dataclass
+class BatchStats:
+    """Counters reported at the end of a batch."""
+    total: int = 0
+    ok: int = 0
+    errors: int = 0
+    cached: int = 0
+    elapsed_s: float = 0.0
+
+
+class ResultCache:
+    """Fingerprint -> payload LRU (batch runner and model service)."""
+
+    def __init__(self, max_size: int) -> None:
+        self._data: OrderedDict[str, dict] = OrderedDict()
+        self._max = max_size
+
+    def get(self, key: str) -> dict | None:
+        hit = self._data.get(key)
+        if hit is not None:
+            self._data.move_to_end(key)
+        return hit
+
+    def put(self, key: str, payload: dict) -> None:
+        if self._max <= 0:
+            return
+        self._data[key] = payload
+        self._data.move_to_end(key)
+        while len(self._data) > self._max:
+            self._data.popitem(last=False)
+
+
+def run_batch(
+    lines: Iterable[str],
+    emit: Callable[[dict], None],
+    *,
+    workers: int = 1,
+    statements: bool | str = False,
+    discount_rate: float = 0.052,
+    max_in_flight: int | None = None,
+    cache_size: int = 1024,
+    cache: ResultCache | None = None,
+) -> BatchStats:
+    """Run every scenario in `lines`, calling `emit(record)` as each completes.
+
+    workers <= 1 runs in-process (no pool); otherwise a ProcessPoolExecutor
+    of warm workers is used with at most max_in_flight (default 4 × workers)
+    scenarios queued at once.  Results are cached for this call only
+    (cache_size entries) unless `cache` is given: pass one ResultCache to
+    several calls made with the same statements / discount_rate options to
+    share results between books.  Keys include the config fingerprint, so
+    a shared cache stays valid across config edits.
+    """
+    stats = BatchStats()
+    cache = cache if cache is not None else ResultCache(cache_size)
+    started = time.perf_counter()
+    cfg = ModelConfig.load()
+
+    def _emit_ok(item: ScenarioLine, payload: dict, cached: bool) -> None:
+        stats.ok += 1
+        stats.cached += int(cached)
+        emit({"id": item.id, "fingerprint": item.fingerprint, "status": "ok",
+              "cached": cached, "inputs": item.overrides, **payload})
+
+    def _emit_error(item: ScenarioLine, error: str) -> None:
+        stats.errors += 1
+        emit({"id": item.id, "fingerprint": item.fingerprint, "status": "error", "error": error})
+
+    def _from_cache(item: ScenarioLine) -> bool:
+        hit = cache.get(item.fingerprint)
+        if hit is None:
+            return False
+        _emit_ok(item, {**hit, "elapsed_s": 0.0}, cached=True)
+        return True
+
+    if workers <= 1:
+        for item in read_scenarios(lines, cfg):
+            stats.total += 1
+            if item.error:
+                _emit_error(item, item.error)
+                continue
+            if _from_cache(item):
+                continue
+            t0 = time.perf_counter()
+            try:
+                payload = evaluate_scenario(
+                    *resolve_overrides(item.overrides, cfg),
+                    statements=statements, discount_rate=discount_rate,
+                )
+            except Exception as exc:  # one failing case must not stop the book
+                _emit_error(item, f"{type(exc).__name__}: {exc}")
+                continue
+            payload["elapsed_s"] = time.perf_counter() - t0
+            cache.put(item.fingerprint, payload)
+            _emit_ok(item, payload, cached=False)
+        stats.elapsed_s = time.perf_counter() - started
+        return stats
+
+    limit = max_in_flight or 4 * workers
+    in_flight: dict[Future, str] = {}
+    waiting: dict[str, list[ScenarioLine]] = {}
+
+    def _drain(block_until: int) -> None:
+        while len(in_flight) > block_until:
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for fut in done:
+                fp = in_flight.pop(fut)
+                items = waiting.pop(fp)
+                try:
+                    payload = fut.result()
+                except Exception as exc:
+                    for it in items:
+                        _emit_error(it, f"{type(exc).__name__}: {exc}")
+                    continue
+                cache.put(fp, payload)
+                for n, it in enumerate(items):
+                    _emit_ok(it, payload if n == 0 else {**payload, "elapsed_s": 0.0}, cached=n > 0)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(statements, discount_rate),
+    ) as pool:
+        for item in read_scenarios(lines, cfg):
+            stats.total += 1
+            if item.error:
+                _emit_error(item, item.error)
+                continue
+            if item.fingerprint in waiting:          # coalesce with in-flight twin
+                waiting[item.fingerprint].append(item)
+                continue
+            if _from_cache(item):
+                continue
+            _drain(limit - 1)
+            waiting[item.fingerprint] = [item]
+            in_flight[pool.submit(_worker_run, item.overrides, cfg.fingerprint)] = item.fingerprint
+        _drain(0)
+
+    stats.elapsed_s = time.perf_counter() - started
+    return stats
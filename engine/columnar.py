@@ -0,0 +1,341 @@
+"""Columnar export — partitioned Parquet / Arrow IPC datasets of model runs.
+
+Layout (hive partitioning, one directory per table):
+
+    <root>/<table>/entity=<key>/part-00000.parquet
+
+Tables: scenarios, metrics, annual, waterfall_semi, waterfall_annual,
+semi_annual_pl, sr_schedule, mz_schedule, ops_annual, ops_semi_annual,
+ic_semi, sweep.  The holding company is entity=sclca.  Every row carries a
+"scenario" column (scenario_fingerprint: "<config fp>:<inputs fp>", the
+engine.batch key) to join across tables; scenarios rows hold the inputs
+plus "config_overrides", the run's dotted config overlay as JSON text.
+
+Writes stream: rows are buffered per partition only until a row group is
+full (or the global cell budget is hit), then handed to a pyarrow writer,
+so a scenario book never sits in memory as list[dict] or a DataFrame.
+Column metadata (label, unit, nature, sign, family, fmt) comes from
+config/columns.json via ColumnRegistry and is attached to each field.
+
+    with ColumnarWriter("out/book") as w:
+        w.add_result(model_result, scenario=scenario_fingerprint(cfg, inputs), inputs=inputs)
+
+    open_dataset("out/book", "annual").to_table(filter=pc.field("entity") == "nwl")
+
+pyarrow is imported lazily (same as pandas in SweepResult.dataframe).
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from engine.registry import ColumnRegistry
+
+if TYPE_CHECKING:
+    from engine.config import ModelConfig, ScenarioInputs
+    from engine.scenarios import SweepResult
+    from engine.types import ModelResult
+
+ENTITY_TABLES = (
+    "annual", "waterfall_semi", "waterfall_annual", "semi_annual_pl",
+    "sr_schedule", "mz_schedule", "ops_annual", "ops_semi_annual",
+)
+HOLDING_TABLES = ("annual", "waterfall_semi", "waterfall_annual", "sr_schedule", "mz_schedule", "ic_semi")
+HOLDING_ENTITY = "sclca"
+
+_INT_KEYS = frozenset({"row", "year", "month", "period", "Year", "Month", "Period"})
+_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+def _pa():
+    try:
+        import pyarrow as pa
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError("Columnar export needs pyarrow: pip install pyarrow") from exc
+    return pa
+
+
+# ── Type inference ──────────────────────────────────────────────
+
+
+def _infer_type(key: str, values: list, registry: ColumnRegistry):
+    """Arrow type for one column, the same in every partition and part file.
+
+    Registered columns are numeric statement lines: always float64,
+    whatever one buffer happens to hold — a flag that is False for one
+    entity and 0.0 (or a count, at holding level) for another must not be
+    bool in one file and double in the next.  Whole-number period keys are
+    int64; unregistered all-bool columns bool, other numbers float64.
+    All-None columns are null (unify with any type).
+    """
+    pa = _pa()
+    seen = {type(v) for v in values if v is not None}
+    if seen and not seen <= {int, float, bool}:
+        return pa.string()                                 # text; nested values -> JSON text
+    if key in _INT_KEYS and all(v is None or float(v).is_integer() for v in values):
+        return pa.int64() if seen else pa.null()           # 3.0 and 3 are the same period
+    if registry.get(key) is not None:
+        return pa.float64()
+    if not seen:
+        return pa.null()
+    return pa.bool_() if seen == {bool} else pa.float64()
+
+
+def _to_array(values: list, typ):
+    pa = _pa()
+    if pa.types.is_floating(typ):
+        values = [None if v is None else float(v) for v in values]
+    elif pa.types.is_integer(typ):
+        values = [None if v is None else int(v) for v in values]
+    elif pa.types.is_string(typ):
+        values = [v if v is None or isinstance(v, str) else json.dumps(v, default=str) for v in values]
+    return pa.array(values, type=typ)
+
+
+# ── Partition writer ────────────────────────────────────────────
+
+
+class _Partition:
+    """Buffered rows + open file writer for one (table, entity) directory."""
+
+    def __init__(self, directory: Path, table: str, fmt: str, compression: str,
+                 registry: ColumnRegistry) -> None:
+        self.directory = directory
+        self.table = table
+        self.fmt = fmt
+        self.compression = compression
+        self.registry = registry
+        self.rows: list[dict] = []
+        self.cells = 0
+        self.schema = None
+        self._writer = None
+        self._sink = None
+        self._part = len(list(directory.glob(f"part-*{_FORMATS[fmt]}"))) if directory.exists() else 0
+
+    def append(self, row: dict) -> None:
+        self.rows.append(row)
+        self.cells += len(row)
+
+    def _field(self, key: str, typ):
+        pa = _pa()
+        col = self.registry.get(key)
+        meta = None
+        if col is not None:
+            meta = {k: str(getattr(col, k)) for k in ("label", "unit", "nature", "sign", "family", "fmt")}
+        return pa.field(key, typ, metadata=meta)
+
+    def _open(self, schema) -> None:
+        pa = _pa()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"part-{self._part:05d}{_FORMATS[self.fmt]}"
+        self._part += 1
+        if self.fmt == "parquet":
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(str(path), schema, compression=self.compression)
+        else:
+            self._sink = pa.OSFile(str(path), "wb")
+            self._writer = pa.ipc.new_file(self._sink, schema)
+        self.schema = schema
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+    def flush(self) -> None:
+        if not self.rows:
+            return
+        pa = _pa()
+        keys: dict[str, None] = {}
+        for row in self.rows:
+            keys.update(dict.fromkeys(row))
+        batch = None
+        if self.schema is not None and set(keys) <= set(self.schema.names):
+            try:
+                batch = pa.Table.from_arrays(
+                    [_to_array([r.get(f.name) for r in self.rows], f.type) for f in self.schema],
+                    schema=self.schema,
+                )
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+                batch = None
+        if batch is None:
+            # New columns or types: start a new part file with the widened schema
+            names = list(self.schema.names) if self.schema is not None else []
+            names += [k for k in keys if k not in names]
+            columns = {k: [r.get(k) for r in self.rows] for k in names}
+            schema = pa.schema(
+                [self._field(k, _infer_type(k, v, self.registry)) for k, v in columns.items()],
+                metadata={"table": self.table, "source": "sclca-model"},
+            )
+            batch = pa.Table.from_arrays([_to_array(columns[f.name], f.type) for f in schema], schema=schema)
+            self._close_writer()
+            self._open(schema)
+        self._writer.write_table(batch)
+        self.rows = []
+        self.cells = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._close_writer()
+
+
+# ── Dataset writer ──────────────────────────────────────────────
+
+
+class ColumnarWriter:
+    """Streaming writer for a partitioned Parquet (or Arrow IPC) dataset.
+
+    row_group_rows bounds each partition's buffer; max_buffered_cells bounds
+    the total across partitions (all partitions flush when exceeded).
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        fmt: str = "parquet",
+        compression: str = "zstd",
+        row_group_rows: int = 8192,
+        max_buffered_cells: int = 2_000_000,
+    ) -> None:
+        if fmt not in _FORMATS:
+            raise ValueError(f"fmt must be one of {sorted(_FORMATS)}, got {fmt!r}")
+        _pa()
+        self.root = Path(root)
+        self.fmt = fmt
+        self.compression = compression
+        self.row_group_rows = row_group_rows
+        self.max_buffered_cells = max_buffered_cells
+        self.rows_written = 0
+        self._registry = ColumnRegistry.load()
+        self._parts: dict[tuple[str, str], _Partition] = {}
+        self._cells = 0
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for part in self._parts.values():
+            part.close()
+        self._parts.clear()
+        self._cells = 0
+
+    def write_rows(self, table: str, entity: str, rows, **columns) -> None:
+        """Append rows to <table>/entity=<entity>; extra columns are added to every row."""
+        key = (table, entity)
+        part = self._parts.get(key)
+        if part is None:
+            part = _Partition(self.root / table / f"entity={entity}", table, self.fmt,
+                              self.compression, self._registry)
+            self._parts[key] = part
+        for i, row in enumerate(rows or ()):
+            part.append({**columns, "row": i, **row})
+            self._cells += len(row) + len(columns) + 1
+            self.rows_written += 1
+            if len(part.rows) >= self.row_group_rows:
+                self._cells -= part.cells
+                part.flush()
+        if self._cells > self.max_buffered_cells:
+            for p in self._parts.values():
+                p.flush()
+            self._cells = 0
+
+    # ── Model outputs ──
+
+    def add_result(
+        self,
+        result: ModelResult,
+        scenario: str = "",
+        inputs: ScenarioInputs | None = None,
+        discount_rate: float = 0.052,
+    ) -> None:
+        """All statements for one ModelResult (+ metrics and inputs rows)."""
+        from engine.batch import result_payload
+
+        for key, er in result.entities.items():
+            for table in ENTITY_TABLES:
+                self.write_rows(table, key, getattr(er, table), scenario=scenario)
+        holding = result.holding or {}
+        for table in HOLDING_TABLES:
+            self.write_rows(table, HOLDING_ENTITY, holding.get(table), scenario=scenario)
+        payload = result_payload(result, discount_rate=discount_rate)
+        self._write_summary(scenario, inputs.to_json() if inputs is not None else None, payload)
+
+    def add_record(self, record: dict) -> None:
+        """One engine.batch "ok" record (statements included when present)."""
+        if record.get("status", "ok") != "ok":
+            return
+        from engine.config import ScenarioInputs, split_overrides
+
+        scenario = record.get("fingerprint", "")
+        for key, stmts in (record.get("statements") or {}).items():
+            entity = HOLDING_ENTITY if key == HOLDING_ENTITY else key
+            for table, rows in stmts.items():
+                self.write_rows(table, entity, rows, scenario=scenario)
+        config, overrides = split_overrides(record.get("inputs", {}))
+        inputs = ScenarioInputs.from_overrides(overrides).to_json()
+        self._write_summary(scenario, inputs, record, config)
+
+    def _write_summary(self, scenario: str, inputs_json: str | None, payload: dict,
+                       config: dict | None = None) -> None:
+        for key, m in payload.get("metrics", {}).items():
+            self.write_rows("metrics", key, [{k: v for k, v in m.items() if k != "entity"}],
+                            scenario=scenario)
+        row = {f"holding_{k}": v for k, v in payload.get("holding", {}).items()}
+        if inputs_json is not None:
+            row.update(json.loads(inputs_json))
+        # Dotted config overlay of the run ({"rates.fx.eur_zar": 21.0}), as JSON text
+        row["config_overrides"] = json.dumps(config or {}, sort_keys=True, default=str)
+        self.write_rows("scenarios", HOLDING_ENTITY, [row], scenario=scenario)
+
+    def add_sweep(self, sweep: SweepResult, scenario: str = "") -> None:
+        """SweepResult rows in a variable-independent layout (variable, value, metrics)."""
+        attr = sweep.variable.attr
+        rows = (
+            {"variable": attr, "label": sweep.variable.label, "value": r[attr],
+             **{k: v for k, v in r.items() if k not in (attr, "entity")}}
+            for r in sweep.rows
+        )
+        self.write_rows("sweep", sweep.entity_key, rows, scenario=scenario)
+
+
+def write_model_result(result: ModelResult, root: str | Path, inputs: ScenarioInputs | None = None,
+                       cfg: ModelConfig | None = None, **kwargs) -> Path:
+    """One-shot export of a single ModelResult; returns the dataset root.
+
+    cfg is the snapshot the result was run under (default: the loaded one);
+    it and inputs make the scenario key.
+    """
+    scenario = ""
+    if inputs is not None:
+        from engine.config import ModelConfig, scenario_fingerprint
+
+        scenario = scenario_fingerprint(cfg if cfg is not None else ModelConfig.load(), inputs)
+    with ColumnarWriter(root, **kwargs) as writer:
+        writer.add_result(result, scenario=scenario, inputs=inputs)
+    return Path(root)
+
+
+def open_dataset(root: str | Path, table: str, fmt: str = "parquet"):
+    """pyarrow Dataset over one table, schema unified across entities / parts."""
+    pa = _pa()
+    import pyarrow.dataset as ds
+
+    path = Path(root) / table
+    files = sorted(str(p) for p in path.glob(f"entity=*/part-*{_FORMATS[fmt]}"))
+    if not files:
+        raise FileNotFoundError(f"No {fmt} parts under {path}")
+    file_format = "parquet" if fmt == "parquet" else "ipc"
+    schemas = [ds.dataset(f, format=file_format).schema for f in files]
+    schema = pa.unify_schemas(schemas + [pa.schema([("entity", pa.string())])])
+    return ds.dataset(files, schema=schema, format=file_format,
+                      partitioning=ds.partitioning(pa.schema([("entity", pa.string())]), flavor="hive"),
+                      partition_base_dir=str(path))
@@ -1,23 +1,155 @@
-"""Model configuration — loads all JSON configs, no Streamlit."""
+"""Model configuration — loads all JSON configs, no Streamlit.
+
+ModelConfig is an immutable snapshot: every section is a deep-frozen
+mapping (FrozenDict / FrozenList, still dict / list subclasses so JSON and
+isinstance checks keep working), derived constants are computed once at
+construction, and the content fingerprint is hashed once per snapshot.
+with_overrides() returns a new snapshot that shares every unchanged
+subtree, so a sweep over a rate or a structure parameter copies only the
+mappings on the changed paths:
+
+    cfg = ModelConfig.load()
+    hi_tax = cfg.with_overrides({"rates.tax.corporate_rate": 0.30})
+"""
 
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
-from functools import lru_cache
+from functools import cached_property, lru_cache
+from typing import Any, Mapping
 
 from engine.currency import EUR, ZAR, FxRate
 
 _CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
 
 
-@lru_cache(maxsize=16)
-def load_config(name: str) -> dict:
-    """Load a JSON config file by name (without .json extension)."""
-    path = _CONFIG_DIR / f"{name}.json"
-    with open(path, "r") as f:
-        return json.load(f)
+# ── Frozen containers ───────────────────────────────────────────
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is immutable (use ModelConfig.with_overrides)")
+
+
+class FrozenDict(dict):
+    """Read-only dict; values are frozen recursively by freeze(), copies are plain dicts."""
+
+    __slots__ = ("_digest",)
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):                 # copies are for mutating: hand back plain containers
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+class FrozenList(list):
+    """Read-only list; `+`, slicing and copies return plain lists."""
+
+    __slots__ = ("_digest",)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+def freeze(obj: Any) -> Any:
+    """Deep-frozen view of JSON-like data; already-frozen subtrees are shared."""
+    if isinstance(obj, (FrozenDict, FrozenList)):
+        return obj
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return FrozenList(freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """Plain, mutable deep copy of (frozen) JSON-like data."""
+    if isinstance(obj, dict):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [thaw(v) for v in obj]
+    return obj
+
+
+def digest(obj: Any) -> str:
+    """Content hash of frozen data, memoised on each frozen node."""
+    if isinstance(obj, (FrozenDict, FrozenList)):
+        try:
+            return obj._digest
+        except AttributeError:
+            pass
+    if isinstance(obj, dict):
+        parts = [f"{json.dumps(str(k))}:{digest(obj[k])}" for k in sorted(obj, key=str)]
+        raw = "{" + ",".join(parts) + "}"
+    elif isinstance(obj, list):
+        raw = "[" + ",".join(digest(v) for v in obj) + "]"
+    else:
+        return json.dumps(obj, sort_keys=True, default=str)
+    h = hashlib.sha1(raw.encode()).hexdigest()
+    if isinstance(obj, (FrozenDict, FrozenList)):
+        obj._digest = h
+    return h
+
+
+def _assoc_in(node: Any, keys: list[str], value: Any, path: str) -> Any:
+    """Copy of node with value at keys; only the nodes on the path are copied."""
+    key, rest = keys[0], keys[1:]
+    if isinstance(node, list):
+        try:
+            index = int(key)
+            child = node[index]
+        except (ValueError, IndexError):
+            raise KeyError(f"{path}: no list index {key!r}") from None
+        items = list(node)
+        items[index] = _assoc_in(child, rest, value, path) if rest else freeze(value)
+        return FrozenList(items)
+    if not isinstance(node, dict):
+        raise KeyError(f"{path}: {key!r} is below a scalar")
+    if rest and key not in node:
+        raise KeyError(f"{path}: no key {key!r}")
+    items = dict(node)
+    items[key] = _assoc_in(node[key], rest, value, path) if rest else freeze(value)
+    return FrozenDict(items)
+
+
+# ── Loaders ─────────────────────────────────────────────────────
+
+
+_CONFIG_CACHE: dict[str, FrozenDict] = {}
+
+
+def load_config(name: str) -> FrozenDict:
+    """Load a JSON config file by name (without .json extension), frozen."""
+    cached = _CONFIG_CACHE.get(name)
+    if cached is None:
+        with open(_CONFIG_DIR / f"{name}.json", "r") as f:
+            cached = _CONFIG_CACHE[name] = freeze(json.load(f))
+    return cached
+
+
+def forget_config(name: str) -> None:
+    """Drop one file from the loader cache; a ModelConfig section also drops the snapshot."""
+    _CONFIG_CACHE.pop(name, None)
+    if name in CONFIG_SECTIONS:
+        _load_snapshot.cache_clear()
 
 
 def load_rates() -> dict:
@@ -52,96 +184,136 @@ def load_project() -> dict:
     return load_config("project")
 
 
-@dataclass
+# ── Model config ────────────────────────────────────────────────
+
+
+CONFIG_SECTIONS = ("structure", "financing", "waterfall", "operations", "assets", "fees", "project", "rates")
+
+
+@dataclass(frozen=True)
 class ModelConfig:
-    """Consolidated model configuration from all JSON files."""
-    structure: dict = field(default_factory=dict)
-    financing: dict = field(default_factory=dict)
-    waterfall: dict = field(default_factory=dict)
-    operations: dict = field(default_factory=dict)
-    assets: dict = field(default_factory=dict)
-    fees: dict = field(default_factory=dict)
-    project: dict = field(default_factory=dict)
-    rates: dict = field(default_factory=dict)
-
-    # Derived constants
-    ic_margin: float = 0.0
-    sr_facility_rate: float = 0.0
-    mz_facility_rate: float = 0.0
-    sr_ic_rate: float = 0.0
-    mz_ic_rate: float = 0.0
-    sr_repayments: int = 14
-    mz_repayments: int = 10
-    fd_rate_eur: float = 0.0
-    fd_rate_zar: float = 0.0
-    od_rate: float = 0.0
-    mz_div_gap_rate: float = 0.0
-    zar_swap_rate: float = 0.0
-    tax_rate: float = 0.0
-    fx_rate: float = 0.0
-    fx: FxRate | None = None
-    dsra_rate: float = 0.0
-    cc_irr_target: float = 0.0
-    ops_reserve_coverage: float = 0.0
+    """Consolidated model configuration from all JSON files (immutable snapshot)."""
+    structure: dict = field(default_factory=FrozenDict)
+    financing: dict = field(default_factory=FrozenDict)
+    waterfall: dict = field(default_factory=FrozenDict)
+    operations: dict = field(default_factory=FrozenDict)
+    assets: dict = field(default_factory=FrozenDict)
+    fees: dict = field(default_factory=FrozenDict)
+    project: dict = field(default_factory=FrozenDict)
+    rates: dict = field(default_factory=FrozenDict)
+
+    # Derived constants (computed in __post_init__)
+    ic_margin: float = field(default=0.0, init=False)
+    sr_facility_rate: float = field(default=0.0, init=False)
+    mz_facility_rate: float = field(default=0.0, init=False)
+    sr_ic_rate: float = field(default=0.0, init=False)
+    mz_ic_rate: float = field(default=0.0, init=False)
+    sr_repayments: int = field(default=14, init=False)
+    mz_repayments: int = field(default=10, init=False)
+    fd_rate_eur: float = field(default=0.0, init=False)
+    fd_rate_zar: float = field(default=0.0, init=False)
+    od_rate: float = field(default=0.0, init=False)
+    mz_div_gap_rate: float = field(default=0.0, init=False)
+    zar_swap_rate: float = field(default=0.0, init=False)
+    tax_rate: float = field(default=0.0, init=False)
+    fx_rate: float = field(default=0.0, init=False)
+    fx: FxRate | None = field(default=None, init=False)
+    dsra_rate: float = field(default=0.0, init=False)
+    cc_irr_target: float = field(default=0.0, init=False)
+    ops_reserve_coverage: float = field(default=0.0, init=False)
 
     # Equity
-    equity_nwl: float = 0.0
-    equity_lanred: float = 0.0
-    equity_twx: float = 0.0
+    equity_nwl: float = field(default=0.0, init=False)
+    equity_lanred: float = field(default=0.0, init=False)
+    equity_twx: float = field(default=0.0, init=False)
+
+    def __post_init__(self):
+        for name in CONFIG_SECTIONS:
+            object.__setattr__(self, name, freeze(getattr(self, name)))
+        if self.rates:                      # bare ModelConfig() keeps zero constants
+            for name, value in self._derive_constants().items():
+                object.__setattr__(self, name, value)
 
     @classmethod
     def load(cls) -> "ModelConfig":
-        """Load all configs and derive constants."""
-        cfg = cls(
-            structure=load_structure(),
-            financing=load_financing(),
-            waterfall=load_waterfall_config(),
-            operations=load_operations(),
-            assets=load_assets(),
-            fees=load_fees(),
-            project=load_project(),
-            rates=load_rates(),
-        )
-        cfg._derive_constants()
-        return cfg
+        """The snapshot of all configs on disk (loaded once, shared)."""
+        return _load_snapshot()
 
-    def _derive_constants(self):
+    def _derive_constants(self) -> dict:
         rates = self.rates
         sr = self.structure["sources"]["senior_debt"]
         mz = self.structure["sources"]["mezzanine"]
         proj = self.project
-
-        self.ic_margin = rates.get("intercompany_margin", 0.005)
-        self.sr_facility_rate = rates["senior_debt"]["facility_rate"]
-        self.mz_facility_rate = rates["mezzanine"]["total_rate"]
-        self.sr_ic_rate = self.sr_facility_rate + self.ic_margin  # 5.20%
-        self.mz_ic_rate = self.mz_facility_rate + self.ic_margin  # 14.75%
-        self.sr_repayments = sr["repayments"]                     # 14
-        self.mz_repayments = mz.get("repayments", 10)             # 10
-        self.fd_rate_eur = rates["fixed_deposits"]["eur"]["rate"]  # 3.5%
-        self.fd_rate_zar = rates["fixed_deposits"]["zar"]["rate"]  # 9.0%
-        self.od_rate = rates["ic_overdraft"]["rate"]               # 10%
-        self.mz_div_gap_rate = rates["cc_irr"]["gap"]              # 5.25%
-        self.zar_swap_rate = rates["swap"]["zar_rate"]             # 9.69%
-        self.cc_irr_target = rates["cc_irr"]["target"]             # 20%
-        self.tax_rate = rates["tax"]["corporate_rate"]             # 27%
-        self.fx_rate = rates["fx"]["eur_zar"]                      # 20.0
-        self.fx = FxRate(self.fx_rate)
+        d: dict = {}
+
+        d["ic_margin"] = rates.get("intercompany_margin", 0.005)
+        d["sr_facility_rate"] = rates["senior_debt"]["facility_rate"]
+        d["mz_facility_rate"] = rates["mezzanine"]["total_rate"]
+        d["sr_ic_rate"] = d["sr_facility_rate"] + d["ic_margin"]   # 5.20%
+        d["mz_ic_rate"] = d["mz_facility_rate"] + d["ic_margin"]   # 14.75%
+        d["sr_repayments"] = sr["repayments"]                      # 14
+        d["mz_repayments"] = mz.get("repayments", 10)              # 10
+        d["fd_rate_eur"] = rates["fixed_deposits"]["eur"]["rate"]  # 3.5%
+        d["fd_rate_zar"] = rates["fixed_deposits"]["zar"]["rate"]  # 9.0%
+        d["od_rate"] = rates["ic_overdraft"]["rate"]               # 10%
+        d["mz_div_gap_rate"] = rates["cc_irr"]["gap"]              # 5.25%
+        d["zar_swap_rate"] = rates["swap"]["zar_rate"]             # 9.69%
+        d["cc_irr_target"] = rates["cc_irr"]["target"]             # 20%
+        d["tax_rate"] = rates["tax"]["corporate_rate"]             # 27%
+        d["fx_rate"] = rates["fx"]["eur_zar"]                      # 20.0
+        d["fx"] = FxRate(d["fx_rate"])
 
         # Waterfall cascade parameters
         ec = self.waterfall["entity_cascade"]
-        self.ops_reserve_coverage = ec["ops_reserve_coverage_pct"]  # 1.0
+        d["ops_reserve_coverage"] = ec["ops_reserve_coverage_pct"]  # 1.0
 
         # DSRA rate from project.json (legacy)
         params = proj.get("model_parameters", {})
-        self.dsra_rate = params.get("dsra_rate", 0.09)
+        d["dsra_rate"] = params.get("dsra_rate", 0.09)
 
         # Equity
         eq = params.get("equity_in_subsidiaries", {})
         fx = proj["project"]["fx_rates"]["EUR_ZAR"]
-        self.equity_nwl = ZAR(eq.get("nwl_pct", 0.93) * eq.get("nwl_base_zar", 1000000)).to_eur(fx).value
-        self.equity_lanred = ZAR(eq.get("lanred_pct", 1.0) * eq.get("lanred_base_zar", 1000000)).to_eur(fx).value
-        self.equity_twx = ZAR(eq.get("timberworx_pct", 0.05) * eq.get("timberworx_base_zar", 1000000)).to_eur(fx).value
+        d["equity_nwl"] = ZAR(eq.get("nwl_pct", 0.93) * eq.get("nwl_base_zar", 1000000)).to_eur(fx).value
+        d["equity_lanred"] = ZAR(eq.get("lanred_pct", 1.0) * eq.get("lanred_base_zar", 1000000)).to_eur(fx).value
+        d["equity_twx"] = ZAR(eq.get("timberworx_pct", 0.05) * eq.get("timberworx_base_zar", 1000000)).to_eur(fx).value
+        return d
+
+    # -- Identity --
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Content hash of all sections (computed once; shared subtrees reuse theirs)."""
+        raw = ",".join(f"{name}:{digest(getattr(self, name))}" for name in CONFIG_SECTIONS)
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ModelConfig):
+            return NotImplemented
+        return self is other or self.fingerprint == other.fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    # -- Copy-on-write --
+
+    def with_overrides(self, overrides: Mapping[str, Any]) -> "ModelConfig":
+        """New snapshot with {"section.key.sub": value} paths replaced.
+
+        A path may also name a whole section or subtree (its value is frozen
+        and used as-is).  Digits index into lists.  Intermediate keys must
+        exist (KeyError otherwise); the last one may be new.  Unchanged
+        sections and subtrees are shared with this snapshot, not copied.
+        """
+        sections = {name: getattr(self, name) for name in CONFIG_SECTIONS}
+        for path, value in overrides.items():
+            section, *keys = path.split(".")
+            if section not in sections:
+                raise KeyError(f"{path}: unknown config section {section!r}")
+            sections[section] = (_assoc_in(sections[section], keys, value, path)
+                                 if keys else freeze(value))
+        changed = {k: v for k, v in sections.items() if v is not getattr(self, k)}
+        return replace(self, **changed) if changed else self
 
     def entity_loans(self) -> dict[str, dict]:
         """Return {entity_key: {senior_portion, mezz_portion, ...}} from structure."""
@@ -154,6 +326,11 @@ class ModelConfig:
         return sum(l["mezz_portion"] for l in self.entity_loans().values())
 
 
+@lru_cache(maxsize=1)
+def _load_snapshot() -> ModelConfig:
+    return ModelConfig(**{name: load_config(name) for name in CONFIG_SECTIONS})
+
+
 @dataclass
 class ScenarioInputs:
     """UI-driven overrides (from Streamlit sliders or defaults)."""
@@ -254,3 +431,65 @@ class ScenarioInputs:
     def defaults(cls) -> "ScenarioInputs":
         """Return default ScenarioInputs (no UI overrides)."""
         return cls()
+
+    @classmethod
+    def from_overrides(cls, overrides: dict) -> "ScenarioInputs":
+        """Build from a partial {field: value} dict (batch CLI / service input).
+
+        Session-state derivations apply (hedge selection -> swap toggles,
+        scenario -> LanRED ECA defaults); fields given explicitly win.
+        Raises ValueError on unknown keys; dotted config paths belong to
+        resolve_overrides().
+        """
+        names = {f.name for f in fields(cls)}
+        unknown = sorted(set(overrides) - names)
+        if unknown:
+            raise ValueError(f"Unknown ScenarioInputs fields: {unknown}")
+        inputs = cls.from_session_state(overrides)
+        for key, value in overrides.items():
+            setattr(inputs, key, value)
+        return inputs
+
+    def to_json(self) -> str:
+        """Canonical JSON of the public fields (orchestrator-private vectors excluded)."""
+        values = {f.name: getattr(self, f.name) for f in fields(self)}   # all scalars: no deep copy
+        return json.dumps(values, sort_keys=True, default=str)
+
+    def fingerprint(self) -> str:
+        """Stable hash of the public fields."""
+        return hashlib.sha1(self.to_json().encode()).hexdigest()
+
+
+# ── Flat overrides ──────────────────────────────────────────────
+
+
+def is_config_path(attr: str) -> bool:
+    return "." in attr and attr.split(".", 1)[0] in CONFIG_SECTIONS
+
+
+def split_overrides(overrides: dict) -> tuple[dict, dict]:
+    """(config path overrides, ScenarioInputs overrides) from one flat dict."""
+    config = {k: v for k, v in overrides.items() if is_config_path(k)}
+    return config, {k: v for k, v in overrides.items() if k not in config}
+
+
+def resolve_overrides(overrides: dict, cfg: ModelConfig | None = None) -> tuple[ModelConfig, ScenarioInputs]:
+    """(cfg, inputs) for a flat dict mixing dotted config paths and ScenarioInputs fields.
+
+    Config paths become a copy-on-write overlay on cfg (default: the loaded
+    snapshot); the rest go through ScenarioInputs.from_overrides.  Raises
+    ValueError for unknown fields and for config paths that do not resolve.
+    """
+    config, inputs = split_overrides(overrides)
+    cfg = cfg if cfg is not None else ModelConfig.load()
+    if config:
+        try:
+            cfg = cfg.with_overrides(config)
+        except KeyError as exc:
+            raise ValueError(f"Unknown config path: {exc.args[0]}") from None
+    return cfg, ScenarioInputs.from_overrides(inputs)
+
+
+def scenario_fingerprint(cfg: ModelConfig, inputs: ScenarioInputs) -> str:
+    """Cache / dedup key for one (config, inputs) pair."""
+    return f"{cfg.fingerprint}:{inputs.fingerprint()}"
@@ -0,0 +1,344 @@
+"""Excel export — write-only openpyxl workbooks of engine results.
+
+    write_model_workbook(result, "model.xlsx")          # one sheet per statement
+    write_scenario_book(items, "book.xlsx")              # one sheet per scenario
+
+Each entity gets a "Statements" sheet laid out by the statement templates
+(engine.statements: sections, subtotals, signs as in the app), followed
+by the raw statements (annual P&L/CF/BS, semi-annual waterfall, holding)
+line items down / periods across; facility schedules keep their
+period-row layout.  Number formats and labels come from config/columns.json
+(ColumnRegistry fmt + label) and are applied through a handful of named
+styles registered once per workbook, so cells carry a style reference
+instead of per-cell font/format objects.
+
+Write-only mode streams each sheet's rows to a temp file as they are
+appended: memory stays flat however many scenarios a book holds, and each
+result can be discarded once its sheet is written.  Accepts a ModelResult
+or its to_dict() form (Streamlit cache / model service payload).
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from copy import copy
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterable
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+
+from engine.registry import ColumnRegistry
+from engine.statements import StatementTable, model_statements
+
+if TYPE_CHECKING:
+    from engine.config import ScenarioInputs
+    from engine.types import ModelResult
+
+ENTITY_LABELS = {"nwl": "NWL", "lanred": "LanRED", "timberworx": "Timberworx", "sclca": "SCLCA"}
+
+# (section key, title, source table, layout) — "wide" = periods across
+ENTITY_SECTIONS = (
+    ("annual", "Annual P&L / CF / BS", "annual", "wide"),
+    ("waterfall_semi", "Semi-annual Waterfall", "waterfall_semi", "wide"),
+    ("sr_schedule", "Senior IC Facility", "sr_schedule", "rows"),
+    ("mz_schedule", "Mezz IC Facility", "mz_schedule", "rows"),
+)
+HOLDING_SECTIONS = (
+    ("annual", "Annual P&L / CF / BS", "annual", "wide"),
+    ("consolidated", "Consolidated", "consolidated", "wide"),
+    ("waterfall_semi", "Semi-annual Waterfall", "waterfall_semi", "wide"),
+    ("sr_schedule", "Senior Facility", "sr_schedule", "rows"),
+    ("mz_schedule", "Mezz Facility", "mz_schedule", "rows"),
+)
+
+_PERIOD_KEYS = ("year", "month", "period", "Year", "Month", "Period")
+
+# ColumnRegistry fmt -> Excel number format (pct / ratio values are already x100 / multiples)
+_NUMBER_FORMATS = {
+    "money": '#,##0;(#,##0);"-"',
+    "money_zar": '"R" #,##0;("R" #,##0);"-"',
+    "volume": "#,##0",
+    "int": "0",
+    "pct": '0.0"%"',
+    "ratio": '0.00"x"',
+}
+_DEFAULT_FMT = "money"
+
+
+# ── Styles ──────────────────────────────────────────────────────
+
+
+def _named_styles() -> list[NamedStyle]:
+    thin = Side(style="thin", color="CBD5E1")
+    styles = [
+        NamedStyle(name="sc_title", font=Font(bold=True, size=13, color="1E3A8A")),
+        NamedStyle(name="sc_section", font=Font(bold=True, color="FFFFFF"),
+                   fill=PatternFill("solid", fgColor="1E40AF")),
+        NamedStyle(name="sc_header", font=Font(bold=True), fill=PatternFill("solid", fgColor="E2E8F0"),
+                   border=Border(bottom=thin), alignment=Alignment(horizontal="center")),
+        NamedStyle(name="sc_label", font=Font(color="334155")),
+        NamedStyle(name="sc_subhead", font=Font(bold=True, color="1E3A8A")),
+        NamedStyle(name="sc_total", font=Font(bold=True, color="1E293B")),
+        NamedStyle(name="sc_text"),
+    ]
+    for fmt, number_format in _NUMBER_FORMATS.items():
+        styles.append(NamedStyle(name=f"sc_{fmt}", number_format=number_format))
+    return styles
+
+
+class _Styler:
+    """Precomputed label / style lookup per column key (registry resolved once).
+
+    Named styles are bound once to a prototype cell per sheet; new cells
+    copy its StyleArray instead of re-resolving the style by name.
+    """
+
+    def __init__(self, wb: Workbook) -> None:
+        for style in _named_styles():
+            wb.add_named_style(style)
+        self._registry = ColumnRegistry.load()
+        self._cache: dict[str, tuple[str, str]] = {}
+        self._protos: dict[tuple[int, str], WriteOnlyCell] = {}
+
+    def column(self, key: str) -> tuple[str, str]:
+        """(label, style name) for a column key."""
+        hit = self._cache.get(key)
+        if hit is None:
+            col = self._registry.get(key)
+            label = col.label if col is not None else key
+            fmt = col.fmt if col is not None and col.fmt in _NUMBER_FORMATS else _DEFAULT_FMT
+            hit = self._cache[key] = (label, f"sc_{fmt}")
+        return hit
+
+    def cell(self, ws, value, style: str) -> WriteOnlyCell | None:
+        if value is None:                                  # empty cell, nothing to style
+            return None
+        proto = self._protos.get((id(ws), style))
+        if proto is None:
+            proto = WriteOnlyCell(ws)
+            proto.style = style
+            self._protos[(id(ws), style)] = proto
+        cell = WriteOnlyCell(ws, value=value)
+        cell._style = copy(proto._style)
+        return cell
+
+
+def _value(v):
+    if v is None or isinstance(v, (int, float, str, bool)):
+        return v
+    return str(v)
+
+
+# ── Section writers ─────────────────────────────────────────────
+
+
+def _period_labels(rows: list[dict], prefix: str) -> list[str]:
+    for key in _PERIOD_KEYS:
+        if rows and all(key in r for r in rows):
+            return [f"{prefix}{r[key]:g}" if isinstance(r[key], (int, float)) else str(r[key]) for r in rows]
+    return [f"{prefix}{i + 1}" for i in range(len(rows))]
+
+
+def _write_wide(ws, styler: _Styler, title: str, rows: list[dict], prefix: str) -> None:
+    """Line items down, periods across."""
+    ws.append([styler.cell(ws, title, "sc_section")])
+    ws.append([styler.cell(ws, "Line item", "sc_header")]
+              + [styler.cell(ws, p, "sc_header") for p in _period_labels(rows, prefix)])
+    keys: dict[str, None] = {}
+    for r in rows:
+        keys.update(dict.fromkeys(r))
+    for key in keys:
+        if key in _PERIOD_KEYS:
+            continue
+        label, style = styler.column(key)
+        values = [_value(r.get(key)) for r in rows]
+        if not any(isinstance(v, (int, float)) for v in values):
+            style = "sc_text"
+        ws.append([styler.cell(ws, label, "sc_label")] + [styler.cell(ws, v, style) for v in values])
+    ws.append([])
+
+
+def _write_rows(ws, styler: _Styler, title: str, rows: list[dict]) -> None:
+    """One row per period (facility schedules)."""
+    ws.append([styler.cell(ws, title, "sc_section")])
+    if not rows:
+        ws.append([])
+        return
+    keys = list(rows[0])
+    ws.append([styler.cell(ws, styler.column(k)[0], "sc_header") for k in keys])
+    styles = [
+        ("sc_int" if all(isinstance(r.get(k), int) for r in rows) else "sc_text")
+        if k in _PERIOD_KEYS else styler.column(k)[1]
+        for k in keys
+    ]
+    for r in rows:
+        ws.append([styler.cell(ws, _value(r.get(k)), s) for k, s in zip(keys, styles)])
+    ws.append([])
+
+
+def _write_statement(ws, styler: _Styler, table: StatementTable) -> None:
+    """Template statement: lines down, years + Total across (values signed for display)."""
+    ws.append([styler.cell(ws, table.name, "sc_section")])
+    ws.append([styler.cell(ws, "EUR", "sc_header")]
+              + [styler.cell(ws, f"Y{y}", "sc_header") for y in table.years]
+              + [styler.cell(ws, "Total", "sc_header")])
+    for line in table.lines:
+        if line.style == "spacer":
+            continue
+        if line.style == "section":
+            ws.append([styler.cell(ws, line.label, "sc_subhead")])
+            continue
+        style = "sc_ratio" if line.fmt == "ratio" else "sc_money"
+        label_style = "sc_total" if line.style in ("sub", "total", "grand") else "sc_label"
+        values = [v if v is not None and math.isfinite(v) else None for v in line.values + [line.total]]
+        ws.append([styler.cell(ws, line.label, label_style)] + [styler.cell(ws, v, style) for v in values])
+    ws.append([])
+
+
+def _sections(model: dict) -> Iterable[tuple[str, str, str, list[dict], str]]:
+    """(entity, section key, title, rows, layout) for every exported table."""
+    for key, ent in model["entities"].items():
+        for sec, title, table, layout in ENTITY_SECTIONS:
+            yield key, sec, title, ent.get(table) or [], layout
+    holding = model.get("holding") or {}
+    for sec, title, table, layout in HOLDING_SECTIONS:
+        yield "sclca", sec, title, holding.get(table) or [], layout
+
+
+def _write_section(ws, styler: _Styler, title: str, rows: list[dict], layout: str, sec: str) -> None:
+    if layout == "wide":
+        _write_wide(ws, styler, title, rows, "H" if sec == "waterfall_semi" else "Y")
+    else:
+        _write_rows(ws, styler, title, rows)
+
+
+def _sheet_name(name: str, used: set[str]) -> str:
+    base = re.sub(r"[\[\]:*?/\\]", "-", name)[:31]
+    candidate, n = base, 2
+    while candidate.lower() in used:
+        suffix = f" ({n})"
+        candidate = base[:31 - len(suffix)] + suffix
+        n += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+def _as_dict(result) -> dict:
+    return result if isinstance(result, dict) else result.to_dict()
+
+
+# ── Workbooks ───────────────────────────────────────────────────
+
+
+def _summary_rows(model: dict, discount_rate: float) -> list[tuple[str, dict]]:
+    from engine.analytics import extract_metrics
+    return [
+        (key, extract_metrics(key, ent["annual"], discount_rate).to_dict())
+        for key, ent in model["entities"].items()
+    ]
+
+
+def write_model_workbook(
+    result: ModelResult | dict,
+    target: str | Path | BinaryIO | None = None,
+    *,
+    inputs: ScenarioInputs | None = None,
+    title: str = "SCLCA Financial Model",
+    discount_rate: float = 0.052,
+) -> bytes | None:
+    """One workbook for one run: Summary, template statements per entity, raw sections.
+
+    target=None returns the .xlsx bytes (for st.download_button).
+    """
+    model = _as_dict(result)
+    wb = Workbook(write_only=True)
+    styler = _Styler(wb)
+    used: set[str] = set()
+
+    ws = wb.create_sheet(_sheet_name("Summary", used))
+    ws.append([styler.cell(ws, title, "sc_title")])
+    ws.append([])
+    metrics = _summary_rows(model, discount_rate)
+    if metrics:
+        keys = [k for k in metrics[0][1] if k != "entity"]
+        ws.append([styler.cell(ws, "Entity", "sc_header")]
+                  + [styler.cell(ws, styler.column(k)[0], "sc_header") for k in keys])
+        for key, m in metrics:
+            ws.append([styler.cell(ws, ENTITY_LABELS.get(key, key), "sc_label")]
+                      + [styler.cell(ws, _value(m[k]), styler.column(k)[1]) for k in keys])
+    if inputs is not None:
+        ws.append([])
+        _write_inputs(ws, styler, inputs)
+
+    statements = model_statements(model, inputs)
+    for entity in model["entities"]:
+        ws = wb.create_sheet(_sheet_name(f"{ENTITY_LABELS.get(entity, entity)} Statements", used))
+        ws.freeze_panes = "B1"                               # stacked statements: freeze labels only
+        for statement in ("pnl", "cf", "bs"):
+            _write_statement(ws, styler, statements[entity, statement])
+
+    for entity, sec, sec_title, rows, layout in _sections(model):
+        ws = wb.create_sheet(_sheet_name(f"{ENTITY_LABELS.get(entity, entity)} {sec_title}", used))
+        ws.freeze_panes = "B3" if layout == "wide" else "A3"
+        _write_section(ws, styler, f"{ENTITY_LABELS.get(entity, entity)} — {sec_title}", rows, layout, sec)
+    return _save(wb, target)
+
+
+def _write_inputs(ws, styler: _Styler, inputs: ScenarioInputs) -> None:
+    import json
+    ws.append([styler.cell(ws, "Scenario inputs", "sc_section")])
+    for key, value in json.loads(inputs.to_json()).items():
+        ws.append([styler.cell(ws, key, "sc_label"), styler.cell(ws, _value(value), "sc_text")])
+
+
+def write_scenario_book(
+    items: Iterable[tuple[str, ScenarioInputs | None, ModelResult | dict]],
+    target: str | Path | BinaryIO | None = None,
+    *,
+    discount_rate: float = 0.052,
+) -> bytes | None:
+    """Many runs, one sheet per scenario (sections stacked) + a Scenarios index.
+
+    items yields (label, inputs, result); each result is written and
+    released before the next is pulled, so items can be a generator that
+    runs the model lazily.
+    """
+    wb = Workbook(write_only=True)
+    styler = _Styler(wb)
+    used = {"scenarios"}
+    index = wb.create_sheet("Scenarios")
+    index_header = False
+
+    for label, inputs, result in items:
+        model = _as_dict(result)
+        name = _sheet_name(label, used)
+        metrics = _summary_rows(model, discount_rate)
+        if not index_header:
+            index.append([styler.cell(index, h, "sc_header") for h in
+                          ["Sheet", "Entity", *(styler.column(k)[0] for k in metrics[0][1] if k != "entity")]])
+            index_header = True
+        for key, m in metrics:
+            index.append([styler.cell(index, name, "sc_label"), styler.cell(index, ENTITY_LABELS.get(key, key), "sc_text")]
+                         + [styler.cell(index, _value(v), styler.column(k)[1]) for k, v in m.items() if k != "entity"])
+
+        ws = wb.create_sheet(name)
+        ws.append([styler.cell(ws, label, "sc_title")])
+        if inputs is not None:
+            _write_inputs(ws, styler, inputs)
+        ws.append([])
+        for entity, sec, sec_title, rows, layout in _sections(model):
+            _write_section(ws, styler, f"{ENTITY_LABELS.get(entity, entity)} — {sec_title}", rows, layout, sec)
+    return _save(wb, target)
+
+
+def _save(wb: Workbook, target) -> bytes | None:
+    if target is None:
+        buf = BytesIO()
+        wb.save(buf)
+        return buf.getvalue()
+    wb.save(str(target) if isinstance(target, Path) else target)
+    return None
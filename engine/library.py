@@ -0,0 +1,359 @@
+"""Persistent scenario library — SQLite store of runs and their metrics.
+
+One row per scenario in `scenarios`, unique on (ModelConfig fingerprint,
+ScenarioInputs fingerprint) — a re-run on an edited config or a config
+overlay ("rates.fx.eur_zar") is a new row, never a stale hit — and one
+wide row per scenario in `metrics` with a column per entity metric
+("nwl_dscr_min", "lanred_equity_irr", ...), each indexed.  Cross-entity
+filters are then single-table predicates (no joins), and an ORDER BY on an
+indexed column with LIMIT pages without sorting the whole match set:
+
+    lib = ScenarioLibrary("data/scenario_library.db")
+    lib.add_many(run_batch records / (inputs, payload) pairs)
+    rows, total = lib.page(
+        [("nwl", "dscr_min", "<", 1.2), ("lanred", "equity_irr", ">", 0.12)],
+        order_by=("nwl", "equity_irr", "desc"), page=0, page_size=50,
+    )
+
+Payloads use the engine.batch layout ({"metrics": {entity: EntityMetrics
+dict}, "holding": {...}, "statements": {...}?}).  Statements are stored as
+zlib-compressed JSON and only decoded on request.  A scenario's key is
+"<config fp>:<inputs fp>" (engine.config.scenario_fingerprint, as in batch
+records); reads accept it or a bare inputs fingerprint (latest stored run).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Iterable
+
+from engine.config import ModelConfig, ScenarioInputs, resolve_overrides, split_overrides
+
+DEFAULT_LIBRARY_PATH = Path(__file__).resolve().parent.parent / "data" / "scenario_library.db"
+
+ENTITIES = ("nwl", "lanred", "timberworx")
+METRIC_COLUMNS = (
+    "total_revenue", "total_ebitda", "total_pat", "ebitda_margin", "net_margin",
+    "dscr_min", "dscr_avg", "project_irr", "equity_irr", "llcr_min",
+)
+HOLDING_COLUMNS = ("ni_total", "dscr_min", "dscr_avg", "total_ic_interest_income", "total_net_interest")
+
+_WIDE_COLUMNS = tuple(f"{e}_{c}" for e in ENTITIES for c in METRIC_COLUMNS)
+_OPS = {"<": "<", "<=": "<=", ">": ">", ">=": ">=", "=": "=", "==": "=", "!=": "!="}
+_INSERT_CHUNK = 5000
+
+
+# ── Schema ──────────────────────────────────────────────────────
+
+
+_SCENARIOS_TABLE = f"""
+CREATE TABLE IF NOT EXISTS {{table}} (
+    id           INTEGER PRIMARY KEY,
+    config_fp    TEXT    NOT NULL,
+    fingerprint  TEXT    NOT NULL,
+    label        TEXT    NOT NULL DEFAULT '',
+    inputs_json  TEXT    NOT NULL,
+    {", ".join(f"holding_{c} REAL" for c in HOLDING_COLUMNS)},
+    statements   BLOB,
+    created_at   TEXT    DEFAULT (datetime('now')),
+    UNIQUE (config_fp, fingerprint)
+)"""
+
+_SCHEMA = f"""
+{_SCENARIOS_TABLE.format(table="scenarios")};
+CREATE INDEX IF NOT EXISTS ix_scenarios_fingerprint ON scenarios (fingerprint);
+CREATE TABLE IF NOT EXISTS metrics (
+    scenario_id  INTEGER PRIMARY KEY REFERENCES scenarios(id) ON DELETE CASCADE,
+    {", ".join(f"{c} REAL" for c in _WIDE_COLUMNS)}
+);
+{"".join(f"CREATE INDEX IF NOT EXISTS ix_metrics_{c} ON metrics ({c});" for c in _WIDE_COLUMNS)}
+CREATE INDEX IF NOT EXISTS ix_scenarios_label ON scenarios (label);
+"""
+
+
+_SCENARIO_COLUMNS = (
+    "id, fingerprint, label, inputs_json, "
+    f"{', '.join('holding_' + c for c in HOLDING_COLUMNS)}, statements, created_at"
+)
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Rebuild a pre-config_fp `scenarios` table; its rows get config_fp '' (unknown config)."""
+    cols = [r[1] for r in conn.execute("PRAGMA table_info(scenarios)")]
+    if not cols or "config_fp" in cols:
+        return
+    conn.execute("PRAGMA foreign_keys=OFF")             # keep metrics rows across the rebuild
+    try:
+        with conn:
+            conn.execute(_SCENARIOS_TABLE.format(table="scenarios_v2"))
+            conn.execute(f"INSERT INTO scenarios_v2 (config_fp, {_SCENARIO_COLUMNS}) "
+                         f"SELECT '', {_SCENARIO_COLUMNS} FROM scenarios")
+            conn.execute("DROP TABLE scenarios")
+            conn.execute("ALTER TABLE scenarios_v2 RENAME TO scenarios")
+    finally:
+        conn.execute("PRAGMA foreign_keys=ON")
+
+
+def _split_key(fingerprint: str) -> tuple[str | None, str]:
+    """(config fp or None, inputs fp) from a scenario key or bare inputs fingerprint."""
+    config_fp, sep, inputs_fp = fingerprint.rpartition(":")
+    return (config_fp, inputs_fp) if sep else (None, fingerprint)
+
+
+def _pack_statements(statements: dict | None) -> bytes | None:
+    if not statements:
+        return None
+    return zlib.compress(json.dumps(statements, default=str, separators=(",", ":")).encode(), 6)
+
+
+def _unpack_statements(blob: bytes | None) -> dict | None:
+    return json.loads(zlib.decompress(blob)) if blob else None
+
+
+# ── Library ─────────────────────────────────────────────────────
+
+
+class ScenarioLibrary:
+    """SQLite-backed scenario store with indexed metric queries."""
+
+    def __init__(self, path: str | Path = DEFAULT_LIBRARY_PATH) -> None:
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        _migrate(self._conn)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ScenarioLibrary":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ── Writes ──
+
+    def add(self, inputs: ScenarioInputs | dict, payload: dict, label: str = "",
+            cfg: ModelConfig | None = None) -> bool:
+        """Store one scenario (no ANALYZE); returns False if it is already stored."""
+        return self.add_many([(inputs, payload)], label=label, cfg=cfg, analyze=False) == 1
+
+    def add_many(self, items: Iterable, label: str = "", cfg: ModelConfig | None = None,
+                 analyze: bool = True) -> int:
+        """Bulk insert in chunked transactions; returns the number of new scenarios.
+
+        Items are (inputs, payload) pairs or engine.batch "ok" records (which
+        carry "inputs").  inputs is a ScenarioInputs run on cfg, or a flat
+        override dict whose dotted config paths are applied over cfg
+        (default: the loaded snapshot).  Error records and (config, inputs)
+        pairs already in the library are skipped.  analyze=False leaves the
+        planner statistics to a later analyze() (streaming loads).
+        """
+        base = cfg if cfg is not None else ModelConfig.load()
+        added = 0
+        chunk: list[tuple[str, ScenarioInputs, dict, dict]] = []
+        for item in items:
+            if isinstance(item, dict):
+                if item.get("status", "ok") != "ok":
+                    continue
+                item = (item.get("inputs", {}), item)
+            inputs, payload = item
+            if isinstance(inputs, ScenarioInputs):
+                run_cfg, config = base, {}
+            else:
+                config = split_overrides(inputs)[0]
+                run_cfg, inputs = resolve_overrides(inputs, base)
+            chunk.append((run_cfg.fingerprint, inputs, config, payload))
+            if len(chunk) >= _INSERT_CHUNK:
+                added += self._insert_chunk(chunk, label)
+                chunk = []
+        if chunk:
+            added += self._insert_chunk(chunk, label)
+        if added and analyze:
+            self.analyze()
+        return added
+
+    def analyze(self) -> None:
+        """Refresh planner statistics (sampled, ms) — once per bulk load."""
+        self._conn.execute("PRAGMA analysis_limit=400")
+        self._conn.execute("ANALYZE")
+        self._conn.commit()
+
+    def _insert_chunk(self, chunk: list[tuple[str, ScenarioInputs, dict, dict]], label: str) -> int:
+        scen_sql = (
+            f"INSERT OR IGNORE INTO scenarios (config_fp, fingerprint, label, inputs_json, "
+            f"{', '.join('holding_' + c for c in HOLDING_COLUMNS)}, statements) "
+            f"VALUES ({', '.join('?' * (len(HOLDING_COLUMNS) + 5))})"
+        )
+        metric_sql = (
+            f"INSERT INTO metrics (scenario_id, {', '.join(_WIDE_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * (len(_WIDE_COLUMNS) + 1))})"
+        )
+        added = 0
+        with self._conn:                                   # one transaction per chunk
+            cur = self._conn.cursor()
+            metric_rows = []
+            for config_fp, inputs, config, payload in chunk:
+                holding = payload.get("holding", {})
+                inputs_json = inputs.to_json()
+                if config:                                 # keep the overlay paths with the inputs
+                    inputs_json = json.dumps({**json.loads(inputs_json), **config}, sort_keys=True, default=str)
+                cur.execute(scen_sql, (
+                    config_fp, inputs.fingerprint(), label, inputs_json,
+                    *(holding.get(c) for c in HOLDING_COLUMNS),
+                    _pack_statements(payload.get("statements")),
+                ))
+                if cur.rowcount != 1:                      # (config, inputs) already stored
+                    continue
+                added += 1
+                metrics = payload.get("metrics", {})
+                metric_rows.append((cur.lastrowid, *(
+                    metrics.get(e, {}).get(c) for e in ENTITIES for c in METRIC_COLUMNS
+                )))
+            cur.executemany(metric_sql, metric_rows)
+        return added
+
+    @staticmethod
+    def _key_where(fingerprint: str) -> tuple[str, tuple]:
+        config_fp, inputs_fp = _split_key(fingerprint)
+        if config_fp is None:
+            return "fingerprint = ?", (inputs_fp,)
+        return "config_fp = ? AND fingerprint = ?", (config_fp, inputs_fp)
+
+    def delete(self, fingerprint: str) -> None:
+        """Drop a scenario key (a bare inputs fingerprint drops it under every config)."""
+        where, params = self._key_where(fingerprint)
+        with self._conn:
+            self._conn.execute(f"DELETE FROM scenarios WHERE {where}", params)
+
+    # ── Reads ──
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM scenarios").fetchone()[0]
+
+    def __contains__(self, fingerprint: str) -> bool:
+        where, params = self._key_where(fingerprint)
+        return self._conn.execute(f"SELECT 1 FROM scenarios WHERE {where}", params).fetchone() is not None
+
+    @staticmethod
+    def _column(entity: str, metric: str) -> str:
+        column = f"{entity}_{metric}"
+        if column not in _WIDE_COLUMNS:
+            raise ValueError(
+                f"Unknown metric {entity!r}/{metric!r}; entities {ENTITIES}, metrics {METRIC_COLUMNS}"
+            )
+        return column
+
+    def _where(self, filters: list[tuple[str, str, str, float]],
+               config_fp: str | None = None) -> tuple[str, list]:
+        terms, params = [], []
+        if config_fp is not None:
+            terms.append("s.config_fp = ?")
+            params.append(config_fp)
+        for entity, metric, op, value in filters:
+            if op not in _OPS:
+                raise ValueError(f"Unsupported operator {op!r}")
+            terms.append(f"m.{self._column(entity, metric)} {_OPS[op]} ?")
+            params.append(value)
+        return (" WHERE " + " AND ".join(terms) if terms else ""), params
+
+    def query(
+        self,
+        filters: Iterable[tuple[str, str, str, float]] = (),
+        *,
+        order_by: tuple[str, str, str] | None = None,
+        limit: int | None = 100,
+        offset: int = 0,
+        with_inputs: bool = False,
+        config_fp: str | None = None,
+    ) -> list[dict]:
+        """Scenarios matching every (entity, metric, op, value) filter.
+
+        Each row: {fingerprint (scenario key), label, created_at,
+        <entity>_<metric>...} for every entity metric, plus "inputs" when
+        with_inputs.  order_by = (entity, metric, "asc"|"desc"); default is
+        insertion order.  config_fp limits rows to runs on that ModelConfig.
+        """
+        where, params = self._where(list(filters), config_fp)
+        cols = ("s.config_fp || ':' || s.fingerprint AS fingerprint, s.label, s.created_at, "
+                + ", ".join(f"m.{c}" for c in _WIDE_COLUMNS))
+        if with_inputs:
+            cols += ", s.inputs_json"
+        sql = f"SELECT {cols} FROM metrics m JOIN scenarios s ON s.id = m.scenario_id{where}"
+        if order_by:
+            entity, metric, direction = order_by
+            sql += f" ORDER BY m.{self._column(entity, metric)} {'DESC' if direction.lower() == 'desc' else 'ASC'}"
+        else:
+            sql += " ORDER BY m.scenario_id"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [int(limit), int(offset)]
+        rows = []
+        for r in self._conn.execute(sql, params):
+            row = dict(r)
+            if with_inputs:
+                row["inputs"] = json.loads(row.pop("inputs_json"))
+            rows.append(row)
+        return rows
+
+    def count(self, filters: Iterable[tuple[str, str, str, float]] = (), cap: int | None = None,
+              config_fp: str | None = None) -> int:
+        """Matching scenarios; with cap, stop counting at cap (UI shows "cap+")."""
+        where, params = self._where(list(filters), config_fp)
+        join = " JOIN scenarios s ON s.id = m.scenario_id" if config_fp is not None else ""
+        sql = f"SELECT 1 FROM metrics m{join}{where}"
+        if cap is not None:
+            sql += " LIMIT ?"
+            params.append(int(cap))
+        return self._conn.execute(f"SELECT COUNT(*) FROM ({sql})", params).fetchone()[0]
+
+    def page(
+        self,
+        filters: Iterable[tuple[str, str, str, float]] = (),
+        *,
+        order_by: tuple[str, str, str] | None = None,
+        page: int = 0,
+        page_size: int = 50,
+        count_cap: int | None = 10_000,
+        config_fp: str | None = None,
+    ) -> tuple[list[dict], int]:
+        """One UI page of query() plus the match count (capped at count_cap)."""
+        filters = list(filters)
+        rows = self.query(filters, order_by=order_by, limit=page_size, offset=page * page_size,
+                          config_fp=config_fp)
+        return rows, self.count(filters, cap=count_cap, config_fp=config_fp)
+
+    def get(self, fingerprint: str, statements: bool = False) -> dict | None:
+        """Full record: inputs, holding summary, per-entity metrics (+ statements).
+
+        fingerprint is a scenario key, or a bare inputs fingerprint for the
+        latest run of those inputs on any config.
+        """
+        where, params = self._key_where(fingerprint)
+        r = self._conn.execute(f"SELECT * FROM scenarios WHERE {where} ORDER BY id DESC LIMIT 1",
+                               params).fetchone()
+        if r is None:
+            return None
+        m = self._conn.execute("SELECT * FROM metrics WHERE scenario_id = ?", (r["id"],)).fetchone()
+        metrics = {e: {c: m[f"{e}_{c}"] for c in METRIC_COLUMNS} for e in ENTITIES} if m else {}
+        record = {
+            "fingerprint": f"{r['config_fp']}:{r['fingerprint']}",
+            "config_fp": r["config_fp"],
+            "label": r["label"],
+            "created_at": r["created_at"],
+            "inputs": json.loads(r["inputs_json"]),
+            "holding": {c: r[f"holding_{c}"] for c in HOLDING_COLUMNS},
+            "metrics": metrics,
+        }
+        if statements:
+            record["statements"] = _unpack_statements(r["statements"])
+        return record
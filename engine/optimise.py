@@ -0,0 +1,270 @@
+"""Scenario input optimisers.
+
+Search a single ScenarioInputs attribute for the value that maximises an
+entity objective on a `step` grid, evaluating candidates through the
+cheapest path that reproduces the full model's numbers for that entity,
+then re-running the full model once for the chosen value.  The search is
+coarse-to-fine (see search_1d), so the chosen value is the best grid point
+it visited, not a certified global optimum.
+
+    from engine.optimise import optimise_lanred_split
+
+    best = optimise_lanred_split(cfg, inputs, objective="equity_irr")
+    best.value          # e.g. 0.0 (BESS % of the solar budget)
+    best.model          # full ModelResult at the optimum
+
+Objectives are maximised; "min_dscr" is the minimum annual DSCR.
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+from dataclasses import dataclass, field, replace
+from typing import Callable
+
+from engine.analytics import dscr_min, equity_irr, project_irr
+from engine.config import ModelConfig, ScenarioInputs
+from engine.types import EntityResult, ModelResult
+
+
+# ── Objectives ──────────────────────────────────────────────────
+
+
+def _none_to_floor(value: float | None) -> float:
+    return -math.inf if value is None else value
+
+
+OBJECTIVES: dict[str, Callable[[EntityResult], float]] = {
+    "equity_irr": lambda er: _none_to_floor(equity_irr(er.annual)),
+    "project_irr": lambda er: _none_to_floor(project_irr(er.annual)),
+    "min_dscr": lambda er: dscr_min(er.annual),
+}
+
+
+# ── Result ──────────────────────────────────────────────────────
+
+
+@dataclass
+class OptimiseResult:
+    """Outcome of a 1-D optimisation.
+
+    evaluations: {candidate value: objective} for every candidate tried.
+    model: full ModelResult re-run at the optimum (None if skipped).
+    """
+    attr: str
+    objective: str
+    value: float
+    score: float
+    evaluations: dict[float, float] = field(default_factory=dict)
+    model: ModelResult | None = None
+
+    @property
+    def n_evaluations(self) -> int:
+        return len(self.evaluations)
+
+
+# ── Search ──────────────────────────────────────────────────────
+
+
+def search_1d(
+    f: Callable[[float], float],
+    lo: float,
+    hi: float,
+    step: float,
+    coarse_points: int = 11,
+    cache: dict[float, float] | None = None,
+) -> tuple[float, float, dict[float, float]]:
+    """Maximise f on the grid lo, lo+step, ..., hi.
+
+    Coarse pass over ~coarse_points evenly spaced grid values, then zoom
+    into the bracket around the best point and repeat until the pass runs
+    at `step` resolution; O(coarse_points × log n) evaluations instead of
+    the full grid.  The result is always a grid point and a local maximum
+    at `step` resolution (within one step of a continuous optimum).  It is
+    the grid maximum when f is unimodal on the grid; a narrower peak that
+    falls between coarse-pass points can be missed.  Ties resolve to the
+    lower value.
+
+    Returns (best_value, best_score, evaluations).
+    """
+    cache = {} if cache is None else cache
+    n = int(round((hi - lo) / step))
+
+    def _x(k: int) -> float:
+        return round(min(lo + k * step, hi), 10)
+
+    def _at(k: int) -> float:
+        x = _x(k)
+        if x not in cache:
+            cache[x] = f(x)
+        return cache[x]
+
+    lo_k, hi_k, stride = 0, n, 2 * n
+    while True:
+        # Stride strictly shrinks each pass, even when coarse_points <= 3
+        # leaves the zoom window as wide as the one it came from
+        stride = max(min((hi_k - lo_k) // max(coarse_points - 1, 1), stride // 2), 1)
+        grid = sorted(set(range(lo_k, hi_k + 1, stride)) | {hi_k})
+        best_k = max(grid, key=lambda k: (_at(k), -k))
+        if stride == 1:
+            break
+        lo_k, hi_k = max(best_k - stride, 0), min(best_k + stride, n)
+    best_x = _x(best_k)
+    return best_x, cache[best_x], cache
+
+
+def _with_attr(inputs: ScenarioInputs, attr: str, value: float) -> ScenarioInputs:
+    """Shallow copy of inputs with one attribute replaced.
+
+    copy.copy keeps orchestrator-set private vectors (e.g. the NWL OD lent
+    vector), so an entity-only run sees the same IC flows as the base run.
+    Use dataclasses.replace() instead when a clean full-model run is wanted.
+    """
+    out = copy.copy(inputs)
+    setattr(out, attr, value)
+    return out
+
+
+# ── LanRED PV/BESS split ────────────────────────────────────────
+
+
+def optimise_lanred_split(
+    cfg: ModelConfig | None = None,
+    inputs: ScenarioInputs | None = None,
+    *,
+    objective: str = "equity_irr",
+    attr: str = "lanred_bess_alloc_pct",
+    bounds: tuple[float, float] = (0.0, 50.0),
+    step: float = 1.0,
+    rerun_full_model: bool = True,
+) -> OptimiseResult:
+    """Optimise a LanRED input (default: BESS share of the solar budget).
+
+    Candidates run LanRED only, against the NWL overdraft vector from one
+    base full-model run (LanRED's only upstream dependency), so NWL, TWX
+    and SCLCA are not recomputed per probe.  The full model — including the
+    NWL ↔ LanRED overdraft IC plugin — reruns once for the chosen value.
+
+    attr may be any numeric ScenarioInputs field that only LanRED reads.
+    """
+    from engine.orchestrator import run_model
+    from entities.lanred import build_lanred_entity
+
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective {objective!r}; expected one of {sorted(OBJECTIVES)}")
+    if cfg is None:
+        cfg = ModelConfig.load()
+    if inputs is None:
+        inputs = ScenarioInputs.defaults()
+    score_fn = OBJECTIVES[objective]
+
+    # One base run to capture the IC overdraft vector LanRED receives.
+    # replace() drops any private vectors left on `inputs` by earlier runs.
+    base_inputs = replace(inputs)
+    run_model(cfg, base_inputs)
+
+    def _evaluate(value: float) -> float:
+        return score_fn(build_lanred_entity(cfg, _with_attr(base_inputs, attr, value)))
+
+    value, score, evaluations = search_1d(_evaluate, bounds[0], bounds[1], step)
+
+    model = None
+    if rerun_full_model:
+        model = run_model(cfg, replace(inputs, **{attr: value}))
+        score = score_fn(model.entities["lanred"])
+
+    return OptimiseResult(
+        attr=attr,
+        objective=objective,
+        value=value,
+        score=score,
+        evaluations=evaluations,
+        model=model,
+    )
+
+
+# ── NWL swap notional ───────────────────────────────────────────
+
+
+def _swap_cost_eur(er: EntityResult) -> float:
+    """ZAR-leg payments made (scheduled + accelerated, EUR) less EUR leg delivered."""
+    paid = sum(r.get("swap_leg_scheduled", 0.0) + r.get("swap_leg_accel", 0.0)
+               for r in er.waterfall_semi)
+    delivered = er.swap_schedule.eur_amount_idc if er.swap_schedule else 0.0
+    return paid - delivered
+
+
+SWAP_OBJECTIVES: tuple[str, ...] = ("min_dscr", "swap_cost", "sclca_net_interest")
+
+
+def optimise_nwl_swap_notional(
+    cfg: ModelConfig | None = None,
+    inputs: ScenarioInputs | None = None,
+    *,
+    objective: str = "min_dscr",
+    step: float = 1000.0,
+    rerun_full_model: bool = True,
+) -> OptimiseResult:
+    """Search nwl_swap_notional within compute_nwl_swap_bounds(cfg).
+
+    Objectives (all maximised internally):
+        min_dscr            NWL minimum annual DSCR
+        swap_cost           minus the net EUR cost of the swap (score = −cost)
+        sclca_net_interest  SCLCA net interest income (sum of annual NI,
+                            IC margin plus DSRA FD interest)
+
+    Candidates rerun NWL only, with the LanRED deficit vector from one base
+    full-model run; the NWL ops kernel and the unit swap schedule are
+    cached, so each probe only pays for the financing loop.  For the SCLCA
+    objective LanRED is rerun when NWL's overdraft lending changes, and
+    the holding is rebuilt from the probe's entities.
+    """
+    from engine.orchestrator import run_model
+    from engine.swap import compute_nwl_swap_bounds
+    from entities.lanred import build_lanred_entity
+    from entities.nwl import build_nwl_entity
+    from entities.sclca import build_sclca_holding
+
+    if objective not in SWAP_OBJECTIVES:
+        raise ValueError(f"Unknown objective {objective!r}; expected one of {list(SWAP_OBJECTIVES)}")
+    if cfg is None:
+        cfg = ModelConfig.load()
+    if inputs is None:
+        inputs = ScenarioInputs.defaults()
+    if not inputs.nwl_swap_enabled:
+        raise ValueError("NWL swap is disabled (sclca_nwl_hedge is not 'Cross-Currency Swap')")
+
+    bounds = compute_nwl_swap_bounds(cfg)
+    base_inputs = replace(inputs)
+    base = run_model(cfg, base_inputs)
+    base_od = [r.get("od_lent", 0.0) for r in base.entities["nwl"].waterfall_semi]
+
+    def _evaluate(notional: float) -> float:
+        probe = _with_attr(base_inputs, "nwl_swap_notional", notional)
+        nwl = build_nwl_entity(cfg, probe)
+        if objective == "min_dscr":
+            return dscr_min(nwl.annual)
+        if objective == "swap_cost":
+            return -_swap_cost_eur(nwl)
+        entities = dict(base.entities)
+        od = [r.get("od_lent", 0.0) for r in nwl.waterfall_semi]
+        if any(abs(a - b) > 1.0 for a, b in zip(od, base_od)):
+            probe._nwl_od_lent_vector = od
+            entities["lanred"] = build_lanred_entity(cfg, probe)
+        entities["nwl"] = nwl
+        return sum(a.get("ni", 0.0) for a in build_sclca_holding(entities, cfg)["annual"])
+
+    value, score, evaluations = search_1d(_evaluate, bounds["min"], bounds["max"], step)
+
+    model = None
+    if rerun_full_model:
+        model = run_model(cfg, replace(inputs, nwl_swap_notional=value))
+    return OptimiseResult(
+        attr="nwl_swap_notional",
+        objective=objective,
+        value=value,
+        score=score,
+        evaluations=evaluations,
+        model=model,
+    )
@@ -7,6 +7,8 @@ from pathlib import Path
 from functools import lru_cache
 from typing import NamedTuple
 
+from engine.reload import register
+
 _CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
 
 
@@ -36,6 +38,10 @@ def load_periods_meta() -> dict:
     return {k: v for k, v in data.items() if k != "periods"}
 
 
+register("timeline", load_periods.cache_clear)
+register("timeline", load_periods_meta.cache_clear)
+
+
 def total_periods() -> int:
     return load_periods_meta()["total_periods"]
 
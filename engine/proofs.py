@@ -5,7 +5,7 @@ Each proof is a dict: {"name": str, "expected": float, "actual": float, "toleran
 DESIGN RULE: Every proof must use TWO DIFFERENT computation paths that
 should agree. Never re-derive the same formula on both sides.
 
-Categories returned by build_entity_proofs():
+Categories returned by build_entity_proofs() / EntityProofs:
     "sources_uses"  — loan allocation checks
     "facilities"    — facility schedule integrity
     "assets"        — depreciation and fixed assets
@@ -14,18 +14,44 @@ Categories returned by build_entity_proofs():
     "cf"            — cash flow identity checks
     "waterfall"     — waterfall cascade integrity
     "bs"            — balance sheet identity
+
+Per-entity identities are evaluated column-wise: each field is read once
+into a numpy array over the year (or half-year) axis and the checks are
+array expressions; only the proof dicts are assembled per row.
+EntityProofs (EntityResult.proofs()) builds a category on first access
+and keeps it, so a page only pays for the checks it shows.
 """
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+
 from engine.periods import total_years, total_periods, construction_end_index
 
+if TYPE_CHECKING:
+    from engine.types import EntityResult
+
 
 def _p(name: str, expected: float, actual: float, tolerance: float = 1.0) -> dict:
     """Shorthand proof dict constructor."""
     return {"name": name, "expected": expected, "actual": actual, "tolerance": tolerance}
 
 
+def _col(rows: list[dict], key: str, default: float | None = None) -> np.ndarray:
+    """Column of rows as a float array; default=None means the key is required."""
+    if default is None:
+        return np.array([r[key] for r in rows], dtype=float)
+    return np.array([r.get(key, default) for r in rows], dtype=float)
+
+
+def _prev(values: np.ndarray, first: float) -> np.ndarray:
+    """values shifted one period later; first fills period 1."""
+    return np.concatenate(([first], values[:-1])) if len(values) else values
+
+
 # ── Sources & Uses ────────────────────────────────────────────────
 
 
@@ -119,10 +145,10 @@ def build_facility_proofs(
     # Sum of semi-annual interest vs annual P&L cash interest
     # (waterfall accumulates half-year amounts; annual P&L reads from facility schedule
     # with repayment-start gating — two independent computation paths)
-    _sr_int_total = sum(w.get('ie_half_sr', 0) for w in waterfall_semi)
-    _mz_int_total = sum(w.get('ie_half_mz', 0) for w in waterfall_semi)
-    _pl_ie_sr = sum(a['ie_sr'] for a in annual)
-    _pl_ie_mz = sum(a['ie_mz'] for a in annual)
+    _sr_int_total = float(_col(waterfall_semi, 'ie_half_sr', 0.0).sum())
+    _mz_int_total = float(_col(waterfall_semi, 'ie_half_mz', 0.0).sum())
+    _pl_ie_sr = float(_col(annual, 'ie_sr').sum())
+    _pl_ie_mz = float(_col(annual, 'ie_mz').sum())
     proofs.append(_p("Sum(SR interest) = P&L IE(SR)", _sr_int_total, _pl_ie_sr))
     proofs.append(_p("Sum(MZ interest) = P&L IE(MZ)", _mz_int_total, _pl_ie_mz))
 
@@ -136,10 +162,9 @@ def build_facility_proofs(
     _sr_bal_at_repay = next(
         (r["Closing"] for r in sr_schedule if r["Period"] == _constr_end), 0.0
     )
-    _sr_repaid_total = sum(
-        w.get('sr_prin_sched', 0) + w.get('sr_accel_entity', 0)
-        for hi, w in enumerate(waterfall_semi)
-        if hi >= _rep_start
+    _repaying = waterfall_semi[_rep_start:]
+    _sr_repaid_total = float(
+        (_col(_repaying, 'sr_prin_sched', 0.0) + _col(_repaying, 'sr_accel_entity', 0.0)).sum()
     )
     proofs.append(_p(
         "SR repaid = SR balance at repayment start",
@@ -231,7 +256,7 @@ def build_asset_proofs(
     ))
 
     # Y10 accumulated depr <= depr base (allow small rounding tolerance)
-    _acc_depr_10 = sum(annual[i]['depr'] for i in range(total_years()))
+    _acc_depr_10 = float(_col(annual[:total_years()], 'depr').sum())
     _gap = depr_base - _acc_depr_10
     proofs.append(_p(
         "Y10 accum depr <= depr base",
@@ -315,36 +340,27 @@ def build_ops_proofs(
     - Ops rev_total = P&L rev_total (ops dict vs annual dict — different keys)
     """
     proofs: list[dict] = []
-
-    for yi, _op in enumerate(ops_annual):
+    n = len(ops_annual)
+    _a = annual[:n]
+
+    _op_rev = _col(ops_annual, 'rev_total', 0.0)
+    # NWL: revenue components sum to rev_total
+    _exp_rev = (_col(ops_annual, 'rev_sewage', 0.0) + _col(ops_annual, 'rev_reuse', 0.0)
+                + _col(ops_annual, 'rev_bulk_services', 0.0)).tolist()
+    # EBITDA: ops dict formula vs engine P&L value (different computation paths)
+    _exp_ebitda = (_op_rev - _col(ops_annual, 'om_cost', 0.0)
+                   - _col(ops_annual, 'power_cost', 0.0) - _col(ops_annual, 'rent_cost', 0.0)).tolist()
+    _ebitda = _col(_a, 'ebitda').tolist()
+    _pl_rev = _col(_a, 'rev_total', 0.0).tolist()
+    _op_rev = _op_rev.tolist()
+
+    for yi in range(n):
         _y = yi + 1
-        _a = annual[yi]
-
-        # NWL: revenue components sum to rev_total
         if entity_key == "nwl":
-            _exp_rev = (_op.get('rev_sewage', 0) + _op.get('rev_reuse', 0)
-                        + _op.get('rev_bulk_services', 0))
-            proofs.append(_p(
-                f"Y{_y}: Rev components = rev_total",
-                _exp_rev,
-                _op.get('rev_total', 0),
-            ))
-
-        # EBITDA: ops dict formula vs engine P&L value (different computation paths)
-        _exp_ebitda = (_op.get('rev_total', 0) - _op.get('om_cost', 0)
-                       - _op.get('power_cost', 0) - _op.get('rent_cost', 0))
-        proofs.append(_p(
-            f"Y{_y}: EBITDA = Rev - OM - Pwr - Rent",
-            _exp_ebitda,
-            _a['ebitda'],
-        ))
-
+            proofs.append(_p(f"Y{_y}: Rev components = rev_total", _exp_rev[yi], _op_rev[yi]))
+        proofs.append(_p(f"Y{_y}: EBITDA = Rev - OM - Pwr - Rent", _exp_ebitda[yi], _ebitda[yi]))
         # Ops rev_total vs P&L rev_total
-        proofs.append(_p(
-            f"Y{_y}: Ops rev = P&L rev",
-            _op.get('rev_total', 0),
-            _a.get('rev_total', 0),
-        ))
+        proofs.append(_p(f"Y{_y}: Ops rev = P&L rev", _op_rev[yi], _pl_rev[yi]))
 
     return proofs
 
@@ -367,63 +383,54 @@ def build_pnl_proofs(
     - 10yr total PAT = closing retained earnings (P&L accumulation vs BS RE)
     """
     proofs: list[dict] = []
+    n = len(annual)
+    _ebitda = _col(annual, 'ebitda')
+    _depr = _col(annual, 'depr')
+    _ebit = _col(annual, 'ebit')
+    _pbt = _col(annual, 'pbt')
+    _tax = _col(annual, 'tax')
+    _pat = _col(annual, 'pat')
+
+    # Tax ceiling: sum of max(h_pbt, 0) * rate across the two semi-annual halves.
+    # Annual PBT can be low while one half has high profit (and thus high tax) and
+    # the other has a loss — so the ceiling is NOT max(annual_PBT, 0) * rate.
+    # Fallback (no semi-annual rows): annual PBT (may be too tight for carry-forward cases)
+    _ceiling = np.maximum(_pbt, 0.0) * tax_rate
+    _m = min(len(semi_annual_pl) // 2, n) if semi_annual_pl is not None else 0
+    if _m:
+        _h = np.maximum(_col(semi_annual_pl[:_m * 2], 'pbt', 0.0).reshape(_m, 2), 0.0)
+        _ceiling[:_m] = _h[:, 0] * tax_rate + _h[:, 1] * tax_rate
+
+    # EBITDA - Depr = EBIT: stored EBIT vs formula from stored EBITDA and Depr
+    _exp_ebit = (_ebitda - _depr).tolist()
+    # EBIT - IE + FD = PBT: stored PBT vs formula from stored components
+    _exp_pbt = (_ebit - _col(annual, 'ie') + _col(annual, 'fd_income', 0.0)).tolist()
+    # Tax >= 0 (semi-annual loss carry-forward means naive PBT*rate can give neg tax)
+    _tax_floor = np.maximum(_tax, 0.0).tolist()
+    _tax_cap = np.minimum(_tax, _ceiling).tolist()
+    _exp_pat = (_pbt - _tax).tolist()
+    _ebit, _pbt, _tax, _pat = _ebit.tolist(), _pbt.tolist(), _tax.tolist(), _pat.tolist()
 
     for yi, _a in enumerate(annual):
         _y = _a['year']
-
-        # EBITDA - Depr = EBIT: stored EBIT vs formula from stored EBITDA and Depr
-        proofs.append(_p(
-            f"Y{_y}: EBITDA - Depr = EBIT",
-            _a['ebitda'] - _a['depr'],
-            _a['ebit'],
-        ))
-
-        # EBIT - IE + FD = PBT: stored PBT vs formula from stored components
-        proofs.append(_p(
-            f"Y{_y}: EBIT - IE + FD = PBT",
-            _a['ebit'] - _a['ie'] + _a.get('fd_income', 0.0),
-            _a['pbt'],
-        ))
-
-        # Tax >= 0 (semi-annual loss carry-forward means naive PBT*rate can give neg tax)
-        proofs.append(_p(
-            f"Y{_y}: Tax >= 0",
-            max(_a['tax'], 0.0),
-            _a['tax'],
-        ))
-
-        # Tax ceiling: sum of max(h_pbt, 0) * rate across the two semi-annual halves.
-        # Annual PBT can be low while one half has high profit (and thus high tax) and
-        # the other has a loss — so the ceiling is NOT max(annual_PBT, 0) * rate.
-        if semi_annual_pl is not None and len(semi_annual_pl) >= (yi + 1) * 2:
-            _h1_pbt = semi_annual_pl[yi * 2].get('pbt', 0)
-            _h2_pbt = semi_annual_pl[yi * 2 + 1].get('pbt', 0)
-            _tax_ceiling = max(_h1_pbt, 0) * tax_rate + max(_h2_pbt, 0) * tax_rate
-        else:
-            # Fallback: use annual PBT (may be too tight for carry-forward cases)
-            _tax_ceiling = max(_a['pbt'], 0.0) * tax_rate
-        proofs.append(_p(
-            f"Y{_y}: Tax <= sum(max(h_pbt,0)*rate)",
-            min(_a['tax'], _tax_ceiling),
-            _a['tax'],
-        ))
-
-        # PBT - Tax = PAT
-        proofs.append(_p(f"Y{_y}: PBT - Tax = PAT", _a['pbt'] - _a['tax'], _a['pat']))
+        proofs.append(_p(f"Y{_y}: EBITDA - Depr = EBIT", _exp_ebit[yi], _ebit[yi]))
+        proofs.append(_p(f"Y{_y}: EBIT - IE + FD = PBT", _exp_pbt[yi], _pbt[yi]))
+        proofs.append(_p(f"Y{_y}: Tax >= 0", _tax_floor[yi], _tax[yi]))
+        proofs.append(_p(f"Y{_y}: Tax <= sum(max(h_pbt,0)*rate)", _tax_cap[yi], _tax[yi]))
+        proofs.append(_p(f"Y{_y}: PBT - Tax = PAT", _exp_pat[yi], _pat[yi]))
 
     # Cumulative PAT (P&L path) vs closing retained earnings on BS (BS path)
     # Adjust BS retained for swap liability + cum swap DS + OD (non-P&L items)
     if annual:
         _last = annual[-1]
-        _cum_swap_ds = sum(_a.get('cf_swap_ds', 0) for _a in annual)
         _swap_od_10 = (_last.get('bs_swap_liability', 0)
-                       + _cum_swap_ds
+                       + float(_col(annual, 'cf_swap_ds', 0.0).sum())
                        + _last.get('wf_od_bal', 0))
-        _cum_grants_10 = sum(_a.get('cf_grants', 0) for _a in annual)
+        _cum_grants_10 = float(_col(annual, 'cf_grants', 0.0).sum())
         _cum_divs_10 = _last.get('cum_dividends', 0)
         proofs.append(_p(
             "10yr total PAT = closing retained earnings (adj swap/OD)",
-            sum(_a['pat'] for _a in annual) + _cum_grants_10 - _cum_divs_10,
+            sum(_pat) + _cum_grants_10 - _cum_divs_10,
             _last.get('bs_retained', float('nan')) + _swap_od_10,
         ))
     else:
@@ -503,45 +510,44 @@ def build_cf_proofs(annual: list[dict]) -> list[dict]:
     - Sum(CF Ops) = Sum(EBITDA + II - Tax) over 10yr (aggregate cross-check)
     """
     proofs: list[dict] = []
+    _ops = _col(annual, 'cf_ops')
+    _ebitda = _col(annual, 'ebitda')
+    _ii = _col(annual, 'ii_dsra', 0.0)
+    _cf_tax = _col(annual, 'cf_tax')
+    _swap_ds = _col(annual, 'cf_swap_ds', 0.0)
+
+    # FreeCF: stored value vs derived from CF Ops, DS, Swap
+    # (engine/loop.py sets cf_after_debt_service; cf_ops and cf_ds are independent)
+    _exp_free = (_ops - _col(annual, 'cf_ds') - _swap_ds).tolist()
+    # CF Ops = EBITDA + FD income - Tax (P&L source vs CF formula)
+    _exp_ops = (_ebitda + _ii - _cf_tax).tolist()
+    # CF Net = sum of components (engine build_annual() formula vs stored result)
+    _grant_accel = np.array([_a.get('cf_grant_accel', _a.get('cf_prepay', 0)) for _a in annual],
+                            dtype=float)
+    _exp_net = (_col(annual, 'cf_equity')
+                + _col(annual, 'cf_draw') - _col(annual, 'cf_capex')
+                + _col(annual, 'cf_grants') - _grant_accel
+                + _ops
+                - _col(annual, 'cf_ie') - _col(annual, 'cf_pr')
+                - _swap_ds
+                - _col(annual, 'cf_dividend', 0.0)).tolist()
+    _ops_l = _ops.tolist()
 
-    for _a in annual:
+    for yi, _a in enumerate(annual):
         _y = _a['year']
-        _swap_ds_annual = _a.get('cf_swap_ds', 0.0)
-
-        # FreeCF: stored value vs derived from CF Ops, DS, Swap
-        # (engine/loop.py sets cf_after_debt_service; cf_ops and cf_ds are independent)
         proofs.append(_p(
             f"Y{_y}: FreeCF = Ops - DS - Swap",
-            _a['cf_ops'] - _a['cf_ds'] - _swap_ds_annual,
-            _a.get('cf_after_debt_service', _a['cf_ops'] - _a['cf_ds'] - _swap_ds_annual),
-        ))
-
-        # CF Ops = EBITDA + FD income - Tax (P&L source vs CF formula)
-        proofs.append(_p(
-            f"Y{_y}: CF Ops = EBITDA + II - Tax",
-            _a['ebitda'] + _a.get('ii_dsra', 0.0) - _a['cf_tax'],
-            _a['cf_ops'],
+            _exp_free[yi],
+            _a.get('cf_after_debt_service', _exp_free[yi]),
         ))
-
-        # CF Net = sum of components (engine build_annual() formula vs stored result)
-        _exp_net = (_a['cf_equity']
-                    + _a['cf_draw'] - _a['cf_capex']
-                    + _a['cf_grants'] - _a.get('cf_grant_accel', _a.get('cf_prepay', 0))
-                    + _a['cf_ops']
-                    - _a['cf_ie'] - _a['cf_pr']
-                    - _a.get('cf_swap_ds', 0)
-                    - _a.get('cf_dividend', 0))
-        proofs.append(_p(f"Y{_y}: CF Net = components", _exp_net, _a['cf_net']))
+        proofs.append(_p(f"Y{_y}: CF Ops = EBITDA + II - Tax", _exp_ops[yi], _ops_l[yi]))
+        proofs.append(_p(f"Y{_y}: CF Net = components", _exp_net[yi], _a['cf_net']))
 
     # 10yr aggregate: CF Ops total (CF path) = EBITDA + II - Tax total (P&L path)
-    _total_cf_ops = sum(_a['cf_ops'] for _a in annual)
-    _total_pnl_ops = (sum(_a['ebitda'] for _a in annual)
-                      + sum(_a.get('ii_dsra', 0.0) for _a in annual)
-                      - sum(_a['cf_tax'] for _a in annual))
     proofs.append(_p(
         "Sum(CF Ops) = Sum(EBITDA + II - Tax)",
-        _total_pnl_ops,
-        _total_cf_ops,
+        float(_ebitda.sum() + _ii.sum() - _cf_tax.sum()),
+        float(_ops.sum()),
     ))
 
     return proofs
@@ -619,68 +625,67 @@ def build_waterfall_proofs(waterfall_semi: list[dict]) -> list[dict]:
     - No Entity FD while debt outstanding (priority order)
     - Mezz balance = prev - scheduled - accel + draw (roll-forward)
     """
-    proofs: list[dict] = []
+    from engine.periods import repayment_start_index
 
-    for _aud_hi in range(total_periods()):
+    proofs: list[dict] = []
+    _w = waterfall_semi[:total_periods()]
+    n = len(_w)
+
+    _sr_pi = _col(_w, 'sr_pi').tolist()
+    _mz_pi = _col(_w, 'mz_pi').tolist()
+    # Surplus >= 0 (engine output check — sources are trust, expected=0 test on min)
+    _surplus_min = np.minimum(_col(_w, 'surplus'), 0).tolist()
+    # Free surplus >= 0 (allocation remainder)
+    _free_min = np.minimum(_col(_w, 'free_surplus', 0.0), 0).tolist()
+
+    # Balance continuity: no P+I when previous balance was zero
+    _mz_prev_zero = _prev(_col(_w, 'mz_ic_bal', 999.0), 999.0) <= 0.01
+    _sr_prev_zero = _prev(_col(_w, 'sr_ic_bal', 999.0), 999.0) <= 0.01
+
+    # Entity FD only when ALL debt = 0 (waterfall priority order)
+    _mz_bal = _col(_w, 'mz_ic_bal', 0.0)
+    _swap_bal = np.array([_aw.get('swap_leg_bal', _aw.get('zar_leg_bal', 0)) for _aw in _w],
+                         dtype=float)
+    _efd = _col(_w, 'entity_fd_fill', 0.0) > 0
+    _any_debt = (_mz_bal > 0.01) | (_col(_w, 'sr_ic_bal', 0.0) > 0.01) | (_swap_bal > 0.01)
+
+    # Mezz balance roll-forward: prev - scheduled - accel + draw
+    # Skip construction periods — IDC capitalisation (interest added to balance)
+    # is handled by FacilityState, not the waterfall cascade, so the simple
+    # roll-forward formula doesn't apply during construction.
+    _prev_mz = _prev(_mz_bal, 0.0)
+    _mz_draw = _col(_w, 'mezz_draw', 0.0)
+    _exp_mz = np.maximum(
+        _prev_mz - _col(_w, 'mz_prin_sched', 0.0) - _col(_w, 'mz_accel_entity', 0.0) + _mz_draw, 0
+    ).tolist()
+    _hi = np.arange(n)
+    _roll = (_hi > 0) & (_hi >= repayment_start_index()) & ((_prev_mz > 0.01) | (_mz_draw > 0))
+    _mz_bal = _mz_bal.tolist()
+
+    for _aud_hi in range(n):
         _aud_h = _aud_hi + 1
-        _aw = waterfall_semi[_aud_hi]
-        _a_sr_pi = _aw['sr_pi']
-        _a_mz_pi = _aw['mz_pi']
-        _a_surplus = _aw['surplus']
-
-        # Surplus >= 0 (engine output check — sources are trust, expected=0 test on min)
-        proofs.append(_p(f"H{_aud_h}: Surplus >= 0", 0.0, min(_a_surplus, 0)))
-
-        # Free surplus >= 0 (allocation remainder)
-        _a_free = _aw.get('free_surplus', 0)
-        proofs.append(_p(f"H{_aud_h}: Free surplus (remainder) >= 0", 0.0, min(_a_free, 0)))
-
-        # Balance continuity: no P+I when previous balance was zero
-        if _aud_hi > 0:
-            _prev_mz_bal = waterfall_semi[_aud_hi - 1].get('mz_ic_bal', 999)
-            if _prev_mz_bal <= 0.01:
-                proofs.append(_p(
-                    f"H{_aud_h}: Mezz IC prev bal=0 → Mz P+I should be 0",
-                    0.0, _a_mz_pi,
-                ))
-            _prev_sr_bal = waterfall_semi[_aud_hi - 1].get('sr_ic_bal', 999)
-            if _prev_sr_bal <= 0.01:
-                proofs.append(_p(
-                    f"H{_aud_h}: Sr IC prev bal=0 → Sr P+I should be 0",
-                    0.0, _a_sr_pi,
-                ))
-
-        # Entity FD only when ALL debt = 0 (waterfall priority order)
-        _a_efd = _aw.get('entity_fd_fill', 0)
-        if _a_efd > 0:
-            _any_debt = (_aw.get('mz_ic_bal', 0) > 0.01 or _aw.get('sr_ic_bal', 0) > 0.01
-                         or _aw.get('zar_leg_bal', 0) > 0.01)
+        proofs.append(_p(f"H{_aud_h}: Surplus >= 0", 0.0, _surplus_min[_aud_hi]))
+        proofs.append(_p(f"H{_aud_h}: Free surplus (remainder) >= 0", 0.0, _free_min[_aud_hi]))
+        if _mz_prev_zero[_aud_hi]:
+            proofs.append(_p(
+                f"H{_aud_h}: Mezz IC prev bal=0 → Mz P+I should be 0",
+                0.0, _mz_pi[_aud_hi],
+            ))
+        if _sr_prev_zero[_aud_hi]:
+            proofs.append(_p(
+                f"H{_aud_h}: Sr IC prev bal=0 → Sr P+I should be 0",
+                0.0, _sr_pi[_aud_hi],
+            ))
+        if _efd[_aud_hi]:
             proofs.append(_p(
                 f"H{_aud_h}: Entity FD only when ALL debt = 0",
-                0.0, 1.0 if _any_debt else 0.0,
+                0.0, 1.0 if _any_debt[_aud_hi] else 0.0,
+            ))
+        if _roll[_aud_hi]:
+            proofs.append(_p(
+                f"H{_aud_h}: Mezz bal = prev - sched - accel + draw",
+                _exp_mz[_aud_hi], _mz_bal[_aud_hi], tolerance=10.0,
             ))
-
-        # Mezz balance roll-forward: prev - scheduled - accel + draw
-        # Skip construction periods — IDC capitalisation (interest added to balance)
-        # is handled by FacilityState, not the waterfall cascade, so the simple
-        # roll-forward formula doesn't apply during construction.
-        from engine.periods import repayment_start_index as _rsi
-        _rep_hi = _rsi()
-        if _aud_hi > 0 and _aud_hi >= _rep_hi:
-            _prev_mz = waterfall_semi[_aud_hi - 1].get('mz_ic_bal', 0)
-            _exp_mz = max(
-                _prev_mz - _aw.get('mz_prin_sched', 0)
-                - _aw.get('mz_accel_entity', 0)
-                + _aw.get('mezz_draw', 0),
-                0
-            )
-            if _prev_mz > 0.01 or _aw.get('mezz_draw', 0) > 0:
-                proofs.append({
-                    "name": f"H{_aud_h}: Mezz bal = prev - sched - accel + draw",
-                    "expected": _exp_mz,
-                    "actual": _aw.get('mz_ic_bal', 0),
-                    "tolerance": 10.0,
-                })
 
     return proofs
 
@@ -768,47 +773,41 @@ def build_bs_proofs(annual: list[dict], depr_base: float) -> list[dict]:
     - Fixed Assets = min(cum_capex+idc, base+idc) - accum_depr (formula vs stored)
     """
     proofs: list[dict] = []
+    _fixed = _col(annual, 'bs_fixed_assets')
+
+    # Assets = Fixed Assets + DSRA (independent component sum vs stored bs_assets)
+    _exp_assets = (_fixed + _col(annual, 'bs_dsra')).tolist()
+
+    # RE vs CumPAT+Grants: the gap is exactly (swap_liability + cum_swap_ds + OD).
+    # Swap is a non-P&L financial obligation: the ZAR leg liability sits on the BS
+    # reducing equity, and cumulative swap debt service payments reduce cash (and
+    # therefore equity) without flowing through the P&L. Together they equal the
+    # initial swap notional in EUR terms. OD is also non-P&L.
+    _re_adj = (_col(annual, 'bs_retained')
+               + (_col(annual, 'bs_swap_liability', 0.0)
+                  + np.cumsum(_col(annual, 'cf_swap_ds', 0.0))
+                  + _col(annual, 'wf_od_bal', 0.0))).tolist()
+
+    # Fixed assets roll-forward (CF-derived formula vs stored value)
+    _acc_depr = np.cumsum(_col(annual, 'depr'))
+    _cum_capex = np.cumsum(_col(annual, 'cf_capex', 0.0))
+    _cum_idc = np.cumsum(_col(annual, 'cf_idc', 0.0))
+    _exp_fixed = np.maximum(
+        np.minimum(_cum_capex + _cum_idc, depr_base + _cum_idc) - _acc_depr, 0
+    ).tolist()
+    _fixed = _fixed.tolist()
 
-    for _a in annual:
+    for yi, _a in enumerate(annual):
         _y = _a['year']
-
-        # Assets = Fixed Assets + DSRA (independent component sum vs stored bs_assets)
-        proofs.append(_p(
-            f"Y{_y}: Assets = Fixed Assets + DSRA",
-            _a['bs_fixed_assets'] + _a['bs_dsra'],
-            _a['bs_assets'],
-        ))
-
-        # RE vs CumPAT+Grants: the gap is exactly (swap_liability + cum_swap_ds + OD).
-        # Swap is a non-P&L financial obligation: the ZAR leg liability sits on the BS
-        # reducing equity, and cumulative swap debt service payments reduce cash (and
-        # therefore equity) without flowing through the P&L. Together they equal the
-        # initial swap notional in EUR terms. OD is also non-P&L.
-        _swap_od = (_a.get('bs_swap_liability', 0)
-                    + sum(annual[j].get('cf_swap_ds', 0) for j in range(_y))
-                    + _a.get('wf_od_bal', 0))
+        proofs.append(_p(f"Y{_y}: Assets = Fixed Assets + DSRA", _exp_assets[yi], _a['bs_assets']))
         proofs.append(_p(
             f"Y{_y}: RE = CumPAT + Grants (adj swap/OD)",
             _a['bs_retained_check'],
-            _a['bs_retained'] + _swap_od,
+            _re_adj[yi],
         ))
-
         # BS Reserves = DSRA FD closing (waterfall bucket vs CF accumulator)
-        proofs.append(_p(
-            f"Y{_y}: BS Reserves = DSRA FD",
-            _a['dsra_bal'],
-            _a['bs_dsra'],
-        ))
-
-        # Fixed assets roll-forward (CF-derived formula vs stored value)
-        _acc_depr = sum(annual[i]['depr'] for i in range(_y))
-        _cum_capex_chk = sum(annual[i].get('cf_capex', 0) for i in range(_y))
-        _cum_idc_chk = sum(annual[i].get('cf_idc', 0) for i in range(_y))
-        proofs.append(_p(
-            f"Y{_y}: Fixed Assets = Base+IDC - AccDepr",
-            max(min(_cum_capex_chk + _cum_idc_chk, depr_base + _cum_idc_chk) - _acc_depr, 0),
-            _a['bs_fixed_assets'],
-        ))
+        proofs.append(_p(f"Y{_y}: BS Reserves = DSRA FD", _a['dsra_bal'], _a['bs_dsra']))
+        proofs.append(_p(f"Y{_y}: Fixed Assets = Base+IDC - AccDepr", _exp_fixed[yi], _fixed[yi]))
 
     return proofs
 
@@ -944,6 +943,134 @@ def build_ic_recon_proofs(
 # ── Top-level builder ─────────────────────────────────────────────
 
 
+PROOF_CATEGORIES = ("sources_uses", "facilities", "assets", "ops", "pnl", "cf", "waterfall", "bs")
+
+
+class EntityProofs(Mapping):
+    """Lazy {category: proofs} mapping for one entity.
+
+    A category is built on first access and memoised.  Categories whose
+    inputs were not supplied are absent, exactly as in build_entity_proofs();
+    membership tests never build anything.  With on_error, a failing category
+    is reported as on_error(category, exc) and reads as [] (not memoised).
+    Holds no locks or lambdas, so it pickles with the EntityResult.
+    """
+
+    def __init__(
+        self,
+        annual: list[dict],
+        waterfall_semi: list[dict],
+        entity_key: str,
+        *,
+        ops_annual: list[dict] | None = None,
+        depr_base: float = 0.0,
+        tax_rate: float = 0.27,
+        entity_data: dict | None = None,
+        structure: dict | None = None,
+        sr_schedule: list[dict] | None = None,
+        semi_annual_pl: list[dict] | None = None,
+        on_error: Callable[[str, Exception], Any] | None = None,
+    ):
+        self.annual = annual
+        self.waterfall_semi = waterfall_semi
+        self.entity_key = entity_key
+        self.ops_annual = ops_annual
+        self.depr_base = depr_base
+        self.tax_rate = tax_rate
+        self.entity_data = entity_data
+        self.structure = structure
+        self.sr_schedule = sr_schedule
+        self.semi_annual_pl = semi_annual_pl
+        self.on_error = on_error
+        self._built: dict[str, list[dict]] = {}
+
+    @classmethod
+    def from_entity(
+        cls,
+        entity: EntityResult | Mapping,
+        entity_key: str | None = None,
+        *,
+        tax_rate: float,
+        structure: dict | None,
+        on_error: Callable[[str, Exception], Any] | None = None,
+    ) -> EntityProofs:
+        """Proofs for an EntityResult or its ModelResult.to_dict() entry."""
+        er = entity if isinstance(entity, Mapping) else vars(entity)
+        entity_key = entity_key or er["entity_key"]
+        entity_data = (structure['uses']['loans_to_subsidiaries'].get(entity_key)
+                       if structure is not None else None)
+        return cls(
+            er["annual"], er["waterfall_semi"], entity_key,
+            ops_annual=er.get("ops_annual"),
+            depr_base=er.get("depreciable_base", 0.0),
+            tax_rate=tax_rate,
+            entity_data=entity_data,
+            structure=structure,
+            sr_schedule=er.get("sr_schedule"),
+            semi_annual_pl=er.get("semi_annual_pl"),
+            on_error=on_error,
+        )
+
+    def _available(self, category: str) -> bool:
+        if category == "sources_uses":
+            return self.entity_data is not None and self.structure is not None
+        if category == "facilities":
+            return bool(self.waterfall_semi) and self.sr_schedule is not None
+        if category == "assets":
+            return self.entity_data is not None
+        if category == "ops":
+            return self.ops_annual is not None
+        if category == "waterfall":
+            return bool(self.waterfall_semi)
+        return category in PROOF_CATEGORIES
+
+    def _build(self, category: str) -> list[dict]:
+        if category == "sources_uses":
+            return build_sources_uses_proofs(self.entity_data, self.structure)
+        if category == "facilities":
+            return build_facility_proofs(self.waterfall_semi, self.annual, self.sr_schedule)
+        if category == "assets":
+            return build_asset_proofs(self.annual, self.depr_base, self.entity_data)
+        if category == "ops":
+            return build_ops_proofs(self.ops_annual, self.annual, self.entity_key)
+        if category == "pnl":
+            return build_pnl_proofs(self.annual, self.tax_rate, self.semi_annual_pl)
+        if category == "cf":
+            return build_cf_proofs(self.annual)
+        if category == "waterfall":
+            return build_waterfall_proofs(self.waterfall_semi)
+        return build_bs_proofs(self.annual, self.depr_base)
+
+    def __getitem__(self, category: str) -> list[dict]:
+        if category in self._built:
+            return self._built[category]
+        if not self._available(category):
+            raise KeyError(category)
+        try:
+            proofs = self._build(category)
+        except Exception as exc:
+            if self.on_error is None:
+                raise
+            self.on_error(category, exc)
+            return []
+        self._built[category] = proofs
+        return proofs
+
+    def __contains__(self, category: object) -> bool:
+        return isinstance(category, str) and self._available(category)
+
+    def __iter__(self):
+        return (c for c in PROOF_CATEGORIES if self._available(c))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    @property
+    def built(self) -> tuple[str, ...]:
+        """Categories evaluated so far."""
+        return tuple(self._built)
+
+
 def build_entity_proofs(
     annual: list[dict],
     waterfall_semi: list[dict],
@@ -974,26 +1101,13 @@ def build_entity_proofs(
         sr_schedule: senior facility schedule (needed for "facilities" category)
         semi_annual_pl: 20-period semi-annual P&L rows (needed for tax ceiling proof)
     """
-    result: dict[str, list[dict]] = {}
-
-    if entity_data is not None and structure is not None:
-        result["sources_uses"] = build_sources_uses_proofs(entity_data, structure)
-
-    if waterfall_semi and sr_schedule is not None:
-        result["facilities"] = build_facility_proofs(waterfall_semi, annual, sr_schedule)
-
-    if entity_data is not None:
-        result["assets"] = build_asset_proofs(annual, depr_base, entity_data)
-
-    if ops_annual is not None:
-        result["ops"] = build_ops_proofs(ops_annual, annual, entity_key)
-
-    result["pnl"] = build_pnl_proofs(annual, tax_rate, semi_annual_pl)
-    result["cf"] = build_cf_proofs(annual)
-
-    if waterfall_semi:
-        result["waterfall"] = build_waterfall_proofs(waterfall_semi)
-
-    result["bs"] = build_bs_proofs(annual, depr_base)
-
-    return result
+    return dict(EntityProofs(
+        annual, waterfall_semi, entity_key,
+        ops_annual=ops_annual,
+        depr_base=depr_base,
+        tax_rate=tax_rate,
+        entity_data=entity_data,
+        structure=structure,
+        sr_schedule=sr_schedule,
+        semi_annual_pl=semi_annual_pl,
+    ))
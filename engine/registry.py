@@ -22,12 +22,15 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import warnings
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator
 
+from engine.reload import register
+
 
 # ── ColumnDef ────────────────────────────────────────────────────────
 
@@ -64,15 +67,28 @@ _CONFIG_PATH = Path(__file__).parent.parent / "config" / "columns.json"
 # Module-level singleton
 _registry: ColumnRegistry | None = None
 
+# Nature bit flags (ColumnRegistry.bits / select)
+STOCK, FLOW, PARAMETER = 1, 2, 4
+_NATURE_BITS = {"stock": STOCK, "flow": FLOW, "parameter": PARAMETER}
+
 
 class ColumnRegistry:
-    """Loaded from config/columns.json. Provides typed lookup and validation."""
+    """Loaded from config/columns.json. Provides typed lookup and validation.
+
+    Every index (family, account, nature, entity, nature bit flags, labels)
+    is compiled once at construction; lookups are single dict hits.
+    Validation results are memoised per registry, which is keyed by the
+    digest of its source file.
+    """
 
     __slots__ = ("_columns", "_stock_keys", "_flow_keys",
-                 "_by_family", "_by_account")
+                 "_by_family", "_by_account", "_by_nature", "_by_entity",
+                 "_generic", "_bits", "_labels", "digest", "_checks")
 
-    def __init__(self, columns: dict[str, ColumnDef]) -> None:
+    def __init__(self, columns: dict[str, ColumnDef], digest: str = "") -> None:
         self._columns = columns
+        self.digest = digest
+        self._checks: dict[tuple, tuple[str, ...]] = {}
 
         # Pre-compute indices
         self._stock_keys = frozenset(
@@ -83,10 +99,21 @@ class ColumnRegistry:
         )
         self._by_family: dict[str, list[ColumnDef]] = {}
         self._by_account: dict[str, list[ColumnDef]] = {}
+        self._by_nature: dict[str, list[ColumnDef]] = {}
+        self._bits = {k: _NATURE_BITS.get(c.nature, 0) for k, c in columns.items()}
+        self._labels = {k: c.label for k, c in columns.items()}
         for c in columns.values():
             self._by_family.setdefault(c.family, []).append(c)
+            self._by_nature.setdefault(c.nature, []).append(c)
             if c.account:
                 self._by_account.setdefault(c.account, []).append(c)
+        # Entity-scoped columns, each entity list in registry order with the generic ones
+        self._generic = tuple(c for c in columns.values() if not c.entity)
+        entities = {e for c in columns.values() for e in c.entity}
+        self._by_entity = {
+            e: tuple(c for c in columns.values() if not c.entity or e in c.entity)
+            for e in entities
+        }
 
     # ── Factory ──
 
@@ -101,8 +128,8 @@ class ColumnRegistry:
             path = _CONFIG_PATH
         path = Path(path)
 
-        with open(path) as f:
-            raw = json.load(f)
+        blob = path.read_bytes()
+        raw = json.loads(blob)
 
         columns: dict[str, ColumnDef] = {}
         for key, entry in raw.items():
@@ -121,14 +148,14 @@ class ColumnRegistry:
                 entity=tuple(entity_raw) if entity_raw else (),
             )
 
-        registry = cls(columns)
+        registry = cls(columns, digest=hashlib.sha1(blob).hexdigest())
         if path == _CONFIG_PATH:
             _registry = registry  # cache default path only
         return registry
 
     @classmethod
     def reset(cls) -> None:
-        """Clear the cached singleton (for testing)."""
+        """Clear the cached singleton (tests, config hot-reload)."""
         global _registry
         _registry = None
 
@@ -175,12 +202,27 @@ class ColumnRegistry:
         """All columns sharing a parent account."""
         return self._by_account.get(account, [])
 
+    def by_nature(self, nature: str) -> list[ColumnDef]:
+        """All columns of one nature ("flow", "stock" or "parameter")."""
+        return self._by_nature.get(nature, [])
+
     def for_entity(self, entity_key: str) -> list[ColumnDef]:
         """Columns applicable to a specific entity (or to all entities)."""
-        return [
-            c for c in self._columns.values()
-            if not c.entity or entity_key in c.entity
-        ]
+        return list(self._by_entity.get(entity_key, self._generic))
+
+    def bits(self, key: str) -> int:
+        """Nature bit flag (STOCK / FLOW / PARAMETER) of a key; 0 if unknown."""
+        return self._bits.get(key, 0)
+
+    def select(self, keys, mask: int) -> list[str]:
+        """The keys whose nature flag is in mask (e.g. STOCK | FLOW), in order."""
+        bits = self._bits
+        return [k for k in keys if bits.get(k, 0) & mask]
+
+    def labels(self, keys) -> dict[str, str]:
+        """{key: registry label}, falling back to the key itself."""
+        labels = self._labels
+        return {k: labels.get(k, k) for k in keys}
 
     # ── Cross-Validation ──
 
@@ -206,6 +248,10 @@ class ColumnRegistry:
         Returns:
             List of mismatch descriptions (empty = all good).
         """
+        memo_key = ("stock_keys", frozenset(stock_keys), label)
+        hit = self._checks.get(memo_key)
+        if hit is not None:
+            return list(hit)
         prefix = f"[{label}] " if label else ""
         issues: list[str] = []
         for key in sorted(stock_keys):
@@ -217,6 +263,7 @@ class ColumnRegistry:
                     f"{prefix}Stock key '{key}' has nature='{col.nature}' "
                     f"in registry (expected 'stock')"
                 )
+        self._checks[memo_key] = tuple(issues)
         return issues
 
     def validate_account_units(self) -> list[str]:
@@ -239,6 +286,9 @@ class ColumnRegistry:
 
         Returns list of issues (empty = all good).
         """
+        hit = self._checks.get(("schema",))
+        if hit is not None:
+            return list(hit)
         issues: list[str] = []
 
         valid_natures = {"flow", "stock", "parameter"}
@@ -251,9 +301,13 @@ class ColumnRegistry:
                 issues.append(f"'{col.key}': invalid sign '{col.sign}'")
 
         issues.extend(self.validate_account_units())
+        self._checks[("schema",)] = tuple(issues)
         return issues
 
 
+register("registry", ColumnRegistry.reset)
+
+
 # ── Startup Validation ───────────────────────────────────────────────
 
 
@@ -0,0 +1,146 @@
+"""Config hot-reload — mtime watcher with targeted cache invalidation.
+
+A ConfigWatcher polls config/*.json (stdlib only, no inotify dependency)
+and, for every file whose mtime or size changed, drops that file from the
+loaders and clears only the cache groups that depend on it:
+
+    operations.json / assets.json   -> ops, results
+    other ModelConfig sections      -> results
+    periods.json                    -> timeline and every other group
+    columns.json                    -> registry, tags
+    anything else                   -> its own loader entries only
+
+Every changed file is also dropped from the per-file loaders
+(engine.config.load_config, which re-snapshots ModelConfig for a section).
+
+Each module registers its caches next to their definition, so a module
+that was never imported costs nothing to invalidate.  The app registers its
+st.cache_data functions the same way:
+
+    from engine.reload import register, watch
+    register("results", _run_engine_model.clear)
+    watch()                  # idempotent; daemon thread, 0.5 s poll
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Callable, Iterable
+
+from engine.config import _CONFIG_DIR, CONFIG_SECTIONS, forget_config
+
+GROUPS = ("ops", "results", "timeline", "registry", "tags")
+
+# Config file (stem) -> dependent cache groups
+DEPENDENTS: dict[str, tuple[str, ...]] = {
+    **{name: ("results",) for name in CONFIG_SECTIONS},
+    "operations": ("ops", "results"),
+    "assets": ("ops", "results"),        # LanRED dispatch hashes the solar budget
+    "periods": GROUPS,
+    "columns": ("registry", "tags"),
+}
+
+# Handlers are keyed by name (or the callable itself), so a Streamlit rerun
+# that re-registers a freshly decorated function replaces its old entry.
+_handlers: dict[str, dict[object, Callable[[], None]]] = {g: {} for g in GROUPS}
+_loaders: dict[object, Callable[[str], None]] = {forget_config: forget_config}
+_lock = threading.Lock()
+
+
+def register(group: str, clear: Callable[[], None], name: str | None = None) -> None:
+    """Call clear() whenever a config file that group depends on changes."""
+    if group not in _handlers:
+        raise ValueError(f"Unknown cache group {group!r}; expected one of {GROUPS}")
+    with _lock:
+        _handlers[group][clear if name is None else name] = clear
+
+
+def register_loader(forget: Callable[[str], None], name: str | None = None) -> None:
+    """Call forget(file_stem) for every changed config file (per-file loader caches)."""
+    with _lock:
+        _loaders[forget if name is None else name] = forget
+
+
+def groups_for(names: Iterable[str]) -> list[str]:
+    """Cache groups invalidated by a set of changed config files, in GROUPS order."""
+    hit = {g for name in names for g in DEPENDENTS.get(name, ())}
+    return [g for g in GROUPS if g in hit]
+
+
+def invalidate(names: Iterable[str]) -> list[str]:
+    """Forget the changed files and clear their dependent groups; returns the groups."""
+    names = list(names)
+    with _lock:
+        loaders = list(_loaders.values())
+        groups = groups_for(names)
+        handlers = [h for g in groups for h in _handlers[g].values()]
+    for name in names:
+        for forget in loaders:
+            forget(name)
+    for clear in handlers:
+        clear()
+    return groups
+
+
+# ── Watcher ─────────────────────────────────────────────────────
+
+
+class ConfigWatcher:
+    """Polls a config directory and invalidates caches for changed files."""
+
+    def __init__(self, directory: Path | str = _CONFIG_DIR, interval: float = 0.5) -> None:
+        self.directory = Path(directory)
+        self.interval = interval
+        self._stamps = self._scan()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        stamps = {}
+        for path in self.directory.glob("*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:                      # removed mid-scan
+                continue
+            stamps[path.stem] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def poll(self) -> list[str]:
+        """Invalidate caches for files changed since the last poll; returns their names."""
+        stamps = self._scan()
+        changed = sorted(name for name in stamps.keys() | self._stamps.keys()
+                         if stamps.get(name) != self._stamps.get(name))
+        self._stamps = stamps
+        if changed:
+            invalidate(changed)
+        return changed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def start(self) -> "ConfigWatcher":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+_watcher: ConfigWatcher | None = None
+
+
+def watch(interval: float = 0.5) -> ConfigWatcher:
+    """Start (once per process) the watcher on the model's config directory."""
+    global _watcher
+    with _lock:
+        if _watcher is None:
+            _watcher = ConfigWatcher(interval=interval)
+    return _watcher.start()
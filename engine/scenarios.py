@@ -2,6 +2,10 @@
 
 Single scenario: change ScenarioInputs → re-run DAG → get result.
 Sensitivity sweep: run DAG N times with systematic variable changes → DataFrame.
+A sweep variable is either a ScenarioInputs attribute or a dotted config
+path ("rates.senior_debt.facility_rate"), applied as a copy-on-write
+ModelConfig overlay.  Sweep points are cached by (config, inputs)
+fingerprint, so rate and FX stress tables re-use runs like tariff sweeps.
 
 The DAG is fast (single-pass, no convergence), so running 50+ scenarios
 in a sweep is feasible for interactive tornado charts.
@@ -10,11 +14,17 @@ in a sweep is feasible for interactive tornado charts.
 from __future__ import annotations
 
 import copy
+import itertools
+import random
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator
 
-from engine.config import ModelConfig, ScenarioInputs
-from engine.analytics import extract_metrics, EntityMetrics
+from engine.config import ModelConfig, ScenarioInputs, is_config_path, split_overrides
+from engine.analytics import EntityMetrics
+from engine.reload import register
+
+if TYPE_CHECKING:
+    from engine.library import ScenarioLibrary
 
 
 @dataclass
@@ -22,6 +32,7 @@ class SweepVariable:
     """A variable to sweep in sensitivity analysis.
 
     attr: ScenarioInputs attribute name (e.g. "nwl_greenfield_growth_pct")
+          or dotted config path (e.g. "rates.senior_debt.facility_rate")
     base: Base case value (e.g. 7.7)
     low: Low end of sweep range (e.g. 3.0)
     high: High end of sweep range (e.g. 12.0)
@@ -43,6 +54,22 @@ class SweepVariable:
         step_size = (self.high - self.low) / (self.steps - 1)
         return [self.low + i * step_size for i in range(self.steps)]
 
+    @property
+    def is_config(self) -> bool:
+        """True if attr is a ModelConfig path rather than a ScenarioInputs field."""
+        return is_config_path(self.attr)
+
+
+def apply_point(
+    variable: SweepVariable, value: Any, cfg: ModelConfig, inputs: ScenarioInputs,
+) -> tuple[ModelConfig, ScenarioInputs]:
+    """(cfg, inputs) with the variable set to value; the other side is shared."""
+    if variable.is_config:
+        return cfg.with_overrides({variable.attr: value}), inputs
+    inputs = copy.copy(inputs)
+    setattr(inputs, variable.attr, value)
+    return cfg, inputs
+
 
 @dataclass
 class SweepResult:
@@ -62,26 +89,62 @@ class SweepResult:
         return pd.DataFrame(self.rows)
 
 
+# ── Sweep point cache ───────────────────────────────────────────
+
+SWEEP_CACHE_SIZE = 256
+
+_sweep_cache = None
+
+
+def _point_cache():
+    global _sweep_cache
+    if _sweep_cache is None:
+        from engine.batch import ResultCache
+        _sweep_cache = ResultCache(SWEEP_CACHE_SIZE)
+    return _sweep_cache
+
+
+def clear_sweep_cache() -> None:
+    global _sweep_cache
+    _sweep_cache = None
+
+
+register("results", clear_sweep_cache)
+
+
+def _point_payload(cfg: ModelConfig, inputs: ScenarioInputs, discount_rate: float) -> dict:
+    """engine.batch payload for one sweep point, cached by (config, inputs) fingerprint."""
+    from engine.batch import evaluate_scenario
+
+    key = f"{cfg.fingerprint}:{inputs.fingerprint()}:{discount_rate!r}"
+    cache = _point_cache()
+    payload = cache.get(key)
+    if payload is None:
+        payload = evaluate_scenario(cfg, inputs, discount_rate=discount_rate)
+        cache.put(key, payload)
+    return payload
+
+
 def run_sweep(
     variable: SweepVariable,
     entity_key: str = "nwl",
     cfg: ModelConfig | None = None,
     base_inputs: ScenarioInputs | None = None,
     discount_rate: float = 0.052,
+    library: ScenarioLibrary | None = None,
 ) -> SweepResult:
     """Run a single-variable sensitivity sweep.
 
     For each value in variable.values:
-        1. Clone base_inputs
-        2. Set the variable to the sweep value
-        3. Run the full model
-        4. Extract metrics for the specified entity
-        5. Collect as a row
-
-    Returns SweepResult with one row per scenario.
+        1. Apply the value (inputs copy, or config overlay for config paths)
+        2. Run the full model, or reuse the cached run for that point
+        3. Extract metrics for the specified entity
+        4. Collect as a row
+
+    Returns SweepResult with one row per scenario.  With a library, every
+    run (all entities + holding summary) is also stored there under its
+    (config, inputs) key, config-path points included.
     """
-    from engine.orchestrator import run_model
-
     if cfg is None:
         cfg = ModelConfig.load()
     if base_inputs is None:
@@ -90,21 +153,14 @@ def run_sweep(
     result = SweepResult(variable=variable, entity_key=entity_key)
 
     for val in variable.values:
-        # Clone inputs and set the sweep variable
-        inputs = copy.copy(base_inputs)
-        setattr(inputs, variable.attr, val)
-
-        # Run the model
-        model_result = run_model(cfg, inputs)
-
-        # Extract metrics
-        er = model_result.entities[entity_key]
-        metrics = extract_metrics(entity_key, er.annual, discount_rate)
+        point_cfg, inputs = apply_point(variable, val, cfg, base_inputs)
+        payload = _point_payload(point_cfg, inputs, discount_rate)
 
-        # Build row
         row = {variable.attr: val, "is_base": abs(val - variable.base) < 1e-10}
-        row.update(metrics.to_dict())
+        row.update(payload["metrics"][entity_key])
         result.rows.append(row)
+        if library is not None:
+            library.add(inputs, payload, label=variable.label or variable.attr, cfg=point_cfg)
 
     return result
 
@@ -115,6 +171,7 @@ def run_multi_sweep(
     cfg: ModelConfig | None = None,
     base_inputs: ScenarioInputs | None = None,
     discount_rate: float = 0.052,
+    library: ScenarioLibrary | None = None,
 ) -> list[SweepResult]:
     """Run sweeps for multiple variables (one at a time, not grid).
 
@@ -127,11 +184,30 @@ def run_multi_sweep(
         base_inputs = ScenarioInputs.defaults()
 
     return [
-        run_sweep(v, entity_key, cfg, base_inputs, discount_rate)
+        run_sweep(v, entity_key, cfg, base_inputs, discount_rate, library)
         for v in variables
     ]
 
 
+# ── Scenario books ──────────────────────────────────────────────
+
+
+def grid_overrides(variables: list[SweepVariable]) -> Iterator[dict]:
+    """Full-factorial grid: one {attr: value} override dict per combination.
+
+    Config-path attrs stay in the flat dict; split_overrides() separates them.
+    """
+    for combo in itertools.product(*(v.values for v in variables)):
+        yield {v.attr: val for v, val in zip(variables, combo)}
+
+
+def sample_overrides(variables: list[SweepVariable], n: int, seed: int = 0) -> Iterator[dict]:
+    """Monte Carlo book: n override dicts, each attr uniform on [low, high]."""
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield {v.attr: rng.uniform(v.low, v.high) for v in variables}
+
+
 # ── Common Sweep Presets ────────────────────────────────────────
 
 
@@ -162,3 +238,32 @@ NWL_SWEEP_PRESETS: list[SweepVariable] = [
         label="Cash Sweep %",
     ),
 ]
+
+
+RATE_SWEEP_PRESETS: list[SweepVariable] = [
+    SweepVariable(
+        attr="rates.senior_debt.facility_rate",
+        base=0.047, low=0.035, high=0.065, steps=5,
+        label="Senior Facility Rate",
+    ),
+    SweepVariable(
+        attr="rates.mezzanine.total_rate",
+        base=0.1425, low=0.11, high=0.17, steps=5,
+        label="Mezz Total Rate",
+    ),
+    SweepVariable(
+        attr="rates.fx.eur_zar",
+        base=20.0, low=17.0, high=23.0, steps=5,
+        label="EUR/ZAR",
+    ),
+    SweepVariable(
+        attr="rates.fixed_deposits.zar.rate",
+        base=0.09, low=0.06, high=0.11, steps=5,
+        label="ZAR FD Rate",
+    ),
+    SweepVariable(
+        attr="rates.tax.corporate_rate",
+        base=0.27, low=0.22, high=0.32, steps=5,
+        label="Corporate Tax Rate",
+    ),
+]
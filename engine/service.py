@@ -0,0 +1,235 @@
+"""Local HTTP/JSON model service — warm worker pool + request coalescing.
+
+    python -m engine serve --port 8765 --workers 4
+
+Endpoints (JSON bodies; "inputs" is a partial ScenarioInputs dict):
+
+    GET  /health                     pool size, cache size, request counters
+    POST /run      {inputs, statements?, discount_rate?}
+                   -> per-entity metrics + holding summary (engine.batch payload)
+    POST /metrics  {inputs, entity, discount_rate?}
+                   -> EntityMetrics.to_dict() for one entity
+    POST /model    {inputs}
+                   -> full ModelResult.to_dict() (the Streamlit app's layout)
+    POST /sweep    {inputs?, entity?, discount_rate?,
+                    variable: {attr, base, low, high, steps?, label?}}
+                   -> {"rows": [...]} in engine.scenarios.run_sweep row layout
+
+"inputs" of every endpoint may also carry dotted config paths
+("rates.fx.eur_zar": 21.0), and a sweep variable's attr may be one; they
+are applied as a copy-on-write overlay on the worker's ModelConfig.
+
+Workers load ModelConfig once at start.  serve() watches config/*.json;
+every job carries the current config fingerprint, and a worker whose
+snapshot is stale reloads it before running.  Requests are keyed by
+(endpoint kind, config + overlay fingerprint, ScenarioInputs fingerprint,
+options), so results computed on an old config are never served:
+identical concurrent requests share one pool job, and completed results
+are served from an LRU cache.  Sweeps fan out one job per value through
+the same path, so they run in parallel and share results with /run callers.
+
+The Streamlit app uses this as its backend when MODEL_SERVICE_URL is set
+(see ModelServiceClient).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import urllib.request
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from engine.batch import ResultCache, _init_worker, _worker_evaluate, _worker_model
+from engine.config import ModelConfig, ScenarioInputs, resolve_overrides, scenario_fingerprint
+from engine.scenarios import SweepVariable
+
+
+# ── Coalescing pool ─────────────────────────────────────────────
+
+
+class ModelService:
+    """Warm ProcessPoolExecutor with fingerprint coalescing and an LRU cache."""
+
+    def __init__(self, workers: int = 2, cache_size: int = 512) -> None:
+        self.workers = workers
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(False, 0.052),
+        )
+        self._cache = ResultCache(cache_size)
+        self._in_flight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "computed": 0, "coalesced": 0, "cached": 0}
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def _submit(self, key: str, fn, *args) -> Future:
+        """Return a Future for key, reusing a cached or in-flight result."""
+        with self._lock:
+            self.stats["requests"] += 1
+            hit = self._cache.get(key)
+            if hit is not None:
+                self.stats["cached"] += 1
+                done: Future = Future()
+                done.set_result(hit)
+                return done
+            fut = self._in_flight.get(key)
+            if fut is not None:
+                self.stats["coalesced"] += 1
+                return fut
+            self.stats["computed"] += 1
+            fut = self._pool.submit(fn, *args)
+            self._in_flight[key] = fut
+        fut.add_done_callback(lambda f, k=key: self._finish(k, f))
+        return fut
+
+    def _finish(self, key: str, fut: Future) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if not fut.cancelled() and fut.exception() is None:
+                self._cache.put(key, fut.result())
+
+    # ── Public calls ──
+
+    def run(self, overrides: dict, statements: bool = False, discount_rate: float = 0.052) -> Future:
+        base = ModelConfig.load()
+        fp = scenario_fingerprint(*resolve_overrides(overrides, base))
+        key = f"run:{fp}:{int(statements)}:{discount_rate!r}"
+        return self._submit(key, _worker_evaluate, overrides, statements, discount_rate, base.fingerprint)
+
+    def model(self, overrides: dict) -> Future:
+        base = ModelConfig.load()
+        fp = scenario_fingerprint(*resolve_overrides(overrides, base))
+        return self._submit(f"model:{fp}", _worker_model, overrides, base.fingerprint)
+
+    def metrics(self, overrides: dict, entity: str, discount_rate: float = 0.052) -> dict:
+        payload = self.run(overrides, discount_rate=discount_rate).result()
+        if entity not in payload["metrics"]:
+            raise ValueError(f"Unknown entity {entity!r}; expected one of {sorted(payload['metrics'])}")
+        return payload["metrics"][entity]
+
+    def sweep(self, overrides: dict, variable: SweepVariable,
+              entity: str = "nwl", discount_rate: float = 0.052) -> list[dict]:
+        futures = [
+            (val, self.run({**overrides, variable.attr: val}, discount_rate=discount_rate))
+            for val in variable.values
+        ]
+        rows = []
+        for val, fut in futures:
+            row = {variable.attr: val, "is_base": abs(val - variable.base) < 1e-10}
+            row.update(fut.result()["metrics"][entity])
+            rows.append(row)
+        return rows
+
+
+# ── HTTP layer ──────────────────────────────────────────────────
+
+
+def _make_handler(service: ModelService):
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "SCLCAModel/1.0"
+
+        def log_message(self, fmt, *args):  # keep stderr quiet; stats via /health
+            pass
+
+        def _send(self, status: int, body: dict) -> None:
+            data = json.dumps(body, default=str).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path.rstrip("/") == "/health":
+                self._send(200, {"status": "ok", "workers": service.workers, **service.stats})
+            else:
+                self._send(404, {"error": f"no route {self.path}"})
+
+        def do_POST(self):
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                req = json.loads(self.rfile.read(length) or b"{}")
+                inputs = req.get("inputs", {})
+                rate = float(req.get("discount_rate", 0.052))
+                route = self.path.rstrip("/")
+                if route == "/run":
+                    body = service.run(inputs, bool(req.get("statements", False)), rate).result()
+                elif route == "/model":
+                    body = service.model(inputs).result()
+                elif route == "/metrics":
+                    body = service.metrics(inputs, req.get("entity", "nwl"), rate)
+                elif route == "/sweep":
+                    body = {"rows": service.sweep(
+                        inputs, SweepVariable(**req["variable"]), req.get("entity", "nwl"), rate)}
+                else:
+                    self._send(404, {"error": f"no route {self.path}"})
+                    return
+            except (ValueError, TypeError, KeyError) as exc:
+                self._send(400, {"error": f"{type(exc).__name__}: {exc}"})
+                return
+            except Exception as exc:
+                self._send(500, {"error": f"{type(exc).__name__}: {exc}"})
+                return
+            self._send(200, body)
+
+    return Handler
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, workers: int = 2,
+          cache_size: int = 512) -> None:
+    """Run the service until interrupted (config edits are picked up live)."""
+    from engine.reload import watch
+
+    watch()
+    service = ModelService(workers=workers, cache_size=cache_size)
+    httpd = ThreadingHTTPServer((host, port), _make_handler(service))
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        service.close()
+
+
+# ── Client ──────────────────────────────────────────────────────
+
+
+class ModelServiceClient:
+    """Minimal stdlib client for the model service."""
+
+    def __init__(self, url: str, timeout: float = 120.0) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _post(self, route: str, body: dict) -> dict:
+        req = urllib.request.Request(
+            self.url + route,
+            data=json.dumps(body, default=str).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            return json.loads(resp.read())
+
+    @staticmethod
+    def _overrides(inputs: ScenarioInputs | dict) -> dict:
+        return asdict(inputs) if isinstance(inputs, ScenarioInputs) else dict(inputs)
+
+    def run(self, inputs: ScenarioInputs | dict, statements: bool = False) -> dict:
+        return self._post("/run", {"inputs": self._overrides(inputs), "statements": statements})
+
+    def model(self, inputs: ScenarioInputs | dict) -> dict:
+        return self._post("/model", {"inputs": self._overrides(inputs)})
+
+    def metrics(self, inputs: ScenarioInputs | dict, entity: str = "nwl") -> dict:
+        return self._post("/metrics", {"inputs": self._overrides(inputs), "entity": entity})
+
+    def sweep(self, variable: SweepVariable, inputs: ScenarioInputs | dict | None = None,
+              entity: str = "nwl") -> list[dict]:
+        body = {"inputs": self._overrides(inputs or {}), "entity": entity,
+                "variable": asdict(variable)}
+        return self._post("/sweep", body)["rows"]
@@ -0,0 +1,411 @@
+"""Template-driven statement engine — compiled plans, one vectorised pass.
+
+Statement layouts live in config/templates/{pnl,cf,bs}.json (checked
+against the column registry by engine.template_validator).  Each template
+is compiled once into a StatementPlan of steps:
+
+    driver / balance   registry column x sign (balance totals = closing value)
+    formula            expression over columns / earlier lines, e.g.
+                       "cf_ops / (cf_ds + cf_swap_ds)"
+    aggregation        sum of earlier displayed lines: "of": ["cf_draw", "cf_capex"]
+
+evaluate_statements() then evaluates every step for all entities and all
+years at once: each column a plan reads is gathered into one
+(entity, year) matrix, so a formula is a single numpy expression across
+the whole result instead of a per-row dict walk.
+
+Sections and lines can be limited with "entities": [...] and shown only
+"when" / "unless" a flag holds.  Flags come from the caller (swap,
+brownfield_plus) or from the template's own "flags" expressions, which
+hold for an entity if they hold in any year.  Labels may use
+str.format fields filled from context ("Tax ({tax_rate:.0%})").
+
+    tables = model_statements(result, inputs)
+    tables["nwl", "pnl"].rows()     # [(label, values + [total], row_type, key), ...]
+
+rows() is the layout views.heritage.inject_pnl_heritage() renders; the
+board pack and the Excel export read the same tables.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType
+from typing import TYPE_CHECKING, Any, Iterable
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from engine.config import ModelConfig, ScenarioInputs
+    from engine.types import ModelResult
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "config" / "templates"
+STATEMENTS = ("pnl", "cf", "bs")
+
+_DEFAULT_TOTALS = {"pnl": "sum", "cf": "sum", "bs": "last"}
+_STYLES = {"line", "sub", "total", "grand", "memo"}
+
+
+# ── Plans ───────────────────────────────────────────────────────
+
+
+def _vmax(*args):
+    return np.maximum.reduce(np.broadcast_arrays(*args)) if len(args) > 1 else np.asarray(args[0])
+
+
+def _vmin(*args):
+    return np.minimum.reduce(np.broadcast_arrays(*args)) if len(args) > 1 else np.asarray(args[0])
+
+
+# Vectorised counterparts of engine.roster._SAFE_NAMES
+_SAFE_NAMES: dict[str, Any] = {"max": _vmax, "min": _vmin, "abs": np.abs}
+_BANNED = re.compile(r"\b(import|exec|eval|open|compile|getattr)\b|__")
+
+
+def _compile_expr(expr: str, where: str) -> CodeType:
+    """Compile a template expression once (same guard rails as roster._safe_eval)."""
+    if _BANNED.search(expr):
+        raise ValueError(f"{where}: disallowed construct in expression {expr!r}")
+    try:
+        return compile(expr, f"<{where}>", "eval")
+    except SyntaxError as e:
+        raise ValueError(f"{where}: invalid expression {expr!r} -> {e}") from e
+
+
+@dataclass(frozen=True)
+class Step:
+    """One compiled template line (or a section header)."""
+    id: str
+    label: str
+    kind: str                           # driver | balance | formula | aggregation | spacer | section
+    sign: float = 1.0
+    style: str = "line"
+    total: str = "sum"                  # sum | last | mean | none
+    fmt: str = ""                       # "" (money) | ratio | check
+    entities: frozenset[str] | None = None
+    when: tuple[str, ...] = ()
+    unless: tuple[str, ...] = ()
+    of: tuple[str, ...] = ()
+    code: CodeType | None = None
+
+
+@dataclass(frozen=True)
+class StatementPlan:
+    """A compiled template: ordered steps plus the columns and flags they read."""
+    statement: str
+    name: str
+    steps: tuple[Step, ...]
+    columns: tuple[str, ...]
+    flags: tuple[tuple[str, CodeType], ...] = ()
+
+
+def _filters(spec: dict, parent: dict | None = None) -> dict:
+    def _names(key: str) -> tuple[str, ...]:
+        own = spec.get(key) or ()
+        own = (own,) if isinstance(own, str) else tuple(own)
+        return (parent or {}).get(key, ()) + own
+
+    entities = spec.get("entities")
+    inherited = (parent or {}).get("entities")
+    if entities is not None:
+        entities = frozenset(entities) & inherited if inherited is not None else frozenset(entities)
+    else:
+        entities = inherited
+    return {"entities": entities, "when": _names("when"), "unless": _names("unless")}
+
+
+def compile_template(template: dict, statement: str | None = None) -> StatementPlan:
+    """Compile a parsed template into a StatementPlan."""
+    statement = statement or template.get("statement") or template.get("name", "")
+    default_total = template.get("total", _DEFAULT_TOTALS.get(statement, "sum"))
+    steps: list[Step] = []
+    columns: dict[str, None] = {}
+    defined: set[str] = set()                # every line id so far (aggregation operands)
+    derived: set[str] = set()                # formula / aggregation ids (formula operands)
+
+    def _line(spec: dict, scope: dict, where: str) -> Step:
+        kind = spec.get("type", "driver")
+        line_id = spec.get("id", "")
+        style = spec.get("style", "line")
+        if style not in _STYLES:
+            raise ValueError(f"{where}: unknown style {style!r}")
+        common = dict(
+            id=line_id, label=spec.get("label", line_id), kind=kind, style=style,
+            sign=float(spec.get("sign", 1)), fmt=spec.get("format", ""), **_filters(spec, scope),
+        )
+        if kind == "spacer":
+            return Step(**{**common, "id": "", "label": "", "total": "none"})
+        if kind in ("driver", "balance"):
+            columns.setdefault(line_id)
+            total = spec.get("total", "last" if kind == "balance" else default_total)
+            return Step(**common, total=total)
+        if kind == "formula":
+            code = _compile_expr(spec["expr"], f"{statement}.{line_id}")
+            for name in code.co_names:
+                if name not in _SAFE_NAMES and name not in derived:
+                    columns.setdefault(name)
+            return Step(**common, total=spec.get("total", default_total), code=code)
+        if kind == "aggregation":
+            missing = [x for x in spec.get("of", ()) if x not in defined]
+            if missing:
+                raise ValueError(f"{where}: aggregation of undefined lines {missing}")
+            return Step(**common, total=spec.get("total", default_total), of=tuple(spec["of"]))
+        raise ValueError(f"{where}: unknown line type {kind!r}")
+
+    sections = template.get("sections") or [{"lines": template.get("lines", [])}]
+    for si, section in enumerate(sections):
+        scope = _filters(section)
+        where = f"{statement} section {section.get('label', si)!r}"
+        steps.append(Step(id="", label=section.get("label", ""), kind="section", total="none", **scope))
+        lines = list(section.get("lines", []))
+        for sub in section.get("subsections", []):
+            lines.extend(sub.get("lines", []))
+        if section.get("summary"):
+            lines.append(section["summary"])
+        for spec in lines:
+            step = _line(spec, scope, where)
+            steps.append(step)
+            if step.id:
+                defined.add(step.id)
+                if step.kind in ("formula", "aggregation"):
+                    derived.add(step.id)
+
+    flags = tuple((name, _compile_expr(expr, f"{statement}.flags.{name}"))
+                  for name, expr in template.get("flags", {}).items())
+    for _, code in flags:
+        for name in code.co_names:
+            if name not in _SAFE_NAMES:
+                columns.setdefault(name)
+    return StatementPlan(statement=statement, name=template.get("name", statement),
+                         steps=tuple(steps), columns=tuple(columns), flags=flags)
+
+
+_plans: dict[Path, tuple[int, StatementPlan]] = {}
+_plans_lock = threading.Lock()
+
+
+def load_plan(statement: str, template_dir: str | Path | None = None) -> StatementPlan:
+    """Compiled plan for <template_dir>/<statement>.json (recompiled when the file changes)."""
+    path = Path(template_dir or TEMPLATE_DIR) / f"{statement}.json"
+    mtime = path.stat().st_mtime_ns
+    with _plans_lock:
+        hit = _plans.get(path)
+        if hit is not None and hit[0] == mtime:
+            return hit[1]
+    with open(path, encoding="utf-8") as f:
+        plan = compile_template(json.load(f), statement)
+    with _plans_lock:
+        _plans[path] = (mtime, plan)
+    return plan
+
+
+# ── Evaluation ──────────────────────────────────────────────────
+
+
+@dataclass
+class StatementLine:
+    """One evaluated line for one entity; values are per year."""
+    label: str
+    style: str                          # section | spacer | line | sub | total | grand | memo
+    key: str = ""
+    values: list[float] = field(default_factory=list)
+    total: float | None = None
+    fmt: str = ""
+
+
+@dataclass
+class StatementTable:
+    """One statement for one entity, lines in display order."""
+    entity: str
+    statement: str
+    name: str
+    years: list[Any]
+    lines: list[StatementLine]
+
+    def rows(self, money_fmt: str = "€{:,.0f}") -> list[tuple]:
+        """(label, values + [total], row_type, key) rows for inject_pnl_heritage()."""
+        blank = [None] * (len(self.years) + 1)
+        out: list[tuple] = []
+        for line in self.lines:
+            if line.style in ("section", "spacer"):
+                out.append((line.label, list(blank), line.style, ""))
+            elif line.fmt == "ratio":
+                cells = [f"{v:.2f}x" if math.isfinite(v) else "n/a" for v in line.values]
+                total = f"{line.total:.2f}x" if line.total is not None and math.isfinite(line.total) else "n/a"
+                out.append((line.label, cells + [total], line.style, line.key))
+            elif line.fmt == "check":
+                cells = ["OK" if abs(v) < 0.01 else money_fmt.format(v) for v in line.values + [line.total]]
+                out.append((line.label, cells, line.style, line.key))
+            else:
+                out.append((line.label, line.values + [line.total], line.style, line.key))
+        return out
+
+
+def _visible(step: Step, entity: str, flags: dict[str, bool]) -> bool:
+    if step.entities is not None and entity not in step.entities:
+        return False
+    return all(flags.get(f, False) for f in step.when) and not any(flags.get(f, False) for f in step.unless)
+
+
+def _label(label: str, context: dict | None) -> str:
+    if context and "{" in label:
+        try:
+            return label.format(**context)
+        except (KeyError, IndexError, ValueError):
+            return label
+    return label
+
+
+def _flag_values(value: Any, keys: list[str]) -> list[bool]:
+    if isinstance(value, dict):
+        return [bool(value.get(k, False)) for k in keys]
+    return [bool(value)] * len(keys)
+
+
+def evaluate_plan(
+    plan: StatementPlan,
+    annuals: dict[str, list[dict]],
+    *,
+    flags: dict[str, Any] | None = None,
+    context: dict | None = None,
+) -> dict[str, StatementTable]:
+    """Evaluate plan for every entity in annuals ({entity: annual rows}) in one pass.
+
+    flags maps a flag name to a bool (all entities) or {entity: bool}.
+    """
+    keys = list(annuals)
+    if not keys:
+        return {}
+    lengths = np.array([len(annuals[k]) for k in keys])
+    n_years = max(int(lengths.max()), 1)
+    valid = np.arange(n_years) < lengths[:, None]
+    last = np.maximum(lengths - 1, 0)
+    rows_idx = np.arange(len(keys))
+
+    cube = np.zeros((len(plan.columns), len(keys), n_years))
+    for j, k in enumerate(keys):
+        rows = annuals[k]
+        if rows:
+            cube[:, j, :len(rows)] = [[a.get(c, 0.0) for a in rows] for c in plan.columns]
+    env: dict[str, Any] = dict(zip(plan.columns, cube))
+    env.update(_SAFE_NAMES)
+
+    entity_flags = {name: _flag_values(v, keys) for name, v in (flags or {}).items()}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for name, code in plan.flags:
+            held = np.broadcast_to(eval(code, {"__builtins__": {}}, env), valid.shape)  # noqa: S307
+            entity_flags[name] = (held & valid).any(axis=1).tolist()
+
+        computed: list[tuple[Step, np.ndarray | None, np.ndarray | None]] = []
+        lines: dict[str, np.ndarray] = {}
+        for step in plan.steps:
+            if step.kind in ("section", "spacer"):
+                computed.append((step, None, None))
+                continue
+            if step.kind in ("driver", "balance"):
+                values = step.sign * env[step.id]
+            elif step.kind == "formula":
+                ns = {**lines, **env}
+                values = step.sign * np.broadcast_to(
+                    eval(step.code, {"__builtins__": {}}, ns), valid.shape).astype(float)  # noqa: S307
+            else:
+                values = step.sign * sum(lines[x] for x in step.of)
+            lines[step.id] = values
+
+            if step.total == "sum":
+                # sequential (like builtins.sum); + 0.0 normalises -0.0
+                totals = np.cumsum(np.where(valid, values, 0.0), axis=1)[:, -1] + 0.0
+            elif step.total == "last":
+                totals = values[rows_idx, last]
+            elif step.total == "mean":
+                ok = valid & np.isfinite(values)
+                count = ok.sum(axis=1)
+                totals = np.where(count > 0,
+                                  np.cumsum(np.where(ok, values, 0.0), axis=1)[:, -1] / np.maximum(count, 1),
+                                  np.nan)
+            else:
+                totals = None
+            computed.append((step, values, totals))
+
+    tables: dict[str, StatementTable] = {}
+    for j, k in enumerate(keys):
+        n = int(lengths[j])
+        fl = {name: vals[j] for name, vals in entity_flags.items()}
+        out: list[StatementLine] = []
+        in_section = False
+        for step, values, totals in computed:
+            if step.kind == "section":
+                in_section = _visible(step, k, fl)
+                if in_section:
+                    if out:
+                        out.append(StatementLine(label="", style="spacer"))
+                    if step.label:
+                        out.append(StatementLine(label=_label(step.label, context), style="section"))
+                continue
+            if not in_section or not _visible(step, k, fl):
+                continue
+            if step.kind == "spacer":
+                out.append(StatementLine(label="", style="spacer"))
+                continue
+            out.append(StatementLine(
+                label=_label(step.label, context),
+                style=step.style,
+                key=step.id if step.kind in ("driver", "balance") else "",
+                values=values[j, :n].tolist(),
+                total=None if totals is None else float(totals[j]),
+                fmt=step.fmt,
+            ))
+        years = [a.get("year", i + 1) for i, a in enumerate(annuals[k])]
+        tables[k] = StatementTable(entity=k, statement=plan.statement, name=plan.name, years=years, lines=out)
+    return tables
+
+
+def evaluate_statements(
+    annuals: dict[str, list[dict]],
+    statements: Iterable[str] = STATEMENTS,
+    *,
+    flags: dict[str, Any] | None = None,
+    context: dict | None = None,
+    template_dir: str | Path | None = None,
+) -> dict[tuple[str, str], StatementTable]:
+    """{(entity, statement): StatementTable} for every entity x statement."""
+    tables: dict[tuple[str, str], StatementTable] = {}
+    for statement in statements:
+        plan = load_plan(statement, template_dir)
+        for entity, table in evaluate_plan(plan, annuals, flags=flags, context=context).items():
+            tables[entity, statement] = table
+    return tables
+
+
+def statement_flags(swap_active: dict[str, bool], lanred_scenario: str = "Brownfield+") -> dict[str, Any]:
+    """Caller-side flags the shipped templates use."""
+    return {"swap": dict(swap_active), "brownfield_plus": lanred_scenario == "Brownfield+"}
+
+
+def model_statements(
+    result: ModelResult | dict,
+    inputs: ScenarioInputs | None = None,
+    *,
+    cfg: ModelConfig | None = None,
+    statements: Iterable[str] = STATEMENTS,
+) -> dict[tuple[str, str], StatementTable]:
+    """Template statements for every entity of a ModelResult (or its to_dict() form)."""
+    if isinstance(result, dict):
+        entities = {k: (e.get("annual") or [], bool(e.get("swap_active"))) for k, e in result["entities"].items()}
+    else:
+        entities = {k: (e.annual, e.swap_active) for k, e in result.entities.items()}
+    if cfg is None:
+        from engine.config import ModelConfig
+        cfg = ModelConfig.load()
+    scenario = inputs.lanred_scenario if inputs is not None else "Brownfield+"
+    return evaluate_statements(
+        {k: annual for k, (annual, _) in entities.items()},
+        statements,
+        flags=statement_flags({k: swap for k, (_, swap) in entities.items()}, scenario),
+        context={"tax_rate": cfg.tax_rate},
+    )
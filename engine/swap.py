@@ -18,14 +18,20 @@ Swap notional sizing:
     senior_portion — 100% local content, no min/max slider.
     TWX has no swap.
 
-Internal calculations use EUR/ZAR typed amounts.
-Dict output uses .value for serialisation compatibility.
+Schedules are closed-form and linear in the notional: one unit schedule
+per (fx, rates, timing) is cached and scaled, so notional sweeps and
+optimisers (engine.optimise) never rebuild them.
+Dict output holds plain floats for serialisation compatibility.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+import numpy as np
+
 from engine.config import ModelConfig
-from engine.currency import EUR, ZAR
+from engine.currency import EUR
 from engine.periods import (
     repayment_start_month, total_periods, period_start_month,
     construction_period_labels,
@@ -132,86 +138,129 @@ def compute_nwl_swap_bounds(cfg: ModelConfig) -> dict:
     }
 
 
-def build_nwl_swap_schedule(
-    swap_amount_eur: float,
+# ── Closed-form swap schedules ───────────────────────────────────
+
+
+@lru_cache(maxsize=64)
+def _unit_swap_schedule(
     fx_rate: float,
-    cfg: ModelConfig,
-    last_sr_month: int | None = None,
+    zar_rate: float,
+    eur_rate: float,
+    start_month: int,
+    tenor: int,
+    eur_grace_periods: int,
 ) -> dict:
-    """EUR->ZAR cross-currency swap schedule (NWL).
+    """Swap schedule for a EUR 1 notional, as read-only arrays.
 
-    EUR leg (asset): bullet delivery at M24. Compounds at IIC rate during grace.
-    ZAR leg (liability): P_constant profile (constant principal + declining interest).
+    Every amount in the schedule is linear in the notional, so one cached
+    unit schedule per (fx, rates, timing) serves every notional:
+
+        ZAR leg IDC:   opening_k  = Z0 × (1 + r)^k,        k < grace
+        Repayment:     opening_i  = B − i × B / tenor,     B = Z0 × (1 + r)^grace
+        EUR leg IDC:   EUR 1 × (1 + r_eur)^eur_grace
     """
-    wf_cfg = cfg.waterfall
-    swap_cfg = wf_cfg.get("nwl_swap", {})
-    zar_rate = swap_cfg.get("zar_rate", 0.0969)
-    start_month = swap_cfg.get("zar_leg_start_month", 36)
-    eur_rate = cfg.sr_facility_rate  # 4.70%
-    zar_repayments = swap_cfg.get("zar_leg_repayments", 12)
-    # Derive last_sr_month from config if not supplied by caller
-    if last_sr_month is None:
-        last_sr_month = start_month + (zar_repayments - 1) * 6
-    tenor = max(1, (last_sr_month - start_month) // 6 + 1)
-    eur_notional = EUR(swap_amount_eur)
-    zar_initial = eur_notional.to_zar(fx_rate)
     semi_rate_zar = zar_rate / 2.0
-    semi_rate_eur = eur_rate / 2.0
+    zar_initial = EUR(1.0).to_zar(fx_rate).value
+    grace_periods = start_month // 6
 
-    schedule = []
+    k = np.arange(grace_periods)
+    idc_opening = zar_initial * (1.0 + semi_rate_zar) ** k
+    idc_interest = idc_opening * semi_rate_zar
+    idc_closing = idc_opening + idc_interest
+
+    zar_idc = zar_initial * (1.0 + semi_rate_zar) ** grace_periods
+    p_constant = zar_idc / tenor
+    i = np.arange(tenor)
+    rep_opening = zar_idc * (1.0 - i / tenor)
+    rep_interest = rep_opening * semi_rate_zar
+    rep_closing = zar_idc * (1.0 - (i + 1) / tenor)
+
+    arrays = {
+        "idc_opening": idc_opening, "idc_interest": idc_interest,
+        "idc_closing": idc_closing, "rep_opening": rep_opening,
+        "rep_interest": rep_interest, "rep_closing": rep_closing,
+    }
+    for arr in arrays.values():
+        arr.setflags(write=False)
+    return {
+        **arrays,
+        "zar_initial": zar_initial,
+        "zar_amount_idc": zar_idc,
+        "p_constant": p_constant,
+        "eur_amount_idc": (1.0 + eur_rate / 2.0) ** eur_grace_periods,
+    }
 
-    # IDC phase: ZAR leg compounds from M0 to start_month
-    grace_periods = start_month // 6
-    zar_bal = zar_initial
-    for gi in range(grace_periods):
-        month = gi * 6
-        opening = zar_bal
-        interest = opening * semi_rate_zar
-        zar_bal = opening + interest
+
+def _swap_schedule_dict(
+    notional_eur: float,
+    fx_rate: float,
+    zar_rate: float,
+    eur_rate: float,
+    start_month: int,
+    tenor: int,
+) -> dict:
+    """Scale the cached unit schedule to `notional_eur` (fresh dict + rows)."""
+    u = _unit_swap_schedule(
+        float(fx_rate), float(zar_rate), float(eur_rate),
+        int(start_month), int(tenor), repayment_start_month() // 6,
+    )
+    n = float(notional_eur)
+    schedule = []
+    for gi in range(len(u["idc_opening"])):
         schedule.append({
-            "period": gi, "month": month,
-            "opening": opening.value, "interest": interest.value,
+            "period": gi, "month": gi * 6,
+            "opening": float(u["idc_opening"][gi] * n),
+            "interest": float(u["idc_interest"][gi] * n),
             "principal": 0.0, "payment": 0.0,
-            "closing": zar_bal.value, "phase": "idc",
+            "closing": float(u["idc_closing"][gi] * n), "phase": "idc",
         })
-
-    # EUR leg IDC: compounds from M0 to M24 (bullet delivery)
-    eur_grace_periods = repayment_start_month() // 6  # 4
-    eur_bal = eur_notional
-    for _ in range(eur_grace_periods):
-        eur_bal = eur_bal * (1 + semi_rate_eur)
-    eur_amount_idc = eur_bal
-
-    # Repayment phase: P_constant on IDC-inflated ZAR balance
-    p_constant = zar_bal * (1.0 / tenor)
+    principal = u["p_constant"] * n
     for i in range(tenor):
-        month = start_month + i * 6
-        opening = zar_bal
-        interest = opening * semi_rate_zar
-        principal = p_constant
-        payment = principal + interest
-        zar_bal = opening - principal
+        interest = float(u["rep_interest"][i] * n)
         schedule.append({
-            "period": start_month // 6 + i, "month": month,
-            "opening": opening.value, "interest": interest.value,
-            "principal": principal.value, "payment": payment.value,
-            "closing": max(zar_bal.value, 0), "phase": "repayment",
+            "period": start_month // 6 + i, "month": start_month + i * 6,
+            "opening": float(u["rep_opening"][i] * n), "interest": interest,
+            "principal": principal, "payment": principal + interest,
+            "closing": float(u["rep_closing"][i] * n), "phase": "repayment",
         })
 
     return {
-        "eur_amount": eur_notional.value,
-        "eur_amount_idc": eur_amount_idc.value,
+        "eur_amount": n,
+        "eur_amount_idc": u["eur_amount_idc"] * n,
         "eur_rate": eur_rate,
-        "zar_amount": zar_initial.value,
-        "zar_amount_idc": zar_bal.value + p_constant.value * tenor,
+        "zar_amount": u["zar_initial"] * n,
+        "zar_amount_idc": u["zar_amount_idc"] * n,
         "zar_rate": zar_rate,
-        "p_constant_zar": p_constant.value,
+        "p_constant_zar": principal,
         "tenor": tenor,
         "start_month": start_month,
         "schedule": schedule,
     }
 
 
+def build_nwl_swap_schedule(
+    swap_amount_eur: float,
+    fx_rate: float,
+    cfg: ModelConfig,
+    last_sr_month: int | None = None,
+) -> dict:
+    """EUR->ZAR cross-currency swap schedule (NWL).
+
+    EUR leg (asset): bullet delivery at M24. Compounds at IIC rate during grace.
+    ZAR leg (liability): P_constant profile (constant principal + declining interest).
+    """
+    swap_cfg = cfg.waterfall.get("nwl_swap", {})
+    zar_rate = swap_cfg.get("zar_rate", 0.0969)
+    start_month = swap_cfg.get("zar_leg_start_month", 36)
+    eur_rate = cfg.sr_facility_rate  # 4.70%
+    zar_repayments = swap_cfg.get("zar_leg_repayments", 12)
+    # Derive last_sr_month from config if not supplied by caller
+    if last_sr_month is None:
+        last_sr_month = start_month + (zar_repayments - 1) * 6
+    tenor = max(1, (last_sr_month - start_month) // 6 + 1)
+    return _swap_schedule_dict(swap_amount_eur, fx_rate, zar_rate, eur_rate, start_month, tenor)
+
+
 def build_lanred_swap_schedule(
     eur_amount: float,
     fx_rate: float,
@@ -222,69 +271,12 @@ def build_lanred_swap_schedule(
     EUR leg: follows IC Senior schedule (14 semi-annual from M24).
     ZAR leg: P_constant profile, 28 semi-annual from M24.
     """
-    wf_cfg = cfg.waterfall
-    swap_cfg = wf_cfg.get("lanred_swap", {})
+    swap_cfg = cfg.waterfall.get("lanred_swap", {})
     zar_rate = swap_cfg.get("zar_rate", 0.0969)
     zar_repayments = swap_cfg.get("zar_leg_repayments", 28)
     start_month = swap_cfg.get("zar_leg_start_month", 24)
     eur_rate = cfg.sr_facility_rate  # 4.70%
-    eur_notional = EUR(eur_amount)
-    zar_initial = eur_notional.to_zar(fx_rate)
-    semi_rate_zar = zar_rate / 2.0
-    semi_rate_eur = eur_rate / 2.0
-
-    schedule = []
-
-    # IDC phase: ZAR leg compounds from M0 to start_month
-    grace_periods = start_month // 6
-    zar_bal = zar_initial
-    for gi in range(grace_periods):
-        month = gi * 6
-        opening = zar_bal
-        interest = opening * semi_rate_zar
-        zar_bal = opening + interest
-        schedule.append({
-            "period": gi, "month": month,
-            "opening": opening.value, "interest": interest.value,
-            "principal": 0.0, "payment": 0.0,
-            "closing": zar_bal.value, "phase": "idc",
-        })
-
-    # EUR leg IDC: compounds from M0 to M24
-    eur_grace_periods = repayment_start_month() // 6
-    eur_bal = eur_notional
-    for _ in range(eur_grace_periods):
-        eur_bal = eur_bal * (1 + semi_rate_eur)
-    eur_amount_idc = eur_bal
-
-    # Repayment phase: P_constant on IDC-inflated ZAR balance
-    p_constant = zar_bal * (1.0 / zar_repayments)
-    for i in range(zar_repayments):
-        month = start_month + i * 6
-        opening = zar_bal
-        interest = opening * semi_rate_zar
-        principal = p_constant
-        payment = principal + interest
-        zar_bal = opening - principal
-        schedule.append({
-            "period": start_month // 6 + i, "month": month,
-            "opening": opening.value, "interest": interest.value,
-            "principal": principal.value, "payment": payment.value,
-            "closing": max(zar_bal.value, 0), "phase": "repayment",
-        })
-
-    return {
-        "eur_amount": eur_notional.value,
-        "eur_amount_idc": eur_amount_idc.value,
-        "eur_rate": eur_rate,
-        "zar_amount": zar_initial.value,
-        "zar_amount_idc": zar_bal.value + p_constant.value * zar_repayments,
-        "zar_rate": zar_rate,
-        "p_constant_zar": p_constant.value,
-        "tenor": zar_repayments,
-        "start_month": start_month,
-        "schedule": schedule,
-    }
+    return _swap_schedule_dict(eur_amount, fx_rate, zar_rate, eur_rate, start_month, zar_repayments)
 
 
 def extract_swap_vectors(
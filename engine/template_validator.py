@@ -6,7 +6,8 @@ are consistent with the column registry (config/columns.json).
 Cross-check rules:
 1. Key existence — every template line ID must exist in registry
    (unless type is "formula", "spacer", or "aggregation").
-2. Nature ↔ statement — stocks on flow statements → warning.
+2. Nature ↔ statement — stocks on flow statements → warning
+   (unless the line is type "balance", i.e. explicitly point-in-time).
 3. Sign consistency — negative-sign column displayed as positive → warning.
 4. Unit match — formula mixing different units → warning.
 5. Account grouping — same account must share unit (delegated to registry).
@@ -21,6 +22,7 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 
@@ -36,6 +38,9 @@ _SKIP_TYPES = {"formula", "spacer", "aggregation"}
 # Statement frequencies that are flow-oriented
 _FLOW_FREQUENCIES = {"semi-annual", "annual"}
 
+# (registry digest, ((file, sha1), ...)) -> issues; content-keyed, never stale
+_RESULTS: dict[tuple, tuple[str, ...]] = {}
+
 
 def validate_template(
     template: dict,
@@ -77,7 +82,8 @@ def validate_template(
                 continue
 
             # Nature ↔ statement check
-            if col.is_stock and not is_balance_sheet and frequency in _FLOW_FREQUENCIES:
+            if (col.is_stock and line_type != "balance"
+                    and not is_balance_sheet and frequency in _FLOW_FREQUENCIES):
                 # Stock on a flow statement — might be intentional (e.g., tax_loss_pool on P&L)
                 # but worth flagging
                 issues.append(
@@ -137,6 +143,9 @@ def validate_all_templates(
 
     Returns:
         List of all warnings/errors across all templates.
+
+    Results are memoised on the registry digest and the template file
+    hashes, so a repeat call only re-reads the template bytes.
     """
     if template_dir is None:
         # Check NWL model config first, then global engine config
@@ -150,12 +159,26 @@ def validate_all_templates(
     if registry is None:
         registry = ColumnRegistry.load()
 
+    blobs: list[tuple[Path, bytes | OSError]] = []
+    for path in sorted(template_dir.glob("*.json")):
+        try:
+            blobs.append((path, path.read_bytes()))
+        except OSError as e:
+            blobs.append((path, e))
+    key = None
+    if registry.digest and not any(isinstance(b, OSError) for _, b in blobs):
+        key = (registry.digest, tuple((p.name, hashlib.sha1(b).hexdigest()) for p, b in blobs))
+        hit = _RESULTS.get(key)
+        if hit is not None:
+            return list(hit)
+
     all_issues: list[str] = []
 
-    for path in sorted(template_dir.glob("*.json")):
+    for path, blob in blobs:
         try:
-            with open(path) as f:
-                template = json.load(f)
+            if isinstance(blob, OSError):
+                raise blob
+            template = json.loads(blob)
         except (json.JSONDecodeError, OSError) as e:
             all_issues.append(f"[{path.name}] Failed to load: {e}")
             continue
@@ -165,4 +188,6 @@ def validate_all_templates(
         )
         all_issues.extend(issues)
 
+    if key is not None:
+        _RESULTS[key] = tuple(all_issues)
     return all_issues
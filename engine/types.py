@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
+
+if TYPE_CHECKING:
+    from engine.proofs import EntityProofs
 
 
 # ── Facility ────────────────────────────────────────────────────
@@ -200,6 +203,20 @@ class EntityResult:
     swap_active: bool
     cash_inflows: list[dict] | None
     pre_revenue_hedge_total: float
+    _proofs: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def proofs(self, cfg: Any = None) -> EntityProofs:
+        """Audit cross-checks, built per category on first access (memoised).
+
+        cfg supplies tax_rate and structure; defaults to ModelConfig.load().
+        """
+        if self._proofs is None:
+            from engine.proofs import EntityProofs
+            if cfg is None:
+                from engine.config import ModelConfig
+                cfg = ModelConfig.load()
+            self._proofs = EntityProofs.from_entity(self, tax_rate=cfg.tax_rate, structure=cfg.structure)
+        return self._proofs
 
     # -- Derived metrics (computed properties) --
 
@@ -305,14 +322,7 @@ class EntityResult:
             reg = ColumnRegistry.load()
             for df in dfs.values():
                 if "col_labels" not in df.attrs:
-                    labels = {}
-                    for col in df.columns:
-                        cdef = reg.get(col)
-                        if cdef is not None:
-                            labels[col] = cdef.label
-                        else:
-                            labels[col] = col
-                    df.attrs["col_labels"] = labels
+                    df.attrs["col_labels"] = reg.labels(df.columns)
         except (FileNotFoundError, OSError, ImportError):
             pass  # Registry not available — tags still work via prefix fallback
 
@@ -335,3 +345,31 @@ class ModelResult:
         Usage: result.entity_dataframes["nwl"]["annual"]
         """
         return {k: v.dataframes for k, v in self.entities.items()}
+
+    def to_dict(self) -> dict:
+        """Plain JSON-safe dict (Streamlit cache / model service payload)."""
+        entities = {}
+        for key, er in self.entities.items():
+            entities[key] = {
+                "annual": er.annual,
+                "sr_schedule": er.sr_schedule,
+                "mz_schedule": er.mz_schedule,
+                "waterfall_semi": er.waterfall_semi,
+                "waterfall_annual": er.waterfall_annual,
+                "semi_annual_pl": er.semi_annual_pl,
+                "semi_annual_tax": er.semi_annual_tax,
+                "ops_annual": er.ops_annual,
+                "ops_semi_annual": er.ops_semi_annual,
+                "registry": er.registry,
+                "depreciable_base": er.depreciable_base,
+                "entity_equity": er.entity_equity,
+                "swap_schedule": er.swap_schedule.to_dict() if er.swap_schedule else None,
+                "swap_active": er.swap_active,
+                "cash_inflows": er.cash_inflows,
+                "pre_revenue_hedge_total": er.pre_revenue_hedge_total,
+            }
+        return {
+            "entities": entities,
+            "holding": self.holding,
+            "ic_semi": self.ic_semi,
+        }
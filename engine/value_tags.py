@@ -27,6 +27,8 @@ from __future__ import annotations
 
 from enum import Enum
 
+from engine.reload import register
+
 
 class ValueType(str, Enum):
     """Accounting category for a computed value."""
@@ -190,7 +192,30 @@ def _tag_column_fallback(col_name: str) -> tuple[ValueType, str]:
     return ValueType.OTHER, ""
 
 
+# Column name -> (ValueType, unit); tags depend only on the registry
+_TAG_CACHE: dict[str, tuple[ValueType, str]] = {}
+# Column layout -> tag dict (DataFrames of one table share a layout)
+_LAYOUT_CACHE: dict[tuple[str, ...], dict[str, tuple[ValueType, str]]] = {}
+_LAYOUT_CACHE_MAX = 256
+
+
+def clear_tag_cache() -> None:
+    _TAG_CACHE.clear()
+    _LAYOUT_CACHE.clear()
+
+
+register("tags", clear_tag_cache)
+
+
 def _tag_column(col_name: str) -> tuple[ValueType, str]:
+    """Classify a column (memoised per name until the registry changes)."""
+    tag = _TAG_CACHE.get(col_name)
+    if tag is None:
+        tag = _TAG_CACHE[col_name] = _classify_column(col_name)
+    return tag
+
+
+def _classify_column(col_name: str) -> tuple[ValueType, str]:
     """Classify a column: registry first, prefix fallback second."""
     # Lazy import to avoid circular dependency at module load time
     from engine.registry import ColumnRegistry
@@ -215,7 +240,14 @@ def tag_columns(columns: list[str]) -> dict[str, tuple[ValueType, str]]:
 
     Returns: {col_name: (ValueType, unit)}
     """
-    return {col: _tag_column(col) for col in columns}
+    layout = tuple(columns)
+    tags = _LAYOUT_CACHE.get(layout)
+    if tags is None:
+        tags = {col: _tag_column(col) for col in layout}
+        if len(_LAYOUT_CACHE) >= _LAYOUT_CACHE_MAX:
+            _LAYOUT_CACHE.pop(next(iter(_LAYOUT_CACHE)))
+        _LAYOUT_CACHE[layout] = tags
+    return dict(tags)
 
 
 def tag_dataframe(df: "pd.DataFrame") -> "pd.DataFrame":
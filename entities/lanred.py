@@ -4,12 +4,18 @@ Two operating scenarios:
 - Brownfield+: Northlands portfolio (5 sites, contracted tenant PPAs)
 - Greenfield:  Solar PV + BESS (4 revenue streams)
 
+Greenfield uses the hourly dispatch in entities.lanred_dispatch when
+operations.json lanred.hourly_dispatch.enabled is set; otherwise the flat
+capacity-factor model below.
+
 build_lanred_operating_model(cfg, inputs) -> list[dict]
 build_lanred_entity(cfg, inputs)          -> EntityResult
 """
 
 from __future__ import annotations
 
+import numpy as np
+
 from engine.config import ModelConfig, ScenarioInputs
 from engine.types import EntityResult, SwapSchedule
 from engine.currency import EUR, ZAR
@@ -17,8 +23,9 @@ from engine.facility import build_entity_schedule, build_schedule, extract_facil
 from engine.loop import run_entity_loop, build_annual, to_annual, _WATERFALL_STOCK_KEYS
 from engine.pnl import build_semi_annual_pnl, extract_tax_vector
 from engine.swap import build_lanred_swap_schedule, extract_swap_vectors
+from entities.lanred_dispatch import build_lanred_dispatch, dispatch_enabled
 from engine.periods import (
-    total_periods, total_years, annual_month_range,
+    total_periods, total_years, annual_month_range, period_start_month,
     construction_period_labels, construction_end_index, repayment_start_month,
     semi_index_to_facility_period,
 )
@@ -375,6 +382,90 @@ def _build_lanred_greenfield_model(cfg: ModelConfig, inputs: ScenarioInputs) ->
     return annual_rows
 
 
+def _build_lanred_greenfield_dispatch_model(
+    cfg: ModelConfig, inputs: ScenarioInputs,
+) -> tuple[list[dict], list[dict]]:
+    """Greenfield operating model driven by the hourly dispatch.
+
+    Same row keys as _build_lanred_greenfield_model, plus dispatch detail
+    (BESS throughput, spilled energy).  O&M and grid charges accrue monthly
+    so the semi-annual rows carry the real seasonality.
+    Returns (ops_annual, ops_semi_annual).
+    """
+    lanred_cfg = cfg.operations.get("lanred", {})
+    om_cfg = lanred_cfg.get("om", {})
+    grid_cfg = lanred_cfg.get("grid_connection", {})
+    d = build_lanred_dispatch(cfg, inputs.lanred_bess_alloc_pct)
+    fx = cfg.fx_rate
+
+    months = np.arange(total_years() * 12)
+    year_start = (months // 12) * 12
+
+    def _indexed(start_month: int, pct: float) -> np.ndarray:
+        yrs = np.maximum((year_start - start_month) / 12.0, 0.0)
+        return ((1.0 + pct) ** yrs) * (months >= start_month)
+
+    om_start = int(om_cfg.get("opex_start_month", 18))
+    om_zar = (float(om_cfg.get("fixed_annual_zar", 120000)) / 12.0
+              * _indexed(om_start, float(om_cfg.get("annual_indexation_pa", 0.05)))
+              + d.monthly["generation_kwh"] * float(om_cfg.get("variable_r_per_kwh", 0.05))
+              * (months >= om_start))
+    grid_zar = (float(grid_cfg.get("monthly_availability_charge_zar", 5000))
+                * _indexed(int(grid_cfg.get("start_month", 18)),
+                           float(grid_cfg.get("annual_escalation_pct", 5.0)) / 100.0))
+
+    streams = {
+        "rev_ic_nwl": d.monthly["rev_ic_nwl_zar"],
+        "rev_smart_city": d.monthly["rev_smart_city_zar"],
+        "rev_open_market": d.monthly["rev_open_market_zar"],
+        "rev_bess_arbitrage": d.monthly["rev_bess_arbitrage_zar"],
+    }
+    energy = ("generation_kwh", "bess_discharge_kwh", "bess_grid_charge_kwh",
+              "bess_solar_charge_kwh", "spilled_kwh")
+
+    def _rows(width: int) -> list[dict]:
+        def _agg(arr: np.ndarray) -> np.ndarray:
+            return arr.reshape(-1, width).sum(axis=1)
+
+        gen = _agg(d.monthly["generation_kwh"])
+        shares = {k: _agg(d.monthly[k]) for k in ("ic_kwh", "sc_kwh", "mkt_kwh")}
+        rev = {k: _agg(v) / fx for k, v in streams.items()}
+        om = _agg(om_zar) / fx
+        grid = _agg(grid_zar) / fx
+        rows = []
+        for i in range(len(gen)):
+            yi = i * width // 12
+            rev_total = sum(float(v[i]) for v in rev.values())
+
+            def _share(key: str) -> float:
+                return float(shares[key][i] / gen[i] * 100.0) if gen[i] > 0 else 0.0
+
+            row = {
+                "installed_mwp": d.installed_kwp / 1000.0,
+                "bess_capacity_kwh": d.bess_capacity_kwh,
+                "bess_effective_kwh": float(d.bess_effective_kwh[yi]),
+                "capacity_factor_pct": float(d.capacity_factor[yi] * 100.0),
+                **{k: float(v[i]) for k, v in rev.items()},
+                "ic_share_pct": _share("ic_kwh"),
+                "sc_share_pct": _share("sc_kwh"),
+                "mkt_share_pct": _share("mkt_kwh"),
+                "rev_power_sales": rev_total,
+                "rev_operating": rev_total,
+                "rev_total": rev_total,
+                "om_cost": float(om[i] + grid[i]),
+                "grid_cost": float(grid[i]),
+                "power_cost": 0.0,
+                "rent_cost": 0.0,
+            }
+            row.update({k: float(_agg(d.monthly[k])[i]) for k in energy})
+            rows.append(row)
+        return rows
+
+    annual_rows = [{"year": yi + 1, **row} for yi, row in enumerate(_rows(12))]
+    semi_rows = [{"month": period_start_month(hi), **row} for hi, row in enumerate(_rows(6))]
+    return annual_rows, semi_rows
+
+
 # ── Public API ───────────────────────────────────────────────────────────────
 
 def build_lanred_operating_model(cfg: ModelConfig, inputs: ScenarioInputs) -> list[dict]:
@@ -383,9 +474,16 @@ def build_lanred_operating_model(cfg: ModelConfig, inputs: ScenarioInputs) -> li
     Routes to Brownfield+ or Greenfield model based on inputs.lanred_scenario.
     Returns list of 10 annual dicts compatible with engine.pnl / engine.waterfall.
     """
+    return _build_lanred_ops(cfg, inputs)[0]
+
+
+def _build_lanred_ops(cfg: ModelConfig, inputs: ScenarioInputs) -> tuple[list[dict], list[dict] | None]:
+    """(ops_annual, ops_semi_annual); semi-annual is None for the annual/2 fallback."""
     if inputs.lanred_scenario == "Brownfield+":
-        return _build_lanred_brownfield_model(cfg)
-    return _build_lanred_greenfield_model(cfg, inputs)
+        return _build_lanred_brownfield_model(cfg), None
+    if dispatch_enabled(cfg):
+        return _build_lanred_greenfield_dispatch_model(cfg, inputs)
+    return _build_lanred_greenfield_model(cfg, inputs), None
 
 
 def build_lanred_entity(cfg: ModelConfig, inputs: ScenarioInputs) -> EntityResult:
@@ -409,8 +507,9 @@ def build_lanred_entity(cfg: ModelConfig, inputs: ScenarioInputs) -> EntityResul
     mz_schedule = build_entity_schedule(entity_key, cfg, debt_type="mezz")
 
     # ── 2. Operating model ──
-    ops_annual = build_lanred_operating_model(cfg, inputs)
-    ops_semi_annual = None  # LanRED uses annual/2 fallback (no semi-annual ops model)
+    # Brownfield+ and the flat greenfield model use the annual/2 fallback;
+    # the hourly dispatch model supplies real semi-annual rows.
+    ops_annual, ops_semi_annual = _build_lanred_ops(cfg, inputs)
 
     # ── 3. Depreciable base (total_loan as proxy) ──
     depreciable_base = entity_data.get("total_loan", 0.0)
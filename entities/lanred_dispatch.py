@@ -0,0 +1,367 @@
+"""LanRED hourly solar + BESS dispatch.
+
+Simulates a typical 8,760-hour year for each of the 10 model years:
+clear-sky PV profile scaled to the configured capacity factor (with
+degradation), BESS charge/discharge against the Eskom TOU bands, and
+hour-by-hour allocation of PV energy to IC NWL, Smart City and the open
+market.  Results are aggregated to model months, so the operating model
+can sum them to the 20 semi-annual periods or the 10 years.
+
+Everything is evaluated on (year, day, hour) NumPy arrays, and results are
+cached per (config hash, BESS allocation %) so lanred_bess_alloc_pct
+sweeps only pay for each capacity split once.
+
+build_lanred_dispatch(cfg, bess_alloc_pct) -> LanredDispatch
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from engine.config import ModelConfig
+from engine.periods import total_years
+from engine.reload import register
+
+HOURS_PER_DAY = 24
+DAYS_PER_YEAR = 365
+
+_TOU_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "project_intelligence.db"
+
+_DEFAULT_DISPATCH = {
+    "enabled": False,
+    "calendar_start_month": 1,
+    "calendar_year": 2026,
+    "latitude_deg": -25.94,
+    "tou_tariff_name": "Homeflex",
+    "high_demand_months": [6, 7, 8],
+    "peak_hours": {"high_demand": [6, 7, 17, 18], "low_demand": [7, 8, 18, 19]},
+    "offpeak_hours": [22, 23, 0, 1, 2, 3, 4, 5],
+    "weekend_peak_as": "standard",
+    "max_c_rate": 0.5,
+    "min_grid_cycle_spread_r_per_kwh": 0.5,
+}
+
+
+# ── Config helpers ───────────────────────────────────────────────────────────
+
+def dispatch_settings(cfg: ModelConfig) -> dict:
+    """lanred.hourly_dispatch merged over the built-in defaults."""
+    user = cfg.operations.get("lanred", {}).get("hourly_dispatch", {})
+    return {**_DEFAULT_DISPATCH, **user}
+
+
+def dispatch_enabled(cfg: ModelConfig) -> bool:
+    """True when the greenfield model should use the hourly dispatch."""
+    return bool(dispatch_settings(cfg).get("enabled", False))
+
+
+def lanred_dispatch_config_hash(cfg: ModelConfig) -> str:
+    """Stable hash of every config input the dispatch reads."""
+    payload = {
+        "lanred": cfg.operations.get("lanred", {}),
+        "nwl_power": cfg.operations.get("nwl", {}).get("power", {}),
+        "nwl_on_ramp": cfg.operations.get("nwl", {}).get("on_ramp", {}),
+        "solar_assets": cfg.assets["assets"].get("solar", {}),
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha1(blob).hexdigest()
+
+
+@lru_cache(maxsize=4)
+def _load_tou_rates(tariff_name: str) -> dict[tuple[str, str], float]:
+    """(season, period) -> R/kWh from data/project_intelligence.db.
+
+    Returns an empty dict if the database or table is unavailable; the
+    caller then falls back to the bess_arbitrage config rates.
+    """
+    if not _TOU_DB_PATH.exists():
+        return {}
+    try:
+        with sqlite3.connect(str(_TOU_DB_PATH)) as conn:
+            rows = conn.execute(
+                "SELECT season, period, rate_r_per_kwh FROM eskom_tou_tariffs "
+                "WHERE tariff_name = ?", (tariff_name,),
+            ).fetchall()
+    except sqlite3.Error:
+        return {}
+    return {(season, period): float(rate) for season, period, rate in rows}
+
+
+def _tou_rates(cfg: ModelConfig, settings: dict) -> dict[str, dict[str, float]]:
+    """Season -> {peak, standard, offpeak} base-year rates (R/kWh)."""
+    arb_cfg = cfg.operations.get("lanred", {}).get("power_sales", {}).get("bess_arbitrage", {})
+    hd_cfg = arb_cfg.get("high_demand_season", {})
+    ld_cfg = arb_cfg.get("low_demand_season", {})
+    db = _load_tou_rates(settings["tou_tariff_name"])
+
+    def _season(season: str, scfg: dict, peak: float, offpeak: float) -> dict[str, float]:
+        pk = db.get((season, "peak"), float(scfg.get("peak_rate_r_per_kwh", peak)))
+        op = db.get((season, "offpeak"), float(scfg.get("offpeak_rate_r_per_kwh", offpeak)))
+        st = db.get((season, "standard"), float(scfg.get("standard_rate_r_per_kwh", op)))
+        return {"peak": pk, "standard": st, "offpeak": op}
+
+    return {
+        "high_demand": _season("high_demand", hd_cfg, 7.04, 1.02),
+        "low_demand": _season("low_demand", ld_cfg, 2.00, 1.59),
+    }
+
+
+# ── Calendar + profiles ──────────────────────────────────────────────────────
+
+def _calendar(settings: dict) -> tuple[np.ndarray, np.ndarray]:
+    """Calendar month (1-12) and weekday (Mon=0) for each day of the typical year."""
+    start = np.datetime64(f"{int(settings['calendar_year'])}-01-01")
+    days = start + np.arange(DAYS_PER_YEAR)
+    month = days.astype("datetime64[M]").astype(int) % 12 + 1
+    weekday = (days.astype("datetime64[D]").astype(np.int64) + 3) % 7
+    return month, weekday
+
+
+def _pv_shape(latitude_deg: float, capacity_factor: float) -> np.ndarray:
+    """(365, 24) clear-sky PV output per kWp, averaging to capacity_factor."""
+    n = np.arange(1, DAYS_PER_YEAR + 1)[:, None]
+    hour = np.arange(HOURS_PER_DAY)[None, :] + 0.5
+    decl = np.radians(23.45) * np.sin(2.0 * np.pi * (284 + n) / 365.0)
+    lat = np.radians(latitude_deg)
+    omega = np.radians((hour - 12.0) * 15.0)
+    sin_elev = np.sin(lat) * np.sin(decl) + np.cos(lat) * np.cos(decl) * np.cos(omega)
+    shape = np.clip(sin_elev, 0.0, None)
+    total = shape.sum()
+    if total <= 0:
+        return np.zeros_like(shape)
+    return shape * (capacity_factor * DAYS_PER_YEAR * HOURS_PER_DAY / total)
+
+
+def _tou_grid(settings: dict, rates: dict, month: np.ndarray,
+              weekday: np.ndarray) -> dict[str, np.ndarray]:
+    """(365, 24) TOU rate and band masks for the typical year."""
+    hd_months = set(int(m) for m in settings["high_demand_months"])
+    is_hd = np.isin(month, list(hd_months))[:, None]
+    hours = np.arange(HOURS_PER_DAY)[None, :]
+
+    peak_hd = np.isin(hours, settings["peak_hours"]["high_demand"])
+    peak_ld = np.isin(hours, settings["peak_hours"]["low_demand"])
+    peak_band = np.where(is_hd, peak_hd, peak_ld)
+    offpeak_band = np.broadcast_to(np.isin(hours, settings["offpeak_hours"]),
+                                   peak_band.shape)
+    weekend = (weekday >= 5)[:, None]
+
+    def _season_rate(period: str) -> np.ndarray:
+        return np.where(is_hd, rates["high_demand"][period], rates["low_demand"][period])
+
+    weekend_peak = settings.get("weekend_peak_as", "standard")
+    peak_rate = np.where(weekend, _season_rate(weekend_peak), _season_rate("peak"))
+    rate = np.where(offpeak_band, _season_rate("offpeak"), _season_rate("standard"))
+    rate = np.where(peak_band, peak_rate, rate)
+
+    # Morning peak = peak hours before noon; evening peak = the rest.
+    morning = peak_band & (hours < 12)
+    evening = peak_band & (hours >= 12)
+    first_morning = np.where(morning.any(axis=1), morning.argmax(axis=1), 12)[:, None]
+    last_morning = np.where(morning.any(axis=1),
+                            HOURS_PER_DAY - 1 - morning[:, ::-1].argmax(axis=1), 11)[:, None]
+    first_evening = np.where(evening.any(axis=1), evening.argmax(axis=1), HOURS_PER_DAY)[:, None]
+    return {
+        "rate": rate,
+        "morning": morning,
+        "evening": evening,
+        "grid_charge": offpeak_band & (hours < first_morning),
+        "solar_charge": (hours > last_morning) & (hours < first_evening),
+    }
+
+
+def _capped_fill(power: np.ndarray, energy_cap: np.ndarray) -> np.ndarray:
+    """Hourly fill of `power` (..., 24) until the daily total reaches energy_cap (...)."""
+    cum = np.minimum(np.cumsum(power, axis=-1), energy_cap[..., None])
+    return np.diff(cum, axis=-1, prepend=0.0)
+
+
+# ── Result ───────────────────────────────────────────────────────────────────
+
+@dataclass
+class LanredDispatch:
+    """Dispatch results by model month (120,) plus per-year capacity stats.
+
+    Energy in kWh, revenue in ZAR (nominal, escalated).
+    """
+    installed_kwp: float
+    bess_capacity_kwh: float
+    bess_effective_kwh: np.ndarray    # (Y,) usable after degradation
+    capacity_factor: np.ndarray       # (Y,) after degradation
+    monthly: dict[str, np.ndarray]    # key -> (Y*12,)
+
+    def annual(self, key: str) -> np.ndarray:
+        """(Y,) annual totals."""
+        return self.monthly[key].reshape(-1, 12).sum(axis=1)
+
+    def semi(self, key: str) -> np.ndarray:
+        """(2Y,) semi-annual totals aligned with engine.periods."""
+        return self.monthly[key].reshape(-1, 6).sum(axis=1)
+
+
+# ── Simulation ───────────────────────────────────────────────────────────────
+
+_DISPATCH_CACHE: dict[tuple, LanredDispatch] = {}
+_DISPATCH_CACHE_MAX = 64
+register("ops", _DISPATCH_CACHE.clear)
+
+
+def _simulate(cfg: ModelConfig, bess_alloc_pct: float) -> LanredDispatch:
+    settings = dispatch_settings(cfg)
+    lanred_cfg = cfg.operations.get("lanred", {})
+    solar_cfg = lanred_cfg.get("solar_capacity", {})
+    bess_cfg = lanred_cfg.get("battery_storage", {})
+    sales_cfg = lanred_cfg.get("power_sales", {})
+    nwl_cfg = cfg.operations.get("nwl", {})
+    n_years = total_years()
+
+    # ── Capacity split (same derivation as the flat greenfield model) ──
+    solar_assets = cfg.assets["assets"].get("solar", {})
+    total_budget = solar_assets.get("total", 2908809.0)
+    bess_budget = total_budget * bess_alloc_pct / 100.0
+    cost_per_kwp = float(solar_cfg.get("cost_per_kwp_eur", 850))
+    installed_kwp = (total_budget - bess_budget) / cost_per_kwp if cost_per_kwp > 0 else 0.0
+    cost_per_kwh = float(bess_cfg.get("cost_per_kwh_eur", 364))
+    bess_kwh = bess_budget / cost_per_kwh if cost_per_kwh > 0 else 0.0
+
+    cf_base = float(solar_cfg.get("capacity_factor_pct", 21.5)) / 100.0
+    pv_deg = float(solar_cfg.get("degradation_pa_pct", 0.5)) / 100.0
+    cod_month = int(solar_cfg.get("cod_month", 18))
+    usable = float(bess_cfg.get("usable_capacity_pct", 90.0)) / 100.0
+    rt_eff = float(bess_cfg.get("roundtrip_efficiency_pct", 85.0)) / 100.0
+    bess_deg = float(bess_cfg.get("degradation_pa_pct", 2.0)) / 100.0
+
+    # ── Model-month index for every (year, day) ──
+    month, weekday = _calendar(settings)
+    start0 = int(settings["calendar_start_month"]) - 1
+    month_offset = (month - 1 - start0) % 12                       # (D,)
+    years = np.arange(n_years)
+    model_month = years[:, None] * 12 + month_offset[None, :]      # (Y, D)
+    y_start = years * 12
+
+    def _after(start_month: int) -> np.ndarray:
+        return (model_month >= start_month)[..., None]             # (Y, D, 1)
+
+    def _escalation(pct: float, from_month: int) -> np.ndarray:
+        yrs = np.maximum((y_start - from_month) / 12.0, 0.0)
+        return ((1.0 + pct / 100.0) ** yrs)[:, None, None]        # (Y, 1, 1)
+
+    operating = _after(cod_month)
+    years_since_cod = np.maximum((y_start - cod_month) / 12.0, 0.0)
+    pv_factor = (1.0 - pv_deg) ** years_since_cod                  # (Y,)
+    shape = _pv_shape(float(settings["latitude_deg"]), cf_base)
+    pv = installed_kwp * shape[None] * pv_factor[:, None, None] * operating
+
+    # ── BESS dispatch against TOU bands ──
+    tou = _tou_grid(settings, _tou_rates(cfg, settings), month, weekday)
+    rate = tou["rate"][None]
+    arb_cfg = sales_cfg.get("bess_arbitrage", {})
+    arb_on = _after(int(arb_cfg.get("start_month", 18))) & bool(arb_cfg.get("enabled", False))
+    energy_cap = bess_kwh * usable * (1.0 - bess_deg) ** years_since_cod   # (Y,)
+    e_day = np.broadcast_to(energy_cap[:, None], model_month.shape) * arb_on[..., 0]
+    p_max = bess_kwh * float(settings["max_c_rate"])
+
+    # Cycle 1: grid off-peak -> morning peak, only on days where it pays.
+    morning_rate = np.where(tou["morning"], tou["rate"], 0.0).max(axis=1)
+    offpeak_rate = np.where(tou["grid_charge"], tou["rate"], np.inf).min(axis=1)
+    spread = morning_rate * rt_eff - offpeak_rate
+    grid_day = spread >= float(settings["min_grid_cycle_spread_r_per_kwh"])
+    grid_in = _capped_fill(p_max * tou["grid_charge"][None], e_day * grid_day[None])
+    grid_out = _capped_fill(p_max * tou["morning"][None], grid_in.sum(-1) * rt_eff)
+
+    # Cycle 2: midday solar -> evening peak.
+    solar_in = _capped_fill(np.minimum(pv, p_max) * tou["solar_charge"][None], e_day)
+    solar_out = _capped_fill(p_max * tou["evening"][None], solar_in.sum(-1) * rt_eff)
+
+    # ── PV allocation: IC NWL load, Smart City share, open-market residual ──
+    sold = pv - solar_in
+    ic_cfg = sales_cfg.get("ic_nwl", {})
+    kwh_per_m3 = float(nwl_cfg.get("power", {}).get("kwh_per_m3", 0.4))
+    mld = np.zeros(n_years * 12)
+    for row in nwl_cfg.get("on_ramp", {}).get("rows", []):
+        cap = row.get("capacity_available_mld")
+        if cap is not None:
+            mld[int(row.get("period_months", 0)):] = cap
+    ic_load_kw = (mld[model_month] * 1000.0 * kwh_per_m3 / HOURS_PER_DAY)[..., None]
+    ic_on = _after(int(ic_cfg.get("start_month", 18))) & bool(ic_cfg.get("demand_driven", False))
+    ic_kwh = np.minimum(sold, ic_load_kw) * ic_on
+
+    sc_cfg = sales_cfg.get("smart_city_offtake", {})
+    sc_share = [s / 100.0 for s in sc_cfg.get(
+        "share_of_generation_pct_by_year", [0, 0, 15, 25, 30, 35, 40, 45, 50, 50])]
+    sc_share = np.array([sc_share[min(y, len(sc_share) - 1)] for y in years])
+    sc_on = _after(int(sc_cfg.get("start_month", 36))) & bool(sc_cfg.get("enabled", False))
+    sc_kwh = np.minimum(sold - ic_kwh, sc_share[:, None, None] * pv) * sc_on
+
+    mkt_cfg = sales_cfg.get("open_market", {})
+    mkt_on = _after(int(mkt_cfg.get("start_month", 36))) & bool(mkt_cfg.get("enabled", False))
+    mkt_kwh = (sold - ic_kwh - sc_kwh) * mkt_on
+    spilled = sold - ic_kwh - sc_kwh - mkt_kwh
+
+    # ── Revenue (ZAR, escalated per model year) ──
+    ic_rate = (float(ic_cfg.get("eskom_base_rate_r_per_kwh", 2.81))
+               * (1.0 - float(ic_cfg.get("ic_discount_pct", 10.0)) / 100.0))
+    sc_rate = (float(sc_cfg.get("joburg_business_tariff_r_per_kwh", 2.289))
+               * (1.0 - float(sc_cfg.get("discount_pct", 10.0)) / 100.0))
+    mkt_rate = float(mkt_cfg.get("rate_r_per_kwh", 1.50))
+    solar_cost = float(arb_cfg.get("solar_charge_cost_r_per_kwh", 0.10))
+    arb_esc = _escalation(float(arb_cfg.get("annual_escalation_pct", 10.0)), cod_month)
+
+    rev_ic = ic_kwh * ic_rate * _escalation(float(ic_cfg.get("annual_escalation_pct", 10.0)), cod_month)
+    rev_sc = sc_kwh * sc_rate * _escalation(float(sc_cfg.get("annual_escalation_pct", 10.0)),
+                                            int(sc_cfg.get("start_month", 36)))
+    rev_mkt = mkt_kwh * mkt_rate * _escalation(float(mkt_cfg.get("annual_escalation_pct", 8.0)),
+                                               int(mkt_cfg.get("start_month", 36)))
+    rev_bess = ((grid_out + solar_out) * rate - grid_in * rate - solar_in * solar_cost) * arb_esc
+
+    # ── Aggregate (Y, D, H) -> model months ──
+    flat_month = model_month.ravel()
+
+    def _monthly(arr: np.ndarray) -> np.ndarray:
+        return np.bincount(flat_month, weights=arr.sum(axis=-1).ravel(),
+                           minlength=n_years * 12)
+
+    monthly = {
+        "generation_kwh": _monthly(pv),
+        "ic_kwh": _monthly(ic_kwh),
+        "sc_kwh": _monthly(sc_kwh),
+        "mkt_kwh": _monthly(mkt_kwh),
+        "spilled_kwh": _monthly(spilled),
+        "bess_solar_charge_kwh": _monthly(solar_in),
+        "bess_grid_charge_kwh": _monthly(grid_in),
+        "bess_discharge_kwh": _monthly(grid_out + solar_out),
+        "rev_ic_nwl_zar": _monthly(rev_ic),
+        "rev_smart_city_zar": _monthly(rev_sc),
+        "rev_open_market_zar": _monthly(rev_mkt),
+        "rev_bess_arbitrage_zar": _monthly(rev_bess),
+    }
+    return LanredDispatch(
+        installed_kwp=installed_kwp,
+        bess_capacity_kwh=bess_kwh,
+        bess_effective_kwh=energy_cap,
+        capacity_factor=cf_base * pv_factor,
+        monthly=monthly,
+    )
+
+
+def build_lanred_dispatch(cfg: ModelConfig, bess_alloc_pct: float) -> LanredDispatch:
+    """Hourly dispatch for one PV/BESS budget split, cached per config hash.
+
+    The returned object is shared between callers — treat it as read-only.
+    """
+    key = (lanred_dispatch_config_hash(cfg), round(float(bess_alloc_pct), 6))
+    hit = _DISPATCH_CACHE.get(key)
+    if hit is not None:
+        return hit
+    result = _simulate(cfg, float(bess_alloc_pct))
+    if len(_DISPATCH_CACHE) >= _DISPATCH_CACHE_MAX:
+        _DISPATCH_CACHE.pop(next(iter(_DISPATCH_CACHE)))
+    _DISPATCH_CACHE[key] = result
+    return result
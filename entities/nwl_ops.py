@@ -0,0 +1,540 @@
+"""NWL operating-model kernel — vectorised over a batch of driver scenarios.
+
+Single source for the NWL quantity, tariff, revenue and cost vectors used by
+build_nwl_operating_model() (full entity run) and build_nwl_sensitivity()
+(sensitivity tab). All vectors are built with array operations over the
+20 canonical semi-annual periods; scenarios form the leading axis so a
+sweep over NWL drivers is one kernel call instead of N dict rebuilds.
+
+Shapes:
+    drivers  — each field is a scalar or a (S,) sequence, broadcast to S
+    vectors  — (S, 20) semi-annual ZAR (or MLD for quantities)
+    annual   — (S, 10) via annual_sum() / annual_mean()
+
+No Streamlit imports.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from engine.config import ModelConfig, ScenarioInputs
+from engine.periods import total_periods, total_years, period_start_month
+
+# Semi-annual demand anchors (M18..M72) for the greenfield/brownfield vectors
+DEMAND_MONTHS = [18, 24, 30, 36, 42, 48, 54, 60, 66, 72]
+
+# 1 MLD over half a year, in kL
+HALF_YEAR_KL_PER_MLD = 1000.0 * 365.0 / 2.0
+
+# Average days per month (power cost convention)
+DAYS_PER_MONTH = 30.44
+
+
+# ---------------------------------------------------------------------------
+# Piecewise-linear helpers (np.interp with linear end extrapolation)
+# ---------------------------------------------------------------------------
+
+def interp_extrapolate(
+    x: np.ndarray,
+    xp: list[float],
+    fp: list[float],
+    floor: float | None = None,
+) -> np.ndarray:
+    """Piecewise-linear interpolation with linear extrapolation at both ends.
+
+    Vectorised equivalent of the legacy _extrapolate_piecewise_linear():
+    anchors are sorted by month, the first/last segment slopes extend
+    beyond the anchor range, and an optional floor clips the result.
+    x may have any shape.
+    """
+    x = np.asarray(x, dtype=float)
+    if not xp or not fp or len(xp) != len(fp):
+        return np.zeros_like(x)
+    order = np.argsort(np.asarray(xp, dtype=float), kind="stable")
+    xs = np.asarray(xp, dtype=float)[order]
+    ys = np.asarray(fp, dtype=float)[order]
+
+    out = np.interp(x, xs, ys)
+    if len(xs) >= 2:
+        left_dx = xs[1] - xs[0]
+        left_slope = (ys[1] - ys[0]) / left_dx if left_dx else 0.0
+        right_dx = xs[-1] - xs[-2]
+        right_slope = (ys[-1] - ys[-2]) / right_dx if right_dx else 0.0
+        out = np.where(x < xs[0], ys[0] + left_slope * (x - xs[0]), out)
+        out = np.where(x > xs[-1], ys[-1] + right_slope * (x - xs[-1]), out)
+    if floor is not None:
+        out = np.maximum(out, floor)
+    return out
+
+
+def _capacity_anchors(ramp_rows: list[dict], delay_months: int) -> tuple[list[int], list[float]]:
+    """Sewage capacity anchors from on_ramp.rows, shifted by a ramp delay.
+
+    Pads (M6, 0) and (M12, 0) so the ramp starts from zero capacity.
+    """
+    pts = [
+        (int(r.get("period_months", 0)) + delay_months, r.get("capacity_available_mld"))
+        for r in ramp_rows
+    ]
+    pts = [(m, float(v)) for m, v in pts if v is not None]
+    if not any(m <= 6 for m, _ in pts):
+        pts.append((6, 0.0))
+    if not any(m == 12 for m, _ in pts):
+        pts.append((12, 0.0))
+    pts = sorted(pts, key=lambda p: p[0])
+    return [m for m, _ in pts], [v for _, v in pts]
+
+
+def _capacity_at_months(cap_months: list[int], cap_vals: list[float], months: np.ndarray) -> np.ndarray:
+    """Monthly capacity for the power cost: interpolated, zero before the
+    first anchor, held flat after the last (no extrapolation)."""
+    if not cap_months:
+        return np.zeros_like(months, dtype=float)
+    out = np.interp(months, cap_months, cap_vals)
+    return np.where(months < cap_months[0], 0.0, out)
+
+
+def _indexed_monthly(amount: np.ndarray, index_pa: np.ndarray, start_month: int, months: np.ndarray) -> np.ndarray:
+    """Monthly amount indexed annually from start_month, zero before it.
+
+    amount/index_pa broadcast against months (typically (S, 1) vs (M,)).
+    """
+    years_from_start = (months - start_month) / 12.0
+    return np.where(months >= start_month, amount * (1.0 + index_pa) ** years_from_start, 0.0)
+
+
+def _monthly_to_semi(monthly: np.ndarray) -> np.ndarray:
+    """Sum (..., 120) monthly values into (..., 20) semi-annual buckets."""
+    return monthly.reshape(*monthly.shape[:-1], total_periods(), 6).sum(axis=-1)
+
+
+# ---------------------------------------------------------------------------
+# Drivers
+# ---------------------------------------------------------------------------
+
+@dataclass
+class NwlOpsDrivers:
+    """NWL operating drivers — each field a scalar or a (S,) batch.
+
+    Scalars broadcast across the batch; all sequences must share length S.
+    """
+    sewage_rate_2025: float | list[float] = 46.40
+    water_rate_2025: float | list[float] = 62.05
+    growth_pct: float | list[float] = 7.7
+    brine_pct: float | list[float] = 10.0
+    reuse_ratio: float | list[float] = 0.80
+    ramp_delay_months: int | list[int] = 0
+    piped_delay_months: int | list[int] = 0
+    # Sewerage revenue sharing (honeysucker)
+    srv_growth_pct: float | list[float] = 7.7
+    srv_transport_r_km: float | list[float] = 28.0
+    srv_truck_capacity_m3: float | list[float] = 10.0
+    srv_nwl_distance_km: float | list[float] = 10.0
+    srv_gov_distance_km: float | list[float] = 100.0
+    srv_saving_to_market_pct: float | list[float] = 40.0
+    # Power (IC from LanRED)
+    power_kwh_per_m3: float | list[float] = 0.4
+    power_eskom_base: float | list[float] = 2.81
+    power_ic_discount: float | list[float] = 10.0
+    power_escalation: float | list[float] = 10.0
+
+    @classmethod
+    def from_inputs(cls, inputs: ScenarioInputs) -> "NwlOpsDrivers":
+        """Drivers for one scenario from UI-driven ScenarioInputs."""
+        return cls(
+            sewage_rate_2025=inputs.nwl_greenfield_sewage_rate_2025,
+            water_rate_2025=inputs.nwl_greenfield_water_rate_2025,
+            growth_pct=inputs.nwl_greenfield_growth_pct,
+            brine_pct=inputs.nwl_greenfield_brine_pct,
+            reuse_ratio=inputs.nwl_greenfield_reuse_ratio,
+            srv_growth_pct=inputs.nwl_srv_growth_pct,
+            srv_transport_r_km=inputs.nwl_srv_transport_r_km,
+            srv_truck_capacity_m3=inputs.nwl_srv_truck_capacity_m3,
+            srv_nwl_distance_km=inputs.nwl_srv_nwl_distance_km,
+            srv_gov_distance_km=inputs.nwl_srv_gov_distance_km,
+            srv_saving_to_market_pct=inputs.nwl_srv_saving_to_market_pct,
+            power_kwh_per_m3=inputs.nwl_power_kwh_per_m3,
+            power_eskom_base=inputs.nwl_power_eskom_base,
+            power_ic_discount=inputs.nwl_power_ic_discount,
+            power_escalation=inputs.nwl_power_escalation,
+        )
+
+    @classmethod
+    def from_config(cls, cfg: ModelConfig) -> "NwlOpsDrivers":
+        """Drivers at the operations.json defaults (no UI overrides)."""
+        ops_cfg = cfg.operations.get("nwl", {})
+        gf_cfg = ops_cfg.get("greenfield", {})
+        srv_cfg = ops_cfg.get("sewerage_revenue_sharing", {})
+        pw_cfg = ops_cfg.get("power", {})
+        return cls(
+            sewage_rate_2025=float(gf_cfg.get("sewage_rate_2025_r_per_kl", 46.40)),
+            water_rate_2025=float(gf_cfg.get("water_rate_2025_r_per_kl", 62.05)),
+            growth_pct=float(gf_cfg.get("annual_growth_pct_default", 7.7)),
+            brine_pct=float(gf_cfg.get("brine_pct_default", 10.0)),
+            reuse_ratio=float(gf_cfg.get("reuse_ratio_default", 0.80)),
+            srv_growth_pct=float(srv_cfg.get("growth_pct_default", 7.7)),
+            srv_transport_r_km=float(srv_cfg.get("transport_r_per_km_default", 28.0)),
+            srv_truck_capacity_m3=float(srv_cfg.get("truck_capacity_m3_default", 10.0)),
+            srv_nwl_distance_km=float(srv_cfg.get("nwl_roundtrip_km_default", 10.0)),
+            srv_gov_distance_km=float(srv_cfg.get("gov_roundtrip_km_default", 100.0)),
+            srv_saving_to_market_pct=float(srv_cfg.get("saving_to_market_pct_default", 40.0)),
+            power_kwh_per_m3=float(pw_cfg.get("kwh_per_m3", 0.4)),
+            power_eskom_base=float(pw_cfg.get("eskom_base_rate_r_per_kwh", 2.81)),
+            power_ic_discount=float(pw_cfg.get("ic_discount_pct", 10.0)),
+            power_escalation=float(pw_cfg.get("annual_escalation_pct", 10.0)),
+        )
+
+    @property
+    def size(self) -> int:
+        """Batch size S (1 if every field is scalar)."""
+        n = 1
+        for f in fields(self):
+            v = np.asarray(getattr(self, f.name))
+            if v.ndim == 0:
+                continue
+            if n != 1 and len(v) != n:
+                raise ValueError(f"Driver {f.name} has length {len(v)}, expected {n}")
+            n = len(v)
+        return n
+
+    def column(self, name: str) -> np.ndarray:
+        """Driver field broadcast to a (S, 1) column for (S, T) arithmetic."""
+        return np.broadcast_to(np.asarray(getattr(self, name), dtype=float), (self.size,))[:, None]
+
+
+# ---------------------------------------------------------------------------
+# Kernel output
+# ---------------------------------------------------------------------------
+
+@dataclass
+class NwlOpsVectors:
+    """Semi-annual NWL operating vectors for S scenarios.
+
+    Quantities in MLD, tariffs in ZAR/kL, revenue/cost in ZAR — all (S, 20).
+    """
+    fx_rate: float
+    months: np.ndarray                  # (20,) period start months
+    # Quantities (MLD)
+    sewage_capacity: np.ndarray
+    sewage_sold: np.ndarray
+    brownfield_served: np.ndarray
+    reuse_sold_topcos: np.ndarray
+    reuse_sold_construction: np.ndarray
+    reuse_overflow_agri: np.ndarray
+    # Tariffs (ZAR/kL)
+    sewage_rate: np.ndarray
+    water_rate: np.ndarray
+    agri_rate: np.ndarray
+    honeysucker_rate: np.ndarray
+    # Revenue (ZAR)
+    rev_gf_sewage: np.ndarray
+    rev_bf_sewage: np.ndarray
+    rev_gf_reuse: np.ndarray
+    rev_construction: np.ndarray
+    rev_agri: np.ndarray
+    rev_bulk: np.ndarray
+    # Costs (ZAR)
+    om_cost: np.ndarray
+    power_cost: np.ndarray
+    rent_cost: np.ndarray
+
+    @property
+    def size(self) -> int:
+        return self.sewage_capacity.shape[0]
+
+    @property
+    def rev_operating(self) -> np.ndarray:
+        return (self.rev_gf_sewage + self.rev_bf_sewage + self.rev_gf_reuse
+                + self.rev_construction + self.rev_agri)
+
+    @property
+    def rev_total(self) -> np.ndarray:
+        return self.rev_operating + self.rev_bulk
+
+    @property
+    def opex(self) -> np.ndarray:
+        return self.om_cost + self.power_cost + self.rent_cost
+
+    @property
+    def ebitda(self) -> np.ndarray:
+        return self.rev_total - self.opex
+
+    @staticmethod
+    def annual_sum(arr: np.ndarray) -> np.ndarray:
+        """(S, 20) semi-annual → (S, 10) annual totals."""
+        return arr.reshape(arr.shape[0], total_years(), -1).sum(axis=-1)
+
+    @staticmethod
+    def annual_mean(arr: np.ndarray) -> np.ndarray:
+        """(S, 20) semi-annual → (S, 10) annual averages (volumes)."""
+        return arr.reshape(arr.shape[0], total_years(), -1).mean(axis=-1)
+
+    def ops_rows(self, i: int = 0) -> tuple[list[dict], list[dict]]:
+        """(ops_annual, ops_semi_annual) dict rows (EUR) for scenario i.
+
+        Row layout matches what run_entity_loop()/build_annual() consume.
+        """
+        fx = self.fx_rate
+        ann = self.annual_sum
+        gf_sew = ann(self.rev_gf_sewage)[i] / fx
+        bf_sew = ann(self.rev_bf_sewage)[i] / fx
+        gf_reu = ann(self.rev_gf_reuse)[i] / fx
+        constr = ann(self.rev_construction)[i] / fx
+        agri = ann(self.rev_agri)[i] / fx
+        bulk = ann(self.rev_bulk)[i] / fx
+        om_zar = ann(self.om_cost)[i]
+        pw_zar = ann(self.power_cost)[i]
+        rent_zar = ann(self.rent_cost)[i]
+        cap_avg = self.annual_mean(self.sewage_capacity)[i]
+        treated_avg = self.annual_mean(self.sewage_sold)[i]
+        reuse_avg = self.annual_mean(
+            self.reuse_sold_topcos + self.reuse_sold_construction + self.reuse_overflow_agri)[i]
+        bf_avg = self.annual_mean(self.brownfield_served)[i]
+
+        annual_rows: list[dict] = []
+        for yi in range(total_years()):
+            rev_op = gf_sew[yi] + bf_sew[yi] + gf_reu[yi] + constr[yi] + agri[yi]
+            annual_rows.append({
+                "year": yi + 1,
+                "rev_greenfield_sewage": float(gf_sew[yi]),
+                "rev_brownfield_sewage": float(bf_sew[yi]),
+                "rev_sewage": float(gf_sew[yi] + bf_sew[yi]),
+                "rev_greenfield_reuse": float(gf_reu[yi]),
+                "rev_construction": float(constr[yi]),
+                "rev_agri": float(agri[yi]),
+                "rev_reuse": float(gf_reu[yi] + constr[yi] + agri[yi]),
+                "rev_operating": float(rev_op),
+                "rev_bulk_services": float(bulk[yi]),
+                "rev_total": float(rev_op + bulk[yi]),
+                "om_cost": float(om_zar[yi] / fx),
+                "power_cost": float(pw_zar[yi] / fx),
+                "rent_cost": float(rent_zar[yi] / fx),
+                "vol_capacity_mld": float(cap_avg[yi]),
+                "vol_treated_mld": float(treated_avg[yi]),
+                "vol_annual_m3": float(treated_avg[yi] * 1000.0 * 365.0),
+                "vol_reuse_annual_m3": float(reuse_avg[yi] * 1000.0 * 365.0),
+                "vol_brownfield_annual_m3": float(bf_avg[yi] * 1000.0 * 365.0),
+                "power_zar": float(pw_zar[yi]),
+                "om_zar": float(om_zar[yi]),
+                "rent_zar": float(rent_zar[yi]),
+            })
+
+        rev_op_s = self.rev_operating[i] / fx
+        bulk_s = self.rev_bulk[i] / fx
+        om_s = self.om_cost[i] / fx
+        pw_s = self.power_cost[i] / fx
+        rent_s = self.rent_cost[i] / fx
+        semi_rows: list[dict] = []
+        for si in range(total_periods()):
+            semi_rows.append({
+                "month": int(self.months[si]),
+                "rev_operating": float(rev_op_s[si]),
+                "rev_bulk_services": float(bulk_s[si]),
+                "rev_total": float(rev_op_s[si] + bulk_s[si]),
+                "om_cost": float(om_s[si]),
+                "power_cost": float(pw_s[si]),
+                "rent_cost": float(rent_s[si]),
+            })
+        return annual_rows, semi_rows
+
+    def sensitivity_rows(self, i: int = 0) -> list[dict]:
+        """10 annual revenue/EBITDA dicts (EUR) for scenario i.
+
+        Layout of build_nwl_sensitivity() output.
+        """
+        fx = self.fx_rate
+        ann = self.annual_sum
+        cols = {
+            "rev_greenfield_sewage": ann(self.rev_gf_sewage)[i],
+            "rev_brownfield_sewage": ann(self.rev_bf_sewage)[i],
+            "rev_reuse": ann(self.rev_gf_reuse)[i],
+            "rev_construction": ann(self.rev_construction)[i],
+            "rev_agri": ann(self.rev_agri)[i],
+            "rev_bulk": ann(self.rev_bulk)[i],
+        }
+        om = ann(self.om_cost)[i] / fx
+        pw = ann(self.power_cost)[i] / fx
+        rn = ann(self.rent_cost)[i] / fx
+        result = []
+        for yi in range(total_years()):
+            row = {"year": yi + 1}
+            row.update({k: float(v[yi] / fx) for k, v in cols.items()})
+            rev = sum(row[k] for k in cols)
+            row.update({
+                "rev_total": rev,
+                "om_cost": float(om[yi]),
+                "power_cost": float(pw[yi]),
+                "rent_cost": float(rn[yi]),
+                "ebitda": rev - float(om[yi]) - float(pw[yi]) - float(rn[yi]),
+            })
+            result.append(row)
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Kernel
+# ---------------------------------------------------------------------------
+
+def build_nwl_ops_vectors(
+    cfg: ModelConfig,
+    drivers: NwlOpsDrivers,
+    *,
+    bulk_timing: str = "lump",
+) -> NwlOpsVectors:
+    """Build all NWL semi-annual ops vectors for a batch of driver scenarios.
+
+    bulk_timing:
+        "lump"     — bulk services recognised in full at M12 (entity model)
+        "receipts" — spread evenly over each row's receipt_period from M13
+                     (sensitivity view convention)
+    """
+    from entities.nwl import compute_coe_rent_monthly_eur
+
+    fx_rate = cfg.fx_rate
+    ops_cfg = cfg.operations.get("nwl", {})
+    gf_cfg = ops_cfg.get("greenfield", {})
+    bf_cfg = ops_cfg.get("brownfield", {})
+    ramp_rows = ops_cfg.get("on_ramp", {}).get("rows", [])
+    bulk_cfg = ops_cfg.get("bulk_services", {})
+    om_cfg = ops_cfg.get("om", {})
+    pw_cfg = ops_cfg.get("power", {})
+    rent_cfg = ops_cfg.get("coe_rent", {})
+
+    n_semi = total_periods()
+    n_months = n_semi * 6
+    S = drivers.size
+    months = np.array([period_start_month(si) for si in range(n_semi)], dtype=float)
+    months_m = np.arange(n_months, dtype=float)
+    col = drivers.column
+
+    # ── Capacity (per unique ramp delay) ──
+    ramp_delay = np.broadcast_to(np.asarray(drivers.ramp_delay_months, dtype=int), (S,))
+    sewage_capacity = np.empty((S, n_semi))
+    cap_monthly = np.empty((S, n_months))
+    for d in np.unique(ramp_delay):
+        cap_m, cap_v = _capacity_anchors(ramp_rows, int(d))
+        mask = ramp_delay == d
+        sewage_capacity[mask] = interp_extrapolate(months, cap_m, cap_v, floor=0.0)
+        cap_monthly[mask] = _capacity_at_months(cap_m, cap_v, months_m)
+
+    # ── Demand (piped demand shifts with piped delay) ──
+    piped_base = [float(x) for x in gf_cfg.get("piped_sewage_topcos_mld", [0.0] * 10)]
+    construction_base = [float(x) for x in gf_cfg.get("construction_water_demand_topcos_mld", [0.0] * 10)]
+    latent_base = [float(x) for x in bf_cfg.get("latent_demand_quantified", [0.0] * 10)]
+    piped_delay = col("piped_delay_months")
+    piped_demand = interp_extrapolate(months[None, :] - piped_delay, DEMAND_MONTHS, piped_base, floor=0.0)
+    construction_demand = interp_extrapolate(months, DEMAND_MONTHS, construction_base, floor=0.0)[None, :]
+    latent_demand = interp_extrapolate(months, DEMAND_MONTHS, latent_base, floor=0.0)[None, :]
+
+    # ── Volumes ──
+    sewage_sold = np.minimum(sewage_capacity, piped_demand)
+    overflow_bf = np.maximum(sewage_capacity - sewage_sold, 0.0)
+    reuse_capacity = sewage_capacity * (1.0 - col("brine_pct") / 100.0)
+    reuse_sold_topcos = np.minimum(reuse_capacity, sewage_sold * col("reuse_ratio"))
+    reuse_after = np.maximum(reuse_capacity - reuse_sold_topcos, 0.0)
+    reuse_sold_constr = np.minimum(reuse_after, construction_demand)
+    reuse_overflow_agri = np.maximum(reuse_capacity - reuse_sold_topcos - reuse_sold_constr, 0.0)
+    brownfield_served = np.minimum(overflow_bf, latent_demand)
+
+    # ── Tariffs ──
+    years = months[None, :] / 12.0
+    growth = (1.0 + col("growth_pct") / 100.0) ** years
+    sewage_rate = col("sewage_rate_2025") * growth
+    water_rate = col("water_rate_2025") * growth
+    agri_rate = float(bf_cfg.get("agri_base_2025_r_per_kl", 37.70)) * growth
+
+    truck_cap = np.maximum(col("srv_truck_capacity_m3"), 1.0)
+    saving_per_m3 = (col("srv_gov_distance_km") - col("srv_nwl_distance_km")) * col("srv_transport_r_km") / truck_cap
+    market_price = np.maximum(saving_per_m3 * (col("srv_saving_to_market_pct") / 100.0), 0.0)
+    honeysucker_rate = market_price * (1.0 + col("srv_growth_pct") / 100.0) ** years
+
+    # ── Revenue (ZAR) ──
+    hyk = HALF_YEAR_KL_PER_MLD
+    rev_gf_sewage = sewage_sold * hyk * sewage_rate
+    rev_bf_sewage = brownfield_served * hyk * honeysucker_rate
+    rev_gf_reuse = reuse_sold_topcos * hyk * water_rate
+    rev_construction = reuse_sold_constr * hyk * water_rate
+    rev_agri = reuse_overflow_agri * hyk * np.broadcast_to(agri_rate, (S, n_semi))
+
+    # ── Bulk services (driver-independent) ──
+    bulk_monthly = np.zeros(n_months)
+    for row in bulk_cfg.get("rows", []):
+        amount = float(row.get("price_zar", 0.0))
+        if amount <= 0.0:
+            continue
+        receipt_period = max(float(row.get("receipt_period", 12.0)), 0.0)
+        if bulk_timing == "lump" or receipt_period == 0.0:
+            bulk_monthly[12] += amount
+        else:
+            spread = (months_m >= 13) & (months_m < 13 + receipt_period)
+            bulk_monthly[spread] += amount / receipt_period
+    rev_bulk = np.broadcast_to(_monthly_to_semi(bulk_monthly), (S, n_semi)).copy()
+
+    # ── O&M (monthly, indexed) ──
+    om_monthly = _indexed_monthly(
+        float(om_cfg.get("flat_fee_per_month_zar", 0.0)),
+        float(om_cfg.get("annual_indexation_pa", 0.0)),
+        int(om_cfg.get("opex_start_month", 12)),
+        months_m,
+    )
+    om_cost = np.broadcast_to(_monthly_to_semi(om_monthly), (S, n_semi)).copy()
+
+    # ── Power (IC from LanRED at Eskom less discount) ──
+    power_rate = col("power_eskom_base") * (1.0 - col("power_ic_discount") / 100.0)
+    rate_indexed = _indexed_monthly(
+        power_rate, col("power_escalation") / 100.0,
+        int(pw_cfg.get("start_month", 18)), months_m[None, :],
+    )
+    kwh_per_day = cap_monthly * 1000.0 * col("power_kwh_per_m3")
+    power_cost = _monthly_to_semi(kwh_per_day * rate_indexed * DAYS_PER_MONTH)
+
+    # ── CoE rent (capital recovery) ──
+    rent_monthly_eur, _, _, _ = compute_coe_rent_monthly_eur(cfg, float(rent_cfg.get("om_overhead_pct", 2.0)))
+    rent_monthly = _indexed_monthly(
+        rent_monthly_eur * fx_rate,
+        float(rent_cfg.get("annual_escalation_pct", 5.0)) / 100.0,
+        int(rent_cfg.get("start_month", 24)),
+        months_m,
+    )
+    rent_cost = np.broadcast_to(_monthly_to_semi(rent_monthly), (S, n_semi)).copy()
+
+    return NwlOpsVectors(
+        fx_rate=fx_rate,
+        months=months.astype(int),
+        sewage_capacity=sewage_capacity,
+        sewage_sold=sewage_sold,
+        brownfield_served=brownfield_served,
+        reuse_sold_topcos=reuse_sold_topcos,
+        reuse_sold_construction=reuse_sold_constr,
+        reuse_overflow_agri=reuse_overflow_agri,
+        sewage_rate=sewage_rate,
+        water_rate=water_rate,
+        agri_rate=np.broadcast_to(agri_rate, (S, n_semi)).copy(),
+        honeysucker_rate=honeysucker_rate,
+        rev_gf_sewage=rev_gf_sewage,
+        rev_bf_sewage=rev_bf_sewage,
+        rev_gf_reuse=rev_gf_reuse,
+        rev_construction=rev_construction,
+        rev_agri=rev_agri,
+        rev_bulk=rev_bulk,
+        om_cost=om_cost,
+        power_cost=power_cost,
+        rent_cost=rent_cost,
+    )
+
+
+def nwl_ops_config_hash(cfg: ModelConfig) -> str:
+    """Content hash of every config section the NWL ops kernel reads."""
+    import hashlib
+    import json
+
+    payload = json.dumps({
+        "operations": cfg.operations.get("nwl", {}),
+        "assets": cfg.assets.get("assets", {}).get("coe", {}),
+        "rates": cfg.rates,
+        "fx_rate": cfg.fx_rate,
+    }, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
@@ -0,0 +1,5 @@
+"""Headless reports — board pack HTML / PDF."""
+
+from reports.board_pack import build_board_pack, render_pdf
+
+__all__ = ["build_board_pack", "render_pdf"]
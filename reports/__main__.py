@@ -0,0 +1,34 @@
+"""CLI entry: python -m reports [--out DIR] [--inputs overrides.json] [--workers N] [--pdf]"""
+
+import argparse
+import json
+import sys
+
+from engine.config import ScenarioInputs, resolve_overrides
+from reports.board_pack import DEFAULT_OUTPUT_DIR, build_board_pack
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m reports", description="Headless board pack.")
+    parser.add_argument("--out", default=str(DEFAULT_OUTPUT_DIR), help="Output directory.")
+    parser.add_argument("--inputs", default=None,
+                        help="JSON file of ScenarioInputs overrides and/or dotted config paths.")
+    parser.add_argument("--workers", type=int, default=4, help="Section render processes (1 = in-process).")
+    parser.add_argument("--pdf", action="store_true", help="Also render board_pack.pdf.")
+    parser.add_argument("--title", default="SCLCA Board Pack")
+    args = parser.parse_args(argv)
+
+    cfg, inputs = None, ScenarioInputs()
+    if args.inputs:
+        with open(args.inputs) as f:
+            cfg, inputs = resolve_overrides(json.load(f))
+    pack = build_board_pack(args.out, cfg=cfg, inputs=inputs, workers=args.workers, pdf=args.pdf, title=args.title)
+    print(f"Board pack written to: {pack.html}")
+    if pack.pdf:
+        print(f"PDF written to: {pack.pdf}")
+    print(f"{pack.elapsed_s:.1f}s (" + ", ".join(f"{k} {v:.2f}s" for k, v in pack.section_s.items()) + ")")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
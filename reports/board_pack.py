@@ -0,0 +1,335 @@
+"""Board pack — headless HTML (optionally PDF) report of one model run.
+
+The model runs once; each section (NWL, LanRED, Timberworx, SCLCA holding)
+is then rendered from that shared, read-only ModelResult — in parallel
+worker processes when workers > 1.  A section is a metrics strip, P&L /
+cash flow / balance sheet tables (years as columns, no heritage tooltips;
+entity lines from the config/templates statement engine) and SVG charts
+from svg_generators.  Sections are stitched into one
+self-contained HTML file.
+
+    from reports import build_board_pack
+    pack = build_board_pack("output/board_pack", workers=4, pdf=True)
+    pack.html, pack.pdf
+"""
+
+from __future__ import annotations
+
+import html
+import math
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+
+from engine.analytics import extract_metrics
+from engine.config import ModelConfig, ScenarioInputs
+from engine.orchestrator import run_model
+from engine.registry import ColumnRegistry
+from engine.statements import StatementTable, model_statements
+from engine.types import ModelResult
+from svg_generators import entity_about_svgs, generate_annual_bars_svg
+
+DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent.parent / "output" / "board_pack"
+
+SECTIONS = ("nwl", "lanred", "timberworx", "sclca")
+SECTION_NAMES = {
+    "nwl": "New Water Lanseria",
+    "lanred": "LanRED",
+    "timberworx": "Timberworx",
+    "sclca": "SCLCA Holding",
+}
+SECTION_COLORS = {"nwl": "#2563EB", "lanred": "#EAB308", "timberworx": "#8B4513", "sclca": "#1E3A5F"}
+
+# Entity statements come from config/templates (engine.statements); the holding
+# has no template, so its tables list (key, fallback label) — labels come from
+# config/columns.json where present; keys the holding does not produce are skipped.
+HOLDING_PNL = (
+    ("ii_total", "IC interest income"), ("ie", "Interest expense"),
+    ("ic_margin_income", "IC margin"), ("ebitda", "EBITDA"), ("ii_dsra", "DSRA interest"),
+    ("pbt", "Profit before tax"), ("tax", "Tax"), ("pat", "Profit after tax"),
+)
+HOLDING_CF = (
+    ("cf_ii", "Interest received"), ("cf_ie", "Interest paid"),
+    ("cf_net_interest", "Net interest"), ("cf_tax", "Tax paid"), ("cf_ops", "Cash from operations"),
+)
+HOLDING_BS = (
+    ("ic_loans_total", "IC loans"), ("bs_dsra", "DSRA"), ("bs_assets", "Total assets"),
+    ("sr_debt", "Senior debt"), ("mz_debt", "Mezzanine debt"), ("bs_liabilities", "Total liabilities"),
+    ("bs_equity", "Equity"), ("bs_gap", "Balance check"),
+)
+
+_CSS = """
+body { font-family: 'Segoe UI', Arial, sans-serif; color: #1E293B; margin: 32px; }
+h1 { color: #1E3A5F; margin-bottom: 0; } .meta { color: #64748B; margin-top: 4px; }
+section { page-break-before: always; } section:first-of-type { page-break-before: auto; }
+h2 { border-bottom: 3px solid var(--accent); padding-bottom: 4px; }
+h3 { color: #1E3A5F; margin-top: 24px; }
+.metrics { display: flex; flex-wrap: wrap; gap: 12px; }
+.metric { background: #F8FAFC; border: 1px solid #E2E8F0; border-radius: 8px; padding: 8px 14px; }
+.metric b { display: block; font-size: 18px; } .metric span { color: #64748B; font-size: 12px; }
+table { border-collapse: collapse; font-size: 11px; width: 100%; }
+th, td { padding: 3px 6px; text-align: right; border-bottom: 1px solid #E2E8F0; white-space: nowrap; }
+th:first-child, td:first-child { text-align: left; }
+thead th { background: #1E3A5F; color: #FFFFFF; }
+tr.total td { font-weight: 700; border-top: 1px solid #94A3B8; }
+tr.section td { font-weight: 700; color: #1E3A5F; background: #F1F5F9; text-align: left; }
+tr.memo td { color: #64748B; font-style: italic; }
+.chart svg { width: 100%; max-width: 760px; height: auto; margin: 12px 0; }
+"""
+
+_TOTAL_KEYS = frozenset({"rev_total", "ebitda", "pat", "cf_net", "bs_assets", "bs_equity",
+                         "cf_ops", "bs_liabilities"})
+
+
+@dataclass
+class BoardPack:
+    """Paths and timings of one generated board pack."""
+    html: Path
+    pdf: Path | None = None
+    elapsed_s: float = 0.0
+    section_s: dict[str, float] = field(default_factory=dict)
+
+
+# ── Formatting ──────────────────────────────────────────────────
+
+
+def _fmt(value, fmt: str = "money") -> str:
+    if value is None:
+        return ""
+    if fmt == "pct":
+        return f"{value:.1f}%"
+    if fmt == "ratio":
+        return f"{value:.2f}x"
+    if abs(value) < 0.5:
+        return "-"
+    return f"({abs(value):,.0f})" if value < 0 else f"{value:,.0f}"
+
+
+def _table(rows: list[dict], lines: tuple, registry: ColumnRegistry) -> str:
+    """Years-as-columns statement table; lines absent from rows are skipped."""
+    if not rows:
+        return ""
+    present = set().union(*(r.keys() for r in rows))
+    head = "".join(f"<th>Y{r.get('year', i + 1)}</th>" for i, r in enumerate(rows))
+    body = []
+    for key, fallback in lines:
+        if key not in present:
+            continue
+        col = registry.get(key)
+        label = col.label if col is not None else fallback
+        fmt = col.fmt if col is not None else "money"
+        cells = "".join(f"<td>{_fmt(r.get(key, 0.0), fmt)}</td>" for r in rows)
+        cls = ' class="total"' if key in _TOTAL_KEYS else ""
+        body.append(f"<tr{cls}><td>{html.escape(label)}</td>{cells}</tr>")
+    return (f"<table><thead><tr><th>EUR</th>{head}</tr></thead>"
+            f"<tbody>{''.join(body)}</tbody></table>")
+
+
+def _statement_html(table: StatementTable) -> str:
+    """Years-as-columns table (plus Total) of one template statement."""
+    head = "".join(f"<th>Y{y}</th>" for y in table.years) + "<th>Total</th>"
+    body = []
+    for line in table.lines:
+        if line.style == "spacer":
+            continue
+        if line.style == "section":
+            body.append(f'<tr class="section"><td colspan="{len(table.years) + 2}">'
+                        f"{html.escape(line.label)}</td></tr>")
+            continue
+        if line.fmt == "ratio":
+            cells = [_fmt(v, "ratio") if math.isfinite(v) else "n/a" for v in line.values + [line.total]]
+        elif line.fmt == "check":
+            cells = ["OK" if abs(v) < 0.01 else _fmt(v) for v in line.values + [line.total]]
+        else:
+            cells = [_fmt(v) for v in line.values + [line.total]]
+        cls = {"sub": ' class="total"', "total": ' class="total"', "grand": ' class="total"',
+               "memo": ' class="memo"'}.get(line.style, "")
+        body.append(f"<tr{cls}><td>{html.escape(line.label)}</td>"
+                    + "".join(f"<td>{c}</td>" for c in cells) + "</tr>")
+    return (f"<table><thead><tr><th>EUR</th>{head}</tr></thead>"
+            f"<tbody>{''.join(body)}</tbody></table>")
+
+
+def _metric_strip(items: list[tuple[str, str]]) -> str:
+    cells = "".join(f'<div class="metric"><b>{v}</b><span>{html.escape(k)}</span></div>' for k, v in items)
+    return f'<div class="metrics">{cells}</div>'
+
+
+# ── Sections ────────────────────────────────────────────────────
+
+
+def render_section(
+    result: ModelResult,
+    key: str,
+    discount_rate: float = 0.052,
+    statements: dict[tuple[str, str], StatementTable] | None = None,
+) -> str:
+    """HTML <section> for one entity key (or "sclca" for the holding).
+
+    statements is model_statements(result, inputs), evaluated once per pack;
+    computed here (base-case flags) when not given.
+    """
+    registry = ColumnRegistry.load()
+    color = SECTION_COLORS[key]
+    if key == "sclca":
+        holding = result.holding or {}
+        annual = holding.get("annual", [])
+        strip = _metric_strip([
+            ("Net income (total)", _fmt(sum(a.get("ni", a.get("pat", 0.0)) for a in annual))),
+            ("Min DSCR", _fmt(holding.get("dscr_min"), "ratio") if holding.get("dscr_min") else "n/a"),
+            ("Avg DSCR", _fmt(holding.get("dscr_avg"), "ratio") if holding.get("dscr_avg") else "n/a"),
+            ("IC interest income", _fmt(holding.get("total_ic_interest_income"))),
+            ("Net interest", _fmt(holding.get("total_net_interest"))),
+        ])
+        tables = [_table(annual, lines, registry) for lines in (HOLDING_PNL, HOLDING_CF, HOLDING_BS)]
+        series = [("ii_total", "IC interest income", color), ("ie", "Interest expense", "#94A3B8"),
+                  ("pat", "Profit after tax", "#16a34a")]
+        about: dict[str, str] = {}
+    else:
+        annual = result.entities[key].annual
+        m = extract_metrics(key, annual, discount_rate)
+        strip = _metric_strip([
+            ("Revenue (total)", _fmt(m.total_revenue)),
+            ("EBITDA margin", _fmt(m.ebitda_margin, "pct")),
+            ("Min DSCR", _fmt(m.dscr_min, "ratio")),
+            ("Avg DSCR", _fmt(m.dscr_avg, "ratio")),
+            ("Project IRR", _fmt(m.project_irr * 100, "pct") if m.project_irr is not None else "n/a"),
+            ("Equity IRR", _fmt(m.equity_irr * 100, "pct") if m.equity_irr is not None else "n/a"),
+            ("Min LLCR", _fmt(m.llcr_min, "ratio") if m.llcr_min is not None else "n/a"),
+        ])
+        if statements is None:
+            statements = model_statements(result)
+        tables = [_statement_html(statements[key, st]) for st in ("pnl", "cf", "bs")]
+        series = [("rev_total", "Revenue", color), ("ebitda", "EBITDA", "#16a34a"),
+                  ("cf_ds", "Debt service", "#94A3B8")]
+        about = entity_about_svgs(key)
+
+    labels = [f"Y{a.get('year', i + 1)}" for i, a in enumerate(annual)]
+    chart = generate_annual_bars_svg(
+        f"{SECTION_NAMES[key]} — annual (EUR)", labels,
+        [{"name": name, "values": [a.get(k, 0.0) for a in annual], "color": c}
+         for k, name, c in series if any(k in a for a in annual)],
+    )
+    parts = [
+        f'<section style="--accent:{color}"><h2>{html.escape(SECTION_NAMES[key])}</h2>',
+        strip,
+        f'<div class="chart">{chart}</div>',
+        "<h3>Income statement</h3>", tables[0],
+        "<h3>Cash flow</h3>", tables[1],
+        "<h3>Balance sheet</h3>", tables[2],
+    ]
+    for heading, svg in about.items():
+        parts.append(f'<h3>{html.escape(heading)}</h3><div class="chart">{svg}</div>')
+    parts.append("</section>")
+    return "\n".join(parts)
+
+
+# Worker processes receive the ModelResult once (initializer), not per section.
+_WORKER_RESULT: ModelResult | None = None
+_WORKER_STATEMENTS: dict | None = None
+
+
+def _init_worker(result: ModelResult, statements: dict | None = None) -> None:
+    global _WORKER_RESULT, _WORKER_STATEMENTS
+    _WORKER_RESULT, _WORKER_STATEMENTS = result, statements
+
+
+def _worker_section(key: str, discount_rate: float) -> tuple[str, str, float]:
+    t0 = time.perf_counter()
+    body = render_section(_WORKER_RESULT, key, discount_rate, _WORKER_STATEMENTS)
+    return key, body, time.perf_counter() - t0
+
+
+# ── PDF ─────────────────────────────────────────────────────────
+
+
+def render_pdf(html_path: str | Path, pdf_path: str | Path) -> Path:
+    """HTML -> PDF with whichever local renderer is available.
+
+    Tried in order: weasyprint (Python), headless Chromium / Chrome,
+    wkhtmltopdf.  Raises RuntimeError when none is installed.
+    """
+    html_path, pdf_path = Path(html_path).resolve(), Path(pdf_path).resolve()
+    try:
+        from weasyprint import HTML
+    except ImportError:
+        HTML = None
+    if HTML is not None:
+        HTML(filename=str(html_path)).write_pdf(str(pdf_path))
+        return pdf_path
+    for exe in ("chromium", "chromium-browser", "google-chrome", "google-chrome-stable"):
+        binary = shutil.which(exe)
+        if binary:
+            subprocess.run(
+                [binary, "--headless", "--disable-gpu", "--no-pdf-header-footer",
+                 f"--print-to-pdf={pdf_path}", html_path.as_uri()],
+                check=True, capture_output=True, timeout=300,
+            )
+            return pdf_path
+    binary = shutil.which("wkhtmltopdf")
+    if binary:
+        subprocess.run([binary, "--quiet", str(html_path), str(pdf_path)],
+                       check=True, capture_output=True, timeout=300)
+        return pdf_path
+    raise RuntimeError(
+        "No PDF renderer found: pip install weasyprint, or install chromium / wkhtmltopdf"
+    )
+
+
+# ── Build ───────────────────────────────────────────────────────
+
+
+def build_board_pack(
+    out_dir: str | Path = DEFAULT_OUTPUT_DIR,
+    *,
+    result: ModelResult | None = None,
+    cfg: ModelConfig | None = None,
+    inputs: ScenarioInputs | None = None,
+    workers: int = 1,
+    pdf: bool = False,
+    title: str = "SCLCA Board Pack",
+    discount_rate: float = 0.052,
+) -> BoardPack:
+    """Run the model (unless result is given) and write board_pack.html.
+
+    workers > 1 renders sections in a process pool; pdf=True also writes
+    board_pack.pdf via render_pdf().
+    """
+    t0 = time.perf_counter()
+    cfg = cfg or ModelConfig.load()
+    if result is None:
+        result = run_model(cfg, inputs or ScenarioInputs())
+    statements = model_statements(result, inputs, cfg=cfg)      # every entity, one pass
+
+    timings: dict[str, float] = {}
+    sections: dict[str, str] = {}
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(SECTIONS)),
+                                 initializer=_init_worker, initargs=(result, statements)) as pool:
+            for key, body, secs in pool.map(_worker_section, SECTIONS, [discount_rate] * len(SECTIONS)):
+                sections[key], timings[key] = body, secs
+    else:
+        for key in SECTIONS:
+            t = time.perf_counter()
+            sections[key] = render_section(result, key, discount_rate, statements)
+            timings[key] = time.perf_counter() - t
+
+    fingerprint = inputs.fingerprint()[:12] if inputs is not None else "base case"
+    doc = (
+        f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{html.escape(title)}</title>'
+        f"<style>{_CSS}</style></head><body>"
+        f"<h1>{html.escape(title)}</h1>"
+        f'<p class="meta">{date.today().isoformat()} · scenario {html.escape(fingerprint)}</p>\n'
+        + "\n".join(sections[k] for k in SECTIONS)
+        + "</body></html>"
+    )
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    html_path = out / "board_pack.html"
+    html_path.write_text(doc, encoding="utf-8")
+    pdf_path = render_pdf(html_path, out / "board_pack.pdf") if pdf else None
+    return BoardPack(html_path, pdf_path, time.perf_counter() - t0, timings)
@@ -16,6 +16,15 @@ Adds the following tables to data/guarantor_analysis.db:
                               reports, insurance values vs. book values).
   - mgmt_report_solar_pv:    Monthly solar PV generation and savings per entity
                               per report_date.
+  - mgmt_report_sources:     One row per ingested report file (sha1), so
+                              populate_mgmt_report_db.py skips unchanged reports.
+  - mgmt_report_monthly_kpis: Pre-aggregated monthly KPIs per entity (latest
+                              report in the month + rent roll, arrears, variance
+                              and solar roll-ups) for trend charts.
+
+Indexes on (entity_key, report_date) back the per-report upsert, and a
+covering index on mgmt_report_monthly_kpis serves trend queries from the
+index alone.
 """
 import sqlite3
 import os
@@ -24,9 +33,26 @@ DB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(DB_DIR, "guarantor_analysis.db")
 
 
-def main():
-    os.makedirs(DB_DIR, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+TABLES = [
+    'mgmt_report_kpis',
+    'mgmt_report_tenants',
+    'mgmt_report_arrears',
+    'data_source_variances',
+    'mgmt_report_solar_pv',
+    'mgmt_report_sources',
+    'mgmt_report_monthly_kpis',
+]
+
+# KPI columns carried by the trend covering indexes
+KPI_TREND_COLUMNS = [
+    'vacancy_rate_pct', 'collections_pct', 'noi', 'net_income_ytd',
+    'arrears_total', 'tenant_count',
+]
+MONTHLY_TREND_COLUMNS = KPI_TREND_COLUMNS + ['rent_roll_monthly', 'solar_actual_kwh']
+
+
+def create_tables(conn):
+    """Create all management report tables and indexes (idempotent)."""
     c = conn.cursor()
 
     # ── Table 1: mgmt_report_kpis ──
@@ -133,18 +159,71 @@ def main():
         created_at  TEXT    DEFAULT (datetime('now'))
     )''')
 
+    # ── Table 6: mgmt_report_sources ──
+    # One row per source report file; sha1 drives change detection on re-run.
+    c.execute('''CREATE TABLE IF NOT EXISTS mgmt_report_sources (
+        path        TEXT    PRIMARY KEY,
+        entity_key  TEXT    NOT NULL,
+        report_date TEXT    NOT NULL,
+        sha1        TEXT    NOT NULL,
+        ingested_at TEXT    DEFAULT (datetime('now'))
+    )''')
+
+    # ── Table 7: mgmt_report_monthly_kpis ──
+    # One row per entity per calendar month (YYYY-MM of report_date), rebuilt for
+    # the entities touched by each populate run.  Values come from the latest
+    # report in the month; rent roll, arrears, variances and solar are rolled up.
+    c.execute('''CREATE TABLE IF NOT EXISTS mgmt_report_monthly_kpis (
+        entity_key           TEXT    NOT NULL,
+        month                TEXT    NOT NULL,
+        report_date          TEXT    NOT NULL,
+        entity_name          TEXT,
+        guarantor_group      TEXT,
+        vacancy_rate_pct     REAL,
+        collections_pct      REAL,
+        noi                  REAL,
+        net_income_ytd       REAL,
+        finance_costs        REAL,
+        arrears_total        REAL,
+        tenant_count         INTEGER,
+        quality_score        REAL,
+        rent_roll_monthly    REAL,
+        rent_roll_gla_m2     REAL,
+        arrears_debtors      INTEGER,
+        arrears_detail_total REAL,
+        variances_high       INTEGER,
+        solar_actual_kwh     REAL,
+        solar_target_kwh     REAL,
+        solar_savings_rand   REAL,
+        PRIMARY KEY (entity_key, month)
+    ) WITHOUT ROWID''')
+
+    # ── Indexes ──
+    # Detail tables are replaced per (entity_key, report_date) on upsert.
+    for table in ['mgmt_report_tenants', 'mgmt_report_arrears',
+                  'data_source_variances', 'mgmt_report_solar_pv']:
+        c.execute(f'CREATE INDEX IF NOT EXISTS ix_{table}_report '
+                  f'ON {table} (entity_key, report_date)')
+    # Trend charts: per-entity or per-group series read from the index alone.
+    c.execute(f'''CREATE INDEX IF NOT EXISTS ix_mgmt_report_kpis_trend
+        ON mgmt_report_kpis (entity_key, report_date, {', '.join(KPI_TREND_COLUMNS)})''')
+    c.execute(f'''CREATE INDEX IF NOT EXISTS ix_mgmt_report_monthly_kpis_trend
+        ON mgmt_report_monthly_kpis (entity_key, month, {', '.join(MONTHLY_TREND_COLUMNS)})''')
+    c.execute('''CREATE INDEX IF NOT EXISTS ix_mgmt_report_monthly_kpis_group
+        ON mgmt_report_monthly_kpis (guarantor_group, month, entity_key)''')
+
     conn.commit()
 
+
+def main():
+    os.makedirs(DB_DIR, exist_ok=True)
+    conn = sqlite3.connect(DB_PATH)
+    create_tables(conn)
+    c = conn.cursor()
+
     # ── Verify: print table names and row counts ──
-    tables = [
-        'mgmt_report_kpis',
-        'mgmt_report_tenants',
-        'mgmt_report_arrears',
-        'data_source_variances',
-        'mgmt_report_solar_pv',
-    ]
     print("Tables in guarantor_analysis.db:")
-    for table in tables:
+    for table in TABLES:
         c.execute(f'SELECT COUNT(*) FROM {table}')
         count = c.fetchone()[0]
         print(f"  {table}: {count} rows")
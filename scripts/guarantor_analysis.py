@@ -15,10 +15,24 @@ Output: analysis dict per entity, suitable for UI rendering or reporting
 Can be used standalone (CLI) or imported into app.py.
 """
 
+import copy
+import hashlib
 import json
 import math
+import os
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
+
+try:
+    import guarantor_store
+except ImportError:
+    guarantor_store = None
 
 
 # ============================================================================
@@ -1433,38 +1447,231 @@ def analyse_entity(entity_name: str, afs_data: Optional[dict], mgmt_data: Option
     story = generate_story(entity_name, lifecycle, is_analysis, bs_analysis,
                           mgmt_report_analysis=mr_analysis)
 
-    # Co-ownership consolidation
-    co_ownership = None
-    co_config = (entity_config or {}).get("co_ownership")
-    if co_config:
-        co_ownership = compute_co_ownership_consolidated(
-            entity_afs=afs_data, co_owner_afs=co_owner_afs_data,
-            entity_mgmt=mgmt_data, co_owner_mgmt=co_owner_mgmt_data,
-            ownership_pct=co_config.get("ownership_pct", 50),
-            lifecycle_signals=lifecycle.get("signals", {}))
-        if co_ownership:
-            # If consolidated IC >= 1.0 but entity IC < 1.0, flag for upgrade
-            if (co_ownership.get("consolidated_ic") and
-                    co_ownership["consolidated_ic"] >= 1.0 and
-                    not lifecycle["signals"].get("covers_fc")):
-                lifecycle["signals"]["co_own_upgrade"] = True
-                lifecycle["stage"] = "cash_generating"
-                lifecycle["label"] = LIFECYCLE_STAGES["cash_generating"]["label"]
-                lifecycle["color"] = LIFECYCLE_STAGES["cash_generating"]["color"]
-                lifecycle["detail"] += (" [CO-OWN] Consolidated IC "
-                                        f"{co_ownership['consolidated_ic']:.2f}x — "
-                                        "entity carries 100% debt but receives only "
-                                        f"{co_config.get('ownership_pct', 50)}% income.")
-
-    return {
+    result = {
         "entity": entity_name,
         "lifecycle": lifecycle,
         "is_analysis": is_analysis,
         "bs_analysis": bs_analysis,
         "mr_analysis": mr_analysis,
-        "co_ownership": co_ownership,
+        "co_ownership": None,
         "story": story,
     }
+    co_config = (entity_config or {}).get("co_ownership")
+    if co_config:
+        _apply_co_ownership(result, co_config, afs_data, mgmt_data, co_owner_afs_data, co_owner_mgmt_data)
+    return result
+
+
+def _apply_co_ownership(result: dict, co_config: dict, afs_data: Optional[dict], mgmt_data: Optional[dict],
+                        co_owner_afs_data: Optional[dict], co_owner_mgmt_data: Optional[dict]) -> None:
+    """Attach consolidated co-ownership metrics to an analyse_entity() result (in place).
+
+    Upgrades the lifecycle to cash_generating when consolidated IC >= 1.0 but
+    the entity alone does not cover its finance costs.
+    """
+    lifecycle = result["lifecycle"]
+    co_ownership = compute_co_ownership_consolidated(
+        entity_afs=afs_data, co_owner_afs=co_owner_afs_data,
+        entity_mgmt=mgmt_data, co_owner_mgmt=co_owner_mgmt_data,
+        ownership_pct=co_config.get("ownership_pct", 50),
+        lifecycle_signals=lifecycle.get("signals", {}))
+    result["co_ownership"] = co_ownership
+    if co_ownership:
+        # If consolidated IC >= 1.0 but entity IC < 1.0, flag for upgrade
+        if (co_ownership.get("consolidated_ic") and
+                co_ownership["consolidated_ic"] >= 1.0 and
+                not lifecycle["signals"].get("covers_fc")):
+            lifecycle["signals"]["co_own_upgrade"] = True
+            lifecycle["stage"] = "cash_generating"
+            lifecycle["label"] = LIFECYCLE_STAGES["cash_generating"]["label"]
+            lifecycle["color"] = LIFECYCLE_STAGES["cash_generating"]["color"]
+            lifecycle["detail"] += (" [CO-OWN] Consolidated IC "
+                                    f"{co_ownership['consolidated_ic']:.2f}x — "
+                                    "entity carries 100% debt but receives only "
+                                    f"{co_config.get('ownership_pct', 50)}% income.")
+
+
+# ============================================================================
+# Batch Mode
+# ============================================================================
+#
+# analyse_batch() runs many entities at once: each entity's base analysis is
+# memoised on a digest of its input JSONs (plus name and adjustment config),
+# cache misses run in a process pool, and co-ownership consolidation is
+# applied once per co-owned entity afterwards in the parent — so editing a
+# co-owner's AFS only re-consolidates, and the base analysis of an unchanged
+# entity is never recomputed.
+
+ANALYSIS_CACHE_SIZE = 256
+
+_ANALYSIS_CACHE: "OrderedDict[str, dict]" = OrderedDict()
+_ANALYSIS_LOCK = threading.Lock()
+
+def input_digest(entity_name: str, *docs, entity_config: Optional[dict] = None) -> str:
+    """sha1 over an entity's name, input JSONs and adjustment config.
+
+    Parsed JSON is hashed via pickle (3-4x cheaper than json.dumps); documents
+    parsed from identical files pickle identically, and a key-order difference
+    only costs a cache miss.
+    """
+    h = hashlib.sha1(entity_name.encode())
+    for part in (*docs, entity_config):
+        h.update(pickle.dumps(part, protocol=5))
+    return h.hexdigest()
+
+
+def clear_analysis_cache() -> None:
+    with _ANALYSIS_LOCK:
+        _ANALYSIS_CACHE.clear()
+
+
+def _base_job(job: dict) -> tuple[str, dict]:
+    """(digest, analyse_entity kwargs) for a job's base analysis — co-ownership stripped."""
+    config = {k: v for k, v in (job.get("entity_config") or {}).items() if k != "co_ownership"} or None
+    kwargs = {
+        "entity_name": job["entity_name"],
+        "afs_data": job.get("afs_data"),
+        "mgmt_data": job.get("mgmt_data"),
+        "mgmt_report_data": job.get("mgmt_report_data"),
+        "entity_config": config,
+    }
+    digest = input_digest(kwargs["entity_name"], kwargs["afs_data"], kwargs["mgmt_data"],
+                          kwargs["mgmt_report_data"], entity_config=config)
+    return digest, kwargs
+
+
+def _cached(digest: str) -> Optional[dict]:
+    with _ANALYSIS_LOCK:
+        hit = _ANALYSIS_CACHE.get(digest)
+        if hit is not None:
+            _ANALYSIS_CACHE.move_to_end(digest)
+        return hit
+
+
+def _remember(digest: str, result: dict) -> None:
+    with _ANALYSIS_LOCK:
+        _ANALYSIS_CACHE[digest] = result
+        _ANALYSIS_CACHE.move_to_end(digest)
+        while len(_ANALYSIS_CACHE) > ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+
+
+def _analyse_worker(kwargs: dict) -> dict:
+    return analyse_entity(**kwargs)
+
+
+def analyse_batch(jobs: dict, workers: Optional[int] = 1) -> dict:
+    """Analyse many entities; returns {job key: analyse_entity() result}.
+
+    jobs: {key: {"entity_name": str, plus any analyse_entity keyword argument}}.
+    A job may name another job as "co_owner" instead of passing the co-owner's
+    data.  workers=None uses one process per CPU; workers <= 1 runs in-process.
+    Results are fresh copies — callers may mutate them.
+    """
+    keyed = {key: _base_job(job) for key, job in jobs.items()}
+    misses = {}
+    for key, (digest, kwargs) in keyed.items():
+        if _cached(digest) is None:
+            misses.setdefault(digest, kwargs)
+
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if misses and workers > 1 and len(misses) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(misses))) as pool:
+                for digest, result in zip(misses, pool.map(_analyse_worker, misses.values())):
+                    _remember(digest, result)
+            misses = {}
+        except (OSError, BrokenProcessPool):           # no fork / sandboxed: run in-process
+            pass
+    for digest, kwargs in misses.items():
+        _remember(digest, analyse_entity(**kwargs))
+
+    results = {key: copy.deepcopy(_cached(digest) or analyse_entity(**kwargs))
+               for key, (digest, kwargs) in keyed.items()}
+
+    # Co-ownership consolidation, once per co-owned entity
+    for key, job in jobs.items():
+        co_config = (job.get("entity_config") or {}).get("co_ownership")
+        if not co_config:
+            continue
+        co_job = jobs.get(job.get("co_owner"), {})
+        _apply_co_ownership(results[key], co_config, job.get("afs_data"), job.get("mgmt_data"),
+                            job.get("co_owner_afs_data") or co_job.get("afs_data"),
+                            job.get("co_owner_mgmt_data") or co_job.get("mgmt_data"))
+    return results
+
+
+def analyse_entity_cached(entity_name: str, afs_data: Optional[dict], mgmt_data: Optional[dict],
+                          mgmt_report_data: Optional[dict] = None, **kwargs) -> dict:
+    """analyse_entity() through the batch memo (same arguments and result)."""
+    job = {"entity_name": entity_name, "afs_data": afs_data, "mgmt_data": mgmt_data,
+           "mgmt_report_data": mgmt_report_data, **kwargs}
+    return analyse_batch({entity_name: job})[entity_name]
+
+
+def hierarchy_docs(root: Optional[Path] = None) -> Mapping:
+    """{json stem: parsed JSON} for every *_structured.json under root (default data/guarantor).
+
+    When the statement store (scripts/guarantor_store.py) is built and current
+    for every folder, this is its lazy DocumentMap, so hierarchy_jobs decodes
+    only the documents the hierarchy names; otherwise the files are parsed.
+    """
+    root = Path(root) if root is not None else Path(__file__).resolve().parent.parent / "data" / "guarantor"
+    folders = [root, *sorted(p for p in root.rglob("*") if p.is_dir())] if root.is_dir() else []
+    store = guarantor_store.open_readonly() if guarantor_store is not None else None
+    if store is not None:
+        try:
+            if folders and all(store.is_current(f) for f in folders):
+                return store.document_map(folders)
+        except sqlite3.Error:
+            pass
+        store.close()
+    docs = {}
+    for folder in folders:
+        for path in sorted(folder.glob("*_structured.json")):
+            if path.stem not in docs:
+                docs[path.stem] = _load_json(path)
+    return docs
+
+
+def hierarchy_jobs(guarantor_config: dict, docs: Mapping, mgmt_docs: Optional[dict] = None,
+                   groups: Optional[list] = None) -> dict:
+    """Batch jobs for every entity with an AFS JSON in the guarantor.json hierarchy.
+
+    docs: {json stem: parsed JSON} holding AFS and mgmt-report JSONs (nodes'
+    "json" / "mgmt_report" keys), e.g. hierarchy_docs(); only the documents
+    the hierarchy names are looked up.  mgmt_docs: {AFS stem: management
+    accounts}.  Adjustment configs resolve to AFS stems; co-owners are linked
+    by job key.
+    """
+    mgmt_docs = mgmt_docs or {}
+    nodes = []
+    for group_key, group in guarantor_config.get("groups", {}).items():
+        if groups is None or group_key in groups:
+            nodes.extend(_flatten_children(group.get("holding", {})))
+            nodes.extend(group.get("siblings", []))
+    stems = {n["json"]: n for n in nodes if n.get("json") in docs}
+
+    entity_configs = {}
+    for cfg_key, cfg in _build_entity_configs(guarantor_config).items():
+        stem = _map_config_key_to_afs_key(cfg_key, stems)
+        if stem:
+            entity_configs[stem] = cfg
+
+    jobs = {}
+    for stem, node in stems.items():
+        afs = docs[stem]
+        config = entity_configs.get(stem)
+        co_key = ((config or {}).get("co_ownership") or {}).get("co_owner_key")
+        jobs[stem] = {
+            "entity_name": afs.get("metadata", {}).get("entity", {}).get("legal_name", stem),
+            "afs_data": afs,
+            "mgmt_data": mgmt_docs.get(stem),
+            "mgmt_report_data": docs.get(node.get("mgmt_report")),
+            "entity_config": config,
+            "co_owner": _map_config_key_to_afs_key(co_key, stems) if co_key else None,
+        }
+    return jobs
 
 
 # ============================================================================
@@ -1519,7 +1726,14 @@ def _map_config_key_to_afs_key(config_key: str, afs_map: dict) -> Optional[str]:
 
 def main():
     """Analyse all entities using AFS + management accounts + config adjustments."""
+    import argparse
     import sys
+
+    parser = argparse.ArgumentParser(description="Guarantor financial analysis (batch).")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: one per CPU; 1 = in-process).")
+    args = parser.parse_args()
+
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent / "scripts"))
     import re_extract_mgmt_accounts as extractor
 
@@ -1554,7 +1768,7 @@ def main():
         mgmt_cache[mgmt_key] = _load_json(mgmt_path)
 
     # Analyse each entity in AFS_MAP (superset of FILE_MAP)
-    results = []
+    jobs, groups = {}, {}
     for afs_key, (afs_path, grp, has_mgmt) in extractor.AFS_MAP.items():
         afs_data = afs_cache.get(afs_key)
         mgmt_data = mgmt_cache.get(afs_key)
@@ -1604,10 +1818,17 @@ def main():
             meta = mgmt_data.get("metadata", {}).get("entity", {})
             entity_name = meta.get("legal_name", afs_key)
 
-        result = analyse_entity(
-            entity_name, afs_data=afs_data, mgmt_data=mgmt_data,
-            mgmt_report_data=mgmt_report_data, entity_config=ent_config,
-            co_owner_afs_data=co_owner_afs, co_owner_mgmt_data=co_owner_mgmt)
+        jobs[afs_key] = {
+            "entity_name": entity_name, "afs_data": afs_data, "mgmt_data": mgmt_data,
+            "mgmt_report_data": mgmt_report_data, "entity_config": ent_config,
+            "co_owner_afs_data": co_owner_afs, "co_owner_mgmt_data": co_owner_mgmt,
+        }
+        groups[afs_key] = grp
+
+    batch = analyse_batch(jobs, workers=args.workers)
+    results = []
+    for afs_key, result in batch.items():
+        grp, entity_name = groups[afs_key], result["entity"]
         results.append((afs_key, grp, result))
 
         lc = result["lifecycle"]
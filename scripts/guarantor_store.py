@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""Indexed SQLite store for guarantor structured JSON (AFS, mgmt accounts, Broll reports).
+
+Run: python3 scripts/guarantor_store.py [folder ...]
+
+Each *_structured.json is ingested once per content hash into
+data/guarantor_statements.db:
+  - documents:  one row per file (path, folder, entity, group, period labels,
+                sha1, zlib-compressed body)
+  - line_items: one row per statement leaf with a "values" array, keyed by
+                (document, statement, account path, period index)
+
+Re-ingest is incremental: a file whose sha1 is unchanged is not re-parsed,
+changed files replace their line items in one transaction, and files that
+disappeared from an ingested folder are dropped.
+
+The store is built offline (this script); readers open it read-only and
+never sync.  is_current() compares the stored name / size / mtime of a
+folder's files with a stat of the disk, so a reader falls back to the JSON
+files when the store is missing or out of date.  Statements read back as
+slices (GuarantorStore.statements) keep the same nested {"values": [...]}
+layout as the source JSON, and document_map() decodes a body only when it
+is looked up:
+
+    store = open_readonly()
+    if store is not None and store.is_current(folder):
+        vph = store.statements(path, ("statement_of_financial_position",))
+        docs = store.document_map(folder)
+        rows = store.line_items(statement="statement_of_financial_position",
+                                account="assets/total_assets", period=0)
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+MODEL_DIR = Path(__file__).resolve().parent.parent
+DB_PATH = MODEL_DIR / "data" / "guarantor_statements.db"
+GUARANTOR_DIR = MODEL_DIR / "data" / "guarantor"
+# Local-dev source tree (AFS, mgmt accounts, Broll reports); absent on deploys
+CONTEXT_DIR = MODEL_DIR.parent.parent / "context" / "Guarantor"
+
+# Top-level keys that are not statements (never normalised into line items)
+_SKIP_SECTIONS = {"metadata", "data_quality_notes"}
+
+
+# ── Schema ──────────────────────────────────────────────────────
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id               INTEGER PRIMARY KEY,
+    path             TEXT    NOT NULL UNIQUE,
+    folder           TEXT    NOT NULL,
+    name             TEXT    NOT NULL,
+    entity           TEXT,
+    guarantor_group  TEXT,
+    doc_type         TEXT,
+    periods_json     TEXT    NOT NULL DEFAULT '[]',
+    sha1             TEXT    NOT NULL,
+    size             INTEGER,
+    mtime_ns         INTEGER,
+    body             BLOB    NOT NULL,
+    ingested_at      TEXT    DEFAULT (datetime('now'))
+);
+CREATE TABLE IF NOT EXISTS line_items (
+    doc_id     INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    statement  TEXT    NOT NULL,
+    account    TEXT    NOT NULL,
+    period     INTEGER NOT NULL,
+    value      REAL,
+    PRIMARY KEY (doc_id, statement, account, period)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_documents_folder ON documents (folder, name);
+CREATE INDEX IF NOT EXISTS ix_documents_entity ON documents (entity);
+CREATE INDEX IF NOT EXISTS ix_line_items_account ON line_items (statement, account, period);
+"""
+
+
+def _pack(doc) -> bytes:
+    return zlib.compress(json.dumps(doc, separators=(",", ":")).encode(), 6)
+
+
+def _unpack(blob: bytes):
+    return json.loads(zlib.decompress(blob))
+
+
+def line_items(doc: dict) -> Iterator[tuple[str, str, int, float | None]]:
+    """(statement, account path, period index, value) for every "values" leaf."""
+    def _walk(node, path: tuple[str, ...]):
+        if isinstance(node, dict):
+            values = node.get("values")
+            if isinstance(values, list):
+                for i, v in enumerate(values):
+                    yield path[0], "/".join(path[1:]), i, v if isinstance(v, (int, float)) else None
+                return
+            for key, child in node.items():
+                yield from _walk(child, path + (key,))
+
+    for section, node in doc.items():
+        if section not in _SKIP_SECTIONS:
+            yield from _walk(node, (section,))
+
+
+def _nest(rows: Iterable) -> dict:
+    """Rebuild {statement: nested {"values": [...]}} from (statement, account, period, value)."""
+    out: dict = {}
+    for statement, account, period, value in rows:
+        node = out.setdefault(statement, {})
+        for key in account.split("/") if account else ():
+            node = node.setdefault(key, {})
+        values = node.setdefault("values", [])
+        values.extend([None] * (period + 1 - len(values)))
+        values[period] = value
+    return out
+
+
+@dataclass
+class IngestStats:
+    """Per-call ingest counters."""
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    errors: list[tuple[str, str]] = field(default_factory=list)
+    elapsed_s: float = 0.0
+
+
+class DocumentMap(Mapping):
+    """{stem: parsed JSON} over stored files; a body is decoded on first lookup."""
+
+    def __init__(self, conn: sqlite3.Connection, ids: dict[str, int]) -> None:
+        self._conn = conn
+        self._ids = ids
+        self._docs: dict[str, dict] = {}
+
+    def __getitem__(self, stem: str):
+        if stem not in self._docs:
+            row = self._conn.execute("SELECT body FROM documents WHERE id = ?", (self._ids[stem],)).fetchone()
+            self._docs[stem] = _unpack(row[0])
+        return self._docs[stem]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+# ── Store ───────────────────────────────────────────────────────
+
+
+class GuarantorStore:
+    """SQLite store of guarantor statements with incremental, hash-keyed ingest.
+
+    readonly=True opens an existing store for queries only (no schema
+    writes, no ingest); see open_readonly().
+    """
+
+    def __init__(self, path: str | Path = DB_PATH, readonly: bool = False) -> None:
+        self.path = Path(path)
+        if readonly:
+            self._conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True,
+                                         check_same_thread=False)
+            return
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        # Stores built before size / mtime_ns were tracked
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(documents)")}
+        for column in ("size", "mtime_ns"):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE documents ADD COLUMN {column} INTEGER")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "GuarantorStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ── Ingest ──
+
+    def _ingest(self, path: Path, stats: IngestStats) -> None:
+        st = path.stat()
+        blob = path.read_bytes()
+        sha1 = hashlib.sha1(blob).hexdigest()
+        row = self._conn.execute("SELECT id, sha1 FROM documents WHERE path = ?", (str(path),)).fetchone()
+        if row is not None and row[1] == sha1:
+            # Touched but identical: refresh the stat so is_current() holds
+            self._conn.execute("UPDATE documents SET size=?, mtime_ns=? WHERE id=?",
+                               (st.st_size, st.st_mtime_ns, row[0]))
+            stats.unchanged += 1
+            return
+        try:
+            doc = json.loads(blob)
+        except json.JSONDecodeError as exc:
+            stats.errors.append((str(path), f"JSONDecodeError: {exc}"))
+            return
+        meta = doc.get("metadata", {}) if isinstance(doc, dict) else {}
+        entity = meta.get("entity", {}) if isinstance(meta.get("entity"), dict) else {}
+        values = (str(path), str(path.parent), path.name, entity.get("legal_name"),
+                  meta.get("guarantor_group") or entity.get("guarantor_group"),
+                  meta.get("document_type"), json.dumps(meta.get("presentation_columns") or []),
+                  sha1, st.st_size, st.st_mtime_ns, _pack(doc))
+        cur = self._conn.cursor()
+        if row is None:
+            cur.execute(
+                "INSERT INTO documents (path, folder, name, entity, guarantor_group, doc_type, "
+                "periods_json, sha1, size, mtime_ns, body) VALUES (?,?,?,?,?,?,?,?,?,?,?)", values)
+            doc_id = cur.lastrowid
+            stats.added += 1
+        else:
+            doc_id = row[0]
+            cur.execute(
+                "UPDATE documents SET path=?, folder=?, name=?, entity=?, guarantor_group=?, doc_type=?, "
+                "periods_json=?, sha1=?, size=?, mtime_ns=?, body=?, ingested_at=datetime('now') WHERE id=?", (*values, doc_id))
+            cur.execute("DELETE FROM line_items WHERE doc_id = ?", (doc_id,))
+            stats.updated += 1
+        if isinstance(doc, dict):
+            cur.executemany(
+                "INSERT OR REPLACE INTO line_items (doc_id, statement, account, period, value) "
+                "VALUES (?,?,?,?,?)",
+                ((doc_id, *item) for item in line_items(doc)),
+            )
+
+    def ingest(self, folder: str | Path, pattern: str = "*_structured.json") -> IngestStats:
+        """Ingest folder/pattern in one transaction; unchanged files are not parsed."""
+        started = time.perf_counter()
+        folder = Path(folder).resolve()
+        stats = IngestStats()
+        paths = sorted(folder.glob(pattern)) if folder.is_dir() else []
+        with self._conn:
+            for path in paths:
+                try:
+                    self._ingest(path, stats)
+                except OSError as exc:                     # vanished or unreadable mid-ingest
+                    stats.errors.append((str(path), f"{type(exc).__name__}: {exc}"))
+            present = {str(p) for p in paths}
+            gone = [(doc_id,) for doc_id, path, name in self._conn.execute(
+                        "SELECT id, path, name FROM documents WHERE folder = ?", (str(folder),))
+                    if fnmatch.fnmatchcase(name, pattern) and path not in present]
+            self._conn.executemany("DELETE FROM documents WHERE id = ?", gone)
+            stats.removed = len(gone)
+        stats.elapsed_s = time.perf_counter() - started
+        return stats
+
+    def ingest_file(self, path: str | Path) -> IngestStats:
+        stats = IngestStats()
+        with self._conn:
+            self._ingest(Path(path).resolve(), stats)
+        return stats
+
+    # ── Reads ──
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def is_current(self, folder: str | Path, pattern: str = "*_structured.json") -> bool:
+        """True if the stored folder/pattern files match the disk by name, size and mtime.
+
+        A stat per file, no reads: cheap enough to call on every render.
+        """
+        folder = Path(folder).resolve()
+        on_disk = set()
+        for path in (folder.glob(pattern) if folder.is_dir() else ()):
+            st = path.stat()
+            on_disk.add((path.name, st.st_size, st.st_mtime_ns))
+        stored = {(name, size, mtime_ns) for name, size, mtime_ns in self._conn.execute(
+                      "SELECT name, size, mtime_ns FROM documents WHERE folder = ?", (str(folder),))
+                  if fnmatch.fnmatchcase(name, pattern)}
+        return on_disk == stored
+
+    def document_map(self, folders: str | Path | Iterable[str | Path],
+                     pattern: str = "*_structured.json") -> DocumentMap:
+        """Lazy {stem: parsed JSON} over the stored files in folder(s) matching pattern.
+
+        The first folder wins on a duplicate stem.  The map reads through this
+        store's connection, so use it before close().
+        """
+        if isinstance(folders, (str, Path)):
+            folders = [folders]
+        ids: dict[str, int] = {}
+        for folder in folders:
+            for doc_id, name in self._conn.execute(
+                    "SELECT id, name FROM documents WHERE folder = ? ORDER BY name",
+                    (str(Path(folder).resolve()),)):
+                if fnmatch.fnmatchcase(name, pattern):
+                    ids.setdefault(Path(name).stem, doc_id)
+        return DocumentMap(self._conn, ids)
+
+    def documents(self, folder: str | Path, pattern: str = "*_structured.json") -> dict[str, dict]:
+        """{stem: parsed JSON} for the stored files in folder matching pattern."""
+        return dict(self.document_map(folder, pattern))
+
+    def document(self, path: str | Path):
+        row = self._conn.execute(
+            "SELECT body FROM documents WHERE path = ?", (str(Path(path).resolve()),)).fetchone()
+        return _unpack(row[0]) if row else None
+
+    def periods(self, path: str | Path) -> list[str]:
+        """Period labels (metadata.presentation_columns) of one file."""
+        row = self._conn.execute(
+            "SELECT periods_json FROM documents WHERE path = ?", (str(Path(path).resolve()),)).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def statements(self, path: str | Path, statements: Iterable[str]) -> dict:
+        """Only the named statements of one file, as nested {"values": [...]} trees."""
+        statements = list(statements)
+        rows = self._conn.execute(
+            f"SELECT li.statement, li.account, li.period, li.value FROM line_items li "
+            f"JOIN documents d ON d.id = li.doc_id "
+            f"WHERE d.path = ? AND li.statement IN ({', '.join('?' * len(statements))}) "
+            f"ORDER BY li.statement, li.account, li.period",
+            (str(Path(path).resolve()), *statements),
+        )
+        return _nest(rows)
+
+    def line_items(
+        self,
+        *,
+        statement: str | None = None,
+        account: str | None = None,
+        period: int | None = None,
+        entity: str | None = None,
+        folder: str | Path | None = None,
+    ) -> list[tuple]:
+        """(entity, file name, statement, account, period, value) rows matching every given filter."""
+        terms, params = [], []
+        for column, value in (("li.statement", statement), ("li.account", account),
+                              ("li.period", period), ("d.entity", entity)):
+            if value is not None:
+                terms.append(f"{column} = ?")
+                params.append(value)
+        if folder is not None:
+            terms.append("d.folder = ?")
+            params.append(str(Path(folder).resolve()))
+        where = " WHERE " + " AND ".join(terms) if terms else ""
+        return self._conn.execute(
+            "SELECT d.entity, d.name, li.statement, li.account, li.period, li.value "
+            "FROM line_items li JOIN documents d ON d.id = li.doc_id" + where +
+            " ORDER BY d.name, li.statement, li.account, li.period", params,
+        ).fetchall()
+
+
+def open_readonly(path: str | Path = DB_PATH) -> GuarantorStore | None:
+    """The built store opened read-only, or None when it has not been built."""
+    if not Path(path).is_file():
+        return None
+    try:
+        return GuarantorStore(path, readonly=True)
+    except sqlite3.Error:
+        return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ingest guarantor structured JSON into SQLite.")
+    parser.add_argument("folders", nargs="*",
+                        help="Folders to ingest (default: data/guarantor and the context tree, with subfolders).")
+    parser.add_argument("--db", default=str(DB_PATH))
+    args = parser.parse_args(argv)
+
+    folders = [Path(f) for f in args.folders] or \
+        [p for root in (GUARANTOR_DIR, CONTEXT_DIR) if root.is_dir()
+         for p in (root, *sorted(d for d in root.rglob("*") if d.is_dir()))]
+    with GuarantorStore(args.db) as store:
+        for folder in folders:
+            s = store.ingest(folder)
+            print(f"{folder}: +{s.added} ~{s.updated} ={s.unchanged} -{s.removed} "
+                  f"({s.elapsed_s * 1000:.0f} ms)")
+            for path, error in s.errors:
+                print(f"  ! {path}: {error}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,27 +1,46 @@
 #!/usr/bin/env python3
 """Populate SQLite management report tables from extracted JSON files.
 
-Run: python3 scripts/populate_mgmt_report_db.py
+Run: python3 scripts/populate_mgmt_report_db.py [folder ...] [--db PATH] [--force]
 
 Reads *_mgmt_report_structured.json files from context/Guarantor/Phoenix group/
-and inserts into data/guarantor_analysis.db tables:
+(falling back to data/guarantor/Phoenix group/) and upserts into
+data/guarantor_analysis.db tables:
   - mgmt_report_kpis
   - mgmt_report_tenants
   - mgmt_report_arrears
   - data_source_variances
   - mgmt_report_solar_pv
+  - mgmt_report_monthly_kpis   (summary, rebuilt for touched entities)
+
+Ingestion is incremental: each file's sha1 is recorded in mgmt_report_sources
+and unchanged files are skipped without parsing.  Changed reports replace
+their (entity_key, report_date) rows with executemany in one transaction,
+and the monthly summary is refreshed in the same transaction.  Two files
+with the same (entity_key, report_date) do not double the rows: the last
+file (in scan order) wins.  Sources whose files are gone from the scanned
+folders are pruned, with their rows unless another file still provides them.
 """
+import hashlib
 import json
 import os
 import sqlite3
+import sys
 from pathlib import Path
 
+from add_mgmt_report_tables import MONTHLY_TREND_COLUMNS, create_tables
+
 SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 MODEL_DIR = SCRIPT_DIR.parent
 DB_DIR = MODEL_DIR / "data"
 DB_PATH = DB_DIR / "guarantor_analysis.db"
 PROJECT_ROOT = MODEL_DIR.parent.parent
 CONTEXT_DIR = PROJECT_ROOT / "context" / "Guarantor" / "Phoenix" / "Structured Data" / "Broll Reports"
+FALLBACK_DIR = MODEL_DIR / "data" / "guarantor" / "Phoenix group"
+
+DETAIL_TABLES = ["mgmt_report_tenants", "mgmt_report_arrears",
+                 "data_source_variances", "mgmt_report_solar_pv"]
+REPORT_TABLES = ["mgmt_report_kpis"] + DETAIL_TABLES
 
 
 def _sf(v):
@@ -34,8 +53,55 @@ def _sf(v):
         return None
 
 
-def populate_kpis(cursor, entity_key, report_date, mr_data, mr_analysis):
-    """Insert or replace a row in mgmt_report_kpis."""
+# ── Row builders ──
+# One tuple per row, in the column order of the matching INSERT below.
+
+KPI_SQL = """
+    INSERT OR REPLACE INTO mgmt_report_kpis (
+        entity_key, entity_name, report_date, guarantor_group,
+        total_gla_m2, vacancy_rate_pct, vacancy_gla_m2, collections_pct,
+        trading_density_per_m2, net_income_ytd, net_income_budget, net_income_variance,
+        noi, finance_costs, property_net_income_monthly,
+        national_tenant_pct, anchor_count, lease_expiry_12m_pct, weighted_escalation,
+        utility_recovery_composite, has_solar_pv, has_active_capex,
+        solar_kwp, solar_savings_ytd, quality_score, quality_flags,
+        capex_ytd, arrears_total, tenant_count
+    ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+
+TENANT_SQL = """
+    INSERT INTO mgmt_report_tenants (
+        entity_key, report_date, tenant_name, trading_name,
+        gla_m2, lease_start, lease_end, rental_monthly,
+        rental_per_m2, escalation_pct, tenant_type, renewal_status
+    ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+
+ARREARS_SQL = """
+    INSERT INTO mgmt_report_arrears (
+        entity_key, report_date, tenant_name, amount,
+        days_outstanding, status, action, deposit_held
+    ) VALUES (?,?,?,?,?,?,?,?)
+"""
+
+VARIANCE_SQL = """
+    INSERT INTO data_source_variances (
+        entity_key, report_date, variance_type,
+        source_a, source_b, source_a_value, source_b_value,
+        difference, explanation, severity
+    ) VALUES (?,?,?,?,?,?,?,?,?,?)
+"""
+
+SOLAR_SQL = """
+    INSERT INTO mgmt_report_solar_pv (
+        entity_key, report_date, month,
+        target_kwh, actual_kwh, savings_rand
+    ) VALUES (?,?,?,?,?,?)
+"""
+
+
+def kpi_row(entity_key, report_date, mr_data, mr_analysis):
+    """mgmt_report_kpis row for one report."""
     ds = mr_data.get("derived_signals", {})
     pd = mr_data.get("property_details", {})
     ls = mr_data.get("leasing_summary", {})
@@ -52,18 +118,7 @@ def populate_kpis(cursor, entity_key, report_date, mr_data, mr_analysis):
     noi_item = isp.get("NOI", {})
     fc_item = isp.get("finance_costs", {})
 
-    cursor.execute("""
-        INSERT OR REPLACE INTO mgmt_report_kpis (
-            entity_key, entity_name, report_date, guarantor_group,
-            total_gla_m2, vacancy_rate_pct, vacancy_gla_m2, collections_pct,
-            trading_density_per_m2, net_income_ytd, net_income_budget, net_income_variance,
-            noi, finance_costs, property_net_income_monthly,
-            national_tenant_pct, anchor_count, lease_expiry_12m_pct, weighted_escalation,
-            utility_recovery_composite, has_solar_pv, has_active_capex,
-            solar_kwp, solar_savings_ytd, quality_score, quality_flags,
-            capex_ytd, arrears_total, tenant_count
-        ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-    """, (
+    return (
         entity_key, entity_name, report_date, group,
         _sf(pd.get("total_gla_m2")),
         _sf(ls.get("vacancy_rate_pct")),
@@ -90,52 +145,42 @@ def populate_kpis(cursor, entity_key, report_date, mr_data, mr_analysis):
         _sf(isp.get("capex", {}).get("actual") if isinstance(isp.get("capex"), dict) else None),
         _sf(ao.get("total")),
         pd.get("tenant_count"),
-    ))
+    )
 
 
-def populate_tenants(cursor, entity_key, report_date, mr_data):
-    """Insert tenant rows."""
-    tenants = mr_data.get("tenant_data", [])
-    for t in tenants:
-        if not t.get("name"):
-            continue
-        cursor.execute("""
-            INSERT INTO mgmt_report_tenants (
-                entity_key, report_date, tenant_name, trading_name,
-                gla_m2, lease_start, lease_end, rental_monthly,
-                rental_per_m2, escalation_pct, tenant_type, renewal_status
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
-        """, (
+def tenant_rows(entity_key, report_date, mr_data):
+    """mgmt_report_tenants rows (rent roll)."""
+    return [
+        (
             entity_key, report_date,
             t.get("name"), t.get("trading_name"),
             _sf(t.get("gla_m2")), t.get("lease_start"), t.get("lease_end"),
             _sf(t.get("rental_monthly")), _sf(t.get("rental_per_m2")),
             _sf(t.get("escalation_pct")), t.get("tenant_type"),
             t.get("renewal_status"),
-        ))
+        )
+        for t in mr_data.get("tenant_data", [])
+        if t.get("name")
+    ]
 
 
-def populate_arrears(cursor, entity_key, report_date, mr_data):
-    """Insert arrears detail rows."""
-    arrears = mr_data.get("arrears_detail", [])
-    for a in arrears:
-        if not a.get("tenant_name"):
-            continue
-        cursor.execute("""
-            INSERT INTO mgmt_report_arrears (
-                entity_key, report_date, tenant_name, amount,
-                days_outstanding, status, action, deposit_held
-            ) VALUES (?,?,?,?,?,?,?,?)
-        """, (
+def arrears_rows(entity_key, report_date, mr_data):
+    """mgmt_report_arrears rows (per-debtor arrears)."""
+    return [
+        (
             entity_key, report_date,
             a.get("tenant_name"), _sf(a.get("amount")),
             a.get("days_outstanding"), a.get("status"),
             a.get("action"), _sf(a.get("deposit_held")),
-        ))
+        )
+        for a in mr_data.get("arrears_detail", [])
+        if a.get("tenant_name")
+    ]
 
 
-def populate_variances(cursor, entity_key, report_date, mr_data):
-    """Insert data source variance rows."""
+def variance_rows(entity_key, report_date, mr_data):
+    """data_source_variances rows, with severity from the relative difference."""
+    rows = []
     variances = mr_data.get("variances", {})
     for vtype, vd in variances.items():
         if not isinstance(vd, dict):
@@ -156,51 +201,201 @@ def populate_variances(cursor, entity_key, report_date, mr_data):
             elif ref > 0 and abs(diff) / ref > 0.10:
                 severity = "medium"
 
-        cursor.execute("""
-            INSERT INTO data_source_variances (
-                entity_key, report_date, variance_type,
-                source_a, source_b, source_a_value, source_b_value,
-                difference, explanation, severity
-            ) VALUES (?,?,?,?,?,?,?,?,?,?)
-        """, (
+        rows.append((
             entity_key, report_date, vtype,
             vd.get("source_a"), vd.get("source_b"),
             _sf(vd.get("source_a_value")), _sf(vd.get("source_b_value")),
             _sf(diff), vd.get("explanation"), severity,
         ))
+    return rows
 
 
-def populate_solar(cursor, entity_key, report_date, mr_data):
-    """Insert solar PV monthly production rows."""
+def solar_rows(entity_key, report_date, mr_data):
+    """mgmt_report_solar_pv rows (monthly production)."""
     sp = mr_data.get("solar_pv", {})
     if not sp.get("has_solar"):
-        return
+        return []
+    rows = []
     monthly = sp.get("monthly_production", sp.get("monthly_production_kwh", []))
     for m in monthly:
         if not isinstance(m, dict) or not m.get("month"):
             continue
         target = m.get("target_kwh") or m.get("target")
         actual = m.get("actual_kwh") or m.get("actual")
-        cursor.execute("""
-            INSERT INTO mgmt_report_solar_pv (
-                entity_key, report_date, month,
-                target_kwh, actual_kwh, savings_rand
-            ) VALUES (?,?,?,?,?,?)
-        """, (
+        rows.append((
             entity_key, report_date, m.get("month"),
             _sf(target), _sf(actual),
             _sf(m.get("savings_rand")),
         ))
+    return rows
+
+
+# ── Upsert ──
+
 
+def report_key(mr_data, stem):
+    """(entity_key, report_date) a report's rows are stored under."""
+    meta = mr_data.get("metadata", {})
+    entity_key = meta.get("entity", {}).get("entity_key", stem)
+    report_date = meta.get("reporting_period", {}).get("end_date", "2025-12-31")
+    return entity_key, report_date
+
+
+def upsert_reports(conn, reports):
+    """Replace the rows of each (entity_key, report_date, mr_data, mr_analysis) report.
+
+    Runs inside the caller's transaction: one DELETE + one executemany INSERT
+    per table for the whole batch.  Reports sharing a key are deduplicated,
+    the last one wins.
+    """
+    reports = list({(ek, rd): (ek, rd, mr, an) for ek, rd, mr, an in reports}.values())
+    keys = [(ek, rd) for ek, rd, _, _ in reports]
+    for table in REPORT_TABLES:
+        conn.executemany(f"DELETE FROM {table} WHERE entity_key = ? AND report_date = ?", keys)
+    conn.executemany(KPI_SQL, [kpi_row(ek, rd, mr, an) for ek, rd, mr, an in reports])
+    for sql, build in ((TENANT_SQL, tenant_rows), (ARREARS_SQL, arrears_rows),
+                       (VARIANCE_SQL, variance_rows), (SOLAR_SQL, solar_rows)):
+        conn.executemany(sql, [row for ek, rd, mr, _ in reports for row in build(ek, rd, mr)])
+
+
+_MONTHLY_SQL = """
+    INSERT INTO mgmt_report_monthly_kpis (
+        entity_key, month, report_date, entity_name, guarantor_group,
+        vacancy_rate_pct, collections_pct, noi, net_income_ytd, finance_costs,
+        arrears_total, tenant_count, quality_score,
+        rent_roll_monthly, rent_roll_gla_m2, arrears_debtors, arrears_detail_total,
+        variances_high, solar_actual_kwh, solar_target_kwh, solar_savings_rand
+    )
+    SELECT k.entity_key, substr(k.report_date, 1, 7), k.report_date, k.entity_name, k.guarantor_group,
+           k.vacancy_rate_pct, k.collections_pct, k.noi, k.net_income_ytd, k.finance_costs,
+           k.arrears_total, k.tenant_count, k.quality_score,
+           t.rent, t.gla, a.debtors, a.total, v.high, s.actual, s.target, s.savings
+    FROM mgmt_report_kpis k
+    LEFT JOIN (SELECT report_date, SUM(rental_monthly) AS rent, SUM(gla_m2) AS gla
+               FROM mgmt_report_tenants WHERE entity_key = :ek GROUP BY report_date) t
+           ON t.report_date = k.report_date
+    LEFT JOIN (SELECT report_date, COUNT(*) AS debtors, SUM(amount) AS total
+               FROM mgmt_report_arrears WHERE entity_key = :ek GROUP BY report_date) a
+           ON a.report_date = k.report_date
+    LEFT JOIN (SELECT report_date, SUM(severity = 'high') AS high
+               FROM data_source_variances WHERE entity_key = :ek GROUP BY report_date) v
+           ON v.report_date = k.report_date
+    LEFT JOIN (SELECT report_date, SUM(actual_kwh) AS actual, SUM(target_kwh) AS target,
+                      SUM(savings_rand) AS savings
+               FROM mgmt_report_solar_pv WHERE entity_key = :ek GROUP BY report_date) s
+           ON s.report_date = k.report_date
+    WHERE k.entity_key = :ek
+      AND k.report_date = (SELECT MAX(k2.report_date) FROM mgmt_report_kpis k2
+                           WHERE k2.entity_key = k.entity_key
+                             AND substr(k2.report_date, 1, 7) = substr(k.report_date, 1, 7))
+"""
 
-def main():
-    if not DB_PATH.exists():
-        print(f"ERROR: Database not found at {DB_PATH}")
-        print("Run scripts/add_mgmt_report_tables.py first.")
-        return
+
+def refresh_monthly_kpis(conn, entity_keys):
+    """Rebuild mgmt_report_monthly_kpis for the given entities (caller's transaction)."""
+    params = [{"ek": ek} for ek in sorted(set(entity_keys))]
+    conn.executemany("DELETE FROM mgmt_report_monthly_kpis WHERE entity_key = :ek", params)
+    conn.executemany(_MONTHLY_SQL, params)
+
+
+def populate(conn, json_files, ga=None, force=False, folders=None):
+    """Ingest report files; unchanged ones (same sha1) are skipped without parsing.
+
+    Known sources under `folders` (default: the folders of json_files) that
+    are not in json_files are pruned.  Returns {"added", "updated",
+    "unchanged", "removed", "errors"} lists of file stems.
+    """
+    stats = {"added": [], "updated": [], "unchanged": [], "removed": [], "errors": []}
+    json_files = [Path(jf) for jf in json_files]
+    known = {path: (ek, rd, sha1) for path, ek, rd, sha1 in conn.execute(
+        "SELECT path, entity_key, report_date, sha1 FROM mgmt_report_sources")}
+    scanned = {str(Path(f)) for f in folders} if folders is not None else {str(jf.parent) for jf in json_files}
+    present = {str(jf) for jf in json_files}
+    gone = sorted(path for path in known if str(Path(path).parent) in scanned and path not in present)
+    reports, sources, stale, touched = [], [], [], set()
+    for path in gone:
+        stale.append(known[path][:2])
+        touched.add(known[path][0])
+        stats["removed"].append(Path(path).stem)
+    for jf in json_files:
+        blob = Path(jf).read_bytes()
+        sha1 = hashlib.sha1(blob).hexdigest()
+        previous = known.get(str(jf))
+        if previous and previous[2] == sha1 and not force:
+            stats["unchanged"].append(jf.stem)
+            continue
+        try:
+            mr_data = json.loads(blob)
+        except json.JSONDecodeError as exc:
+            stats["errors"].append(f"{jf.stem}: {exc}")
+            continue
+        entity_key, report_date = report_key(mr_data, jf.stem)
+        mr_analysis = ga.analyse_mgmt_report(mr_data) if ga else None
+        reports.append((entity_key, report_date, mr_data, mr_analysis))
+        sources.append((str(jf), entity_key, report_date, sha1))
+        touched.add(entity_key)
+        if previous and previous[:2] != (entity_key, report_date):
+            stale.append(previous[:2])                   # report re-dated or re-keyed
+            touched.add(previous[0])
+        stats["updated" if previous else "added"].append(jf.stem)
+
+    # A stale key keeps its rows while another file still provides it; an
+    # unchanged provider is re-read, since the rows may be the departed file's
+    after = {path: key[:2] for path, key in known.items() if path not in gone}
+    after.update((path, (ek, rd)) for path, ek, rd, _ in sources)
+    fresh = {path for path, _, _, _ in sources}
+    for path in sorted(p for p, key in after.items() if key in set(stale) and p not in fresh):
+        try:
+            mr_data = json.loads(Path(path).read_bytes())
+        except (OSError, json.JSONDecodeError) as exc:
+            stats["errors"].append(f"{Path(path).stem}: {exc}")
+            continue
+        entity_key, report_date = after[path]
+        reports.append((entity_key, report_date, mr_data, ga.analyse_mgmt_report(mr_data) if ga else None))
+    stale = sorted(set(stale) - set(after.values()))
+
+    if reports or gone:
+        with conn:
+            for table in REPORT_TABLES:
+                conn.executemany(f"DELETE FROM {table} WHERE entity_key = ? AND report_date = ?", stale)
+            upsert_reports(conn, reports)
+            conn.executemany("DELETE FROM mgmt_report_sources WHERE path = ?", [(p,) for p in gone])
+            conn.executemany(
+                "INSERT OR REPLACE INTO mgmt_report_sources (path, entity_key, report_date, sha1) "
+                "VALUES (?,?,?,?)", sources)
+            refresh_monthly_kpis(conn, touched)
+    return stats
+
+
+def monthly_kpis(conn, entity_key=None, group=None):
+    """Trend series from mgmt_report_monthly_kpis: (entity_key, month, *MONTHLY_TREND_COLUMNS).
+
+    Per-entity reads are served from the covering trend index.
+    """
+    terms, params = [], []
+    if entity_key is not None:
+        terms.append("entity_key = ?")
+        params.append(entity_key)
+    if group is not None:
+        terms.append("guarantor_group = ?")
+        params.append(group)
+    where = " WHERE " + " AND ".join(terms) if terms else ""
+    return conn.execute(
+        f"SELECT entity_key, month, {', '.join(MONTHLY_TREND_COLUMNS)} "
+        f"FROM mgmt_report_monthly_kpis{where} ORDER BY entity_key, month", params).fetchall()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Populate management report tables (incremental).")
+    parser.add_argument("folders", nargs="*", help="Folders of *_mgmt_report_structured.json "
+                                                    "(default: context Broll Reports, else data/guarantor/Phoenix group).")
+    parser.add_argument("--db", default=str(DB_PATH))
+    parser.add_argument("--force", action="store_true", help="Re-ingest reports even if unchanged.")
+    args = parser.parse_args(argv)
 
     # Import analysis engine for quality scoring
-    import sys
     sys.path.insert(0, str(SCRIPT_DIR))
     try:
         import guarantor_analysis as ga
@@ -208,71 +403,34 @@ def main():
         ga = None
         print("WARNING: guarantor_analysis module not found, quality scores will be null")
 
-    conn = sqlite3.connect(str(DB_PATH))
-    c = conn.cursor()
-
-    # Find all mgmt report JSONs
-    json_files = sorted(CONTEXT_DIR.glob("*_mgmt_report_structured.json"))
+    folders = [Path(f) for f in args.folders] or [CONTEXT_DIR if CONTEXT_DIR.exists() else FALLBACK_DIR]
+    json_files = sorted(jf for folder in folders for jf in folder.glob("*_mgmt_report_structured.json"))
     if not json_files:
-        print(f"No *_mgmt_report_structured.json files found in {CONTEXT_DIR}")
-        conn.close()
-        return
+        print(f"No *_mgmt_report_structured.json files found in {', '.join(map(str, folders))}")
+        if not Path(args.db).exists():
+            return                                         # else prune the departed sources
 
     print(f"Found {len(json_files)} management report JSONs")
-
-    for jf in json_files:
-        stem = jf.stem
-        print(f"\nProcessing: {stem}")
-
-        with open(jf, "r") as f:
-            mr_data = json.load(f)
-
-        meta = mr_data.get("metadata", {})
-        entity_key = meta.get("entity", {}).get("entity_key", stem)
-        rp = meta.get("reporting_period", {})
-        report_date = rp.get("end_date", "2025-12-31")
-
-        # Run analysis
-        mr_analysis = None
-        if ga:
-            mr_analysis = ga.analyse_mgmt_report(mr_data)
-            print(f"  Quality score: {mr_analysis.get('quality_score', 'N/A')}")
-            print(f"  Flags: {', '.join(mr_analysis.get('quality_flags', []))}")
-
-        # Clear existing data for this entity+date (idempotent)
-        for table in ["mgmt_report_kpis", "mgmt_report_tenants", "mgmt_report_arrears",
-                       "data_source_variances", "mgmt_report_solar_pv"]:
-            c.execute(f"DELETE FROM {table} WHERE entity_key = ? AND report_date = ?",
-                      (entity_key, report_date))
-
-        populate_kpis(c, entity_key, report_date, mr_data, mr_analysis)
-        populate_tenants(c, entity_key, report_date, mr_data)
-        populate_arrears(c, entity_key, report_date, mr_data)
-        populate_variances(c, entity_key, report_date, mr_data)
-        populate_solar(c, entity_key, report_date, mr_data)
-
-        conn.commit()
-
-        # Summary
-        for table in ["mgmt_report_kpis", "mgmt_report_tenants", "mgmt_report_arrears",
-                       "data_source_variances", "mgmt_report_solar_pv"]:
-            c.execute(f"SELECT COUNT(*) FROM {table} WHERE entity_key = ?", (entity_key,))
-            count = c.fetchone()[0]
-            print(f"  {table}: {count} rows")
+    Path(args.db).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(args.db)
+    create_tables(conn)
+    stats = populate(conn, json_files, ga=ga, force=args.force, folders=folders)
+    for status in ("added", "updated", "removed", "unchanged"):
+        print(f"  {status}: {len(stats[status])}" + (f" ({', '.join(stats[status])})"
+                                                     if stats[status] and status != "unchanged" else ""))
+    for error in stats["errors"]:
+        print(f"  ERROR {error}")
 
     # Final summary
     print("\n" + "=" * 60)
     print("Database Summary:")
-    for table in ["mgmt_report_kpis", "mgmt_report_tenants", "mgmt_report_arrears",
-                   "data_source_variances", "mgmt_report_solar_pv"]:
-        c.execute(f"SELECT COUNT(*) FROM {table}")
-        count = c.fetchone()[0]
+    for table in REPORT_TABLES + ["mgmt_report_monthly_kpis"]:
+        count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
         print(f"  {table}: {count} total rows")
 
     conn.close()
-    print(f"\nDatabase: {DB_PATH}")
-    print(f"Size: {os.path.getsize(str(DB_PATH)):,} bytes")
-
+    print(f"\nDatabase: {args.db}")
+    print(f"Size: {os.path.getsize(args.db):,} bytes")
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,11 @@ Each function is self-contained and returns a complete SVG string
 suitable for embedding in Streamlit via st.markdown (unsafe_allow_html)
 or writing directly to a .svg file.
 
+Every public generator is memoised on a hash of its arguments (see
+memoize_svg), so reruns with unchanged data return the cached string.
+Asset SVGs under assets/ are compiled once per file mtime into an
+SvgTemplate whose <text id="..."> slots are filled by dict lookup.
+
 Visual style follows the project's funding-structure.svg:
   - Background:  #F8FAFC rounded rect
   - Font:        'Segoe UI', Arial, sans-serif
@@ -20,7 +25,15 @@ Visual style follows the project's funding-structure.svg:
 
 from __future__ import annotations
 
-from typing import List, Dict, Optional
+import functools
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from html import escape
+from pathlib import Path
+from typing import Callable, List, Dict, Optional
 
 # ---------------------------------------------------------------------------
 # Shared constants & helpers
@@ -108,10 +121,70 @@ def _gradient_def(gid: str, top: str, bottom: str) -> str:
     )
 
 
+# ---------------------------------------------------------------------------
+# Render cache
+# ---------------------------------------------------------------------------
+
+SVG_CACHE_SIZE = 256
+
+_svg_cache: "OrderedDict[str, str]" = OrderedDict()
+_svg_cache_lock = threading.Lock()
+_svg_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _cache_key(*parts) -> str:
+    """sha1 of the canonical JSON of parts (dict order-insensitive)."""
+    raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _cached(key: str, build: Callable[[], str]) -> str:
+    with _svg_cache_lock:
+        hit = _svg_cache.get(key)
+        if hit is not None:
+            _svg_cache.move_to_end(key)
+            _svg_cache_stats["hits"] += 1
+            return hit
+        _svg_cache_stats["misses"] += 1
+    svg = build()
+    with _svg_cache_lock:
+        _svg_cache[key] = svg
+        while len(_svg_cache) > SVG_CACHE_SIZE:
+            _svg_cache.popitem(last=False)
+    return svg
+
+
+def memoize_svg(fn: Callable[..., str]) -> Callable[..., str]:
+    """Cache an SVG generator's output on a hash of its input data.
+
+    The undecorated function stays available as fn.uncached.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs) -> str:
+        return _cached(_cache_key(fn.__name__, args, kwargs), lambda: fn(*args, **kwargs))
+
+    wrapper.uncached = fn
+    return wrapper
+
+
+def svg_cache_info() -> Dict[str, int]:
+    """Hit / miss counters and current size of the SVG render cache."""
+    with _svg_cache_lock:
+        return {**_svg_cache_stats, "size": len(_svg_cache), "templates": len(_templates)}
+
+
+def clear_svg_cache() -> None:
+    with _svg_cache_lock:
+        _svg_cache.clear()
+        _templates.clear()
+        _svg_cache_stats.update(hits=0, misses=0)
+
+
 # ---------------------------------------------------------------------------
 # 1. Green Drop Compliance Trend
 # ---------------------------------------------------------------------------
 
+@memoize_svg
 def generate_nwl_crisis_svg(trend_data: List[Dict]) -> str:
     """
     Green Drop Compliance Trend -- horizontal stacked bars showing
@@ -244,6 +317,7 @@ def generate_nwl_crisis_svg(trend_data: List[Dict]) -> str:
 # 2. NWL Financing Risk Timeline
 # ---------------------------------------------------------------------------
 
+@memoize_svg
 def generate_nwl_financing_svg(
     grants_eur: float,
     dsra_start: int,
@@ -470,6 +544,7 @@ def generate_nwl_financing_svg(
 # 3. LanRED Tariff Comparison
 # ---------------------------------------------------------------------------
 
+@memoize_svg
 def generate_lanred_tariff_svg(
     eskom_rate: float,
     sc_discount_pct: float,
@@ -625,6 +700,7 @@ def generate_lanred_tariff_svg(
 # 4. TWX Housing Delivery Gap
 # ---------------------------------------------------------------------------
 
+@memoize_svg
 def generate_twx_velocity_svg(
     annual_need: int,
     annual_delivered: int,
@@ -718,6 +794,7 @@ def generate_twx_velocity_svg(
 # 5. TWX JV Partnership Structure
 # ---------------------------------------------------------------------------
 
+@memoize_svg
 def generate_twx_jv_svg() -> str:
     """
     JV Partnership Structure -- organizational diagram showing Timberworx
@@ -820,6 +897,7 @@ def generate_twx_jv_svg() -> str:
 # 6. Lanseria DevCo Divisions
 # ---------------------------------------------------------------------------
 
+@memoize_svg
 def generate_devco_divisions_svg(divisions: List[Dict]) -> str:
     """
     Lanseria DevCo Divisions -- hierarchical org chart showing
@@ -991,6 +1069,180 @@ def generate_devco_divisions_svg(divisions: List[Dict]) -> str:
     return svg
 
 
+# ---------------------------------------------------------------------------
+# 7. Annual Bar Chart (statements, board pack)
+# ---------------------------------------------------------------------------
+
+@memoize_svg
+def generate_annual_bars_svg(
+    title: str,
+    labels: List[str],
+    series: List[Dict],
+    *,
+    width: int = 720,
+    height: int = 300,
+) -> str:
+    """Grouped bar chart of annual series.
+
+    series: [{"name": "Revenue", "values": [...], "color": "#2563EB"}, ...]
+    Values are EUR; negative bars hang below the zero line.
+    """
+    pad_l, pad_r, pad_t, pad_b = 70, 20, 56, 40
+    plot_w = width - pad_l - pad_r
+    plot_h = height - pad_t - pad_b
+    values = [v for s in series for v in s["values"]] or [0.0]
+    vmax = max(max(values), 0.0)
+    vmin = min(min(values), 0.0)
+    span = (vmax - vmin) or 1.0
+
+    def _y(v: float) -> float:
+        return pad_t + (vmax - v) / span * plot_h
+
+    svg = _svg_open(f"{width}x{height}")
+    svg += _bg_rect(width, height)
+    svg += _title(escape(title), width // 2, 26, size=14)
+
+    # Legend
+    lx = pad_l
+    for s in series:
+        svg += f'  <rect x="{lx}" y="36" width="10" height="10" rx="2" fill="{s["color"]}"/>\n'
+        svg += f'  <text x="{lx + 14}" y="45" font-size="11" fill="#64748B">{escape(s["name"])}</text>\n'
+        lx += 24 + 7 * len(s["name"])
+
+    # Gridlines at 0, vmin, vmax
+    for v in sorted({vmin, 0.0, vmax}):
+        y = _y(v)
+        stroke = "#94A3B8" if v == 0 else "#E2E8F0"
+        svg += (f'  <line x1="{pad_l}" y1="{y:.1f}" x2="{width - pad_r}" y2="{y:.1f}" '
+                f'stroke="{stroke}" stroke-width="1"/>\n')
+        svg += (f'  <text x="{pad_l - 6}" y="{y + 4:.1f}" text-anchor="end" '
+                f'font-size="10" fill="#94A3B8">{_fmt_eur(v)}</text>\n')
+
+    n = max(len(labels), 1)
+    group_w = plot_w / n
+    bar_w = group_w * 0.8 / max(len(series), 1)
+    for i, label in enumerate(labels):
+        gx = pad_l + i * group_w + group_w * 0.1
+        for j, s in enumerate(series):
+            v = s["values"][i] if i < len(s["values"]) else 0.0
+            y0, y1 = sorted((_y(0.0), _y(v)))
+            svg += (f'  <rect x="{gx + j * bar_w:.1f}" y="{y0:.1f}" width="{bar_w * 0.92:.1f}" '
+                    f'height="{max(y1 - y0, 0.5):.1f}" rx="2" fill="{s["color"]}"/>\n')
+        svg += (f'  <text x="{pad_l + (i + 0.5) * group_w:.1f}" y="{height - pad_b + 16}" '
+                f'text-anchor="middle" font-size="10" fill="#64748B">{label}</text>\n')
+
+    svg += '</svg>'
+    return svg
+
+
+# ---------------------------------------------------------------------------
+# Asset SVG templates (assets/*.svg with patchable <text id="..."> elements)
+# ---------------------------------------------------------------------------
+
+_TEXT_SLOT_RE = re.compile(r'(<text\b[^>]*\bid="([^"]*)"[^>]*>)([^<]*)(</text>)')
+
+
+class SvgTemplate:
+    """An SVG split once into static chunks and <text id=...> slots.
+
+    render() fills slots from a patch dict (escaped) and joins the chunks;
+    slots without a patch keep the file's original text.
+    """
+
+    __slots__ = ("chunks", "slot_ids", "defaults")
+
+    def __init__(self, svg: str) -> None:
+        self.chunks: List[str] = []
+        self.slot_ids: List[str] = []
+        self.defaults: List[str] = []
+        pos = 0
+        for m in _TEXT_SLOT_RE.finditer(svg):
+            self.chunks.append(svg[pos:m.end(1)])
+            self.slot_ids.append(m.group(2))
+            self.defaults.append(m.group(3))
+            pos = m.start(4)
+        self.chunks.append(svg[pos:])
+
+    def render(self, patches: Optional[Dict[str, str]] = None) -> str:
+        if not patches:
+            return "".join(self.chunks[i] + self.defaults[i] for i in range(len(self.slot_ids))) + self.chunks[-1]
+        out = []
+        for chunk, slot, default in zip(self.chunks, self.slot_ids, self.defaults):
+            out.append(chunk)
+            text = patches.get(slot)
+            out.append(default if text is None else escape(str(text)))
+        out.append(self.chunks[-1])
+        return "".join(out)
+
+
+_templates: Dict[str, tuple] = {}
+
+
+def compile_svg_template(path) -> Optional[SvgTemplate]:
+    """SvgTemplate for an SVG file, recompiled only when its mtime changes."""
+    path = Path(path)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    entry = _templates.get(str(path))
+    if entry is None or entry[0] != mtime:
+        entry = (mtime, SvgTemplate(path.read_text(encoding="utf-8")))
+        _templates[str(path)] = entry
+    return entry[1]
+
+
+def patch_svg_asset(path, patches: Optional[Dict[str, str]] = None) -> str:
+    """Asset SVG with <text id=...> contents replaced; cached on file mtime + patches.
+
+    Returns "" when the file does not exist.
+    """
+    template = compile_svg_template(path)
+    if template is None:
+        return ""
+    key = _cache_key("asset", str(path), _templates[str(Path(path))][0], patches or {})
+    return _cached(key, lambda: template.render(patches))
+
+
+# ---------------------------------------------------------------------------
+# Config-wired diagrams (app About tabs + headless board pack)
+# ---------------------------------------------------------------------------
+
+def entity_about_svgs(entity_key: str) -> Dict[str, str]:
+    """{About heading: svg} for an entity, wired from the JSON configs."""
+    from engine.config import load_config
+
+    out: Dict[str, str] = {}
+    pi = load_config("project_intelligence")
+    if entity_key == "nwl":
+        trend = pi.get("south_africa_crisis_context", {}).get("sewage_treatment", {}).get("green_drop_compliance_trend", [])
+        if trend:
+            out["The Crisis"] = generate_nwl_crisis_svg(trend)
+        sr = load_config("financing").get("senior_debt", {})
+        grants_eur = sr.get("grant_proceeds_to_early_repayment", 0) + sr.get("gepf_bulk_proceeds", 0)
+        nwl_sr = (load_config("structure").get("uses", {}).get("loans_to_subsidiaries", {})
+                  .get("nwl", {}).get("senior_portion", 0))
+        out["The Financing"] = generate_nwl_financing_svg(
+            grants_eur=grants_eur, dsra_start=24, dsra_end=36,
+            exposure_m36_eur=nwl_sr - grants_eur,
+            facility_eur=sr.get("loan_drawdown_total", 0), grace_end=24, maturity=120,
+        )
+    elif entity_key == "lanred":
+        offtake = load_config("operations").get("lanred", {}).get("power_sales", {}).get("smart_city_offtake", {})
+        out["The Solution"] = generate_lanred_tariff_svg(
+            offtake.get("joburg_business_tariff_r_per_kwh", 2.29), offtake.get("discount_pct", 10), 0.80,
+        )
+    elif entity_key == "timberworx":
+        hsg = pi.get("south_africa_crisis_context", {}).get("housing", {})
+        out["The Crisis"] = generate_twx_velocity_svg(
+            hsg.get("annual_need", 178000),
+            hsg.get("annual_delivered", 25000),
+            hsg.get("backlog_units", 3700000),
+        )
+        out["Joint Venture"] = generate_twx_jv_svg()
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Convenience: render all diagrams with sample data (for testing)
 # ---------------------------------------------------------------------------
@@ -1053,6 +1305,13 @@ def _sample_all() -> Dict[str, str]:
          "color": "#64748B", "description": "Precinct Mgmt"},
     ])
 
+    # 7. Annual Bar Chart
+    results["annual_bars"] = generate_annual_bars_svg(
+        "Revenue vs EBITDA", ["Y1", "Y2", "Y3", "Y4"],
+        [{"name": "Revenue", "values": [0, 1.2e6, 2.6e6, 2.9e6], "color": "#2563EB"},
+         {"name": "EBITDA", "values": [-0.3e6, 0.5e6, 1.4e6, 1.6e6], "color": "#16a34a"}],
+    )
+
     return results
 
 
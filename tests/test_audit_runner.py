@@ -0,0 +1,74 @@
+"""Tests for the audit runner (audit/runner.py).
+
+Verifies:
+1. Threaded check groups give the serial results; audits are cached by fingerprint
+2. Batch mode: dedup, bad scenarios as errors, pool == in-process worst deltas
+3. Config-path books (rate sweeps) audit without errors and dedup on the config;
+   an unknown config path is reported as that scenario's error
+"""
+
+import sys
+from pathlib import Path
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def test_grouped_checks_and_cache():
+    from audit.runner import audit_result, clear_audit_cache, run_all_checks
+
+    clear_audit_cache()
+    first = run_all_checks()
+    again = run_all_checks()
+    assert again["results"] is first["results"]
+    assert again["model_result"] is first["model_result"]
+
+    result = first["model_result"]
+    assert audit_result(result, workers=4) == first["results"]
+    assert first["summary"]["total"] == len(first["results"])
+    assert first["summary"]["arithmetic_pass"] + first["summary"]["arithmetic_fail"] \
+        + first["summary"]["design_pass"] + first["summary"]["design_fail"] == len(first["results"])
+
+
+def test_audit_batch():
+    from audit.runner import audit_batch, run_all_checks
+    from engine.scenarios import SweepVariable, grid_overrides, sample_overrides
+
+    growth = SweepVariable("nwl_greenfield_growth_pct", base=7.7, low=5.0, high=9.0, steps=2)
+    book = [*grid_overrides([growth]), {"id": "base", "inputs": {}}, ("dup", {}), {"bogus": 1}]
+    assert book[:2] == [{"nwl_greenfield_growth_pct": 5.0}, {"nwl_greenfield_growth_pct": 9.0}]
+
+    serial = audit_batch(book)
+    assert (serial.total, serial.audited, serial.cached) == (5, 4, 1)
+    assert serial.errors[0][0] == "5" and "bogus" in serial.errors[0][1]
+
+    base = run_all_checks()["results"]
+    fails = [f for f in serial.failures if f["id"] == "base"]
+    assert len(fails) == sum(1 for r in base if not r[5])
+    stat = serial.worst(1)[0]
+    assert stat.worst_delta == max(r[4] for r in base if (r[0], r[1]) == (stat.section, stat.name))
+    assert all(s.runs == 4 for s in serial.checks.values() if not s.section.startswith("SCLCA"))
+
+    pooled = audit_batch(book, workers=2)
+    assert {k: (s.failures, s.worst_delta) for k, s in pooled.checks.items()} \
+        == {k: (s.failures, s.worst_delta) for k, s in serial.checks.items()}
+
+    draws = list(sample_overrides([growth], 3, seed=1))
+    assert draws == list(sample_overrides([growth], 3, seed=1))
+    assert all(5.0 <= d["nwl_greenfield_growth_pct"] <= 9.0 for d in draws)
+
+
+def test_audit_batch_config_paths():
+    from audit.runner import audit_batch
+    from engine.scenarios import RATE_SWEEP_PRESETS, grid_overrides
+
+    book = list(grid_overrides(RATE_SWEEP_PRESETS[:1]))
+    report = audit_batch(book + book[:1])
+    assert not report.errors
+    assert (report.total, report.audited, report.cached) == (6, 6, 1)
+
+    mixed = audit_batch([book[0], ("bad", {"rates.nope.x": 1}), book[1]])
+    assert (mixed.total, mixed.audited) == (3, 2)
+    assert [i for i, _ in mixed.errors] == ["bad"] and "rates.nope.x" in mixed.errors[0][1]
@@ -0,0 +1,103 @@
+"""Tests for the headless batch runner (python -m engine run).
+
+Verifies:
+1. JSONL in -> one record per scenario out, with bad lines reported as errors
+2. Duplicate scenarios are served from the fingerprint cache
+3. A process pool gives the same metrics as the in-process path
+4. Dotted config paths run as config overlays, keyed apart from the base case
+5. A ResultCache passed to several runs serves repeats across books
+6. An unknown config path is an error record, not the end of the book
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+_LINES = [
+    json.dumps({"id": "base", "inputs": {}}),
+    json.dumps({"nwl_greenfield_growth_pct": 5.0}),
+    json.dumps({"id": "base-again", "inputs": {}}),
+    json.dumps({"not_a_field": 1}),
+    "",
+]
+
+
+def test_run_batch_in_process():
+    from engine.batch import run_batch
+    out = []
+    stats = run_batch(_LINES, out.append, workers=1)
+    by_id = {r["id"]: r for r in out}
+    assert stats.total == 4 and stats.ok == 3 and stats.errors == 1 and stats.cached == 1
+    assert by_id["base-again"]["cached"] is True
+    assert by_id["base"]["fingerprint"] == by_id["base-again"]["fingerprint"]
+    assert by_id["4"]["status"] == "error"
+    assert set(by_id["base"]["metrics"]) == {"nwl", "lanred", "timberworx"}
+    assert by_id["2"]["metrics"]["nwl"]["total_revenue"] != by_id["base"]["metrics"]["nwl"]["total_revenue"]
+
+
+def test_run_batch_pool_matches_in_process(tmp_path):
+    from engine.__main__ import main
+    src = tmp_path / "in.jsonl"
+    src.write_text("\n".join(_LINES[:2]) + "\n")
+    out1, out2 = tmp_path / "one.jsonl", tmp_path / "two.jsonl"
+    assert main(["run", "--in", str(src), "--out", str(out1), "--workers", "1"]) == 0
+    assert main(["run", "--in", str(src), "--out", str(out2), "--workers", "2"]) == 0
+    a = {r["id"]: r["metrics"] for r in map(json.loads, out1.read_text().splitlines())}
+    b = {r["id"]: r["metrics"] for r in map(json.loads, out2.read_text().splitlines())}
+    assert a == b
+
+
+def test_config_path_overrides(tmp_path):
+    from engine.__main__ import main
+    src = tmp_path / "in.jsonl"
+    src.write_text("\n".join([
+        json.dumps({"id": "base", "inputs": {}}),
+        json.dumps({"id": "fx", "inputs": {"rates.fx.eur_zar": 21.0}}),
+        json.dumps({"id": "fx-growth", "inputs": {"rates.fx.eur_zar": 21.0, "nwl_greenfield_growth_pct": 5.0}}),
+        json.dumps({"id": "fx-again", "inputs": {"rates.fx.eur_zar": 21.0}}),
+    ]) + "\n")
+    runs = []
+    for workers in ("1", "2"):
+        out = tmp_path / f"out{workers}.jsonl"
+        assert main(["run", "--in", str(src), "--out", str(out), "--workers", workers]) == 0
+        runs.append({r["id"]: r for r in map(json.loads, out.read_text().splitlines())})
+    one, two = runs
+    assert {k: r["metrics"] for k, r in one.items()} == {k: r["metrics"] for k, r in two.items()}
+    assert len({one[k]["fingerprint"] for k in ("base", "fx", "fx-growth")}) == 3
+    assert one["fx-again"]["cached"] is True and one["fx-again"]["fingerprint"] == one["fx"]["fingerprint"]
+    assert one["fx"]["metrics"]["nwl"] != one["base"]["metrics"]["nwl"]
+
+
+def test_shared_cache_across_runs():
+    from engine.batch import ResultCache, run_batch
+    book = [json.dumps({"rates.fx.eur_zar": 21.0}), json.dumps({"nwl_greenfield_growth_pct": 5.0})]
+    cache, first, again = ResultCache(16), [], []
+    assert run_batch(book, first.append, cache=cache).cached == 0
+    stats = run_batch(book, again.append, cache=cache)
+    assert (stats.ok, stats.cached) == (2, 2)
+    assert [r["metrics"] for r in again] == [r["metrics"] for r in first]
+    assert first[0]["inputs"] == {"rates.fx.eur_zar": 21.0}
+
+
+def test_unknown_config_path_is_an_error_record(tmp_path):
+    from engine.__main__ import main
+    src = tmp_path / "in.jsonl"
+    src.write_text("\n".join(json.dumps(x) for x in (
+        {"id": "a", "inputs": {}},
+        {"id": "bad", "inputs": {"rates.nope.x": 1}},
+        {"id": "c", "inputs": {"nwl_greenfield_growth_pct": 5.0}},
+    )) + "\n")
+    for workers in ("1", "2"):
+        out = tmp_path / f"out{workers}.jsonl"
+        assert main(["run", "--in", str(src), "--out", str(out), "--workers", workers]) == 1
+        by_id = {r["id"]: r for r in map(json.loads, out.read_text().splitlines())}
+        assert [by_id[k]["status"] for k in ("a", "bad", "c")] == ["ok", "error", "ok"]
+        assert "rates.nope.x" in by_id["bad"]["error"]
+    assert main(["excel", "--in", str(src), "--out", str(tmp_path / "book.xlsx")]) == 1
+    assert (tmp_path / "book.xlsx").exists()
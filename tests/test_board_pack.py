@@ -0,0 +1,59 @@
+"""Tests for the headless board pack (reports/board_pack.py).
+
+Verifies:
+1. Parallel and in-process builds produce the same sections and statement tables
+2. Missing PDF renderers raise a clear error instead of writing a broken file
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def _body(path: Path) -> str:
+    return re.sub(r'<p class="meta">.*?</p>', "", path.read_text(encoding="utf-8"))
+
+
+def test_board_pack_parallel_matches_serial(tmp_path):
+    from engine.orchestrator import run_model
+    from reports import build_board_pack
+    from reports.board_pack import SECTIONS
+
+    result = run_model()
+    serial = build_board_pack(tmp_path / "serial", result=result, workers=1)
+    parallel = build_board_pack(tmp_path / "parallel", result=result, workers=2)
+
+    html = _body(serial.html)
+    assert html == _body(parallel.html)
+    assert html.count("<section") == len(SECTIONS)
+    assert html.count("<table>") == 3 * len(SECTIONS)            # P&L, CF, BS per section
+    assert "Total Revenue" in html and "New Water Lanseria" in html
+    assert "<svg" in html
+    assert serial.pdf is None and set(serial.section_s) == set(SECTIONS)
+
+
+def test_render_pdf_without_renderer(tmp_path, monkeypatch):
+    import builtins
+    from reports.board_pack import render_pdf
+
+    real_import = builtins.__import__
+
+    def _no_weasyprint(name, *args, **kwargs):
+        if name == "weasyprint":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", _no_weasyprint)
+    monkeypatch.setattr("reports.board_pack.shutil.which", lambda exe: None)
+    src = tmp_path / "pack.html"
+    src.write_text("<html></html>")
+    with pytest.raises(RuntimeError, match="No PDF renderer"):
+        render_pdf(src, tmp_path / "pack.pdf")
+    assert not (tmp_path / "pack.pdf").exists()
@@ -0,0 +1,66 @@
+"""Tests for the immutable ModelConfig snapshot (engine/config.py).
+
+Verifies:
+1. Sections are deep-frozen, copies are mutable, the snapshot pickles and is shared
+2. with_overrides() shares unchanged subtrees, re-derives constants and rehashes
+"""
+
+import copy
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def test_snapshot_is_frozen():
+    from engine.config import ModelConfig
+
+    cfg = ModelConfig.load()
+    assert ModelConfig.load() is cfg
+    loans = cfg.entity_loans()
+    with pytest.raises(TypeError):
+        loans["nwl"]["senior_portion"] = 0.0
+    with pytest.raises(TypeError):
+        cfg.financing["loan_detail"]["senior"]["drawdown_schedule"].append(1)
+    with pytest.raises(AttributeError):
+        cfg.tax_rate = 0.3
+
+    mutable = copy.deepcopy(loans)
+    mutable["nwl"]["senior_portion"] = 0.0
+    assert loans["nwl"]["senior_portion"] > 0
+    assert json.loads(json.dumps(cfg.rates)) == cfg.rates
+
+    clone = pickle.loads(pickle.dumps(cfg))
+    assert clone == cfg and hash(clone) == hash(cfg)
+    assert clone.tax_rate == cfg.tax_rate
+
+
+def test_with_overrides():
+    from engine.config import ModelConfig
+
+    cfg = ModelConfig.load()
+    hi = cfg.with_overrides({"rates.tax.corporate_rate": 0.30, "rates.intercompany_margin": 0.01})
+    assert (hi.tax_rate, hi.sr_ic_rate) == (0.30, hi.sr_facility_rate + 0.01)
+    assert cfg.tax_rate == cfg.rates["tax"]["corporate_rate"] != 0.30
+    assert hi.structure is cfg.structure and hi.rates["fx"] is cfg.rates["fx"]
+    assert hi.fingerprint != cfg.fingerprint
+    assert cfg.with_overrides({}) is cfg
+
+    back = hi.with_overrides({"rates.tax.corporate_rate": cfg.tax_rate,
+                              "rates.intercompany_margin": cfg.ic_margin})
+    assert back == cfg and back.fingerprint == cfg.fingerprint
+
+    path = "financing.loan_detail.senior.drawdown_schedule.0"
+    first = cfg.with_overrides({path: 1.0})
+    assert first.financing["loan_detail"]["senior"]["drawdown_schedule"][0] == 1.0
+    with pytest.raises(KeyError):
+        cfg.with_overrides({"rates.no_such_block.rate": 1.0})
+    with pytest.raises(KeyError):
+        cfg.with_overrides({"nonsense.x": 1.0})
@@ -0,0 +1,63 @@
+"""Tests for the write-only Excel export (engine/excel.py).
+
+Verifies:
+1. Full-model workbook: template statements + one sheet per raw section, labels and number formats
+2. Scenario book via CLI: one sheet per scenario plus the Scenarios index
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def test_model_workbook(tmp_path):
+    from engine.config import ScenarioInputs
+    from engine.excel import write_model_workbook
+    from engine.orchestrator import run_model
+
+    inputs = ScenarioInputs()
+    result = run_model(None, inputs)
+    path = tmp_path / "model.xlsx"
+    write_model_workbook(result, path, inputs=inputs)
+    assert write_model_workbook(result.to_dict())[:2] == b"PK"     # bytes for download
+
+    wb = openpyxl.load_workbook(path)
+    assert wb.sheetnames[0] == "Summary"
+    assert {"NWL Annual P&L - CF - BS", "SCLCA Consolidated", "LanRED Senior IC Facility"} <= set(wb.sheetnames)
+
+    ws = wb["NWL Annual P&L - CF - BS"]
+    rows = {r[0].value: r for r in ws.iter_rows(min_row=3) if r[0].value}
+    rev = rows["Total Revenue"]
+    assert sum(c.value for c in rev[1:]) == pytest.approx(result.entities["nwl"].total_revenue)
+    assert rev[3].number_format == '#,##0;(#,##0);"-"'
+
+    ws = wb["NWL Statements"]
+    rows = {r[0].value: r for r in ws.iter_rows() if r[0].value}
+    assert {"Income Statement", "Cash Flow Statement", "Balance Sheet", "OPERATING COSTS"} <= set(rows)
+    assert rows["Total Revenue"][-1].value == pytest.approx(result.entities["nwl"].total_revenue)
+    assert rows["O&M expense"][1].value <= 0
+
+
+def test_scenario_book_cli(tmp_path):
+    from engine.__main__ import main
+
+    src = tmp_path / "in.jsonl"
+    src.write_text("\n".join(json.dumps(x) for x in (
+        {"id": "base", "inputs": {}},
+        {"id": "slow", "inputs": {"nwl_greenfield_growth_pct": 3.0}},
+    )) + "\n")
+    out = tmp_path / "book.xlsx"
+    assert main(["excel", "--in", str(src), "--out", str(out)]) == 0
+
+    wb = openpyxl.load_workbook(out, read_only=True)
+    assert wb.sheetnames == ["Scenarios", "base", "slow"]
+    index = list(wb["Scenarios"].iter_rows(min_row=2, values_only=True))
+    assert len(index) == 2 * 3 and {r[0] for r in index} == {"base", "slow"}
@@ -0,0 +1,59 @@
+"""Tests for the plotly figure cache (views/figures.py).
+
+Verifies:
+1. Figures are built once per (fingerprint, chart, closure inputs); changed inputs rebuild
+2. Long line traces are downsampled with their extremes and end points kept
+"""
+
+import sys
+from pathlib import Path
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+_BUILDS = []          # module global: not part of the builders' closure key
+
+
+def test_figure_cached_on_closure_inputs():
+    import plotly.graph_objects as go
+    from views.figures import cached_figure, cached_figure_json, clear_figure_cache, figure_cache_info
+
+    clear_figure_cache()
+    _BUILDS.clear()
+
+    def render(values, fp="abc"):
+        def _build_fig():
+            _BUILDS.append(1)
+            fig = go.Figure(go.Bar(x=["Y1", "Y2"], y=values))
+            return fig
+        return cached_figure("bars", _build_fig, fingerprint=fp), _build_fig
+
+    a, build = render([1.0, 2.0])
+    b, _ = render([1.0, 2.0])
+    assert a is b and len(_BUILDS) == 1
+    assert '"y":[1.0,2.0]' in cached_figure_json("bars", build, fingerprint="abc").replace(" ", "")
+    render([1.0, 3.0])
+    render([1.0, 2.0], fp="other")
+    assert len(_BUILDS) == 3
+    assert figure_cache_info()["hits"] == 1 and figure_cache_info()["size"] == 3
+
+
+def test_downsample_keeps_extremes():
+    import plotly.graph_objects as go
+    from views.figures import downsample_figure
+
+    n = 10_000
+    y = [float(i % 97) for i in range(n)]
+    y[5_000] = 1e6
+    y[7_000] = -1e6
+    fig = go.Figure([go.Scatter(x=list(range(n)), y=y), go.Bar(x=list(range(n)), y=y)])
+    downsample_figure(fig, max_points=500)
+
+    line, bar = fig.data
+    assert len(line.y) <= 502 and len(bar.y) == n
+    assert max(line.y) == 1e6 and min(line.y) == -1e6
+    assert line.x[0] == 0 and line.x[-1] == n - 1
+    assert list(line.x) == sorted(line.x)
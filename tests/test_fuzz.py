@@ -0,0 +1,46 @@
+"""Tests for the invariant fuzzer (audit/fuzz.py).
+
+Verifies:
+1. Random valid scenarios hold the invariants; a planted failing identity shrinks to {}
+2. shrink() drops irrelevant overrides and bisects numbers towards the default
+"""
+
+import sys
+from pathlib import Path
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def test_fuzz_invariants(monkeypatch):
+    import audit.fuzz as fz
+    from engine.config import ScenarioInputs
+
+    book = fz.sample_book(5, seed=3)
+    assert book == fz.sample_book(5, seed=3)
+    for overrides in book:
+        ScenarioInputs.from_overrides(overrides)            # every draw is valid
+
+    report = fz.fuzz(12, seed=3)
+    assert report.ok and report.batch.audited == 12
+    assert {fz.invariant_of(s.section, s.name) for s in report.batch.checks.values()} \
+        == set(fz.INVARIANTS)
+
+    # "Fixed Assets = Base - AccDepr" fails on every scenario, defaults included
+    monkeypatch.setitem(fz.INVARIANTS, "fixed_assets", ("Fixed Assets = Base - AccDepr",))
+    planted = fz.fuzz(2, seed=3)
+    [example] = planted.counterexamples
+    assert example.invariant == "fixed_assets" and example.overrides == {}
+    assert example.original == book[int(example.scenario_id)]
+
+
+def test_shrink():
+    from audit.fuzz import shrink
+
+    overrides = {"nwl_greenfield_growth_pct": 11.0, "lanred_scenario": "Greenfield",
+                 "nwl_power_escalation": 14.0}
+    minimal = shrink(overrides, lambda o: o.get("nwl_greenfield_growth_pct", 7.7) > 10.0)
+    assert set(minimal) == {"nwl_greenfield_growth_pct"}
+    assert 10.0 < minimal["nwl_greenfield_growth_pct"] < 10.02
@@ -0,0 +1,67 @@
+"""Tests for batch guarantor analysis (scripts/guarantor_analysis.py).
+
+Verifies:
+1. Batch results (pool and in-process) match sequential analyse_entity, co-ownership included
+2. Analyses are memoised on input content; an edited input recomputes only its entity
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Ensure the model root (and scripts/) is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+for _p in (_model_root, _model_root / "scripts"):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+
+def _hierarchy():
+    import guarantor_analysis as ga
+
+    docs = {p.stem: json.loads(p.read_text())
+            for p in (_model_root / "data" / "guarantor").rglob("*_structured.json")}
+    config = json.loads((_model_root / "config" / "guarantor.json").read_text())
+    return ga, docs, ga.hierarchy_jobs(config, docs)
+
+
+def test_batch_matches_sequential():
+    ga, docs, jobs = _hierarchy()
+    chartwell = jobs["ChartwellCorner_2025_structured"]
+    assert chartwell["co_owner"] == "ChartwellCoOwner_2025_structured"
+    assert chartwell["mgmt_report_data"] is docs["ChartwellCorner_2025_mgmt_report_structured"]
+    assert "quasi_equity" in jobs["IreoProject10_2025_structured"]["entity_config"]
+
+    expected = {
+        key: ga.analyse_entity(job["entity_name"], job["afs_data"], job["mgmt_data"], job["mgmt_report_data"],
+                               entity_config=job["entity_config"],
+                               co_owner_afs_data=docs.get(job["co_owner"] or ""))
+        for key, job in jobs.items()
+    }
+    assert expected["ChartwellCorner_2025_structured"]["co_ownership"]["co_owner_rev"] > 0
+    for workers in (2, 1):
+        ga.clear_analysis_cache()
+        assert ga.analyse_batch(jobs, workers=workers) == expected
+
+
+def test_memoised_on_inputs(monkeypatch):
+    ga, docs, jobs = _hierarchy()
+    ga.clear_analysis_cache()
+    first = ga.analyse_batch(jobs)
+
+    calls = []
+    real = ga.analyse_entity
+    monkeypatch.setattr(ga, "analyse_entity", lambda *a, **kw: calls.append(kw["entity_name"]) or real(*a, **kw))
+    _, _, again = _hierarchy()                             # freshly parsed, equal content
+    second = ga.analyse_batch(again)
+    assert second == first and calls == []
+
+    second["PRAAM_2025_structured"]["story"].append("caller mutation")
+    afs = again["PRAAM_2025_structured"]["afs_data"]
+    afs["statement_of_comprehensive_income"]["revenue"]["values"][0] *= 2
+    third = ga.analyse_batch(again)
+    assert calls == [again["PRAAM_2025_structured"]["entity_name"]]
+    assert third["PRAAM_2025_structured"]["story"][-1] != "caller mutation"
+    assert ga.analyse_entity_cached(**{k: v for k, v in again["RidgeviewCentre_2025_structured"].items()
+                                       if k != "co_owner"}) == first["RidgeviewCentre_2025_structured"]
+    assert len(calls) == 1
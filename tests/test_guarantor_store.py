@@ -0,0 +1,127 @@
+"""Tests for the guarantor statement store (scripts/guarantor_store.py).
+
+Verifies:
+1. Re-ingest is incremental by file hash: unchanged, edited, added and removed files
+2. Statement slices rebuild the source "values" leaves; line items query across entities
+3. A built store opens read-only, serves current folders without writing, and goes stale on edits
+4. hierarchy_jobs over the store's lazy document map matches the parsed JSON
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+# Ensure the model root (and scripts/) is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+for _p in (_model_root, _model_root / "scripts"):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+
+def _leaves(node, path=()):
+    if isinstance(node, dict):
+        if isinstance(node.get("values"), list):
+            yield path, node["values"]
+            return
+        for key, child in node.items():
+            yield from _leaves(child, path + (key,))
+
+
+def test_incremental_ingest(tmp_path):
+    from guarantor_store import GuarantorStore, GUARANTOR_DIR
+
+    src = GUARANTOR_DIR / "Phoenix group"
+    for name in ("OlivedaleCorner_2025_structured.json", "PRAAM_2025_structured.json",
+                 "OlivedaleCorner_2025_mgmt_report_structured.json"):
+        shutil.copy(src / name, tmp_path / name)
+
+    with GuarantorStore(tmp_path / "store.db") as store:
+        first = store.ingest(tmp_path)
+        assert (first.added, first.unchanged) == (3, 0) and len(store) == 3
+        again = store.ingest(tmp_path)
+        assert (again.added, again.updated, again.unchanged) == (0, 0, 3)
+
+        path = tmp_path / "PRAAM_2025_structured.json"
+        doc = json.loads(path.read_text())
+        doc["statement_of_financial_position"]["assets"]["total_assets"]["values"][0] = 1.0
+        path.write_text(json.dumps(doc))
+        (tmp_path / "OlivedaleCorner_2025_structured.json").unlink()
+        (tmp_path / "broken_structured.json").write_text("{not json")
+        edited = store.ingest(tmp_path)
+        assert (edited.updated, edited.unchanged, edited.removed) == (1, 1, 1)
+        assert edited.errors[0][0].endswith("broken_structured.json")
+
+        docs = store.documents(tmp_path)
+        assert sorted(docs) == ["OlivedaleCorner_2025_mgmt_report_structured", "PRAAM_2025_structured"]
+        assert docs["PRAAM_2025_structured"] == doc
+        assert list(store.documents(tmp_path, "*_mgmt_report_structured.json")) \
+            == ["OlivedaleCorner_2025_mgmt_report_structured"]
+        [row] = store.line_items(statement="statement_of_financial_position",
+                                 account="assets/total_assets", period=0)
+        assert row[1] == "PRAAM_2025_structured.json" and row[5] == 1.0
+
+
+def test_statement_slices(tmp_path):
+    from guarantor_store import GuarantorStore, GUARANTOR_DIR
+
+    path = GUARANTOR_DIR / "VeracityPropertyHoldings_2025_structured.json"
+    doc = json.loads(path.read_text())
+    with GuarantorStore(tmp_path / "store.db") as store:
+        store.ingest_file(path)
+        statements = ("statement_of_comprehensive_income", "statement_of_financial_position")
+        sliced = store.statements(path, statements)
+        assert sorted(sliced) == sorted(statements)
+        for name in statements:
+            assert dict(_leaves(sliced[name])) == dict(_leaves(doc[name]))
+        assert store.periods(path) == doc["metadata"]["presentation_columns"]
+
+        store.ingest(GUARANTOR_DIR / "veracity 2025 financials")
+        rows = store.line_items(statement="statement_of_financial_position",
+                                account="assets/total_assets", period=0)
+        assert len(rows) >= 10 and len({r[0] for r in rows}) == len(rows)
+
+
+def test_readonly_store_tracks_freshness(tmp_path):
+    from guarantor_store import GuarantorStore, GUARANTOR_DIR, open_readonly
+
+    src = GUARANTOR_DIR / "Phoenix group"
+    for name in ("PRAAM_2025_structured.json", "OlivedaleCorner_2025_mgmt_report_structured.json"):
+        shutil.copy(src / name, tmp_path / name)
+    db = tmp_path / "store.db"
+    assert open_readonly(db) is None
+    with GuarantorStore(db) as store:
+        store.ingest(tmp_path)
+    built = db.stat().st_mtime_ns
+
+    with open_readonly(db) as store:
+        assert store.is_current(tmp_path)
+        assert store.is_current(tmp_path, "PRAAM_2025_structured.json")
+        docs = store.documents(tmp_path, "*_mgmt_report_structured.json")
+        assert list(docs) == ["OlivedaleCorner_2025_mgmt_report_structured"]
+
+        path = tmp_path / "PRAAM_2025_structured.json"
+        path.write_text(path.read_text() + "\n")
+        assert not store.is_current(tmp_path)
+        assert store.is_current(tmp_path, "*_mgmt_report_structured.json")
+        (tmp_path / "Ridgeview_mgmt_report_structured.json").write_text("{}")
+        assert not store.is_current(tmp_path, "*_mgmt_report_structured.json")
+    assert db.stat().st_mtime_ns == built
+
+
+def test_hierarchy_jobs_from_store(tmp_path):
+    import guarantor_analysis as ga
+    from guarantor_store import GuarantorStore, GUARANTOR_DIR
+
+    folders = [GUARANTOR_DIR, *sorted(p for p in GUARANTOR_DIR.rglob("*") if p.is_dir())]
+    config = json.loads((_model_root / "config" / "guarantor.json").read_text())
+    with GuarantorStore(tmp_path / "store.db") as store:
+        for folder in folders:
+            store.ingest(folder)
+        docs = store.document_map(folders)
+        assert all(store.is_current(f) for f in folders)
+        assert docs.keys() == ga.hierarchy_docs(GUARANTOR_DIR).keys()
+        jobs = ga.hierarchy_jobs(config, docs)
+        assert jobs == ga.hierarchy_jobs(config, ga.hierarchy_docs(GUARANTOR_DIR))
+        # Only the documents the hierarchy names were decoded
+        assert len(docs._docs) < len(docs)
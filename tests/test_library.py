@@ -0,0 +1,117 @@
+"""Tests for the SQLite scenario library (engine/library.py).
+
+Verifies:
+1. Bulk inserts dedupe on fingerprint and round-trip inputs, metrics and statements
+2. Cross-entity metric filters, ordering and paging
+3. python -m engine run --library stores every ok record
+4. Scenarios are keyed on (config, inputs); single adds skip ANALYZE; old files migrate
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def _payload(i: int) -> dict:
+    return {
+        "metrics": {
+            "nwl": {"dscr_min": 1.0 + i / 10, "equity_irr": 0.10 + i / 100},
+            "lanred": {"dscr_min": 1.5, "equity_irr": 0.20 - i / 100},
+        },
+        "holding": {"ni_total": 1000.0 * i},
+        "statements": {"nwl": {"annual": [{"year": 1, "ni": float(i)}]}},
+    }
+
+
+def test_library_insert_query_page(tmp_path):
+    from engine.config import ScenarioInputs
+    from engine.library import ScenarioLibrary
+
+    items = [({"nwl_greenfield_growth_pct": float(i)}, _payload(i)) for i in range(10)]
+    with ScenarioLibrary(tmp_path / "lib.db") as lib:
+        assert lib.add_many(items, label="grid") == 10
+        assert lib.add_many(items[:3]) == 0                  # same fingerprints
+        assert len(lib) == 10
+
+        fp = ScenarioInputs.from_overrides({"nwl_greenfield_growth_pct": 4.0}).fingerprint()
+        rec = lib.get(fp, statements=True)
+        assert rec["inputs"]["nwl_greenfield_growth_pct"] == 4.0
+        assert rec["metrics"]["nwl"]["dscr_min"] == 1.4
+        assert rec["holding"]["ni_total"] == 4000.0
+        assert rec["statements"]["nwl"]["annual"][0]["ni"] == 4.0
+
+        # NWL dscr_min < 1.5 (i = 0..4) and LanRED equity IRR > 12% (i = 0..7)
+        filters = [("nwl", "dscr_min", "<", 1.5), ("lanred", "equity_irr", ">", 0.12)]
+        assert lib.count(filters) == 5
+        rows, total = lib.page(filters, order_by=("nwl", "equity_irr", "desc"), page=1, page_size=2)
+        assert total == 5
+        assert [r["nwl_dscr_min"] for r in rows] == [1.2, 1.1]
+        assert lib.count(filters, cap=3) == 3
+
+
+def test_batch_cli_writes_library(tmp_path):
+    from engine.__main__ import main
+    from engine.library import ScenarioLibrary
+
+    src = tmp_path / "in.jsonl"
+    src.write_text("\n".join(json.dumps(x) for x in (
+        {}, {"nwl_greenfield_growth_pct": 5.0}, {"bad_field": 1})) + "\n")
+    db = tmp_path / "lib.db"
+    assert main(["run", "--in", str(src), "--out", str(tmp_path / "out.jsonl"),
+                 "--library", str(db), "--label", "cli"]) == 1   # one bad line
+    with ScenarioLibrary(db) as lib:
+        assert len(lib) == 2
+        rows = lib.query(with_inputs=True)
+        assert {r["label"] for r in rows} == {"cli"}
+        assert rows[0]["nwl_dscr_min"] > 0
+
+
+def test_library_keyed_on_config(tmp_path):
+    import sqlite3
+    from engine.config import ModelConfig, ScenarioInputs, scenario_fingerprint
+    from engine.library import ScenarioLibrary
+
+    cfg = ModelConfig.load()
+    fx = cfg.with_overrides({"rates.fx.eur_zar": 21.0})
+    inputs = ScenarioInputs()
+    with ScenarioLibrary(tmp_path / "lib.db") as lib:
+        assert lib.add(inputs, _payload(1))
+        assert lib.add(inputs, _payload(2), cfg=fx)            # same inputs, other config
+        assert not lib.add({}, _payload(3))
+        stats = "SELECT COUNT(*) FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        assert lib._conn.execute(stats).fetchone()[0] == 0       # single adds skip ANALYZE
+        assert lib.add_many([({"rates.fx.eur_zar": 21.0, "nwl_greenfield_growth_pct": 5.0}, _payload(4))]) == 1
+        assert len(lib) == 3
+        assert lib.get(scenario_fingerprint(fx, inputs))["holding"]["ni_total"] == 2000.0
+        assert scenario_fingerprint(cfg, inputs) in lib and f"{'0' * 40}:{inputs.fingerprint()}" not in lib
+        assert lib.count(config_fp=cfg.fingerprint) == 1 and lib.count(config_fp=fx.fingerprint) == 2
+        [row] = lib.query(config_fp=cfg.fingerprint, with_inputs=True)
+        assert row["fingerprint"] == scenario_fingerprint(cfg, inputs)
+        assert {r["inputs"].get("rates.fx.eur_zar") for r in lib.query(with_inputs=True)} == {None, 21.0}
+        assert lib._conn.execute(stats).fetchone()[0] == 1
+
+    from engine.library import ENTITIES, METRIC_COLUMNS
+    wide = ", ".join(f"{e}_{c} REAL" for e in ENTITIES for c in METRIC_COLUMNS)
+    legacy = tmp_path / "legacy.db"
+    conn = sqlite3.connect(legacy)
+    conn.executescript(f"""
+        CREATE TABLE scenarios (id INTEGER PRIMARY KEY, fingerprint TEXT NOT NULL UNIQUE,
+            label TEXT NOT NULL DEFAULT '', inputs_json TEXT NOT NULL, holding_ni_total REAL,
+            holding_dscr_min REAL, holding_dscr_avg REAL, holding_total_ic_interest_income REAL,
+            holding_total_net_interest REAL, statements BLOB, created_at TEXT);
+        CREATE TABLE metrics (scenario_id INTEGER PRIMARY KEY REFERENCES scenarios(id) ON DELETE CASCADE,
+            {wide});
+        INSERT INTO scenarios (id, fingerprint, inputs_json) VALUES (1, 'abc', '{{}}');
+        INSERT INTO metrics (scenario_id, nwl_dscr_min) VALUES (1, 1.3);
+    """)
+    conn.commit()
+    conn.close()
+    with ScenarioLibrary(legacy) as lib:
+        assert len(lib) == 1 and lib.get("abc")["fingerprint"] == ":abc"
+        assert lib.get("abc")["metrics"]["nwl"]["dscr_min"] == 1.3
+        assert lib.add(inputs, _payload(1)) and len(lib) == 2
@@ -0,0 +1,129 @@
+"""Tests for incremental management report DB population (scripts/populate_mgmt_report_db.py).
+
+Verifies:
+1. Unchanged reports are skipped; an edited or re-dated report replaces its rows only
+2. Monthly KPI summary matches the detail tables and trend reads use the covering index
+3. Files sharing a report key do not double rows (last wins); departed files are pruned
+"""
+
+import json
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+# Ensure the model root (and scripts/) is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+for _p in (_model_root, _model_root / "scripts"):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+_REPORTS = _model_root / "data" / "guarantor" / "Phoenix group"
+
+
+def _db(tmp_path):
+    from add_mgmt_report_tables import create_tables
+
+    for src in _REPORTS.glob("*_mgmt_report_structured.json"):
+        shutil.copy(src, tmp_path / src.name)
+    conn = sqlite3.connect(tmp_path / "mgmt.db")
+    create_tables(conn)
+    return conn, sorted(tmp_path.glob("*_mgmt_report_structured.json"))
+
+
+def _counts(conn):
+    from populate_mgmt_report_db import REPORT_TABLES
+
+    return {t: conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+            for t in REPORT_TABLES + ["mgmt_report_monthly_kpis"]}
+
+
+def test_incremental_upsert(tmp_path):
+    import guarantor_analysis as ga
+    from populate_mgmt_report_db import populate
+
+    conn, files = _db(tmp_path)
+    first = populate(conn, files, ga=ga)
+    assert len(first["added"]) == 5 and not first["errors"]
+    counts = _counts(conn)
+    assert counts["mgmt_report_kpis"] == counts["mgmt_report_monthly_kpis"] == 5
+    assert counts["mgmt_report_tenants"] > 50
+
+    again = populate(conn, files, ga=ga)
+    assert len(again["unchanged"]) == 5 and not again["added"] and not again["updated"]
+    assert _counts(conn) == counts
+
+    path = tmp_path / "RidgeviewCentre_2025_mgmt_report_structured.json"
+    doc = json.loads(path.read_text())
+    doc["leasing_summary"]["vacancy_rate_pct"] = 12.5
+    doc["tenant_data"] = doc["tenant_data"][:3]
+    doc["metadata"]["reporting_period"]["end_date"] = "2026-01-31"
+    path.write_text(json.dumps(doc))
+    third = populate(conn, files, ga=ga)
+    assert third["updated"] == [path.stem] and len(third["unchanged"]) == 4
+
+    key = doc["metadata"]["entity"]["entity_key"]
+    assert conn.execute("SELECT report_date, vacancy_rate_pct FROM mgmt_report_kpis WHERE entity_key = ?",
+                        (key,)).fetchall() == [("2026-01-31", 12.5)]
+    assert conn.execute("SELECT COUNT(*) FROM mgmt_report_tenants WHERE entity_key = ?", (key,)).fetchone()[0] == 3
+    assert conn.execute("SELECT month FROM mgmt_report_monthly_kpis WHERE entity_key = ?",
+                        (key,)).fetchall() == [("2026-01",)]
+
+
+def test_monthly_summary(tmp_path):
+    from add_mgmt_report_tables import MONTHLY_TREND_COLUMNS
+    from populate_mgmt_report_db import monthly_kpis, populate
+
+    conn, files = _db(tmp_path)
+    populate(conn, files)
+    for ek, rd, rent, debtors, arrears, kwh in conn.execute(
+            "SELECT entity_key, report_date, rent_roll_monthly, arrears_debtors, arrears_detail_total, "
+            "solar_actual_kwh FROM mgmt_report_monthly_kpis"):
+        key = (ek, rd)
+        assert rent == conn.execute("SELECT SUM(rental_monthly) FROM mgmt_report_tenants "
+                                    "WHERE entity_key = ? AND report_date = ?", key).fetchone()[0]
+        assert (debtors or 0, arrears) == conn.execute(
+            "SELECT COUNT(*), SUM(amount) FROM mgmt_report_arrears "
+            "WHERE entity_key = ? AND report_date = ?", key).fetchone()
+        assert kwh == conn.execute("SELECT SUM(actual_kwh) FROM mgmt_report_solar_pv "
+                                   "WHERE entity_key = ? AND report_date = ?", key).fetchone()[0]
+
+    rows = monthly_kpis(conn, group="phoenix")
+    assert len(rows) == 5 and len(rows[0]) == 2 + len(MONTHLY_TREND_COLUMNS)
+    plan = conn.execute(
+        f"EXPLAIN QUERY PLAN SELECT entity_key, month, {', '.join(MONTHLY_TREND_COLUMNS)} "
+        "FROM mgmt_report_monthly_kpis WHERE entity_key = ? ORDER BY entity_key, month", (rows[0][0],)).fetchall()
+    assert "COVERING INDEX ix_mgmt_report_monthly_kpis_trend" in plan[0][-1]
+
+
+def test_duplicate_keys_and_pruning(tmp_path):
+    from populate_mgmt_report_db import populate
+
+    conn, files = _db(tmp_path)
+    src = tmp_path / "RidgeviewCentre_2025_mgmt_report_structured.json"
+    doc = json.loads(src.read_text())
+    key = doc["metadata"]["entity"]["entity_key"]
+    copy = tmp_path / "ZCopy_mgmt_report_structured.json"
+    doc["tenant_data"] = doc["tenant_data"][:2]
+    copy.write_text(json.dumps(doc))
+    files = sorted(files + [copy])
+
+    def _tenants():
+        return conn.execute("SELECT COUNT(*) FROM mgmt_report_tenants WHERE entity_key = ?", (key,)).fetchone()[0]
+
+    populate(conn, files)
+    assert _tenants() == 2                                   # copy is scanned last and wins
+    baseline = _counts(conn)
+
+    copy.unlink()
+    pruned = populate(conn, [f for f in files if f != copy])
+    assert pruned["removed"] == [copy.stem] and not pruned["updated"]
+    full = len([t for t in json.loads(src.read_text())["tenant_data"] if t.get("name")])
+    assert _tenants() == full                                # surviving file's rows restored
+    assert conn.execute("SELECT COUNT(*) FROM mgmt_report_sources").fetchone()[0] == 5
+
+    src.unlink()
+    gone = populate(conn, [f for f in files if f not in (copy, src)])
+    assert gone["removed"] == [src.stem] and _tenants() == 0
+    counts = _counts(conn)
+    assert counts["mgmt_report_kpis"] == counts["mgmt_report_monthly_kpis"] == baseline["mgmt_report_kpis"] - 1
@@ -0,0 +1,63 @@
+"""Tests for engine proofs (engine/proofs.py).
+
+Verifies:
+1. Every entity identity holds on the base model, via EntityResult.proofs()
+2. EntityProofs builds categories lazily, memoises them and pickles
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def test_entity_proofs_pass():
+    from engine.config import ScenarioInputs
+    from engine.orchestrator import run_model
+    from engine.proofs import PROOF_CATEGORIES
+
+    result = run_model(None, ScenarioInputs())
+    for key, er in result.entities.items():
+        proofs = er.proofs()
+        assert er.proofs() is proofs
+        assert tuple(proofs) == PROOF_CATEGORIES
+        for category, rows in proofs.items():
+            failed = [p["name"] for p in rows
+                      if abs(p["expected"] - p["actual"]) > p["tolerance"]]
+            assert rows and not failed, (key, category, failed)
+
+    nwl = result.entities["nwl"].proofs()
+    assert len(nwl["pnl"]) == 5 * len(result.entities["nwl"].annual) + 1
+    assert nwl["pnl"][0]["name"] == "Y1: EBITDA - Depr = EBIT"
+
+
+def test_entity_proofs_lazy():
+    from engine.proofs import EntityProofs, build_entity_proofs
+
+    annual = [{
+        "year": 1, "ebitda": 10.0, "depr": 4.0, "ebit": 6.0, "ie": 1.0, "pbt": 5.0,
+        "tax": 1.0, "pat": 4.0, "bs_retained": 4.0,
+    }]
+    proofs = EntityProofs(annual, [], "demo", tax_rate=0.2)
+
+    assert "pnl" in proofs and "waterfall" not in proofs and "ops" not in proofs
+    assert proofs.built == ()
+    assert [p["expected"] for p in proofs["pnl"][:2]] == [6.0, 5.0]
+    assert proofs.built == ("pnl",)
+    assert proofs["pnl"] is proofs["pnl"]
+    assert pickle.loads(pickle.dumps(proofs))["pnl"] == proofs["pnl"]
+
+    errors = []
+    failing = EntityProofs(annual, [], "demo", on_error=lambda c, e: errors.append(c))
+    assert failing["cf"] == [] and errors == ["cf"]              # cf_ops missing
+    assert "cf" not in failing.built
+    with pytest.raises(KeyError):
+        build_entity_proofs(annual, [], "demo")               # no on_error: failures propagate
+    with pytest.raises(KeyError):
+        proofs["waterfall"]
@@ -0,0 +1,59 @@
+"""Tests for the compiled column registry (engine/registry.py).
+
+Verifies:
+1. Compiled indexes agree with a linear scan of the columns
+2. Validation and tagging are memoised on content; a reset registry reloads
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def test_compiled_indexes():
+    from engine.registry import FLOW, STOCK, ColumnRegistry
+
+    reg = ColumnRegistry.load()
+    cols = reg.values()
+    assert len(reg.digest) == 40
+    for nature in ("flow", "stock", "parameter"):
+        assert reg.by_nature(nature) == [c for c in cols if c.nature == nature]
+    for entity in ("nwl", "lanred", "timberworx", "nobody"):
+        assert reg.for_entity(entity) == [c for c in cols if not c.entity or entity in c.entity]
+
+    keys = [c.key for c in cols[:40]] + ["not_a_column"]
+    assert reg.select(keys, STOCK) == [k for k in keys if k in reg.stock_keys()]
+    assert reg.select(keys, STOCK | FLOW) == [k for k in keys if reg.bits(k) in (STOCK, FLOW)]
+    assert reg.labels(keys)["not_a_column"] == "not_a_column"
+    assert reg.labels(keys)[keys[0]] == reg[keys[0]].label
+
+
+def test_memoised_validation(tmp_path):
+    import engine.template_validator as tv
+    from engine.loop import _WATERFALL_STOCK_KEYS
+    from engine.registry import ColumnRegistry
+    from engine.value_tags import _LAYOUT_CACHE, tag_columns
+
+    reg = ColumnRegistry.load()
+    first = reg.validate_against_stock_keys(_WATERFALL_STOCK_KEYS, label="wf")
+    first.append("caller mutation")
+    assert reg.validate_against_stock_keys(_WATERFALL_STOCK_KEYS, label="wf") == first[:-1]
+    assert reg.validate_against_stock_keys({"no_such_key"}) == ["Stock key 'no_such_key' not found in registry"]
+
+    shutil.copytree(_model_root / "config" / "templates", tmp_path, dirs_exist_ok=True)
+    tv._RESULTS.clear()
+    assert tv.validate_all_templates(tmp_path, reg) == []
+    assert len(tv._RESULTS) == 1
+    (tmp_path / "bad.json").write_text('{"lines": [{"id": "no_such_line"}]}')
+    assert tv.validate_all_templates(tmp_path, reg) == ["[bad] Unknown column 'no_such_line' (type=driver)"]
+    assert len(tv._RESULTS) == 2
+
+    tags = tag_columns(["cf_net", "opco_dsra_bal"])
+    assert tuple(tags) in _LAYOUT_CACHE and tag_columns(["cf_net", "opco_dsra_bal"]) == tags
+    ColumnRegistry.reset()
+    assert ColumnRegistry.load() is not reg and ColumnRegistry.load().digest == reg.digest
@@ -0,0 +1,82 @@
+"""Tests for config hot-reload (engine/reload.py).
+
+Verifies:
+1. A changed file is re-read and clears only its dependent cache groups
+2. The watcher reports edited, added and removed files once per change
+"""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def _recorder(monkeypatch):
+    import engine.reload as rl
+
+    calls = []
+    monkeypatch.setattr(rl, "_handlers", {g: {} for g in rl.GROUPS})
+    for group in rl.GROUPS:
+        rl.register(group, lambda g=group: calls.append(g), name=f"test.{group}")
+    return calls
+
+
+def test_targeted_invalidation(monkeypatch, tmp_path):
+    import engine.config as config
+    import engine.reload as rl
+
+    calls = _recorder(monkeypatch)
+    assert rl.groups_for(["columns"]) == ["registry", "tags"]
+    assert rl.groups_for(["periods"]) == list(rl.GROUPS)
+    assert rl.invalidate(["guarantor"]) == [] and calls == []
+
+    shutil.copytree(config._CONFIG_DIR, tmp_path, dirs_exist_ok=True)
+    monkeypatch.setattr(config, "_CONFIG_DIR", tmp_path)
+    try:
+        rl.invalidate(["rates"])
+        before = config.ModelConfig.load()
+        rates = json.loads((tmp_path / "rates.json").read_text())
+        rates["tax"]["corporate_rate"] = 0.31
+        (tmp_path / "rates.json").write_text(json.dumps(rates))
+        assert config.ModelConfig.load() is before           # still cached
+
+        calls.clear()
+        assert rl.invalidate(["rates"]) == ["results"] and calls == ["results"]
+        after = config.ModelConfig.load()
+        assert after.tax_rate == 0.31 and after.structure is before.structure
+
+        calls.clear()
+        rl.invalidate(["operations"])
+        assert calls == ["ops", "results"]
+    finally:
+        monkeypatch.undo()
+        rl.invalidate(["rates", "operations"])
+    assert config.ModelConfig.load().tax_rate == 0.27
+
+
+def test_watcher_poll(monkeypatch, tmp_path):
+    from engine.reload import ConfigWatcher
+
+    calls = _recorder(monkeypatch)
+    for name in ("columns", "operations", "guarantor"):
+        (tmp_path / f"{name}.json").write_text("{}")
+    watcher = ConfigWatcher(tmp_path)
+    assert watcher.poll() == []
+
+    path = tmp_path / "columns.json"
+    path.write_text('{"x": 1}')
+    os.utime(path, ns=(1, 1))
+    assert watcher.poll() == ["columns"] and calls == ["registry", "tags"]
+    assert watcher.poll() == []
+
+    calls.clear()
+    (tmp_path / "operations.json").unlink()
+    (tmp_path / "periods.json").write_text("{}")
+    assert watcher.poll() == ["operations", "periods"]
+    assert calls == ["ops", "results", "timeline", "registry", "tags"]
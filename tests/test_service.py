@@ -0,0 +1,75 @@
+"""Tests for the local HTTP model service.
+
+Verifies:
+1. /model returns the same payload as ModelResult.to_dict() locally
+2. Identical requests are computed once (coalesced or cached)
+3. A config edit re-keys requests and warm workers reload their snapshot
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def test_service_model_and_coalescing():
+    from http.server import ThreadingHTTPServer
+    from engine.orchestrator import run_model
+    from engine.service import ModelService, ModelServiceClient, _make_handler
+
+    service = ModelService(workers=1)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(service))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = ModelServiceClient(f"http://127.0.0.1:{httpd.server_address[1]}")
+        remote = client.model({})
+        local = json.loads(json.dumps(run_model().to_dict(), default=str))
+        assert remote == local
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(client.run({"nwl_cash_sweep_pct": 80.0})))
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(results) == 4 and all(r == results[0] for r in results)
+        assert service.stats["computed"] == 2   # one /model + one /run
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        service.close()
+
+
+def test_config_change_reloads_workers(monkeypatch, tmp_path):
+    import shutil
+    import engine.config as config
+    import engine.reload as rl
+    from engine.batch import evaluate_scenario
+    from engine.service import ModelService
+
+    shutil.copytree(config._CONFIG_DIR, tmp_path, dirs_exist_ok=True)
+    monkeypatch.setattr(config, "_CONFIG_DIR", tmp_path)
+    rl.invalidate(config.CONFIG_SECTIONS)
+    service = ModelService(workers=1)
+    try:
+        before = service.run({}).result()
+        rates = json.loads((tmp_path / "rates.json").read_text())
+        rates["tax"]["corporate_rate"] = 0.31
+        (tmp_path / "rates.json").write_text(json.dumps(rates))
+        rl.invalidate(["rates"])                       # what the serve() watcher does
+
+        after = service.run({}).result()
+        assert service.stats["computed"] == 2 and after["metrics"] != before["metrics"]
+        local = evaluate_scenario(config.ModelConfig.load(), config.ScenarioInputs())
+        assert after["metrics"] == json.loads(json.dumps(local["metrics"]))
+    finally:
+        service.close()
+        monkeypatch.undo()
+        rl.invalidate(config.CONFIG_SECTIONS)
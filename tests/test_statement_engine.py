@@ -0,0 +1,83 @@
+"""Tests for the template-driven statement engine (engine/statements.py).
+
+Verifies:
+1. Shipped templates validate against the registry and reproduce the engine's columns
+2. Formula / aggregation / flag / entity-filter semantics of a compiled plan
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def test_shipped_templates_match_model():
+    from engine.config import ScenarioInputs
+    from engine.orchestrator import run_model
+    from engine.statements import model_statements
+    from engine.template_validator import validate_all_templates
+
+    assert validate_all_templates() == []
+
+    result = run_model(None, ScenarioInputs())
+    tables = model_statements(result, ScenarioInputs())
+    assert {k for k, _ in tables} == set(result.entities)
+
+    nwl = result.entities["nwl"].annual
+    pnl = {row[0]: row for row in tables["nwl", "pnl"].rows()}
+    assert pnl["Net Result"][1] == [a["pat"] for a in nwl] + [sum(a["pat"] for a in nwl)]
+    assert pnl["Depreciation"][1][0] == -nwl[0]["depr"]
+    assert pnl["Tax (27%)"][2] == "line"
+
+    cf = {row[0]: row for row in tables["nwl", "cf"].rows()}
+    assert cf["Net Construction"][1][:-1] == [a["cf_draw"] - a["cf_capex"] for a in nwl]
+    assert "SWAP HEDGE" in cf and not any(r[0] == "SWAP HEDGE" for r in tables["lanred", "cf"].rows())
+
+    bs = tables["nwl", "bs"].rows()
+    assert bs[-1][0] == "Assets = Debt + Equity" and set(bs[-1][1]) == {"OK"}
+    assert {r[0]: r for r in bs}["Total Assets"][1][-1] == nwl[-1]["bs_assets"]
+
+
+def test_compiled_plan_semantics():
+    from engine.statements import compile_template, evaluate_plan
+
+    template = {
+        "name": "Demo",
+        "statement": "demo",
+        "flags": {"busy": "x > 5"},
+        "sections": [
+            {"label": "MAIN", "lines": [
+                {"id": "x", "label": "X"},
+                {"id": "y", "label": "Y", "sign": -1},
+                {"id": "net", "label": "Net", "type": "aggregation", "of": ["x", "y"], "style": "total"},
+                {"id": "ratio", "label": "X/Y", "type": "formula", "expr": "x / y",
+                 "format": "ratio", "total": "mean"},
+                {"id": "only_a", "label": "A only", "entities": ["a"]},
+            ]},
+            {"label": "BUSY", "when": "busy", "lines": [{"id": "x", "label": "Closing X", "type": "balance"}]},
+        ],
+    }
+    plan = compile_template(template)
+    assert set(plan.columns) == {"x", "y", "only_a"}
+    tables = evaluate_plan(plan, {
+        "a": [{"year": 1, "x": 4.0, "y": 1.0}, {"year": 2, "x": 6.0, "y": 0.0}],
+        "b": [{"year": 1, "x": 1.0, "y": 2.0}],
+    })
+
+    a = {row[0]: row for row in tables["a"].rows()}
+    assert a["Net"][1] == [3.0, 6.0, 9.0]
+    assert a["X/Y"][1] == ["4.00x", "n/a", "4.00x"]
+    assert a["Closing X"][1] == [4.0, 6.0, 6.0]
+    assert [r[2] for r in tables["a"].rows()][-3:] == ["spacer", "section", "line"]
+
+    b = {row[0]: row for row in tables["b"].rows()}
+    assert "A only" not in b and "BUSY" not in b
+    assert b["Y"][1] == [-2.0, -2.0]
+
+    with pytest.raises(ValueError, match="disallowed"):
+        compile_template({"lines": [{"id": "bad", "type": "formula", "expr": "__import__('os')"}]})
@@ -0,0 +1,52 @@
+"""Tests for cached statement rendering (views/statements.py, views/heritage.py).
+
+Verifies:
+1. fin_table_html aligns / formats cells and is served from cache on repeat calls
+2. inject_pnl_heritage renders once per (entity, statement, rows); changed rows re-render
+"""
+
+import sys
+from pathlib import Path
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def test_fin_table_html_cached():
+    from views.statements import clear_statement_cache, fin_table_html, statement_cache_info
+
+    clear_statement_cache()
+    rows = [("**Revenue**", "1,000", ""), ("*Costs*", "(200)", 0)]
+    html = fin_table_html(rows, ["", "FY2025", "FY2024"])
+    assert html.count("<tr>") == 3
+    assert '<td style="text-align:left;padding:4px 8px;border-bottom:1px solid #eee;font-weight:600;"><b>Revenue</b></td>' in html
+    assert "<i>Costs</i>" in html and "text-align:right" in html
+    assert fin_table_html(rows, ["", "FY2025", "FY2024"]) is html
+    assert statement_cache_info()["hits"] == 1
+
+
+def test_heritage_statement_cached(monkeypatch):
+    import streamlit.components.v1 as stc
+    from engine.orchestrator import run_model
+    from views.heritage import build_pnl_heritage_html, inject_pnl_heritage
+    from views.statements import clear_statement_cache, statement_cache_info
+
+    rendered = []
+    monkeypatch.setattr(stc, "html", lambda html, height, scrolling: rendered.append(height))
+    clear_statement_cache()
+
+    annual = [dict(a) for a in run_model().entities["nwl"].annual]
+    rows = [("REVENUE", [None] * 11, "section", "")]
+    vals = [a["rev_total"] for a in annual]
+    rows.append(("Total Revenue", vals + [sum(vals)], "total", "rev_total"))
+
+    first = inject_pnl_heritage(rows, annual, 10, entity="nwl", statement="pnl")
+    assert inject_pnl_heritage(rows, annual, 10, entity="nwl", statement="pnl") is first
+    assert first == build_pnl_heritage_html(rows, annual, 10)[0]
+    assert 'data-key="rev_total"' in first and "var HD=" in first
+
+    rows[1] = ("Total Revenue", [v * 2 for v in rows[1][1]], "total", "rev_total")
+    assert inject_pnl_heritage(rows, annual, 10, entity="nwl", statement="pnl") != first
+    assert statement_cache_info()["misses"] == 2 and len(rendered) == 3
@@ -0,0 +1,45 @@
+"""Tests for the SVG render cache and asset templates (svg_generators.py).
+
+Verifies:
+1. Generators are memoised on their input data; changed data re-renders
+2. Asset templates patch <text id=...> slots and recompile when the file changes
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def test_generator_memoised_on_inputs():
+    import svg_generators as sg
+
+    sg.clear_svg_cache()
+    a = sg.generate_lanred_tariff_svg(2.29, 10, 0.80)
+    b = sg.generate_lanred_tariff_svg(2.29, 10, 0.80)
+    assert a is b
+    assert sg.svg_cache_info()["hits"] == 1
+    c = sg.generate_lanred_tariff_svg(2.29, 15, 0.80)
+    assert c != a
+    assert a == sg.generate_lanred_tariff_svg.uncached(2.29, 10, 0.80)
+    assert sg.svg_cache_info()["misses"] == 2
+
+
+def test_asset_template_patch_and_reload(tmp_path):
+    import svg_generators as sg
+
+    path = tmp_path / "diagram.svg"
+    path.write_text('<svg><text id="a" x="1">Old A</text><text id="b">Old B</text></svg>')
+    out = sg.patch_svg_asset(path, {"a": "R&D <new>"})
+    assert out == '<svg><text id="a" x="1">R&amp;D &lt;new&gt;</text><text id="b">Old B</text></svg>'
+    assert sg.patch_svg_asset(path) == path.read_text()
+
+    stat = path.stat()
+    path.write_text('<svg><text id="a">Changed</text></svg>')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert sg.patch_svg_asset(path, {"a": "R&D <new>"}) == '<svg><text id="a">R&amp;D &lt;new&gt;</text></svg>'
+    assert sg.patch_svg_asset(tmp_path / "missing.svg") == ""
@@ -0,0 +1,61 @@
+"""Tests for config-path sensitivity sweeps (engine/scenarios.py).
+
+Verifies:
+1. A config-path sweep matches run_model on an overlaid config; points are cached
+2. Mixed override dicts split cleanly; the model service sweeps config paths too
+"""
+
+import sys
+from pathlib import Path
+
+# Ensure the model root is on sys.path
+_model_root = Path(__file__).resolve().parent.parent
+if str(_model_root) not in sys.path:
+    sys.path.insert(0, str(_model_root))
+
+
+def test_config_sweep():
+    from engine.analytics import extract_metrics
+    from engine.config import ModelConfig
+    from engine.orchestrator import run_model
+    import engine.scenarios as sc
+
+    fx = sc.SweepVariable("rates.fx.eur_zar", base=20.0, low=18.0, high=22.0, steps=3)
+    assert fx.is_config and not sc.NWL_SWEEP_PRESETS[0].is_config
+
+    sc.clear_sweep_cache()
+    sweep = sc.run_sweep(fx)
+    assert [r["is_base"] for r in sweep.rows] == [False, True, False]
+    assert len({r["total_pat"] for r in sweep.rows}) == 3
+
+    cfg = ModelConfig.load().with_overrides({"rates.fx.eur_zar": 22.0})
+    direct = extract_metrics("nwl", run_model(cfg).entities["nwl"].annual, 0.052).to_dict()
+    assert {k: sweep.rows[2][k] for k in direct} == direct
+    assert ModelConfig.load().rates["fx"]["eur_zar"] == 20.0
+
+    cache = sc._point_cache()
+    assert len(cache._data) == 3
+    again = sc.run_sweep(fx)
+    assert again.rows == sweep.rows and len(cache._data) == 3
+
+
+def test_split_and_service_sweep():
+    from engine.scenarios import SweepVariable, grid_overrides, run_sweep, split_overrides
+    from engine.service import ModelService
+
+    tax = SweepVariable("rates.tax.corporate_rate", base=0.27, low=0.22, high=0.27, steps=2)
+    growth = SweepVariable("nwl_greenfield_growth_pct", base=7.7, low=5.0, high=9.0, steps=2)
+    book = list(grid_overrides([tax, growth]))
+    assert split_overrides(book[0]) == ({"rates.tax.corporate_rate": 0.22},
+                                        {"nwl_greenfield_growth_pct": 5.0})
+
+    service = ModelService(workers=1)
+    try:
+        rows = service.sweep({}, tax)
+        base = service.run({}).result()["metrics"]["nwl"]
+        assert rows[1]["is_base"] and rows[1]["total_pat"] == base["total_pat"]
+        local = run_sweep(tax).rows
+        assert [r["total_pat"] for r in rows] == [r["total_pat"] for r in local]
+        assert service.stats["computed"] == 2      # base point shared with the /run call
+    finally:
+        service.close()
@@ -0,0 +1,204 @@
+"""Plotly figure cache — build each chart once per (fingerprint, chart id, options).
+
+Chart-heavy tabs rebuild dozens of go.Figure objects on every Streamlit
+rerun.  plot_cached() keys a figure on the model-result fingerprint
+(app._session_input_hash()), a chart id, the builder's definition site and
+the display options / series the chart is drawn from, and only calls the
+builder on a miss:
+
+    def _build_fig_sewage():
+        fig_sewage = go.Figure()
+        ...
+        return fig_sewage
+    plot_cached("sewage_split", _build_fig_sewage, fingerprint=_fig_fp,
+                use_container_width=True)
+
+options defaults to the builder's closure values (the locals it reads), so
+a chart re-renders whenever any of its inputs change.
+
+Entries hold the serialised figure JSON (what the browser receives, after
+downsampling) plus the validated go.Figure built from it once, so a hit
+costs a dict lookup instead of plotly's per-trace validation.  Cached
+figures are shared across sessions: treat them as read-only.
+
+Line / scatter traces longer than max_points are downsampled with
+min/max bucketing (peaks and troughs survive) before caching.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import plotly.graph_objects as go
+
+FIGURE_CACHE_SIZE = 512
+MAX_POINTS = 2000
+
+
+@dataclass
+class _Entry:
+    spec: str
+    figure: go.Figure
+
+
+_figures: "OrderedDict[str, _Entry]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+# ── Keys ─────────────────────────────────────────────────────────
+
+
+def _default(obj: Any):
+    """JSON fallback for numpy / pandas values in options."""
+    if hasattr(obj, "tolist"):                        # numpy arrays, pandas Series / Index
+        return obj.tolist()
+    if hasattr(obj, "to_dict"):                       # DataFrames
+        return obj.to_dict(orient="split")
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    return str(obj)
+
+
+def figure_key(fingerprint: str, chart_id: str, options: Any = None) -> str:
+    """sha1 over the canonical JSON of (fingerprint, chart id, options)."""
+    raw = json.dumps([fingerprint, chart_id, options], sort_keys=True,
+                     default=_default, separators=(",", ":"))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _closure_options(build: Callable) -> dict:
+    """{name: value} of the enclosing-scope variables build() reads."""
+    code = getattr(build, "__code__", None)
+    cells = getattr(build, "__closure__", None) or ()
+    if code is None:
+        return {}
+    return {name: cell.cell_contents for name, cell in zip(code.co_freevars, cells)}
+
+
+def _build_key(fingerprint: str, chart_id: str, build: Callable, options: Any) -> str:
+    code = getattr(build, "__code__", None)
+    site = f"{code.co_filename}:{code.co_firstlineno}" if code is not None else ""
+    if options is None:
+        options = _closure_options(build)
+    return figure_key(fingerprint, f"{chart_id}@{site}", options)
+
+
+# ── Downsampling ────────────────────────────────────────────────
+
+
+def downsample_xy(x: list, y: list, max_points: int = MAX_POINTS) -> tuple[list, list]:
+    """Min/max bucket decimation to at most ~max_points points, keeping ends."""
+    n = len(y)
+    if n <= max_points or max_points < 4:
+        return list(x), list(y)
+    buckets = max_points // 2
+    step = n / buckets
+    idx: list[int] = []
+    for b in range(buckets):
+        lo, hi = int(b * step), min(int((b + 1) * step), n)
+        if lo >= hi:
+            continue
+        window = range(lo, hi)
+        vals = [(y[i] if y[i] is not None else 0.0, i) for i in window]
+        i_min, i_max = min(vals)[1], max(vals)[1]
+        idx.extend(sorted({i_min, i_max}))
+    if idx[0] != 0:
+        idx.insert(0, 0)
+    if idx[-1] != n - 1:
+        idx.append(n - 1)
+    return [x[i] for i in idx], [y[i] for i in idx]
+
+
+def downsample_figure(fig: go.Figure, max_points: int = MAX_POINTS) -> go.Figure:
+    """Decimate long scatter / line traces of fig in place; returns fig."""
+    for trace in fig.data:
+        if trace.type not in ("scatter", "scattergl") or trace.y is None:
+            continue
+        y = list(trace.y)
+        if len(y) <= max_points:
+            continue
+        x = list(trace.x) if trace.x is not None else list(range(len(y)))
+        try:
+            trace.x, trace.y = downsample_xy(x, y, max_points)
+        except TypeError:                             # non-numeric y: plain stride
+            stride = -(-len(y) // max_points)
+            trace.x, trace.y = x[::stride], y[::stride]
+    return fig
+
+
+# ── Cache ───────────────────────────────────────────────────────
+
+
+def cached_figure(
+    chart_id: str,
+    build: Callable[[], go.Figure],
+    *,
+    fingerprint: str = "",
+    options: Any = None,
+    max_points: int = MAX_POINTS,
+) -> go.Figure:
+    """The figure for (fingerprint, chart_id, options), calling build() on a miss.
+
+    options=None keys on build's closure values.
+    """
+    key = _build_key(fingerprint, chart_id, build, options)
+    with _lock:
+        entry = _figures.get(key)
+        if entry is not None:
+            _figures.move_to_end(key)
+            _stats["hits"] += 1
+            return entry.figure
+        _stats["misses"] += 1
+    fig = downsample_figure(build(), max_points)
+    entry = _Entry(spec=fig.to_json(), figure=fig)
+    with _lock:
+        _figures[key] = entry
+        while len(_figures) > FIGURE_CACHE_SIZE:
+            _figures.popitem(last=False)
+    return fig
+
+
+def cached_figure_json(
+    chart_id: str,
+    build: Callable[[], go.Figure],
+    *,
+    fingerprint: str = "",
+    options: Any = None,
+) -> str | None:
+    """Serialised spec of a cached figure (without building it), or None."""
+    with _lock:
+        entry = _figures.get(_build_key(fingerprint, chart_id, build, options))
+    return entry.spec if entry is not None else None
+
+
+def plot_cached(
+    chart_id: str,
+    build: Callable[[], go.Figure],
+    *,
+    fingerprint: str = "",
+    options: Any = None,
+    max_points: int = MAX_POINTS,
+    **chart_kwargs,
+) -> None:
+    """st.plotly_chart of cached_figure(); chart_kwargs go to st.plotly_chart."""
+    import streamlit as st
+
+    fig = cached_figure(chart_id, build, fingerprint=fingerprint, options=options, max_points=max_points)
+    st.plotly_chart(fig, **chart_kwargs)
+
+
+def figure_cache_info() -> dict:
+    with _lock:
+        return {**_stats, "size": len(_figures), "bytes": sum(len(e.spec) for e in _figures.values())}
+
+
+def clear_figure_cache() -> None:
+    with _lock:
+        _figures.clear()
+        _stats.update(hits=0, misses=0)
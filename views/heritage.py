@@ -485,12 +485,99 @@ def _estimate_table_height(pnl_rows: list[tuple], year_count: int) -> int:
     return row_height + 38 + 40
 
 
+def _pnl_row_html(row_data: tuple, ncols: int, year_count: int,
+                  annual_data: list[dict], eur_fmt: str) -> str:
+    """One <tr> of the statement table (cells with heritage data-* attributes)."""
+    if len(row_data) == 4:
+        label, vals, rtype, key = row_data
+    else:
+        label, vals, rtype = row_data
+        key = ""
+
+    if rtype == 'spacer':
+        return f'<tr class="row-spacer"><td colspan="{ncols + 1}"></td></tr>'
+    if rtype == 'section':
+        return (f'<tr class="row-section"><td colspan="{ncols + 1}">'
+                f'{html_mod.escape(label)}</td></tr>')
+
+    row_cls = f"row-{rtype}" if rtype in ('grand', 'total', 'memo', 'sub') else "row-line"
+    key_attr = html_mod.escape(key)
+    cells = []
+    for vi, v in enumerate(vals):
+        if v is None or isinstance(v, str):
+            cells.append('<td></td>')
+            continue
+        cell_text = html_mod.escape(eur_fmt.format(v))
+        # ALL value cells get hc class for uniform styling
+        if key and vi < year_count and vi < len(annual_data):
+            tip_text = _build_tooltip_text(key, annual_data[vi])
+            if not tip_text:
+                # Leaf/driver value — minimal tooltip
+                tip_text = f"{key}\nConfig / driver input"
+            tip_attr = html_mod.escape(tip_text.replace("\n", "\\n"), quote=True)
+            cells.append(f'<td class="hc" data-tip="{tip_attr}" data-key="{key_attr}" data-yi="{vi}">{cell_text}</td>')
+        else:
+            cells.append(f'<td class="hc">{cell_text}</td>')
+    return f'<tr class="{row_cls}"><td>{html_mod.escape(label)}</td>{"".join(cells)}</tr>'
+
+
+def build_pnl_heritage_html(
+    pnl_rows: list[tuple],
+    annual_data: list[dict],
+    year_count: int,
+    eur_fmt: str = "\u20ac{:,.0f}",
+    year_labels: list[str] | None = None,
+) -> tuple[str, int]:
+    """Self-contained statement document (table + heritage payload) and iframe height.
+
+    Pure string building, no Streamlit calls -- see inject_pnl_heritage().
+    """
+    import json as _json
+
+    ncols = year_count + 1  # years + total column
+    if year_labels is None:
+        year_labels = [f"Y{i+1}" for i in range(year_count)]
+    col_headers = list(year_labels) + ["Total"]
+
+    table_html = ''.join((
+        '<table><thead><tr><th>Item</th>',
+        ''.join(f'<th>{html_mod.escape(c)}</th>' for c in col_headers),
+        '</tr></thead><tbody>',
+        ''.join(_pnl_row_html(r, ncols, year_count, annual_data, eur_fmt) for r in pnl_rows),
+        '</tbody></table>',
+    ))
+
+    # Pre-build heritage HTML for click-to-expand panel
+    heritage_data = _build_heritage_data(pnl_rows, annual_data, year_count)
+    hd_json = _json.dumps(heritage_data, ensure_ascii=True)
+
+    # Build complete self-contained HTML document for st.html()
+    full_html = ''.join((
+        '<!DOCTYPE html>'
+        '<html><head><meta charset="utf-8">',
+        f'<style>{_TABLE_CSS}</style>',
+        '</head><body>',
+        f'<script>var HD={hd_json};</script>',
+        '<div id="tooltip-root">',
+        f'<div style="overflow-x:auto;width:100%;">{table_html}</div>',
+        '<div id="heritage-tooltip"></div>',
+        '</div>',
+        f'<script>{_TABLE_JS}</script>',
+        '</body></html>',
+    ))
+    return full_html, _estimate_table_height(pnl_rows, year_count)
+
+
 def inject_pnl_heritage(
     pnl_rows: list[tuple],
     annual_data: list[dict],
     year_count: int,
     eur_fmt: str = "\u20ac{:,.0f}",
     year_labels: list[str] | None = None,
+    *,
+    entity: str = "",
+    statement: str = "",
+    fingerprint: str | None = None,
 ) -> str:
     """Build the P&L HTML table with heritage tooltips and render it.
 
@@ -501,6 +588,10 @@ def inject_pnl_heritage(
     returns the HTML string for backward compatibility, though callers should
     NOT re-render it via st.markdown().
 
+    The document is cached per (entity, statement, format options) and the
+    row content (views/statements.py); fingerprint identifies annual_data
+    (the model result) and defaults to a hash of it.
+
     Args:
         pnl_rows: List of (label, values, row_type, key) tuples.
                   key is the column key for lineage lookup (may be empty).
@@ -508,93 +599,20 @@ def inject_pnl_heritage(
         year_count: Number of year columns.
         eur_fmt: Format string for EUR values.
         year_labels: Column headers for year columns. Defaults to Y1, Y2, etc.
+        entity, statement: Readable cache key parts (e.g. "nwl", "pnl").
+        fingerprint: Result fingerprint for annual_data, if the caller has one.
 
     Returns:
         Complete HTML string for the table (already rendered via st.html).
     """
-    ncols = year_count + 1  # years + total column
-
-    h: list[str] = []
-
-    # Table structure
-    h.append('<table>')
-    h.append('<thead><tr>')
-    h.append('<th>Item</th>')
-
-    if year_labels is None:
-        year_labels = [f"Y{i+1}" for i in range(year_count)]
-    col_headers = list(year_labels) + ["Total"]
-    for c in col_headers:
-        h.append(f'<th>{html_mod.escape(c)}</th>')
-    h.append('</tr></thead><tbody>')
-
-    for row_data in pnl_rows:
-        if len(row_data) == 4:
-            label, vals, rtype, key = row_data
-        else:
-            label, vals, rtype = row_data
-            key = ""
-
-        if rtype == 'spacer':
-            h.append(f'<tr class="row-spacer"><td colspan="{ncols + 1}"></td></tr>')
-            continue
-        if rtype == 'section':
-            h.append(
-                f'<tr class="row-section"><td colspan="{ncols + 1}">'
-                f'{html_mod.escape(label)}</td></tr>'
-            )
-            continue
-
-        row_cls = f"row-{rtype}" if rtype in ('grand', 'total', 'memo', 'sub') else "row-line"
-        h.append(f'<tr class="{row_cls}">')
-        h.append(f'<td>{html_mod.escape(label)}</td>')
-
-        for vi, v in enumerate(vals):
-            if v is not None and not isinstance(v, str):
-                cell_text = html_mod.escape(eur_fmt.format(v))
-                # ALL value cells get hc class for uniform styling
-                if key and vi < year_count and vi < len(annual_data):
-                    tip_text = _build_tooltip_text(key, annual_data[vi])
-                    if not tip_text:
-                        # Leaf/driver value — minimal tooltip
-                        tip_text = f"{key}\nConfig / driver input"
-                    tip_encoded = tip_text.replace("\n", "\\n")
-                    tip_attr = html_mod.escape(tip_encoded, quote=True)
-                    key_attr = html_mod.escape(key)
-                    h.append(f'<td class="hc" data-tip="{tip_attr}" data-key="{key_attr}" data-yi="{vi}">{cell_text}</td>')
-                else:
-                    h.append(f'<td class="hc">{cell_text}</td>')
-            else:
-                h.append('<td></td>')
-
-        h.append('</tr>')
-
-    h.append('</tbody></table>')
-
-    table_html = ''.join(h)
-
-    # Pre-build heritage HTML for click-to-expand panel
-    import json as _json
-    heritage_data = _build_heritage_data(pnl_rows, annual_data, year_count)
-    hd_json = _json.dumps(heritage_data, ensure_ascii=True)
-
-    # Build complete self-contained HTML document for st.html()
-    full_html = (
-        '<!DOCTYPE html>'
-        '<html><head><meta charset="utf-8">'
-        f'<style>{_TABLE_CSS}</style>'
-        '</head><body>'
-        f'<script>var HD={hd_json};</script>'
-        '<div id="tooltip-root">'
-        f'<div style="overflow-x:auto;width:100%;">{table_html}</div>'
-        '<div id="heritage-tooltip"></div>'
-        '</div>'
-        f'<script>{_TABLE_JS}</script>'
-        '</body></html>'
-    )
-
-    # Estimate height for the iframe
-    height = _estimate_table_height(pnl_rows, year_count)
+    from views.statements import cached_html, digest, statement_key
+
+    if fingerprint is None:
+        fingerprint = digest(annual_data)
+    key = statement_key(fingerprint, entity, statement,
+                        (eur_fmt, year_count, year_labels), pnl_rows)
+    full_html, height = cached_html(key, lambda: build_pnl_heritage_html(
+        pnl_rows, annual_data, year_count, eur_fmt, year_labels))
 
     # Render via streamlit.components.v1.html -- full CSS/JS freedom,
     # no sanitizer. This is the same approach used by render_svg() in app.py.
@@ -0,0 +1,135 @@
+"""Statement table rendering — join-based HTML builders + per-statement cache.
+
+Financial statements (P&L, cash flow, balance sheet) and the generic
+right-aligned tables are rebuilt on every Streamlit rerun.  The builders
+here produce each table in a single "".join over generator output, and
+cached_html() keeps the result per key so switching tabs or entities
+re-renders only statements whose inputs changed:
+
+    key = statement_key(fingerprint, "nwl", "pnl", options, rows)
+    html = cached_html(key, lambda: build_statement(...))
+
+Keys hash the display rows themselves alongside the result fingerprint,
+so scenario toggles that change a line always miss.  Heritage payloads
+make statement HTML large (MBs), so the cache is bounded by bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Sequence
+
+STATEMENT_CACHE_BYTES = 192 * 2**20
+
+_cache: "OrderedDict[str, Any]" = OrderedDict()
+_sizes: dict[str, int] = {}
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "bytes": 0}
+
+
+# ── Keys / cache ────────────────────────────────────────────────
+
+
+def _default(obj: Any):
+    if hasattr(obj, "tolist"):                        # numpy / pandas Series
+        return obj.tolist()
+    if hasattr(obj, "to_dict"):                       # DataFrames
+        return obj.to_dict(orient="split")
+    return str(obj)
+
+
+def digest(*parts: Any) -> str:
+    """sha1 of the canonical JSON of parts."""
+    raw = json.dumps(parts, sort_keys=True, default=_default, separators=(",", ":"))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def statement_key(fingerprint: str, entity: str, statement: str, options: Any, rows: Any) -> str:
+    """Cache key for one rendered statement: (entity, statement, options) + content."""
+    return f"{entity}:{statement}:{digest(fingerprint, options, rows)}"
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, tuple):
+        return sum(_size(v) for v in value)
+    return 64
+
+
+def cached_html(key: str, build: Callable[[], Any]) -> Any:
+    """Value for key, calling build() on a miss (LRU, bounded by STATEMENT_CACHE_BYTES)."""
+    with _lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return _cache[key]
+        _stats["misses"] += 1
+    value = build()
+    size = _size(value)
+    with _lock:
+        if key not in _cache:
+            _cache[key] = value
+            _sizes[key] = size
+            _stats["bytes"] += size
+        while _stats["bytes"] > STATEMENT_CACHE_BYTES and len(_cache) > 1:
+            old, _ = _cache.popitem(last=False)
+            _stats["bytes"] -= _sizes.pop(old)
+    return value
+
+
+def statement_cache_info() -> dict:
+    with _lock:
+        return {**_stats, "size": len(_cache)}
+
+
+def clear_statement_cache() -> None:
+    with _lock:
+        _cache.clear()
+        _sizes.clear()
+        _stats.update(hits=0, misses=0, bytes=0)
+
+
+# ── Builders ────────────────────────────────────────────────────
+
+
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.+?)\*')
+
+_TH = '<th style="text-align:{};padding:5px 8px;border-bottom:2px solid #ddd;font-weight:600;">{}</th>'
+_TD = '<td style="text-align:{};padding:4px 8px;border-bottom:1px solid #eee;{}">{}</td>'
+
+
+def md_to_html(text: str) -> str:
+    """Convert simple markdown bold/italic to HTML."""
+    return _ITALIC_RE.sub(r'<i>\1</i>', _BOLD_RE.sub(r'<b>\1</b>', text))
+
+
+def _td(align: str, cell: str) -> str:
+    return _TD.format(align, 'font-weight:600;' if '<b>' in cell else '', cell)
+
+
+def table_html(columns: Sequence[str], rows: Iterable[Sequence[str]], right: Sequence[bool]) -> str:
+    """Scrollable HTML table; cells are pre-rendered strings, right[i] aligns column i."""
+    aligns = ['right' if r else 'left' for r in right]
+    return ''.join((
+        '<div style="overflow-x:auto;width:100%;">'
+        '<table style="border-collapse:collapse;width:100%;font-size:13px;white-space:nowrap;">'
+        '<thead><tr>',
+        ''.join(_TH.format(a, c) for a, c in zip(aligns, columns)),
+        '</tr></thead><tbody>',
+        ''.join('<tr>' + ''.join(_td(a, c) for a, c in zip(aligns, row)) + '</tr>' for row in rows),
+        '</tbody></table></div>',
+    ))
+
+
+def fin_table_html(rows: list[tuple], columns: list[str]) -> str:
+    """Financial table: first column left, the rest right; markdown bold/italic; cached."""
+    def _build() -> str:
+        cells = ([md_to_html(str(v)) if v else '' for v in row] for row in rows)
+        return table_html(columns, cells, [i > 0 for i in range(len(columns))])
+    return cached_html("fin:" + digest(columns, rows), _build)